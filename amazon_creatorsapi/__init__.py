@@ -3,9 +3,40 @@
 A Python wrapper for the Amazon Creators API.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import models
+    from .api import AmazonCreatorsApi
+    from .core import Country
+
 __author__ = "Sergio Abad"
 __all__ = ["AmazonCreatorsApi", "Country", "models"]
 
-from . import models
-from .api import AmazonCreatorsApi
-from .core import Country
+# Names imported on first access (PEP 562), so importing a submodule like
+# amazon_creatorsapi.errors does not import the client and the SDK
+_LAZY_IMPORTS = {
+    "AmazonCreatorsApi": "amazon_creatorsapi.api",
+    "Country": "amazon_creatorsapi.core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client, the countries and the models on first access."""
+    if name == "models":
+        return importlib.import_module("amazon_creatorsapi.models")
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -10,5 +10,7 @@ except ImportError as exc:  # pragma: no cover
     raise ImportError(msg) from exc
 
 from amazon_creatorsapi.aio.api import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.aio.marketplaces import AsyncMultiMarketplaceApi
+from amazon_creatorsapi.aio.transport import HttpxTransport
 
-__all__ = ["AsyncAmazonCreatorsApi"]
+__all__ = ["AsyncAmazonCreatorsApi", "AsyncMultiMarketplaceApi", "HttpxTransport"]
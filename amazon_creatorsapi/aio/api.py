@@ -6,22 +6,65 @@ Provides async methods to interact with the Amazon Creators API.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
 from enum import Enum
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
 
 from typing_extensions import Self
 
 from amazon_creatorsapi.core.constants import DEFAULT_THROTTLING
+from amazon_creatorsapi.core.deadline import Deadline
 from amazon_creatorsapi.core.error_handling import handle_api_error
+from amazon_creatorsapi.core.hedging import (
+    DEFAULT_WINDOW_SIZE,
+    LatencyTracker,
+    hedge_request,
+)
+from amazon_creatorsapi.core.hooks import (
+    DESERIALIZE,
+    NETWORK,
+    TOKEN,
+    RequestEvent,
+    async_call_with_hooks,
+    measure,
+)
+from amazon_creatorsapi.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFETCH,
+    MAX_SEARCH_PAGES,
+    async_iter_pages,
+    count_pages,
+    get_variations_page_count,
+    iter_new_items,
+)
 from amazon_creatorsapi.core.parsers import get_asin, get_items_ids
+from amazon_creatorsapi.core.pipeline import AsyncRequestPipeline
 from amazon_creatorsapi.core.resources import get_all_resources
+from amazon_creatorsapi.core.results import ResultList, ResultMetadata
+from amazon_creatorsapi.core.retry import async_call_with_retry
+from amazon_creatorsapi.core.tracing import (
+    get_tracer,
+    trace_request,
+    trace_retry,
+    trace_token_refresh,
+    traced,
+)
 from amazon_creatorsapi.core.validation import validate_and_get_marketplace
-from amazon_creatorsapi.errors import ItemsNotFoundError
+from amazon_creatorsapi.errors import (
+    AssociateValidationError,
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
+    ItemsNotFoundError,
+    QuotaExceededError,
+    TooManyRequestsError,
+)
 
 try:
+    import httpx
+
     from .auth import VERSION_ENDPOINTS, AsyncOAuth2TokenManager
-    from .client import AsyncHttpClient
+    from .client import DEFAULT_MAX_CONNECTIONS, AsyncHttpClient
 except ImportError as exc:  # pragma: no cover
     msg = (
         "httpx is required for async support. "
@@ -37,9 +80,20 @@ from creatorsapi_python_sdk.models.get_variations_resource import GetVariationsR
 from creatorsapi_python_sdk.models.search_items_resource import SearchItemsResource
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from contextlib import AbstractContextManager
     from types import TracebackType
 
+    from amazon_creatorsapi.core.circuit_breaker import CircuitBreakerRegistry
+    from amazon_creatorsapi.core.hedging import HedgingPolicy
+    from amazon_creatorsapi.core.hooks import EventHooks
     from amazon_creatorsapi.core.marketplaces import CountryCode
+    from amazon_creatorsapi.core.quota import QuotaTracker
+    from amazon_creatorsapi.core.results import ChunkMetadata
+    from amazon_creatorsapi.core.retry import RetryPolicy
+    from amazon_creatorsapi.core.scheduler import RequestScheduler
+    from amazon_creatorsapi.core.token_store import TokenStore
+    from amazon_creatorsapi.core.transport import AsyncTransport
     from creatorsapi_python_sdk.models.condition import Condition
     from creatorsapi_python_sdk.models.delivery_flag import DeliveryFlag
     from creatorsapi_python_sdk.models.sort_by import SortBy
@@ -55,12 +109,19 @@ ENDPOINT_GET_ITEMS = "/catalog/v1/getItems"
 ENDPOINT_SEARCH_ITEMS = "/catalog/v1/searchItems"
 ENDPOINT_GET_VARIATIONS = "/catalog/v1/getVariations"
 ENDPOINT_GET_BROWSE_NODES = "/catalog/v1/getBrowseNodes"
+OPERATIONS = {
+    ENDPOINT_GET_ITEMS: "GetItems",
+    ENDPOINT_SEARCH_ITEMS: "SearchItems",
+    ENDPOINT_GET_VARIATIONS: "GetVariations",
+    ENDPOINT_GET_BROWSE_NODES: "GetBrowseNodes",
+}
 
 # TypeVar for generic resource handling
 ResourceT = TypeVar("ResourceT", bound=Enum)
+T = TypeVar("T")
 
 
-class AsyncAmazonCreatorsApi:
+class AsyncAmazonCreatorsApi(AsyncRequestPipeline):
     """Async version of Amazon Creators API wrapper.
 
     Provides async methods to get information from Amazon using the Creators API.
@@ -104,6 +165,40 @@ class AsyncAmazonCreatorsApi:
         country: Country code (e.g., "ES", "US"). Used to determine marketplace.
         marketplace: Marketplace URL (e.g., "www.amazon.es"). Overrides country.
         throttling: Wait time in seconds between API calls. Defaults to 1 second.
+        token_store: Store used to share OAuth2 tokens with other clients, processes
+            and restarts, e.g. ``FileTokenStore``. Defaults to no sharing.
+        http2: Multiplex concurrent requests over HTTP/2 connections. Requires the
+            ``http2`` extra. Defaults to False.
+        max_connections: Maximum number of open connections. Defaults to 100.
+        max_concurrent_streams: Maximum number of requests in flight at the same
+            time. Defaults to no limit.
+        retry_policy: Policy used to retry requests failing with transient errors,
+            like 429, 5xx or connection errors, including httpx transport errors.
+            Defaults to no retries.
+        hedging: Policy used to send a duplicate request when a request is slower
+            than a percentile of the observed latencies, using the first response.
+            Duplicates are throttled like any other request. Defaults to no
+            hedging.
+        circuit_breakers: Circuit breakers used to fail fast with
+            ``CircuitBreakerOpenError`` while the marketplace is failing or slow.
+            Share the registry between clients to share the circuit breakers.
+            Defaults to no circuit breaker.
+        transport: Async transport sending the requests, including the OAuth2
+            token requests, e.g. an ``AsyncRecordingTransport`` or an
+            ``AsyncReplayTransport``. Defaults to httpx.
+        hooks: Callbacks called during the lifecycle of the requests with the
+            time spent throttling, getting the OAuth2 token, sending and
+            deserializing them. Defaults to no hooks.
+        tracer_provider: OpenTelemetry tracer provider used to trace the calls,
+            with a span for every call and child spans for its requests, retries
+            and token refreshes. Defaults to no tracing.
+        quota: Daily quota counting every request sent, raising
+            ``QuotaExceededError`` when the quota of the priority of the
+            request is spent. Defaults to no quota.
+        scheduler: Scheduler sharing the throttling between the clients of the
+            credential, sending the waiting requests by priority instead of
+            first come first served. Overrides ``throttling``. Defaults to no
+            scheduler.
 
     Raises:
         InvalidArgumentError: If neither country nor marketplace is provided.
@@ -112,6 +207,18 @@ class AsyncAmazonCreatorsApi:
 
     """
 
+    FAILOVER_ERRORS: ClassVar[tuple[type[Exception], ...]] = (
+        AssociateValidationError,
+        QuotaExceededError,
+        TooManyRequestsError,
+    )
+    """Errors of a credential making ``CredentialPool`` fail over to another one."""
+
+    _DEADLINE_ERROR = DeadlineExceededError
+    _QUOTA_ERROR = QuotaExceededError
+    _CIRCUIT_BREAKER_ERROR = CircuitBreakerOpenError
+    _TRANSPORT_ERRORS = (httpx.TransportError,)
+
     def __init__(
         self,
         credential_id: str,
@@ -121,6 +228,19 @@ class AsyncAmazonCreatorsApi:
         country: CountryCode | None = None,
         marketplace: str | None = None,
         throttling: float = DEFAULT_THROTTLING,
+        token_store: TokenStore | None = None,
+        *,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_concurrent_streams: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        transport: AsyncTransport | None = None,
+        hooks: EventHooks | None = None,
+        tracer_provider: Any = None,
+        quota: QuotaTracker | None = None,
+        scheduler: RequestScheduler | None = None,
     ) -> None:
         """Initialize the async Amazon Creators API client."""
         # Validate version early to fail fast (before token manager initialization)
@@ -133,16 +253,34 @@ class AsyncAmazonCreatorsApi:
         self._throttle_lock: asyncio.Lock | None = None
         self.tag = tag
         self.throttling = float(throttling)
+        self.retry_policy = retry_policy
+        self.hedging = hedging
+        self.hooks = hooks
+        self.quota = quota
+        self.scheduler = scheduler
+        self._tracer = get_tracer(tracer_provider)
+        self._latency_trackers: dict[str, LatencyTracker] = {}
 
         # Determine marketplace from country or direct value
         self.marketplace = validate_and_get_marketplace(country, marketplace)
+        self.circuit_breaker = (
+            circuit_breakers.get(self.marketplace)
+            if circuit_breakers is not None
+            else None
+        )
 
         # HTTP client and token manager (initialized lazily or via context manager)
+        self._http2 = http2
+        self._max_connections = max_connections
+        self._max_concurrent_streams = max_concurrent_streams
+        self._transport = transport
         self._http_client: AsyncHttpClient | None = None
         self._token_manager = AsyncOAuth2TokenManager(
             credential_id=credential_id,
             credential_secret=credential_secret,
             version=version,
+            token_store=token_store,
+            transport=transport,
         )
         self._owns_client = False
 
@@ -163,7 +301,7 @@ class AsyncAmazonCreatorsApi:
 
     async def __aenter__(self) -> Self:
         """Enter async context manager, creating a persistent HTTP client."""
-        self._http_client = AsyncHttpClient(host=API_HOST)
+        self._http_client = self._create_http_client()
         await self._http_client.__aenter__()
         self._owns_client = True
         return self
@@ -174,12 +312,14 @@ class AsyncAmazonCreatorsApi:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit async context manager, closing the HTTP client."""
+        """Exit async context manager, closing the HTTP client and the store thread."""
+        self._token_manager.close()
         if self._http_client is not None and self._owns_client:
             await self._http_client.__aexit__(exc_type, exc_val, exc_tb)
             self._http_client = None
             self._owns_client = False
 
+    @traced
     async def get_items(
         self,
         items: str | list[str],
@@ -187,7 +327,9 @@ class AsyncAmazonCreatorsApi:
         currency_of_preference: str | None = None,
         languages_of_preference: list[str] | None = None,
         resources: list[GetItemsResource] | None = None,
-    ) -> list[Item]:
+        *,
+        timeout: float | None = None,
+    ) -> ResultList[Item]:
         """Get items information from Amazon.
 
         Args:
@@ -197,13 +339,17 @@ class AsyncAmazonCreatorsApi:
             currency_of_preference: ISO 4217 currency code for prices.
             languages_of_preference: Languages in order of preference.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
-            List of Item objects with Amazon information.
+            List of Item objects with Amazon information. The ``metadata``
+            attribute of the list contains the retries made for the request.
 
         Raises:
             ItemsNotFoundError: If no items are found.
             InvalidArgumentError: If parameters are invalid.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
@@ -223,15 +369,21 @@ class AsyncAmazonCreatorsApi:
         if languages_of_preference is not None:
             request_body["languagesOfPreference"] = languages_of_preference
 
-        response = await self._make_request(ENDPOINT_GET_ITEMS, request_body)
+        metadata = ResultMetadata()
+        chunk = metadata.add_chunk(item_ids)
 
-        items_result = response.get("itemsResult")
-        if items_result is None or items_result.get("items") is None:
-            msg = "No items have been found"
-            raise ItemsNotFoundError(msg)
+        def deserialize(response: dict[str, Any]) -> ResultList[Item]:
+            items_result = response.get("itemsResult")
+            if items_result is None or items_result.get("items") is None:
+                msg = "No items have been found"
+                raise ItemsNotFoundError(msg)
+            return ResultList(self._deserialize_items(items_result["items"]), metadata)
 
-        return self._deserialize_items(items_result["items"])
+        return await self._make_request(
+            ENDPOINT_GET_ITEMS, request_body, deserialize, chunk, timeout=timeout
+        )
 
+    @traced
     async def search_items(  # noqa: PLR0912, C901
         self,
         keywords: str | None = None,
@@ -254,6 +406,8 @@ class AsyncAmazonCreatorsApi:
         min_reviews_rating: int | None = None,
         sort_by: SortBy | None = None,
         resources: list[SearchItemsResource] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> SearchResult:
         """Search for items on Amazon based on a search query.
 
@@ -281,12 +435,15 @@ class AsyncAmazonCreatorsApi:
             min_reviews_rating: Min review rating (1-5).
             sort_by: Sort method for results.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
             SearchResult containing the list of items.
 
         Raises:
             ItemsNotFoundError: If no items are found.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
@@ -337,15 +494,53 @@ class AsyncAmazonCreatorsApi:
         if sort_by is not None:
             request_body["sortBy"] = sort_by.value
 
-        response = await self._make_request(ENDPOINT_SEARCH_ITEMS, request_body)
+        def deserialize(response: dict[str, Any]) -> SearchResult:
+            search_result = response.get("searchResult")
+            if search_result is None:
+                msg = "No items have been found"
+                raise ItemsNotFoundError(msg)
+            return self._deserialize_search_result(search_result)
 
-        search_result = response.get("searchResult")
-        if search_result is None:
-            msg = "No items have been found"
-            raise ItemsNotFoundError(msg)
+        return await self._make_request(
+            ENDPOINT_SEARCH_ITEMS, request_body, deserialize, timeout=timeout
+        )
+
+    async def iter_search_items(
+        self, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> AsyncGenerator[Item, None]:
+        """Search for items on Amazon, yielding the items of all the pages.
+
+        The pages are requested as the items are consumed, a few at a time, until
+        the total result count of the search or the 10 pages allowed by the API
+        are exhausted. Items returned in several pages are only yielded once.
+
+        Args:
+            prefetch: Number of pages requested at the same time, throttled as
+                usual. Defaults to 2.
+            **kwargs: Arguments of ``search_items``, except ``item_page``.
 
-        return self._deserialize_search_result(search_result)
+        Yields:
+            The items found, in the order of the pages.
 
+        Raises:
+            ItemsNotFoundError: If no items are found.
+            DeadlineExceededError: If the timeout of a page expires.
+
+        """
+        page_size = kwargs.get("item_count") or DEFAULT_PAGE_SIZE
+        pages = async_iter_pages(
+            lambda page: self.search_items(item_page=page, **kwargs),
+            lambda result: count_pages(result.total_result_count, page_size),
+            max_pages=MAX_SEARCH_PAGES,
+            prefetch=prefetch,
+            end_errors=(ItemsNotFoundError,),
+        )
+        seen: set[str] = set()
+        async for page in pages:
+            for item in iter_new_items(page.items, seen):
+                yield item
+
+    @traced
     async def get_variations(
         self,
         asin: str,
@@ -355,23 +550,28 @@ class AsyncAmazonCreatorsApi:
         currency_of_preference: str | None = None,
         languages_of_preference: list[str] | None = None,
         resources: list[GetVariationsResource] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> VariationsResult:
         """Return variations of a product (different sizes, colors, etc.).
 
         Args:
             asin: The ASIN or Amazon product URL of the product.
             variation_count: Number of variations to return (1-10). Defaults to 10.
-            variation_page: Page of variations to return (1-10). Defaults to 1.
+            variation_page: Page of variations to return, starting at 1. Defaults to 1.
             condition: Filter offers by condition type.
             currency_of_preference: ISO 4217 currency code for prices.
             languages_of_preference: Languages in order of preference.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
             VariationsResult containing the list of variations.
 
         Raises:
             ItemsNotFoundError: If no variations are found.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
@@ -396,20 +596,82 @@ class AsyncAmazonCreatorsApi:
         if languages_of_preference is not None:
             request_body["languagesOfPreference"] = languages_of_preference
 
-        response = await self._make_request(ENDPOINT_GET_VARIATIONS, request_body)
+        def deserialize(response: dict[str, Any]) -> VariationsResult:
+            variations_result = response.get("variationsResult")
+            if variations_result is None:
+                msg = "No variations have been found"
+                raise ItemsNotFoundError(msg)
+            return self._deserialize_variations_result(variations_result)
+
+        return await self._make_request(
+            ENDPOINT_GET_VARIATIONS, request_body, deserialize, timeout=timeout
+        )
+
+    async def iter_variations(
+        self, asin: str, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> AsyncGenerator[Item, None]:
+        """Return the variations of all the pages of a product, as they arrive.
+
+        The page count of the first page tells how many pages to request,
+        ``prefetch`` at a time and throttled as usual, while the variations of
+        the previous ones are consumed.
+
+        Args:
+            asin: The ASIN or Amazon product URL of the product.
+            prefetch: Number of pages requested at the same time. Defaults to 2.
+            **kwargs: Arguments of ``get_variations``, except ``variation_page``.
+
+        Yields:
+            The variations, in the order of the pages.
+
+        Raises:
+            ItemsNotFoundError: If no variations are found.
+            DeadlineExceededError: If the timeout of a page expires.
+
+        """
+        seen: set[str] = set()
+        async for page in self._iter_variations_pages(asin, prefetch, kwargs):
+            for item in iter_new_items(page.items, seen):
+                yield item
+
+    async def get_all_variations(
+        self, asin: str, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> VariationsResult:
+        """Return the variations of all the pages of a product in one result.
 
-        variations_result = response.get("variationsResult")
-        if variations_result is None:
-            msg = "No variations have been found"
-            raise ItemsNotFoundError(msg)
+        Same as ``iter_variations``, but waiting for all the pages and returning
+        the first one with the variations of all of them.
 
-        return self._deserialize_variations_result(variations_result)
+        Args:
+            asin: The ASIN or Amazon product URL of the product.
+            prefetch: Number of pages requested at the same time. Defaults to 2.
+            **kwargs: Arguments of ``get_variations``, except ``variation_page``.
+
+        Returns:
+            VariationsResult containing all the variations.
 
+        Raises:
+            ItemsNotFoundError: If no variations are found.
+            DeadlineExceededError: If the timeout of a page expires.
+
+        """
+        pages = [
+            page async for page in self._iter_variations_pages(asin, prefetch, kwargs)
+        ]
+        seen: set[str] = set()
+        pages[0].items = [
+            item for page in pages for item in iter_new_items(page.items, seen)
+        ]
+        return pages[0]
+
+    @traced
     async def get_browse_nodes(
         self,
         browse_node_ids: list[str],
         languages_of_preference: list[str] | None = None,
         resources: list[GetBrowseNodesResource] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> list[BrowseNode]:
         """Return browse node information including name, children, and ancestors.
 
@@ -417,12 +679,15 @@ class AsyncAmazonCreatorsApi:
             browse_node_ids: List of browse node IDs.
             languages_of_preference: Languages in order of preference.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
             List of BrowseNode objects.
 
         Raises:
             ItemsNotFoundError: If no browse nodes are found.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
@@ -437,56 +702,212 @@ class AsyncAmazonCreatorsApi:
         if languages_of_preference is not None:
             request_body["languagesOfPreference"] = languages_of_preference
 
-        response = await self._make_request(ENDPOINT_GET_BROWSE_NODES, request_body)
-
-        browse_nodes_result = response.get("browseNodesResult")
-        if (
-            browse_nodes_result is None
-            or browse_nodes_result.get("browseNodes") is None
-        ):
-            msg = "No browse nodes have been found"
-            raise ItemsNotFoundError(msg)
-
-        return self._deserialize_browse_nodes(browse_nodes_result["browseNodes"])
-
-    async def _throttle(self) -> None:
-        """Wait for the throttling interval to elapse since the last API call.
-
-        Uses asyncio.Lock to prevent race conditions when multiple coroutines
-        attempt to make concurrent requests.
-        """
-        # Lazy initialization of the lock (ensures event loop is active)
-        if self._throttle_lock is None:
-            self._throttle_lock = asyncio.Lock()
+        def deserialize(response: dict[str, Any]) -> list[BrowseNode]:
+            browse_nodes_result = response.get("browseNodesResult")
+            if (
+                browse_nodes_result is None
+                or browse_nodes_result.get("browseNodes") is None
+            ):
+                msg = "No browse nodes have been found"
+                raise ItemsNotFoundError(msg)
+            return self._deserialize_browse_nodes(browse_nodes_result["browseNodes"])
+
+        return await self._make_request(
+            ENDPOINT_GET_BROWSE_NODES, request_body, deserialize, timeout=timeout
+        )
 
-        async with self._throttle_lock:
-            wait_time = self.throttling - (time.time() - self._last_query_time)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            self._last_query_time = time.time()
+    def _iter_variations_pages(
+        self, asin: str, prefetch: int, kwargs: dict[str, Any]
+    ) -> AsyncGenerator[VariationsResult, None]:
+        """Return the pages of variations of an item, up to its page count."""
+        asin = get_asin(asin)
+        return async_iter_pages(
+            lambda page: self.get_variations(asin, variation_page=page, **kwargs),
+            get_variations_page_count,
+            prefetch=prefetch,
+            end_errors=(ItemsNotFoundError,),
+        )
 
     async def _make_request(
         self,
         endpoint: str,
         body: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Make an API request with authentication and throttling.
+        deserialize: Callable[[dict[str, Any]], T],
+        chunk: ChunkMetadata | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> T:
+        """Make an API request with authentication, throttling and retries.
 
         Args:
             endpoint: API endpoint path.
             body: Request body.
+            deserialize: Function building the result from the parsed JSON
+                response.
+            chunk: Metadata where the retries and hedged requests are recorded.
+            timeout: Maximum seconds for the request, including throttling
+                waits, retries and the token refresh.
 
         Returns:
-            Parsed JSON response.
+            The result built from the response.
 
         Raises:
             Various exceptions based on API errors.
 
         """
-        await self._throttle()
+        event = self._create_event(OPERATIONS[endpoint])
+
+        async def make_request() -> T:
+            response = await self._send_with_retries(
+                endpoint, body, chunk, event, timeout
+            )
+            with measure(event, DESERIALIZE):
+                return deserialize(response)
+
+        item_ids = chunk.item_ids if chunk is not None else None
+        with trace_request(self._tracer, event, item_ids):
+            return await async_call_with_hooks(make_request, event)
+
+    async def _send_with_retries(  # noqa: C901
+        self,
+        endpoint: str,
+        body: dict[str, Any],
+        chunk: ChunkMetadata | None,
+        event: RequestEvent | None,
+        timeout: float | None,
+    ) -> dict[str, Any]:
+        """Send an API request with throttling, retries and hedging.
+
+        Returns:
+            Parsed JSON response.
+
+        """
+        policy = self.retry_policy
+        if policy is not None:
+            policy = policy.with_exceptions(httpx.TransportError)
+
+        def on_retry(_retry: int, error: BaseException, delay: float) -> None:
+            if chunk is not None:
+                chunk.retries += 1
+            if event is not None:
+                event.retry(error, delay)
+
+        def on_hedge() -> None:
+            if chunk is not None:
+                chunk.hedges += 1
+
+        deadline = Deadline.from_timeout(timeout)
+
+        async def send() -> dict[str, Any]:
+            if event is not None:
+                event.start_attempt()
+            with trace_retry(self._tracer, event):
+                self._check_circuit_breaker(reserve=False)
+                await self._acquire_quota(deadline)
+                try:
+                    await self._throttle(deadline, event)
+                    self._check_circuit_breaker()
+                except BaseException:
+                    # The request is not sent, so it does not count in the quota
+                    await self._release_quota()
+                    raise
+                with self._track_request():
+                    return await self._hedge_request(
+                        endpoint, body, event, deadline, on_hedge
+                    )
+
+        request = async_call_with_retry(send, policy, on_retry, deadline)
+        if deadline is None:
+            return await request
+
+        try:
+            return await asyncio.wait_for(request, deadline.remaining())
+        except asyncio.TimeoutError as exc:
+            msg = f"The request did not complete in {deadline.timeout} seconds"
+            raise DeadlineExceededError(msg) from exc
+
+    async def _hedge_request(
+        self,
+        endpoint: str,
+        body: dict[str, Any],
+        event: RequestEvent | None,
+        deadline: Deadline | None,
+        on_hedge: Callable[[], None],
+    ) -> dict[str, Any]:
+        """Send an API request, and a duplicate if it is slow with hedging.
+
+        With hedging, the first request and the duplicate are recorded in events
+        of their own, and only the one whose response is used, or the first one
+        if both fail, is merged into the event of the request.
+        """
+        primary_event, hedge_event = (
+            (event.create_attempt(), event.create_attempt())
+            if event is not None and self.hedging is not None
+            else (event, event)
+        )
 
+        async def send(
+            attempt_event: RequestEvent | None,
+        ) -> tuple[dict[str, Any], RequestEvent | None]:
+            response = await self._send_request(endpoint, body, attempt_event)
+            return response, attempt_event
+
+        def record(attempt_event: RequestEvent | None) -> None:
+            # Without hedging, the request is recorded in the event directly
+            if event is None or attempt_event is None or attempt_event is event:
+                return
+            event.merge_attempt(attempt_event)
+
+        async def before_hedge() -> None:
+            await self._acquire_quota(deadline)
+            try:
+                await self._throttle(deadline, hedge_event)
+            except BaseException:
+                await self._release_quota()
+                raise
+
+        try:
+            response, winner = await hedge_request(
+                lambda: send(primary_event),
+                self.hedging,
+                self._get_latency_tracker(endpoint),
+                before_hedge=before_hedge,
+                on_hedge=on_hedge,
+                hedge=lambda: send(hedge_event),
+            )
+        except Exception:
+            record(primary_event)
+            raise
+        record(winner)
+        return response
+
+    def _get_latency_tracker(self, endpoint: str) -> LatencyTracker:
+        """Return the tracker with the latencies observed for an endpoint."""
+        tracker = self._latency_trackers.get(endpoint)
+        if tracker is None:
+            window_size = (
+                self.hedging.window_size if self.hedging else DEFAULT_WINDOW_SIZE
+            )
+            tracker = LatencyTracker(window_size)
+            self._latency_trackers[endpoint] = tracker
+        return tracker
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        body: dict[str, Any],
+        event: RequestEvent | None = None,
+    ) -> dict[str, Any]:
+        """Send a single API request with authentication."""
         # Get auth token
-        token = await self._token_manager.get_token()
+        refresh: AbstractContextManager[Any] = contextlib.nullcontext()
+        if event is not None:
+            hit = self._token_manager.is_token_valid()
+            event.record_cache(TOKEN, hit=hit)
+            if not hit:
+                refresh = trace_token_refresh()
+        with measure(event, TOKEN), refresh:
+            token = await self._token_manager.get_token()
 
         headers = {
             "Authorization": self._build_authorization_header(token),
@@ -494,18 +915,36 @@ class AsyncAmazonCreatorsApi:
             "x-marketplace": self.marketplace,
         }
 
+        if event is not None:
+            event.set_request_body(body)
+
         # Use persistent client if available, otherwise create a new one
-        if self._http_client is not None:
-            response = await self._http_client.post(endpoint, headers, body)
-        else:
-            async with AsyncHttpClient(host=API_HOST) as client:
-                response = await client.post(endpoint, headers, body)
+        with measure(event, NETWORK):
+            if self._http_client is not None:
+                response = await self._http_client.post(endpoint, headers, body)
+            else:
+                async with self._create_http_client() as client:
+                    response = await client.post(endpoint, headers, body)
+
+        if event is not None:
+            event.set_response(response.status_code, response.body)
 
         # Handle errors
         if response.status_code != 200:  # noqa: PLR2004
             self._handle_error_response(response.status_code, response.text)
 
-        return response.json()
+        with measure(event, DESERIALIZE):
+            return response.json()
+
+    def _create_http_client(self) -> AsyncHttpClient:
+        """Create an HTTP client with the configured connection settings."""
+        return AsyncHttpClient(
+            host=API_HOST,
+            http2=self._http2,
+            max_connections=self._max_connections,
+            max_concurrent_streams=self._max_concurrent_streams,
+            transport=self._transport,
+        )
 
     def _build_authorization_header(self, token: str) -> str:
         """Build the version-appropriate Authorization header."""
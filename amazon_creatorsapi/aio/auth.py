@@ -6,10 +6,21 @@ Handles OAuth2 token acquisition, caching, and automatic refresh using async HTT
 from __future__ import annotations
 
 import asyncio
+import functools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
+from amazon_creatorsapi.aio.transport import HttpxTransportAdapter
 from amazon_creatorsapi.errors import AuthenticationError
 
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from amazon_creatorsapi.core.token_store import TokenStore
+    from amazon_creatorsapi.core.transport import AsyncTransport
+
 try:
     import httpx
 except ImportError as exc:  # pragma: no cover
@@ -19,6 +30,7 @@ except ImportError as exc:  # pragma: no cover
     )
     raise ImportError(msg) from exc
 
+T = TypeVar("T")
 
 # OAuth2 constants
 COGNITO_SCOPE = "creatorsapi/default"
@@ -49,31 +61,40 @@ class AsyncOAuth2TokenManager:
     - Token caching with automatic expiration tracking
     - Automatic token refresh when expired
     - Async-safe token refresh with locking
+    - Optional token sharing with other clients and processes via a token store
 
     Args:
         credential_id: OAuth2 credential ID.
         credential_secret: OAuth2 credential secret.
         version: API version (determines auth endpoint).
         auth_endpoint: Optional custom auth endpoint URL.
+        token_store: Optional store used to share tokens.
+        transport: Optional transport sending the token requests instead of httpx.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         credential_id: str,
         credential_secret: str,
         version: str,
         auth_endpoint: str | None = None,
+        token_store: TokenStore | None = None,
+        *,
+        transport: AsyncTransport | None = None,
     ) -> None:
         """Initialize the async OAuth2 token manager."""
         self._credential_id = credential_id
         self._credential_secret = credential_secret
         self._version = version
         self._auth_endpoint = self._determine_auth_endpoint(version, auth_endpoint)
+        self._token_store = token_store
+        self._transport = transport
 
         self._access_token: str | None = None
         self._expires_at: float | None = None
         self._lock: asyncio.Lock | None = None
+        self._store_executor: ThreadPoolExecutor | None = None
 
     def _determine_auth_endpoint(
         self,
@@ -153,7 +174,38 @@ class AsyncOAuth2TokenManager:
                     msg = "Token should be valid at this point"
                     raise AuthenticationError(msg)
                 return self._access_token
-            return await self.refresh_token()
+            if self._token_store is None:
+                return await self.refresh_token()
+            # Hold the store lock across reading, refreshing and saving the token,
+            # so only one of the processes sharing the store requests a new one
+            store_lock = self._token_store.locked()
+            await self._acquire_store_lock(store_lock)
+            try:
+                stored_token = await self.load_stored_token()
+                if stored_token is not None:
+                    return stored_token
+                return await self.refresh_token()
+            finally:
+                await asyncio.shield(
+                    self._run_in_store_thread(store_lock.__exit__, None, None, None)
+                )
+
+    async def load_stored_token(self) -> str | None:
+        """Load a valid token from the token store, if one is configured.
+
+        Returns:
+            The stored access token, or None if no valid token is stored.
+
+        """
+        if self._token_store is None:
+            return None
+        stored_token = await self._run_in_store_thread(
+            self._token_store.get, self._credential_id, self._version
+        )
+        if stored_token is None:
+            return None
+        self._access_token, self._expires_at = stored_token
+        return self._access_token
 
     def is_token_valid(self) -> bool:
         """Check if the current token is valid and not expired.
@@ -186,7 +238,7 @@ class AsyncOAuth2TokenManager:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._create_client() as client:
                 if self.is_lwa():
                     response = await client.post(
                         self._auth_endpoint,
@@ -219,6 +271,14 @@ class AsyncOAuth2TokenManager:
             # Set expiration time with buffer to avoid edge cases
             expires_in = data.get("expires_in", 3600)
             self._expires_at = time.time() + expires_in - TOKEN_EXPIRATION_BUFFER
+            if self._token_store is not None:
+                await self._run_in_store_thread(
+                    self._token_store.set,
+                    self._credential_id,
+                    self._version,
+                    self._access_token,
+                    self._expires_at,
+                )
 
         except httpx.RequestError as exc:
             self.clear_token()
@@ -231,6 +291,64 @@ class AsyncOAuth2TokenManager:
             raise AuthenticationError(msg)
         return self._access_token
 
+    async def _acquire_store_lock(
+        self, store_lock: AbstractContextManager[Any]
+    ) -> None:
+        """Acquire the lock of the token store in the store thread.
+
+        If the caller is cancelled while the store thread waits for the lock, the
+        lock is released once the thread takes it, as the caller will not.
+        """
+        guard = threading.Lock()
+        acquired = abandoned = False
+
+        def acquire() -> None:
+            nonlocal acquired
+            store_lock.__enter__()
+            with guard:
+                if not abandoned:
+                    acquired = True
+                    return
+            store_lock.__exit__(None, None, None)
+
+        try:
+            await self._run_in_store_thread(acquire)
+        except asyncio.CancelledError:
+            with guard:
+                abandoned = True
+            if acquired:
+                await asyncio.shield(
+                    self._run_in_store_thread(store_lock.__exit__, None, None, None)
+                )
+            raise
+
+    async def _run_in_store_thread(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a call to the token store without blocking the event loop.
+
+        Stores may lock and read files, so their calls run in a thread of the
+        manager. It is always the same thread, as the store lock must be released
+        by the thread that acquired it.
+        """
+        if self._store_executor is None:
+            self._store_executor = ThreadPoolExecutor(
+                1, thread_name_prefix="token-store"
+            )
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args)
+        return await loop.run_in_executor(self._store_executor, call)
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the httpx client sending the token request."""
+        if self._transport is None:
+            return httpx.AsyncClient()
+        return httpx.AsyncClient(transport=HttpxTransportAdapter(self._transport))
+
+    def close(self) -> None:
+        """Shut down the thread running the calls to the token store."""
+        if self._store_executor is not None:
+            self._store_executor.shutdown(wait=False)
+            self._store_executor = None
+
     def clear_token(self) -> None:
         """Clear the cached token, forcing a refresh on the next get_token() call."""
         self._access_token = None
@@ -5,6 +5,7 @@ Provides an async HTTP client using httpx for making API requests.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from importlib.metadata import version
@@ -12,9 +13,13 @@ from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
+from amazon_creatorsapi.aio.transport import HttpxTransportAdapter
+
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from amazon_creatorsapi.core.transport import AsyncTransport
+
 try:
     import httpx
 except ImportError as exc:  # pragma: no cover
@@ -27,6 +32,9 @@ except ImportError as exc:  # pragma: no cover
 
 DEFAULT_HOST = "https://creatorsapi.amazon"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
 VERSION = version("python-amazon-paapi")
 USER_AGENT = f"python-amazon-paapi/{VERSION} (async)"
 
@@ -62,30 +70,87 @@ class AsyncHttpClient:
     The context manager approach is more efficient when making multiple
     requests in quick succession due to HTTP connection pooling.
 
+    With ``http2=True`` concurrent requests are multiplexed as streams over a few
+    connections instead of opening one connection per in-flight request. It
+    requires the ``h2`` package: ``pip install python-amazon-paapi[http2]``.
+
     Args:
         host: Base URL for API requests. Defaults to Amazon Creators API.
         timeout: Request timeout in seconds. Defaults to 30.
+        http2: Negotiate HTTP/2 with the server. Defaults to False.
+        max_connections: Maximum number of open connections. Defaults to 100.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+            Defaults to 20.
+        keepalive_expiry: Seconds an idle connection is kept alive. Defaults to 5.
+        max_concurrent_streams: Maximum number of requests in flight at the same
+            time, additional requests wait for a free slot. Defaults to no limit.
+        transport: Transport sending the requests instead of httpx, e.g. to
+            record or replay them. Defaults to httpx.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         host: str = DEFAULT_HOST,
         timeout: float = DEFAULT_TIMEOUT,
+        *,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        max_concurrent_streams: int | None = None,
+        transport: AsyncTransport | None = None,
     ) -> None:
         """Initialize the async HTTP client."""
         self._host = host
         self._timeout = timeout
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._max_concurrent_streams = max_concurrent_streams
+        self._transport = transport
+        self._streams_semaphore: asyncio.Semaphore | None = None
         self._client: httpx.AsyncClient | None = None
         self._owns_client = False
 
-    async def __aenter__(self) -> Self:
-        """Enter async context manager, creating a persistent client."""
-        self._client = httpx.AsyncClient(
+    @property
+    def streams_semaphore(self) -> asyncio.Semaphore | None:
+        """Lazy initialization of the semaphore limiting concurrent requests.
+
+        Created on first access, inside the running event loop, to support
+        Python 3.9 where asyncio primitives bind to the loop on creation.
+
+        Returns:
+            The semaphore, or None if concurrent requests are not limited.
+
+        """
+        if self._max_concurrent_streams is None:
+            return None
+        if self._streams_semaphore is None:
+            self._streams_semaphore = asyncio.Semaphore(self._max_concurrent_streams)
+        return self._streams_semaphore
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the underlying httpx client with the configured settings."""
+        return httpx.AsyncClient(
             base_url=self._host,
             timeout=self._timeout,
             headers={"User-Agent": USER_AGENT},
+            http2=self._http2,
+            limits=self._limits,
+            transport=(
+                HttpxTransportAdapter(self._transport)
+                if self._transport is not None
+                else None
+            ),
         )
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager, creating a persistent client."""
+        self._client = self._create_client()
         self._owns_client = True
         return self
 
@@ -120,24 +185,12 @@ class AsyncHttpClient:
         """
         all_headers = {"User-Agent": USER_AGENT, **headers}
 
-        if self._client is not None:
-            # Use persistent client (context manager mode)
-            response = await self._client.post(
-                path,
-                headers=all_headers,
-                json=body,
-            )
+        semaphore = self.streams_semaphore
+        if semaphore is None:
+            response = await self._post(path, all_headers, body)
         else:
-            # Create a new client for this request (standalone mode)
-            async with httpx.AsyncClient(
-                base_url=self._host,
-                timeout=self._timeout,
-            ) as client:
-                response = await client.post(
-                    path,
-                    headers=all_headers,
-                    json=body,
-                )
+            async with semaphore:
+                response = await self._post(path, all_headers, body)
 
         return AsyncHttpResponse(
             status_code=response.status_code,
@@ -145,3 +198,18 @@ class AsyncHttpClient:
             body=response.content,
             text=response.text,
         )
+
+    async def _post(
+        self,
+        path: str,
+        headers: dict[str, str],
+        body: dict[str, Any],
+    ) -> httpx.Response:
+        """Send a POST request with the persistent or a temporary httpx client."""
+        if self._client is not None:
+            # Use persistent client (context manager mode)
+            return await self._client.post(path, headers=headers, json=body)
+
+        # Create a new client for this request (standalone mode)
+        async with self._create_client() as client:
+            return await client.post(path, headers=headers, json=body)
@@ -0,0 +1,216 @@
+"""Run the same async Creators API calls in several marketplaces concurrently."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+import httpx
+
+from amazon_creatorsapi.aio.api import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.aio.transport import HttpxTransport
+from amazon_creatorsapi.core.constants import DEFAULT_THROTTLING
+from amazon_creatorsapi.core.fanout import MarketplaceResults, async_fan_out
+from amazon_creatorsapi.core.marketplaces import MARKETPLACES
+from amazon_creatorsapi.core.token_store import MemoryTokenStore
+from amazon_creatorsapi.errors import InvalidArgumentError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping, Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from amazon_creatorsapi.core.marketplaces import CountryCode
+    from amazon_creatorsapi.core.results import ResultList
+    from amazon_creatorsapi.core.token_store import TokenStore
+    from creatorsapi_python_sdk.models.browse_node import BrowseNode
+    from creatorsapi_python_sdk.models.item import Item
+    from creatorsapi_python_sdk.models.search_result import SearchResult
+    from creatorsapi_python_sdk.models.variations_result import VariationsResult
+
+T = TypeVar("T")
+
+
+class AsyncMultiMarketplaceApi:
+    """Runs the same calls in several marketplaces concurrently.
+
+    Creates an ``AsyncAmazonCreatorsApi`` for every country, each one with its
+    own throttling. The clients share the OAuth2 token of the credential and,
+    within the async context manager, a single httpx client with its
+    connections. The calls are sent to all the marketplaces at the same time and
+    the results are returned by country code. The marketplaces where the call
+    fails are reported in the ``errors`` of the results, and the error is raised
+    only if it fails in all of them.
+
+    Args:
+        credential_id: Your Creators API credential ID.
+        credential_secret: Your Creators API credential secret.
+        version: API version for the region of the marketplaces.
+        tag: Your affiliate tracking id, or the tracking id of every country.
+        countries: Country codes of the marketplaces, e.g.
+            ``["ES", "DE", "FR", "IT", "UK"]``.
+        throttling: Wait time in seconds between API calls, or the wait time of
+            every country. Each marketplace is throttled independently. Defaults
+            to 1 second.
+        token_store: Store of the OAuth2 tokens. Defaults to a memory store
+            shared by the marketplaces.
+        kwargs: Other arguments of ``AsyncAmazonCreatorsApi`` used for all the
+            marketplaces, like ``retry_policy`` or ``hooks``.
+
+    Raises:
+        InvalidArgumentError: If a country code is not valid, or the tag or the
+            throttling of a country is missing.
+
+    Example:
+        >>> async with AsyncMultiMarketplaceApi(
+        ...     credential_id, credential_secret, "2.2", tags, ["ES", "DE", "FR"]
+        ... ) as api:
+        ...     items = await api.get_items(["B0DLFMFBJW"])
+        >>> items["DE"][0].offers_v2
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        credential_id: str,
+        credential_secret: str,
+        version: str,
+        tag: str | Mapping[str, str],
+        countries: Sequence[CountryCode],
+        *,
+        throttling: float | Mapping[str, float] = DEFAULT_THROTTLING,
+        token_store: TokenStore | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the clients of every marketplace."""
+        if not countries:
+            msg = "At least one country is required"
+            raise InvalidArgumentError(msg)
+        invalid = [country for country in countries if country not in MARKETPLACES]
+        if invalid:
+            msg = f"Country codes are not correct: {', '.join(invalid)}"
+            raise InvalidArgumentError(msg)
+        for name, values in (("tag", tag), ("throttling", throttling)):
+            if isinstance(values, (str, int, float)):
+                continue
+            missing = [
+                country for country in dict.fromkeys(countries) if country not in values
+            ]
+            if missing:
+                msg = f"Missing {name} for the countries: {', '.join(missing)}"
+                raise InvalidArgumentError(msg)
+
+        # Without a transport, the clients share the connections of one client
+        self._transport = HttpxTransport() if "transport" not in kwargs else None
+        kwargs.setdefault("transport", self._transport)
+        token_store = token_store if token_store is not None else MemoryTokenStore()
+        self.clients: dict[str, AsyncAmazonCreatorsApi] = {
+            country: AsyncAmazonCreatorsApi(
+                credential_id,
+                credential_secret,
+                version,
+                tag if isinstance(tag, str) else tag[country],
+                country,
+                throttling=(
+                    throttling
+                    if isinstance(throttling, (int, float))
+                    else throttling[country]
+                ),
+                token_store=token_store,
+                **kwargs,
+            )
+            for country in dict.fromkeys(countries)
+        }
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager, opening the shared connections."""
+        if self._transport is not None and self._transport.client is None:
+            self._transport.client = httpx.AsyncClient()
+            await self._transport.client.__aenter__()
+        for client in self.clients.values():
+            await client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the async context manager, closing the connections."""
+        for client in self.clients.values():
+            await client.__aexit__(exc_type, exc_val, exc_tb)
+        if self._transport is not None and self._transport.client is not None:
+            await self._transport.client.__aexit__(exc_type, exc_val, exc_tb)
+            self._transport.client = None
+
+    async def get_items(
+        self, items: str | list[str], **kwargs: Any
+    ) -> MarketplaceResults[ResultList[Item]]:
+        """Get items information from every marketplace.
+
+        Args:
+            items: One or more items, using ASIN or Amazon product URL.
+            kwargs: Other arguments of ``AsyncAmazonCreatorsApi.get_items``.
+
+        Returns:
+            The items of every marketplace by country code.
+
+        """
+        return await self._fan_out(lambda client: client.get_items(items, **kwargs))
+
+    async def search_items(self, **kwargs: Any) -> MarketplaceResults[SearchResult]:
+        """Search for items in every marketplace.
+
+        Args:
+            kwargs: Arguments of ``AsyncAmazonCreatorsApi.search_items``.
+
+        Returns:
+            The search results of every marketplace by country code.
+
+        """
+        return await self._fan_out(lambda client: client.search_items(**kwargs))
+
+    async def get_variations(
+        self, asin: str, **kwargs: Any
+    ) -> MarketplaceResults[VariationsResult]:
+        """Get the variations of an item in every marketplace.
+
+        Args:
+            asin: One item, using ASIN or Amazon product URL.
+            kwargs: Other arguments of ``AsyncAmazonCreatorsApi.get_variations``.
+
+        Returns:
+            The variations of every marketplace by country code.
+
+        """
+        return await self._fan_out(lambda client: client.get_variations(asin, **kwargs))
+
+    async def get_browse_nodes(
+        self, browse_node_ids: list[str], **kwargs: Any
+    ) -> MarketplaceResults[list[BrowseNode]]:
+        """Get the browse nodes of every marketplace.
+
+        Args:
+            browse_node_ids: List of browse node IDs.
+            kwargs: Other arguments of ``AsyncAmazonCreatorsApi.get_browse_nodes``.
+
+        Returns:
+            The browse nodes of every marketplace by country code.
+
+        """
+        return await self._fan_out(
+            lambda client: client.get_browse_nodes(browse_node_ids, **kwargs)
+        )
+
+    async def _fan_out(
+        self, call: Callable[[AsyncAmazonCreatorsApi], Awaitable[T]]
+    ) -> MarketplaceResults[T]:
+        """Run a call with the client of every marketplace."""
+        return await async_fan_out(
+            {
+                country: functools.partial(call, client)
+                for country, client in self.clients.items()
+            }
+        )
@@ -0,0 +1,99 @@
+"""Async transports for the async Amazon Creators API client.
+
+Provides ``HttpxTransport``, sending the requests with httpx, and the adapter
+plugging any ``AsyncTransport`` into the httpx clients used by the async client.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from amazon_creatorsapi.core.transport import (
+    TransportRequest,
+    TransportResponse,
+    get_decoded_headers,
+)
+
+if TYPE_CHECKING:
+    from amazon_creatorsapi.core.transport import AsyncTransport
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover
+    msg = (
+        "httpx is required for async support. "
+        "Install it with: pip install python-amazon-paapi[async]"
+    )
+    raise ImportError(msg) from exc
+
+
+class HttpxTransport:
+    """Async transport sending the requests with httpx.
+
+    Args:
+        client: httpx client used to send the requests. Defaults to a new client
+            per request.
+
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        """Initialize the transport."""
+        self.client = client
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request and return its response."""
+        if self.client is not None:
+            return await self._send(self.client, request)
+        async with httpx.AsyncClient() as client:
+            return await self._send(client, request)
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        response = await client.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            content=request.body or None,
+            timeout=request.timeout,
+        )
+        return TransportResponse(
+            status=response.status_code,
+            headers=get_decoded_headers(response.headers),
+            body=response.content,
+            reason=response.reason_phrase,
+        )
+
+
+class HttpxTransportAdapter(httpx.AsyncBaseTransport):
+    """httpx transport sending the requests of an httpx client through a transport.
+
+    Args:
+        transport: Async transport sending the requests.
+
+    """
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        """Initialize the adapter."""
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the httpx request through the transport."""
+        timeout = request.extensions.get("timeout", {})
+        response = await self.transport.send(
+            TransportRequest(
+                method=request.method,
+                url=str(request.url),
+                headers=dict(request.headers),
+                body=await request.aread(),
+                timeout=timeout.get("read"),
+            )
+        )
+        return httpx.Response(
+            response.status,
+            headers=response.headers,
+            content=response.body,
+            request=request,
+        )
@@ -5,15 +5,52 @@ A Python wrapper for the Amazon Creators API.
 
 from __future__ import annotations
 
+import contextlib
+import threading
 import time
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING, Any, ClassVar, NoReturn
 
 from amazon_creatorsapi.core.constants import DEFAULT_THROTTLING
+from amazon_creatorsapi.core.deadline import Deadline
 from amazon_creatorsapi.core.error_handling import handle_api_error
+from amazon_creatorsapi.core.hooks import (
+    BUILD,
+    DESERIALIZE,
+    NETWORK,
+    SERIALIZE,
+    TOKEN,
+    get_current_event,
+    measure,
+)
+from amazon_creatorsapi.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFETCH,
+    MAX_SEARCH_PAGES,
+    count_pages,
+    get_variations_page_count,
+    iter_new_items,
+    iter_pages,
+)
 from amazon_creatorsapi.core.parsers import get_asin, get_items_ids
+from amazon_creatorsapi.core.pipeline import RequestPipeline
 from amazon_creatorsapi.core.resources import get_all_resources
+from amazon_creatorsapi.core.results import ResultList, ResultMetadata
+from amazon_creatorsapi.core.tracing import (
+    get_tracer,
+    trace_token_refresh,
+    traced,
+)
+from amazon_creatorsapi.core.transport import TransportPoolManager
 from amazon_creatorsapi.core.validation import validate_and_get_marketplace
-from amazon_creatorsapi.errors import ItemsNotFoundError
+from amazon_creatorsapi.errors import (
+    AmazonCreatorsApiError,
+    AssociateValidationError,
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
+    ItemsNotFoundError,
+    QuotaExceededError,
+    TooManyRequestsError,
+)
 from creatorsapi_python_sdk.api.default_api import DefaultApi
 from creatorsapi_python_sdk.api_client import ApiClient
 from creatorsapi_python_sdk.exceptions import ApiException
@@ -37,7 +74,16 @@ from creatorsapi_python_sdk.models.search_items_request_content import (
 from creatorsapi_python_sdk.models.search_items_resource import SearchItemsResource
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from amazon_creatorsapi.core.circuit_breaker import CircuitBreakerRegistry
+    from amazon_creatorsapi.core.hooks import EventHooks
     from amazon_creatorsapi.core.marketplaces import CountryCode
+    from amazon_creatorsapi.core.quota import QuotaTracker
+    from amazon_creatorsapi.core.retry import RetryPolicy
+    from amazon_creatorsapi.core.scheduler import RequestScheduler
+    from amazon_creatorsapi.core.token_store import TokenStore
+    from amazon_creatorsapi.core.transport import Transport
     from creatorsapi_python_sdk.models.browse_node import BrowseNode
     from creatorsapi_python_sdk.models.condition import Condition
     from creatorsapi_python_sdk.models.delivery_flag import DeliveryFlag
@@ -47,7 +93,7 @@ if TYPE_CHECKING:
     from creatorsapi_python_sdk.models.variations_result import VariationsResult
 
 
-class AmazonCreatorsApi:
+class AmazonCreatorsApi(RequestPipeline):
     """Provides methods to get information from Amazon using the Creators API.
 
     Args:
@@ -58,6 +104,30 @@ class AmazonCreatorsApi:
         country: Country code (e.g., "ES", "US"). Used to determine marketplace.
         marketplace: Marketplace URL (e.g., "www.amazon.es"). Overrides country.
         throttling: Wait time in seconds between API calls. Defaults to 1 second.
+        token_store: Store used to share OAuth2 tokens with other clients, processes
+            and restarts, e.g. ``FileTokenStore``. Defaults to no sharing.
+        retry_policy: Policy used to retry requests failing with transient errors,
+            like 429, 5xx or connection errors. Defaults to no retries.
+        circuit_breakers: Circuit breakers used to fail fast with
+            ``CircuitBreakerOpenError`` while the marketplace is failing or slow.
+            Share the registry between clients to share the circuit breakers.
+            Defaults to no circuit breaker.
+        transport: Transport sending the requests, including the OAuth2 token
+            requests, e.g. a ``RecordingTransport`` or a ``ReplayTransport``.
+            Defaults to urllib3.
+        hooks: Callbacks called during the lifecycle of the requests with the
+            time spent throttling, building, serializing, getting the OAuth2
+            token, sending and deserializing them. Defaults to no hooks.
+        tracer_provider: OpenTelemetry tracer provider used to trace the calls,
+            with a span for every call and child spans for its requests, retries
+            and token refreshes. Defaults to no tracing.
+        quota: Daily quota counting every request sent, raising
+            ``QuotaExceededError`` when the quota of the priority of the
+            request is spent. Defaults to no quota.
+        scheduler: Scheduler sharing the throttling between the clients of the
+            credential, sending the waiting requests by priority instead of
+            first come first served. Overrides ``throttling``. Defaults to no
+            scheduler.
 
     Raises:
         InvalidArgumentError: If neither country nor marketplace is provided.
@@ -74,6 +144,18 @@ class AmazonCreatorsApi:
 
     """
 
+    FAILOVER_ERRORS: ClassVar[tuple[type[Exception], ...]] = (
+        AssociateValidationError,
+        QuotaExceededError,
+        TooManyRequestsError,
+    )
+    """Errors of a credential making ``CredentialPool`` fail over to another one."""
+
+    _API_ERROR = AmazonCreatorsApiError
+    _DEADLINE_ERROR = DeadlineExceededError
+    _QUOTA_ERROR = QuotaExceededError
+    _CIRCUIT_BREAKER_ERROR = CircuitBreakerOpenError
+
     def __init__(
         self,
         credential_id: str,
@@ -83,25 +165,56 @@ class AmazonCreatorsApi:
         country: CountryCode | None = None,
         marketplace: str | None = None,
         throttling: float = DEFAULT_THROTTLING,
+        token_store: TokenStore | None = None,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        transport: Transport | None = None,
+        hooks: EventHooks | None = None,
+        tracer_provider: Any = None,
+        quota: QuotaTracker | None = None,
+        scheduler: RequestScheduler | None = None,
     ) -> None:
         """Initialize the Amazon Creators API client."""
         self._credential_id = credential_id
         self._credential_secret = credential_secret
         self._version = version
         self._last_query_time = time.time() - throttling
+        self._throttle_lock = threading.Lock()
         self.tag = tag
         self.throttling = float(throttling)
+        self.retry_policy = retry_policy
+        self.hooks = hooks
+        self.quota = quota
+        self.scheduler = scheduler
+        self._tracer = get_tracer(tracer_provider)
 
         # Determine marketplace from country or direct value
         self.marketplace = validate_and_get_marketplace(country, marketplace)
+        self.circuit_breaker = (
+            circuit_breakers.get(self.marketplace)
+            if circuit_breakers is not None
+            else None
+        )
 
-        self._api_client = ApiClient(
+        # The phases of the requests are only measured with hooks or tracing
+        api_client_class = (
+            _InstrumentedApiClient
+            if hooks is not None or self._tracer is not None
+            else ApiClient
+        )
+        self._api_client = api_client_class(
             credential_id=credential_id,
             credential_secret=credential_secret,
             version=version,
+            token_store=token_store,
+            pool_manager=(
+                TransportPoolManager(transport) if transport is not None else None
+            ),
         )
         self._api = DefaultApi(self._api_client)
 
+    @traced
     def get_items(
         self,
         items: str | list[str],
@@ -109,7 +222,9 @@ class AmazonCreatorsApi:
         currency_of_preference: str | None = None,
         languages_of_preference: list[str] | None = None,
         resources: list[GetItemsResource] | None = None,
-    ) -> list[Item]:
+        *,
+        timeout: float | None = None,
+    ) -> ResultList[Item]:
         """Get items information from Amazon.
 
         Args:
@@ -119,45 +234,55 @@ class AmazonCreatorsApi:
             currency_of_preference: ISO 4217 currency code for prices.
             languages_of_preference: Languages in order of preference.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
-            List of Item objects with Amazon information.
+            List of Item objects with Amazon information. The ``metadata``
+            attribute of the list contains the retries made for the request.
 
         Raises:
             ItemsNotFoundError: If no items are found.
             InvalidArgumentError: If parameters are invalid.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
             resources = get_all_resources(GetItemsResource)
 
         item_ids = get_items_ids(items)
+        metadata = ResultMetadata()
+        chunk = metadata.add_chunk(item_ids)
+
+        event = self._create_event("GetItems")
+        with measure(event, BUILD):
+            request = GetItemsRequestContent(
+                partnerTag=self.tag,
+                itemIds=item_ids,
+                condition=condition,
+                currencyOfPreference=currency_of_preference,
+                languagesOfPreference=languages_of_preference,
+                resources=resources,
+            )
 
-        request = GetItemsRequestContent(
-            partnerTag=self.tag,
-            itemIds=item_ids,
-            condition=condition,
-            currencyOfPreference=currency_of_preference,
-            languagesOfPreference=languages_of_preference,
-            resources=resources,
-        )
-
-        self._throttle()
-
-        try:
-            response = self._api.get_items(
+        response = self._send(
+            lambda request_timeout: self._api.get_items(
                 x_marketplace=self.marketplace,
                 get_items_request_content=request,
-            )
-        except ApiException as exc:
-            self._handle_api_exception(exc)
+                _request_timeout=request_timeout,
+            ),
+            Deadline.from_timeout(timeout),
+            chunk,
+            event,
+        )
 
         if response.items_result is None or response.items_result.items is None:
             msg = "No items have been found"
             raise ItemsNotFoundError(msg)
 
-        return response.items_result.items
+        return ResultList(response.items_result.items, metadata)
 
+    @traced
     def search_items(
         self,
         keywords: str | None = None,
@@ -180,6 +305,8 @@ class AmazonCreatorsApi:
         min_reviews_rating: int | None = None,
         sort_by: SortBy | None = None,
         resources: list[SearchItemsResource] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> SearchResult:
         """Search for items on Amazon based on a search query.
 
@@ -207,50 +334,55 @@ class AmazonCreatorsApi:
             min_reviews_rating: Min review rating (1-5).
             sort_by: Sort method for results.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
             SearchResult containing the list of items.
 
         Raises:
             ItemsNotFoundError: If no items are found.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
             resources = get_all_resources(SearchItemsResource)
 
-        request = SearchItemsRequestContent(
-            partnerTag=self.tag,
-            keywords=keywords,
-            actor=actor,
-            artist=artist,
-            author=author,
-            brand=brand,
-            title=title,
-            browseNodeId=browse_node_id,
-            searchIndex=search_index,
-            itemCount=item_count,
-            itemPage=item_page,
-            condition=condition,
-            currencyOfPreference=currency_of_preference,
-            deliveryFlags=delivery_flags,
-            languagesOfPreference=languages_of_preference,
-            maxPrice=max_price,
-            minPrice=min_price,
-            minSavingPercent=min_saving_percent,
-            minReviewsRating=min_reviews_rating,
-            sortBy=sort_by,
-            resources=resources,
-        )
-
-        self._throttle()
+        event = self._create_event("SearchItems")
+        with measure(event, BUILD):
+            request = SearchItemsRequestContent(
+                partnerTag=self.tag,
+                keywords=keywords,
+                actor=actor,
+                artist=artist,
+                author=author,
+                brand=brand,
+                title=title,
+                browseNodeId=browse_node_id,
+                searchIndex=search_index,
+                itemCount=item_count,
+                itemPage=item_page,
+                condition=condition,
+                currencyOfPreference=currency_of_preference,
+                deliveryFlags=delivery_flags,
+                languagesOfPreference=languages_of_preference,
+                maxPrice=max_price,
+                minPrice=min_price,
+                minSavingPercent=min_saving_percent,
+                minReviewsRating=min_reviews_rating,
+                sortBy=sort_by,
+                resources=resources,
+            )
 
-        try:
-            response = self._api.search_items(
+        response = self._send(
+            lambda request_timeout: self._api.search_items(
                 x_marketplace=self.marketplace,
                 search_items_request_content=request,
-            )
-        except ApiException as exc:
-            self._handle_api_exception(exc)
+                _request_timeout=request_timeout,
+            ),
+            Deadline.from_timeout(timeout),
+            event=event,
+        )
 
         if response.search_result is None:
             msg = "No items have been found"
@@ -258,6 +390,41 @@ class AmazonCreatorsApi:
 
         return response.search_result
 
+    def iter_search_items(
+        self, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> Generator[Item, None, None]:
+        """Search for items on Amazon, yielding the items of all the pages.
+
+        The pages are requested as the items are consumed, a few at a time, until
+        the total result count of the search or the 10 pages allowed by the API
+        are exhausted. Items returned in several pages are only yielded once.
+
+        Args:
+            prefetch: Number of pages requested at the same time, throttled as
+                usual. Defaults to 2.
+            **kwargs: Arguments of ``search_items``, except ``item_page``.
+
+        Yields:
+            The items found, in the order of the pages.
+
+        Raises:
+            ItemsNotFoundError: If no items are found.
+            DeadlineExceededError: If the timeout of a page expires.
+
+        """
+        page_size = kwargs.get("item_count") or DEFAULT_PAGE_SIZE
+        pages = iter_pages(
+            lambda page: self.search_items(item_page=page, **kwargs),
+            lambda result: count_pages(result.total_result_count, page_size),
+            max_pages=MAX_SEARCH_PAGES,
+            prefetch=prefetch,
+            end_errors=(ItemsNotFoundError,),
+        )
+        seen: set[str] = set()
+        for page in pages:
+            yield from iter_new_items(page.items, seen)
+
+    @traced
     def get_variations(
         self,
         asin: str,
@@ -267,23 +434,28 @@ class AmazonCreatorsApi:
         currency_of_preference: str | None = None,
         languages_of_preference: list[str] | None = None,
         resources: list[GetVariationsResource] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> VariationsResult:
         """Return variations of a product (different sizes, colors, etc.).
 
         Args:
             asin: The ASIN or Amazon product URL of the product.
             variation_count: Number of variations to return (1-10). Defaults to 10.
-            variation_page: Page of variations to return (1-10). Defaults to 1.
+            variation_page: Page of variations to return, starting at 1. Defaults to 1.
             condition: Filter offers by condition type.
             currency_of_preference: ISO 4217 currency code for prices.
             languages_of_preference: Languages in order of preference.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
             VariationsResult containing the list of variations.
 
         Raises:
             ItemsNotFoundError: If no variations are found.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
@@ -291,26 +463,28 @@ class AmazonCreatorsApi:
 
         asin = get_asin(asin)
 
-        request = GetVariationsRequestContent(
-            partnerTag=self.tag,
-            asin=asin,
-            variationCount=variation_count,
-            variationPage=variation_page,
-            condition=condition,
-            currencyOfPreference=currency_of_preference,
-            languagesOfPreference=languages_of_preference,
-            resources=resources,
-        )
-
-        self._throttle()
+        event = self._create_event("GetVariations")
+        with measure(event, BUILD):
+            request = GetVariationsRequestContent(
+                partnerTag=self.tag,
+                asin=asin,
+                variationCount=variation_count,
+                variationPage=variation_page,
+                condition=condition,
+                currencyOfPreference=currency_of_preference,
+                languagesOfPreference=languages_of_preference,
+                resources=resources,
+            )
 
-        try:
-            response = self._api.get_variations(
+        response = self._send(
+            lambda request_timeout: self._api.get_variations(
                 x_marketplace=self.marketplace,
                 get_variations_request_content=request,
-            )
-        except ApiException as exc:
-            self._handle_api_exception(exc)
+                _request_timeout=request_timeout,
+            ),
+            Deadline.from_timeout(timeout),
+            event=event,
+        )
 
         if response.variations_result is None:
             msg = "No variations have been found"
@@ -318,11 +492,68 @@ class AmazonCreatorsApi:
 
         return response.variations_result
 
+    def iter_variations(
+        self, asin: str, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> Generator[Item, None, None]:
+        """Return the variations of all the pages of a product, as they arrive.
+
+        The page count of the first page tells how many pages to request,
+        ``prefetch`` at a time and throttled as usual, while the variations of
+        the previous ones are consumed.
+
+        Args:
+            asin: The ASIN or Amazon product URL of the product.
+            prefetch: Number of pages requested at the same time. Defaults to 2.
+            **kwargs: Arguments of ``get_variations``, except ``variation_page``.
+
+        Yields:
+            The variations, in the order of the pages.
+
+        Raises:
+            ItemsNotFoundError: If no variations are found.
+            DeadlineExceededError: If the timeout of a page expires.
+
+        """
+        seen: set[str] = set()
+        for page in self._iter_variations_pages(asin, prefetch, kwargs):
+            yield from iter_new_items(page.items, seen)
+
+    def get_all_variations(
+        self, asin: str, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> VariationsResult:
+        """Return the variations of all the pages of a product in one result.
+
+        Same as ``iter_variations``, but waiting for all the pages and returning
+        the first one with the variations of all of them.
+
+        Args:
+            asin: The ASIN or Amazon product URL of the product.
+            prefetch: Number of pages requested at the same time. Defaults to 2.
+            **kwargs: Arguments of ``get_variations``, except ``variation_page``.
+
+        Returns:
+            VariationsResult containing all the variations.
+
+        Raises:
+            ItemsNotFoundError: If no variations are found.
+            DeadlineExceededError: If the timeout of a page expires.
+
+        """
+        pages = list(self._iter_variations_pages(asin, prefetch, kwargs))
+        seen: set[str] = set()
+        pages[0].items = [
+            item for page in pages for item in iter_new_items(page.items, seen)
+        ]
+        return pages[0]
+
+    @traced
     def get_browse_nodes(
         self,
         browse_node_ids: list[str],
         languages_of_preference: list[str] | None = None,
         resources: list[GetBrowseNodesResource] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> list[BrowseNode]:
         """Return browse node information including name, children, and ancestors.
 
@@ -330,33 +561,38 @@ class AmazonCreatorsApi:
             browse_node_ids: List of browse node IDs.
             languages_of_preference: Languages in order of preference.
             resources: List of resources to retrieve. Defaults to all.
+            timeout: Maximum seconds for the whole call, including throttling
+                waits, retries and the token refresh. Defaults to no limit.
 
         Returns:
             List of BrowseNode objects.
 
         Raises:
             ItemsNotFoundError: If no browse nodes are found.
+            DeadlineExceededError: If the timeout expires.
 
         """
         if resources is None:
             resources = get_all_resources(GetBrowseNodesResource)
 
-        request = GetBrowseNodesRequestContent(
-            partnerTag=self.tag,
-            browseNodeIds=browse_node_ids,
-            languagesOfPreference=languages_of_preference,
-            resources=resources,
-        )
-
-        self._throttle()
+        event = self._create_event("GetBrowseNodes")
+        with measure(event, BUILD):
+            request = GetBrowseNodesRequestContent(
+                partnerTag=self.tag,
+                browseNodeIds=browse_node_ids,
+                languagesOfPreference=languages_of_preference,
+                resources=resources,
+            )
 
-        try:
-            response = self._api.get_browse_nodes(
+        response = self._send(
+            lambda request_timeout: self._api.get_browse_nodes(
                 x_marketplace=self.marketplace,
                 get_browse_nodes_request_content=request,
-            )
-        except ApiException as exc:
-            self._handle_api_exception(exc)
+                _request_timeout=request_timeout,
+            ),
+            Deadline.from_timeout(timeout),
+            event=event,
+        )
 
         if (
             response.browse_nodes_result is None
@@ -367,12 +603,23 @@ class AmazonCreatorsApi:
 
         return response.browse_nodes_result.browse_nodes
 
-    def _throttle(self) -> None:
-        """Wait for the throttling interval to elapse since the last API call."""
-        wait_time = self.throttling - (time.time() - self._last_query_time)
-        if wait_time > 0:
-            time.sleep(wait_time)
-        self._last_query_time = time.time()
+    def _iter_variations_pages(
+        self, asin: str, prefetch: int, kwargs: dict[str, Any]
+    ) -> Generator[VariationsResult, None, None]:
+        """Return the pages of variations of an item, up to its page count."""
+        asin = get_asin(asin)
+        return iter_pages(
+            lambda page: self.get_variations(asin, variation_page=page, **kwargs),
+            get_variations_page_count,
+            prefetch=prefetch,
+            end_errors=(ItemsNotFoundError,),
+        )
+
+    def _handle_send_error(self, error: Exception, deadline: Deadline | None) -> None:
+        """Raise the error of a request mapped to the errors of the client."""
+        if isinstance(error, ApiException):
+            self._handle_api_exception(error)
+        super()._handle_send_error(error, deadline)
 
     def _handle_api_exception(self, error: ApiException) -> NoReturn:
         """Handle API exceptions and raise appropriate custom exceptions."""
@@ -382,3 +629,61 @@ class AmazonCreatorsApi:
         except Exception as exc:
             # Re-raise with original exception as cause for better stack traces
             raise exc from error
+
+
+class _InstrumentedApiClient(ApiClient):
+    """SDK client measuring the phases of the requests sent with an event.
+
+    Used instead of the SDK client when there are hooks, so the requests of the
+    clients without hooks are not measured.
+    """
+
+    def param_serialize(self, *args: Any, **kwargs: Any) -> Any:
+        """Serialize the request, recording the time spent and the body size."""
+        event = get_current_event()
+        if event is None:
+            return super().param_serialize(*args, **kwargs)
+
+        with event.measure(SERIALIZE):
+            params = super().param_serialize(*args, **kwargs)
+        event.set_request_body(params[3])
+        return params
+
+    def get_token(self, *args: Any, **kwargs: Any) -> str:
+        """Return the OAuth2 token, measuring the time spent."""
+        event = get_current_event()
+        if event is None:
+            return super().get_token(*args, **kwargs)
+
+        token_manager = self._token_manager
+        hit = token_manager is not None and token_manager.is_token_valid()
+        event.record_cache(TOKEN, hit=hit)
+        refresh = contextlib.nullcontext() if hit else trace_token_refresh()
+        with event.measure(TOKEN), refresh:
+            return super().get_token(*args, **kwargs)
+
+    def call_api(self, *args: Any, **kwargs: Any) -> Any:
+        """Send the request, measuring the time spent apart from the token."""
+        event = get_current_event()
+        if event is None:
+            return super().call_api(*args, **kwargs)
+
+        token_time = event.timings.get(TOKEN, 0.0)
+        start = time.perf_counter()
+        try:
+            return super().call_api(*args, **kwargs)
+        finally:
+            token_time = event.timings.get(TOKEN, 0.0) - token_time
+            event.add_timing(NETWORK, time.perf_counter() - start - token_time)
+
+    def response_deserialize(
+        self, response_data: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Deserialize the response, recording the time spent and its size."""
+        event = get_current_event()
+        if event is None:
+            return super().response_deserialize(response_data, *args, **kwargs)
+
+        event.set_response(response_data.status, response_data.data)
+        with event.measure(DESERIALIZE):
+            return super().response_deserialize(response_data, *args, **kwargs)
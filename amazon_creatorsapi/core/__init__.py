@@ -1,6 +1,71 @@
 """Core utilities for Amazon Creators API."""
 
+from .bulk import BulkResult, async_bulk_get_items, bulk_get_items, iter_item_ids
+from .circuit_breaker import CircuitBreakerPolicy, CircuitBreakerRegistry, CircuitState
+from .fanout import MarketplaceResults
+from .hedging import HedgingPolicy
+from .hooks import EventHooks, RequestEvent
 from .marketplaces import Country
+from .metrics import LatencyHistogram, MetricsRegistry
 from .parsers import get_asin
+from .pool import AsyncCredentialPool, CredentialPool
+from .priority import Priority, use_priority
+from .quota import QuotaTracker
+from .recording import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    NoRecordedResponseError,
+    RecordingTransport,
+    ReplayTransport,
+)
+from .results import ResultList
+from .retry import RetryBudget, RetryPolicy
+from .scheduler import RequestScheduler
+from .token_store import FileTokenStore, MemoryTokenStore, TokenStore
+from .transport import (
+    AsyncTransport,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+    Urllib3Transport,
+)
 
-__all__ = ["Country", "get_asin"]
+__all__ = [
+    "AsyncCredentialPool",
+    "AsyncRecordingTransport",
+    "AsyncReplayTransport",
+    "AsyncTransport",
+    "BulkResult",
+    "CircuitBreakerPolicy",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "Country",
+    "CredentialPool",
+    "EventHooks",
+    "FileTokenStore",
+    "HedgingPolicy",
+    "LatencyHistogram",
+    "MarketplaceResults",
+    "MemoryTokenStore",
+    "MetricsRegistry",
+    "NoRecordedResponseError",
+    "Priority",
+    "QuotaTracker",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RequestEvent",
+    "RequestScheduler",
+    "ResultList",
+    "RetryBudget",
+    "RetryPolicy",
+    "TokenStore",
+    "Transport",
+    "TransportRequest",
+    "TransportResponse",
+    "Urllib3Transport",
+    "async_bulk_get_items",
+    "bulk_get_items",
+    "get_asin",
+    "iter_item_ids",
+    "use_priority",
+]
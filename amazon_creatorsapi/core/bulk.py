@@ -0,0 +1,206 @@
+"""Streaming refresh of large lists of items, resumable from a checkpoint.
+
+``bulk_get_items`` reads the item IDs lazily from any iterable or file, packs
+them in requests of 10 items and keeps a bounded number of requests in flight,
+throttled by the client as usual. The results are yielded in the order of the
+input, and a new request is only sent when the consumer takes a result, so the
+memory does not depend on the number of items. With a checkpoint file, the
+number of items yielded is saved after every chunk, and a job restarted with the
+same input skips them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Union
+
+from .files import SharedJsonFile
+from .parsers import get_asin
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Generator, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 10
+DEFAULT_MAX_CONCURRENCY = 4
+
+ItemsSource = Union["Iterable[str]", str, "os.PathLike[str]"]
+"""Item IDs or URLs, or the path of a file with one per line."""
+
+
+@dataclass
+class BulkResult:
+    """Result of the request made for a chunk of item IDs.
+
+    Args:
+        item_ids: Item IDs requested in the chunk.
+        items: Items returned, empty if the request failed.
+        error: Error raised by the request, or None.
+
+    """
+
+    item_ids: list[str]
+    items: list[Any] = field(default_factory=list)
+    error: Exception | None = None
+
+
+def iter_item_ids(source: ItemsSource) -> Iterator[str]:
+    """Yield the item IDs of a source, reading files line by line.
+
+    Empty lines and lines starting with ``#`` are skipped, and product URLs are
+    converted to their ASIN.
+
+    Args:
+        source: Item IDs or URLs, or the path of a file with one per line.
+
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as lines:  # noqa: PTH123
+            yield from _parse_item_ids(lines)
+    else:
+        yield from _parse_item_ids(source)
+
+
+def bulk_get_items(
+    client: Any,
+    source: ItemsSource,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    **kwargs: Any,
+) -> Generator[BulkResult, None, None]:
+    """Get the items of a long list, yielding the results of every chunk.
+
+    The errors of a chunk are returned in its result, except the errors of the
+    credential in the ``FAILOVER_ERRORS`` of the client, like a 429 after the
+    retries or a spent quota, which stop the job so it can be resumed later.
+
+    Args:
+        client: Client used to get the items, e.g. an ``AmazonApi``, an
+            ``AmazonCreatorsApi`` or a ``CredentialPool``.
+        source: Item IDs or URLs, or the path of a file with one per line.
+        chunk_size: Number of items of every request. Defaults to 10.
+        max_concurrency: Maximum number of requests in flight. Defaults to 4.
+        checkpoint: File where the progress is saved, resuming from it if it
+            exists. It is deleted when all the items have been yielded.
+            Defaults to no checkpoint.
+        kwargs: Other arguments of ``get_items``.
+
+    Yields:
+        The result of every chunk, in the order of the source.
+
+    Example:
+        >>> for result in bulk_get_items(api, "asins.txt", checkpoint="job.json"):
+        ...     save(result.items)
+
+    """
+    progress = _Progress(checkpoint)
+    chunks = _iter_chunks(source, chunk_size, progress.done)
+    fatal_errors = getattr(client, "FAILOVER_ERRORS", ())
+    pending: deque[tuple[list[str], Future[Any]]] = deque()
+    executor = ThreadPoolExecutor(max_concurrency)
+    try:
+        # The last None sends no request and waits for the requests in flight
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                get_items = functools.partial(client.get_items, chunk, **kwargs)
+                future = executor.submit(contextvars.copy_context().run, get_items)
+                pending.append((chunk, future))
+            while pending and (chunk is None or len(pending) >= max_concurrency):
+                item_ids, future = pending.popleft()
+                yield _get_result(item_ids, future, fatal_errors)
+                progress.add(len(item_ids))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    progress.finish()
+
+
+async def async_bulk_get_items(
+    client: Any,
+    source: ItemsSource,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    **kwargs: Any,
+) -> AsyncGenerator[BulkResult, None]:
+    """Get the items of a long list, yielding the results of every chunk.
+
+    Async version of ``bulk_get_items``, e.g. for an ``AsyncAmazonCreatorsApi``.
+    """
+    progress = _Progress(checkpoint)
+    chunks = _iter_chunks(source, chunk_size, progress.done)
+    fatal_errors = getattr(client, "FAILOVER_ERRORS", ())
+    pending: deque[tuple[list[str], asyncio.Task[Any]]] = deque()
+    try:
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                task = asyncio.ensure_future(client.get_items(chunk, **kwargs))
+                pending.append((chunk, task))
+            while pending and (chunk is None or len(pending) >= max_concurrency):
+                item_ids, task = pending.popleft()
+                await asyncio.wait([task])
+                yield _get_result(item_ids, task, fatal_errors)
+                progress.add(len(item_ids))
+    finally:
+        for _, task in pending:
+            task.cancel()
+    progress.finish()
+
+
+class _Progress:
+    """Number of items yielded, saved in the checkpoint file if there is one."""
+
+    def __init__(self, path: str | os.PathLike[str] | None) -> None:
+        self._file = SharedJsonFile(path) if path is not None else None
+        done = self._file.read().get("done", 0) if self._file is not None else 0
+        self.done = done if isinstance(done, int) and done > 0 else 0
+
+    def add(self, count: int) -> None:
+        """Count the items of a chunk yielded, saving the checkpoint."""
+        self.done += count
+        if self._file is not None:
+            self._file.write({"done": self.done})
+
+    def finish(self) -> None:
+        """Remove the checkpoint once all the items have been yielded."""
+        if self._file is not None:
+            self._file.path.unlink(missing_ok=True)
+
+
+def _parse_item_ids(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the item IDs of the lines that are not empty nor comments."""
+    for line in lines:
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield get_asin(text)
+
+
+def _iter_chunks(
+    source: ItemsSource, chunk_size: int, skip: int
+) -> Iterator[list[str]]:
+    """Yield the chunks of item IDs of a source, skipping the first ones."""
+    item_ids = itertools.islice(iter_item_ids(source), skip, None)
+    while chunk := list(itertools.islice(item_ids, chunk_size)):
+        yield chunk
+
+
+def _get_result(
+    item_ids: list[str],
+    future: Future[Any] | asyncio.Task[Any],
+    fatal_errors: tuple[type[Exception], ...],
+) -> BulkResult:
+    """Return the result of a finished request, raising the fatal errors."""
+    error = future.exception()
+    if error is None:
+        return BulkResult(item_ids, list(future.result()))
+    if isinstance(error, fatal_errors) or not isinstance(error, Exception):
+        raise error
+    return BulkResult(item_ids, error=error)
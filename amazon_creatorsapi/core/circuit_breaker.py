@@ -0,0 +1,333 @@
+"""Circuit breakers to fail fast while an API endpoint is degraded.
+
+Each host or marketplace has its own circuit breaker, which records the outcome
+and latency of the most recent requests. When the share of failed or slow
+requests reaches a threshold, the circuit opens and requests fail immediately
+instead of waiting for timeouts. After a cooldown the circuit is half-open: a
+few probe requests are let through, closing the circuit if they succeed or
+opening it again if any of them fails.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Callable
+
+import urllib3
+
+from amazon_creatorsapi.core.retry import get_error_chain, get_status_code
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+StateChangeCallback = Callable[[str, "CircuitState", "CircuitState"], None]
+"""Callback called on every transition with the key, the old and the new state."""
+
+DEFAULT_FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+DEFAULT_FAILURE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    OSError,
+    urllib3.exceptions.HTTPError,
+)
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests are sent normally."""
+
+    OPEN = "open"
+    """Requests fail immediately."""
+
+    HALF_OPEN = "half_open"
+    """A limited number of probe requests are sent to test the endpoint."""
+
+
+@dataclass
+class CircuitBreakerPolicy:
+    """Rules to decide when a circuit opens and closes again.
+
+    A request is a failure if the HTTP status of the error is in
+    ``failure_statuses`` or the error is an instance of ``failure_exceptions``.
+    Other errors, like a product not found, mean the endpoint is healthy. A
+    request is slow if it takes longer than ``slow_call_duration``.
+
+    Args:
+        failure_rate: Share of failed requests in the window opening the circuit.
+        slow_call_duration: Seconds after which a request is considered slow. Use
+            None to ignore the latency.
+        slow_call_rate: Share of slow requests in the window opening the circuit.
+        window_size: Number of most recent requests used to compute the rates.
+        min_requests: Number of requests needed in the window to open the circuit.
+        open_duration: Seconds the circuit stays open before probing the endpoint.
+        half_open_requests: Number of successful probe requests needed to close
+            the circuit.
+        failure_statuses: HTTP statuses considered failures of the endpoint.
+        failure_exceptions: Exception types considered failures of the endpoint,
+            like connection errors and timeouts.
+
+    Example:
+        >>> policy = CircuitBreakerPolicy(failure_rate=0.5, slow_call_duration=5)
+        >>> breakers = CircuitBreakerRegistry(policy)
+        >>> api = AmazonCreatorsApi(..., circuit_breakers=breakers)
+
+    """
+
+    failure_rate: float = 0.5
+    slow_call_duration: float | None = None
+    slow_call_rate: float = 1.0
+    window_size: int = 20
+    min_requests: int = 10
+    open_duration: float = 30.0
+    half_open_requests: int = 3
+    failure_statuses: Collection[int] = DEFAULT_FAILURE_STATUSES
+    failure_exceptions: tuple[type[BaseException], ...] = DEFAULT_FAILURE_EXCEPTIONS
+
+    def __post_init__(self) -> None:
+        """Accept any iterable of failure statuses."""
+        self.failure_statuses = frozenset(self.failure_statuses)
+
+    def is_failure(
+        self,
+        error: BaseException,
+        extra_exceptions: tuple[type[BaseException], ...] = (),
+    ) -> bool:
+        """Return whether the error means the endpoint is failing.
+
+        Args:
+            error: Error raised by the request.
+            extra_exceptions: Exception types also considered failures, like the
+                errors of the HTTP library used by a client.
+
+        """
+        status_code = get_status_code(error)
+        if status_code is not None:
+            return status_code in self.failure_statuses
+        exceptions = (*self.failure_exceptions, *extra_exceptions)
+        return any(isinstance(cause, exceptions) for cause in get_error_chain(error))
+
+
+class CircuitBreaker:
+    """Circuit breaker for the requests sent to a single host or marketplace.
+
+    Args:
+        key: Host or marketplace protected by the circuit breaker.
+        policy: Rules to open and close the circuit.
+        on_state_change: Callback called on every state transition.
+
+    """
+
+    def __init__(
+        self,
+        key: str,
+        policy: CircuitBreakerPolicy | None = None,
+        on_state_change: StateChangeCallback | None = None,
+    ) -> None:
+        """Initialize a closed circuit breaker."""
+        self.key = key
+        self.policy = policy if policy is not None else CircuitBreakerPolicy()
+        self.on_state_change = on_state_change
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=self.policy.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._successful_probes = 0
+        # Reentrant, so state change callbacks can read the state
+        self._lock = threading.RLock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, half-open once the open duration has elapsed."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failed requests in the window."""
+        with self._lock:
+            return self._get_rate(0)
+
+    @property
+    def slow_call_rate(self) -> float:
+        """Share of slow requests in the window."""
+        with self._lock:
+            return self._get_rate(1)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the circuit is half-open, or 0 if it is not open."""
+        with self._lock:
+            self._update_state()
+            if self._state != CircuitState.OPEN:
+                return 0.0
+            elapsed = time.monotonic() - self._opened_at
+            return max(0.0, self.policy.open_duration - elapsed)
+
+    def allow_request(self, *, reserve: bool = True) -> bool:
+        """Return whether a request can be sent.
+
+        Args:
+            reserve: Reserve one of the probe requests if the circuit is
+                half-open. Every reserved request must be followed by a call to
+                ``record``. Without reserving, only checks the circuit is not open.
+
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if (
+                self._state == CircuitState.HALF_OPEN
+                and self._probes < self.policy.half_open_requests
+            ):
+                self._probes += reserve
+                return True
+            return False
+
+    @contextlib.contextmanager
+    def track(self, *extra_exceptions: type[BaseException]) -> Iterator[None]:
+        """Record the latency and outcome of the request sent within the block.
+
+        Args:
+            extra_exceptions: Exception types also considered failures.
+
+        """
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as error:
+            self.record(time.monotonic() - start, error, extra_exceptions)
+            raise
+        self.record(time.monotonic() - start)
+
+    def record(
+        self,
+        latency: float,
+        error: BaseException | None = None,
+        extra_exceptions: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        """Record the outcome of a request allowed by ``allow_request``.
+
+        Args:
+            latency: Seconds taken by the request.
+            error: Error raised by the request, or None if it succeeded. Errors
+                that are not exceptions, like a cancellation, release the probe
+                reserved for the request without recording an outcome.
+            extra_exceptions: Exception types also considered failures.
+
+        """
+        with self._lock:
+            if error is not None and not isinstance(error, Exception):
+                if self._state == CircuitState.HALF_OPEN:
+                    self._probes -= 1
+                return
+
+            failed = error is not None and self.policy.is_failure(
+                error, extra_exceptions
+            )
+            slow = (
+                self.policy.slow_call_duration is not None
+                and latency > self.policy.slow_call_duration
+            )
+
+            if self._state == CircuitState.HALF_OPEN:
+                self._record_probe(failed=failed or slow)
+            elif self._state == CircuitState.CLOSED:
+                self._outcomes.append((failed, slow))
+                if self._should_open():
+                    self._transition(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recorded requests."""
+        with self._lock:
+            self._transition(CircuitState.CLOSED)
+
+    def _record_probe(self, *, failed: bool) -> None:
+        if failed:
+            self._transition(CircuitState.OPEN)
+            return
+        self._successful_probes += 1
+        if self._successful_probes >= self.policy.half_open_requests:
+            self._transition(CircuitState.CLOSED)
+
+    def _should_open(self) -> bool:
+        if len(self._outcomes) < self.policy.min_requests:
+            return False
+        return (
+            self._get_rate(0) >= self.policy.failure_rate
+            or self._get_rate(1) >= self.policy.slow_call_rate
+        )
+
+    def _get_rate(self, index: int) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(outcome[index] for outcome in self._outcomes) / len(self._outcomes)
+
+    def _update_state(self) -> None:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.policy.open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous = self._state
+        self._state = state
+        self._probes = 0
+        self._successful_probes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.CLOSED:
+            self._outcomes.clear()
+        if state != previous and self.on_state_change is not None:
+            self.on_state_change(self.key, previous, state)
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers by host or marketplace, shared by the API clients.
+
+    Args:
+        policy: Rules used by all the circuit breakers.
+        on_state_change: Callback called on every state transition, with the key
+            of the circuit breaker, the old and the new state.
+
+    Example:
+        >>> breakers = CircuitBreakerRegistry(CircuitBreakerPolicy())
+        >>> api_es = AmazonCreatorsApi(..., country="ES", circuit_breakers=breakers)
+        >>> api_fr = AmazonCreatorsApi(..., country="FR", circuit_breakers=breakers)
+        >>> breakers.states()
+        {'www.amazon.es': <CircuitState.CLOSED: 'closed'>, ...}
+
+    """
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy | None = None,
+        on_state_change: StateChangeCallback | None = None,
+    ) -> None:
+        """Initialize an empty registry."""
+        self.policy = policy if policy is not None else CircuitBreakerPolicy()
+        self.on_state_change = on_state_change
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Return the circuit breaker for the key, creating it if needed."""
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(
+                    key, self.policy, self.on_state_change
+                )
+            return self._breakers[key]
+
+    def states(self) -> dict[str, CircuitState]:
+        """Return the current state of every circuit breaker by key."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.key: breaker.state for breaker in breakers}
@@ -2,6 +2,9 @@
 
 DEFAULT_THROTTLING = 1
 
+# Maximum number of item IDs in a GetItems request
+ITEMS_PER_REQUEST = 10
+
 # HTTP status codes
 HTTP_NOT_FOUND = 404
 HTTP_TOO_MANY_REQUESTS = 429
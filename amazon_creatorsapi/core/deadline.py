@@ -0,0 +1,45 @@
+"""Deadlines bounding the total time spent in an API call.
+
+A deadline is created from the ``timeout`` of a public method and propagated to
+the throttling waits, the requests for each chunk, the retries and the OAuth2
+token refresh, so a call never takes longer than its timeout.
+"""
+
+from __future__ import annotations
+
+import time
+
+MIN_REQUEST_TIMEOUT = 0.001
+
+
+class Deadline:
+    """Point in time after which a call must stop waiting and sending requests.
+
+    Args:
+        timeout: Seconds from now until the deadline.
+
+    """
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize a deadline expiring after the given timeout."""
+        self.timeout = timeout
+        self._expires_at = time.monotonic() + timeout
+
+    @classmethod
+    def from_timeout(cls, timeout: float | None) -> Deadline | None:
+        """Return a deadline for the timeout, or None if there is no timeout."""
+        return None if timeout is None else cls(timeout)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def remaining(self) -> float:
+        """Return the seconds left until the deadline, or 0 if it has passed."""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def limit(self, timeout: float | None) -> float:
+        """Return the timeout for a request, limited by the time left."""
+        remaining = max(self.remaining(), MIN_REQUEST_TIMEOUT)
+        return remaining if timeout is None else min(timeout, remaining)
@@ -6,6 +6,7 @@ from typing import NoReturn
 
 from amazon_creatorsapi.core.constants import HTTP_NOT_FOUND, HTTP_TOO_MANY_REQUESTS
 from amazon_creatorsapi.errors import (
+    AmazonCreatorsApiError,
     AssociateValidationError,
     InvalidArgumentError,
     ItemsNotFoundError,
@@ -17,6 +18,9 @@ from amazon_creatorsapi.errors import (
 def handle_api_error(status_code: int, body: str) -> NoReturn:
     """Handle API error responses and raise appropriate exceptions.
 
+    The HTTP status is available in the ``status_code`` attribute of the raised
+    exception.
+
     Args:
         status_code: HTTP status code.
         body: Response body text.
@@ -29,27 +33,30 @@ def handle_api_error(status_code: int, body: str) -> NoReturn:
         RequestError: For other errors.
 
     """
+    error = _get_api_error(status_code, body)
+    error.status_code = status_code
+    raise error
+
+
+def _get_api_error(status_code: int, body: str) -> AmazonCreatorsApiError:
+    """Return the exception matching an API error response."""
     if status_code == HTTP_NOT_FOUND:
-        msg = "No items found for the request"
-        raise ItemsNotFoundError(msg)
+        return ItemsNotFoundError("No items found for the request")
 
     if status_code == HTTP_TOO_MANY_REQUESTS:
-        msg = "Rate limit exceeded, try increasing throttling"
-        raise TooManyRequestsError(msg)
+        return TooManyRequestsError("Rate limit exceeded, try increasing throttling")
 
     if "InvalidParameterValue" in body:
-        msg = "Invalid parameter value provided in the request"
-        raise InvalidArgumentError(msg)
+        return InvalidArgumentError("Invalid parameter value provided in the request")
 
     if "InvalidPartnerTag" in body:
-        msg = "The partner tag is invalid or not present"
-        raise InvalidArgumentError(msg)
+        return InvalidArgumentError("The partner tag is invalid or not present")
 
     if "InvalidAssociate" in body:
-        msg = "Credentials are not valid for the selected marketplace"
-        raise AssociateValidationError(msg)
+        return AssociateValidationError(
+            "Credentials are not valid for the selected marketplace"
+        )
 
     # Generic error
     body_info = f" - {body[:200]}" if body else ""
-    msg = f"Request failed with status {status_code}{body_info}"
-    raise RequestError(msg)
+    return RequestError(f"Request failed with status {status_code}{body_info}")
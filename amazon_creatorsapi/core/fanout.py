@@ -0,0 +1,92 @@
+"""Run the same call across the clients of several marketplaces concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping
+    from concurrent.futures import ThreadPoolExecutor
+    from typing import Callable
+
+T = TypeVar("T")
+
+
+class MarketplaceResults(dict[str, T], Generic[T]):
+    """Results of a call in several marketplaces, keyed by country code.
+
+    The marketplaces where the call failed are not in the results, and their
+    errors are kept in ``errors`` instead, so an item missing in one marketplace
+    does not hide the results of the rest.
+
+    Attributes:
+        errors: Error raised in every failed marketplace, by country code.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty results."""
+        super().__init__()
+        self.errors: dict[str, Exception] = {}
+
+    def raise_if_all_failed(self) -> None:
+        """Raise the error of the first marketplace if every marketplace failed."""
+        if self.errors and not self:
+            raise next(iter(self.errors.values()))
+
+
+def fan_out(
+    calls: Mapping[str, Callable[[], T]], executor: ThreadPoolExecutor
+) -> MarketplaceResults[T]:
+    """Run the calls of every marketplace in the threads of an executor.
+
+    The calls run in a copy of the current context, so they keep the priority
+    and the tracing span of the caller.
+
+    Args:
+        calls: Call of every marketplace, by country code.
+        executor: Executor running the calls.
+
+    Returns:
+        The results of the calls, raising the first error if all failed.
+
+    """
+    futures = {
+        country: executor.submit(contextvars.copy_context().run, call)
+        for country, call in calls.items()
+    }
+    results: MarketplaceResults[T] = MarketplaceResults()
+    for country, future in futures.items():
+        error = future.exception()
+        if error is None:
+            results[country] = future.result()
+        elif isinstance(error, Exception):
+            results.errors[country] = error
+        else:
+            raise error
+    results.raise_if_all_failed()
+    return results
+
+
+async def async_fan_out(
+    calls: Mapping[str, Callable[[], Awaitable[T]]],
+) -> MarketplaceResults[T]:
+    """Run the calls of every marketplace concurrently.
+
+    Async version of ``fan_out``.
+    """
+    outcomes = await asyncio.gather(
+        *(call() for call in calls.values()), return_exceptions=True
+    )
+    results: MarketplaceResults[T] = MarketplaceResults()
+    for country, outcome in zip(calls, outcomes):
+        if isinstance(outcome, Exception):
+            results.errors[country] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[country] = outcome
+    results.raise_if_all_failed()
+    return results
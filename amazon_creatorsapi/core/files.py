@@ -0,0 +1,109 @@
+"""JSON files shared by the clients of several threads and processes."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+class SharedJsonFile:
+    """JSON file read and written by several threads and processes.
+
+    Reads and writes are protected with an exclusive lock on a sidecar ``.lock``
+    file, and the file is replaced atomically, so concurrent workers never read a
+    partially written file. The file is created with owner-only permissions. The
+    lock is reentrant, so it can be held across several locked operations.
+
+    Args:
+        path: Path of the JSON file.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize the shared file."""
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+
+    def read(self) -> dict[str, Any]:
+        """Read the file, ignoring missing or corrupted files."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def write(self, data: dict[str, Any]) -> None:
+        """Atomically replace the file with the given data."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                json.dump(data, temp_file)
+            Path(temp_path).replace(self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                Path(temp_path).unlink()
+            raise
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold an exclusive lock shared by threads and processes."""
+        with self._thread_lock:
+            self._depth += 1
+            try:
+                if self._depth > 1:
+                    # The thread already holds the lock of the file
+                    yield
+                else:
+                    with self._lock_file():
+                        yield
+            finally:
+                self._depth -= 1
+
+    @contextlib.contextmanager
+    def _lock_file(self) -> Iterator[None]:
+        """Hold the lock of the sidecar file, shared by processes."""
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_descriptor = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            _lock_file(lock_descriptor)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_descriptor)
+        finally:
+            os.close(lock_descriptor)
+
+
+def _lock_file(file_descriptor: int) -> None:
+    """Acquire an exclusive lock on an open file, blocking until available."""
+    if sys.platform == "win32":  # pragma: no cover
+        msvcrt.locking(file_descriptor, msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+
+
+def _unlock_file(file_descriptor: int) -> None:
+    """Release a lock acquired with _lock_file."""
+    if sys.platform == "win32":  # pragma: no cover
+        msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(file_descriptor, fcntl.LOCK_UN)
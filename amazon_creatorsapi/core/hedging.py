@@ -0,0 +1,182 @@
+"""Hedged requests to reduce the tail latency of async API calls.
+
+When a request has not answered after a high percentile of the latencies
+observed so far, a duplicate request is sent and the first successful response
+is used, cancelling the other request. Duplicates are limited by their own
+budget, so hedging only adds a small share of extra traffic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from amazon_creatorsapi.core.retry import RetryBudget
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+T = TypeVar("T")
+
+DEFAULT_WINDOW_SIZE = 500
+
+
+def _default_hedging_budget() -> RetryBudget:
+    return RetryBudget(ratio=0.05, max_tokens=5)
+
+
+@dataclass
+class HedgingPolicy:
+    """Rules to decide when a duplicate request is sent.
+
+    Args:
+        percentile: Percentile of the observed latencies after which a duplicate
+            request is sent, e.g. 95 for the p95 latency.
+        initial_delay: Delay in seconds used until ``min_samples`` latencies have
+            been observed.
+        min_delay: Minimum delay in seconds before sending a duplicate request.
+        min_samples: Number of latencies needed to use the percentile.
+        window_size: Number of most recent latencies used to compute the
+            percentile.
+        budget: Budget for duplicate requests, by default 5% of the requests. Use
+            None to disable the budget.
+
+    Example:
+        >>> api = AsyncAmazonCreatorsApi(..., hedging=HedgingPolicy(percentile=90))
+
+    """
+
+    percentile: float = 95.0
+    initial_delay: float = 1.0
+    min_delay: float = 0.01
+    min_samples: int = 20
+    window_size: int = DEFAULT_WINDOW_SIZE
+    budget: RetryBudget | None = field(default_factory=_default_hedging_budget)
+
+
+class LatencyTracker:
+    """Sliding window of the most recent request latencies.
+
+    Args:
+        window_size: Number of latencies kept.
+
+    """
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE) -> None:
+        """Initialize an empty latency tracker."""
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of latencies in the window."""
+        return len(self._latencies)
+
+    def record(self, latency: float) -> None:
+        """Add the latency in seconds of a finished request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the given percentile of the latencies, or None if empty."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        rank = math.ceil(percentile / 100 * len(latencies))
+        return latencies[min(max(rank, 1), len(latencies)) - 1]
+
+    def get_hedging_delay(self, policy: HedgingPolicy) -> float:
+        """Return the time to wait for a response before sending a duplicate."""
+        delay = None
+        if len(self) >= policy.min_samples:
+            delay = self.percentile(policy.percentile)
+        if delay is None:
+            delay = policy.initial_delay
+        return max(delay, policy.min_delay)
+
+
+async def hedge_request(  # noqa: PLR0913
+    func: Callable[[], Awaitable[T]],
+    policy: HedgingPolicy | None,
+    tracker: LatencyTracker,
+    *,
+    before_hedge: Callable[[], Awaitable[None]] | None = None,
+    on_hedge: Callable[[], None] | None = None,
+    hedge: Callable[[], Awaitable[T]] | None = None,
+) -> T:
+    """Await a request, sending a duplicate if it is slower than usual.
+
+    The first successful response is returned and the other request cancelled.
+    If both requests fail, the error of the first request is raised. When the
+    first request is cancelled, its elapsed time is recorded as its latency.
+
+    Args:
+        func: Coroutine function making the request, called once per request.
+        policy: Hedging policy. If None, the request is awaited without hedging.
+        tracker: Latencies of the previous requests, updated with this one.
+        before_hedge: Coroutine function awaited before sending the duplicate
+            request, e.g. to wait for the rate limiter.
+        on_hedge: Callback called when a duplicate request is sent.
+        hedge: Coroutine function making the duplicate request, e.g. to record
+            it apart from the first one. Defaults to ``func``.
+
+    Returns:
+        The value returned by the fastest successful request.
+
+    """
+    if policy is None:
+        return await func()
+
+    if policy.budget is not None:
+        policy.budget.deposit()
+
+    start = time.monotonic()
+    primary = asyncio.ensure_future(_timed(func, tracker))
+    pending = {primary}
+    try:
+        delay = tracker.get_hedging_delay(policy)
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or (policy.budget is not None and not policy.budget.withdraw()):
+            return await primary
+
+        if on_hedge is not None:
+            on_hedge()
+        pending.add(asyncio.ensure_future(_timed(hedge or func, tracker, before_hedge)))
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return task.result()
+        return await primary
+    finally:
+        if not primary.done():
+            # The cancelled first request took at least this long, record it so
+            # the hedging delay is not computed from the fastest responses only
+            tracker.record(time.monotonic() - start)
+        for task in pending:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+
+async def _timed(
+    func: Callable[[], Awaitable[T]],
+    tracker: LatencyTracker,
+    before: Callable[[], Awaitable[None]] | None = None,
+) -> T:
+    """Await the request and record its latency if it succeeds."""
+    if before is not None:
+        await before()
+    start = time.monotonic()
+    result = await func()
+    tracker.record(time.monotonic() - start)
+    return result
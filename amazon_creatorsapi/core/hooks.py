@@ -0,0 +1,311 @@
+"""Event hooks called during the lifecycle of the API requests.
+
+Hooks receive a ``RequestEvent`` with the operation, the marketplace, the time
+spent in each phase of the request and the size of the payloads, so callers can
+feed their own metrics or logs. Clients without hooks do not create events nor
+measure anything.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable, Iterator
+
+T = TypeVar("T")
+
+THROTTLE = "throttle"
+BUILD = "build"
+SERIALIZE = "serialize"
+TOKEN = "token"  # noqa: S105
+SIGN = "sign"
+NETWORK = "network"
+DESERIALIZE = "deserialize"
+
+HOOK_NAMES = (
+    "on_request_start",
+    "on_throttle_wait",
+    "on_response",
+    "on_retry",
+    "on_error",
+)
+
+Hook = Callable[["RequestEvent"], None]
+"""Callback called with the event of the request."""
+
+_current_event: ContextVar[RequestEvent | None] = ContextVar(
+    "current_event", default=None
+)
+
+
+class EventHooks:
+    """Callbacks called during the lifecycle of the requests.
+
+    Every hook is called with the ``RequestEvent`` of the request:
+
+    - ``on_request_start``: before each attempt, before throttling.
+    - ``on_throttle_wait``: after waiting for the throttling interval.
+    - ``on_response``: when the request succeeds and the response is
+      deserialized.
+    - ``on_retry``: when an attempt fails and the request is retried.
+    - ``on_error``: when the request fails and is not retried.
+
+    Exceptions raised by the hooks are propagated to the caller.
+
+    Args:
+        on_request_start: Hook or list of hooks called before each attempt.
+        on_throttle_wait: Hook or list of hooks called after a throttling wait.
+        on_response: Hook or list of hooks called when a request succeeds.
+        on_retry: Hook or list of hooks called before retrying a request.
+        on_error: Hook or list of hooks called when a request fails.
+
+    Example:
+        >>> hooks = EventHooks(on_response=lambda event: print(event.timings))
+        >>> api = AmazonApi(..., hooks=hooks)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        on_request_start: Hook | Iterable[Hook] | None = None,
+        on_throttle_wait: Hook | Iterable[Hook] | None = None,
+        on_response: Hook | Iterable[Hook] | None = None,
+        on_retry: Hook | Iterable[Hook] | None = None,
+        on_error: Hook | Iterable[Hook] | None = None,
+    ) -> None:
+        """Initialize the hooks with the given callbacks."""
+        self._hooks: dict[str, list[Hook]] = {name: [] for name in HOOK_NAMES}
+        for name, hooks in zip(
+            HOOK_NAMES,
+            (on_request_start, on_throttle_wait, on_response, on_retry, on_error),
+        ):
+            if callable(hooks):
+                self.add(name, hooks)
+            elif hooks is not None:
+                for hook in hooks:
+                    self.add(name, hook)
+
+    def __bool__(self) -> bool:
+        """Return whether any hook is registered."""
+        return any(self._hooks.values())
+
+    def add(self, name: str, hook: Hook) -> None:
+        """Register a hook.
+
+        Args:
+            name: Name of the event, e.g. ``on_response``.
+            hook: Callback called with the ``RequestEvent``.
+
+        Raises:
+            ValueError: If the name is not a known event.
+
+        """
+        if name not in self._hooks:
+            msg = f"Unknown hook {name!r}, valid hooks are: {', '.join(HOOK_NAMES)}"
+            raise ValueError(msg)
+        self._hooks[name].append(hook)
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        """Call the hooks registered for an event."""
+        for hook in self._hooks[name]:
+            hook(event)
+
+    def create_event(self, operation: str, marketplace: str) -> RequestEvent:
+        """Return the event of a new request, calling these hooks."""
+        return RequestEvent(operation, marketplace, hooks=self)
+
+
+@dataclass
+class RequestEvent:
+    """Information about a request, passed to the event hooks.
+
+    The same event is passed to all the hooks called for a request, filled in as
+    the request progresses.
+
+    Args:
+        operation: Name of the API operation, e.g. ``GetItems``.
+        marketplace: Marketplace of the request, e.g. ``www.amazon.es``.
+        attempt: Number of the attempt being made, starting at 1.
+        timings: Seconds spent in each phase of the request, summed over the
+            attempts. Phases are ``throttle``, ``build``, ``serialize``,
+            ``token``, ``sign``, ``network`` and ``deserialize``, depending on the
+            client.
+        request_size: Size in bytes of the JSON body sent by the current attempt.
+        response_size: Size in bytes of the body received by the current attempt.
+        status_code: HTTP status received by the current attempt.
+        caches: Whether each cache used by the request was hit, e.g.
+            ``{"token": True}`` when the OAuth2 token was reused.
+        error: Error raised by the last attempt, or None.
+        retry_delay: Seconds waited before the next attempt when retrying.
+        duration: Seconds since the request started, set when it completes.
+        hooks: Hooks called for the request.
+
+    """
+
+    operation: str
+    marketplace: str
+    attempt: int = 1
+    timings: dict[str, float] = field(default_factory=dict)
+    request_size: int | None = None
+    response_size: int | None = None
+    status_code: int | None = None
+    error: BaseException | None = None
+    retry_delay: float | None = None
+    duration: float | None = None
+    caches: dict[str, bool] = field(default_factory=dict)
+    hooks: EventHooks = field(default_factory=EventHooks, repr=False, compare=False)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add_timing(self, phase: str, seconds: float) -> None:
+        """Add the seconds spent in a phase of the request."""
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Add the time spent within the block to a phase of the request."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(phase, time.perf_counter() - start)
+
+    def set_request_body(self, body: Any) -> None:
+        """Record the size of the request body, serialized as JSON."""
+        self.request_size = 0 if body is None else len(json.dumps(body).encode())
+
+    def set_response(self, status_code: int | None, body: str | bytes | None) -> None:
+        """Record the status and the size of the body of a response."""
+        self.status_code = status_code
+        if isinstance(body, str):
+            body = body.encode()
+        self.response_size = len(body or b"")
+
+    def record_cache(self, name: str, *, hit: bool) -> None:
+        """Record whether a cache used by the request was hit."""
+        self.caches[name] = hit
+
+    def create_attempt(self) -> RequestEvent:
+        """Return an event recording one of the concurrent requests of an attempt.
+
+        Used for hedged requests, so only the request whose response is used is
+        recorded in this event with ``merge_attempt``.
+        """
+        return RequestEvent(
+            self.operation, self.marketplace, self.attempt, hooks=self.hooks
+        )
+
+    def merge_attempt(self, attempt: RequestEvent) -> None:
+        """Record the phases, payloads and caches of an event of ``create_attempt``."""
+        for phase, seconds in attempt.timings.items():
+            self.add_timing(phase, seconds)
+        self.request_size = attempt.request_size
+        self.response_size = attempt.response_size
+        self.status_code = attempt.status_code
+        self.caches.update(attempt.caches)
+
+    def start_attempt(self) -> None:
+        """Call ``on_request_start`` for a new attempt of the request."""
+        self.request_size = None
+        self.response_size = None
+        self.status_code = None
+        self.error = None
+        self.retry_delay = None
+        self.hooks.emit("on_request_start", self)
+
+    def throttle_wait(self, seconds: float) -> None:
+        """Record a throttling wait and call ``on_throttle_wait``."""
+        self.add_timing(THROTTLE, seconds)
+        self.hooks.emit("on_throttle_wait", self)
+
+    def retry(self, error: BaseException, delay: float) -> None:
+        """Call ``on_retry`` for a failed attempt and count the next one."""
+        self.error = error
+        self.retry_delay = delay
+        self.hooks.emit("on_retry", self)
+        self.attempt += 1
+
+    def succeed(self) -> None:
+        """Set the duration of the request and call ``on_response``."""
+        self.duration = time.perf_counter() - self._start
+        self.hooks.emit("on_response", self)
+
+    def fail(self, error: BaseException) -> None:
+        """Set the duration and the error of the request and call ``on_error``."""
+        self.error = error
+        self.duration = time.perf_counter() - self._start
+        self.hooks.emit("on_error", self)
+
+
+def measure(
+    event: RequestEvent | None, phase: str
+) -> contextlib.AbstractContextManager[None]:
+    """Return a context measuring a phase of the request, if there is an event."""
+    if event is None:
+        return contextlib.nullcontext()
+    return event.measure(phase)
+
+
+def call_with_hooks(func: Callable[[], T], event: RequestEvent | None) -> T:
+    """Call a function sending a request, reporting its outcome to the hooks.
+
+    Args:
+        func: Function sending the request, including its retries.
+        event: Event of the request. If None, the function is just called.
+
+    Returns:
+        The value returned by the function.
+
+    """
+    if event is None:
+        return func()
+    try:
+        result = func()
+    except Exception as error:
+        event.fail(error)
+        raise
+    event.succeed()
+    return result
+
+
+async def async_call_with_hooks(
+    func: Callable[[], Awaitable[T]], event: RequestEvent | None
+) -> T:
+    """Await a coroutine function sending a request, reporting its outcome.
+
+    Async version of ``call_with_hooks``.
+    """
+    if event is None:
+        return await func()
+    try:
+        result = await func()
+    except Exception as error:
+        event.fail(error)
+        raise
+    event.succeed()
+    return result
+
+
+def get_current_event() -> RequestEvent | None:
+    """Return the event of the request being sent in the current context."""
+    return _current_event.get()
+
+
+@contextlib.contextmanager
+def use_event(event: RequestEvent | None) -> Iterator[None]:
+    """Set the event of the request sent within the block.
+
+    Used to record the phases measured by the SDK clients, which do not receive
+    the event as an argument.
+    """
+    token = _current_event.set(event)
+    try:
+        yield
+    finally:
+        _current_event.reset(token)
@@ -0,0 +1,330 @@
+"""Metrics collected from the event hooks of the clients.
+
+``MetricsRegistry`` keeps counters per operation and marketplace, latency
+histograms with a fixed memory footprint, the bytes sent and received, the
+cache hit ratios, the number of throttled (429) responses and the time spent
+waiting for the throttling interval. The metrics can be exported in the
+Prometheus text format or as a dict.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .hooks import THROTTLE, EventHooks
+
+if TYPE_CHECKING:
+    from .hooks import RequestEvent
+
+TOO_MANY_REQUESTS = 429
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LatencyHistogram:
+    """Histogram of durations with a fixed number of buckets.
+
+    Durations are recorded in microseconds in log-linear buckets, like HDR
+    histograms: every power of two is split in ``2 ** (precision_bits - 1)``
+    buckets, so the relative error of the quantiles is below
+    ``2 ** (1 - precision_bits)`` whatever the number of values recorded.
+
+    Args:
+        precision_bits: Bits of precision of the buckets. The default of 6 keeps
+            the error below 3.2% with less than 900 buckets.
+        max_seconds: Highest duration tracked. Longer durations are recorded
+            as this value.
+
+    """
+
+    def __init__(self, precision_bits: int = 6, max_seconds: float = 3600.0) -> None:
+        """Initialize an empty histogram."""
+        self._precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        self._half = self._sub_buckets // 2
+        self._max_value = max(int(max_seconds * 1_000_000), self._sub_buckets)
+        self._counts = [0] * (self._get_index(self._max_value) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def _get_index(self, value: int) -> int:
+        """Return the bucket of a value in microseconds."""
+        if value < self._sub_buckets:
+            return value
+        shift = value.bit_length() - self._precision_bits
+        return (
+            self._sub_buckets + (shift - 1) * self._half + (value >> shift) - self._half
+        )
+
+    def _get_upper_bound(self, index: int) -> int:
+        """Return the highest value in microseconds of a bucket."""
+        if index < self._sub_buckets:
+            return index
+        shift, offset = divmod(index - self._sub_buckets, self._half)
+        shift += 1
+        return ((self._half + offset + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record a duration."""
+        value = min(max(int(seconds * 1_000_000), 0), self._max_value)
+        self._counts[self._get_index(value)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def get_quantile(self, quantile: float) -> float:
+        """Return the duration below which a fraction of the values fall.
+
+        Args:
+            quantile: Fraction of the values, between 0 and 1.
+
+        Returns:
+            The upper bound in seconds of the bucket of the quantile, capped to
+            the highest duration recorded, or 0 if the histogram is empty.
+
+        """
+        if self.count == 0 or self.max is None:
+            return 0.0
+        rank = max(1, round(quantile * self.count))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._get_upper_bound(index) / 1_000_000, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        """Return the count, the sum, the extremes and the main quantiles."""
+        summary: dict[str, float | int | None] = {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+        }
+        for quantile in QUANTILES:
+            summary[f"p{quantile * 100:g}"] = self.get_quantile(quantile)
+        return summary
+
+
+@dataclass
+class _RequestMetrics:
+    """Metrics of the requests of an operation in a marketplace."""
+
+    requests: int = 0
+    errors: int = 0
+    attempts: int = 0
+    retries: int = 0
+    throttled: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    throttle_seconds: float = 0.0
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class MetricsRegistry:
+    """Collector of the metrics of the requests sent by the clients.
+
+    The registry is fed by event hooks, so its metrics only include the clients
+    given its hooks. It is thread safe and can be shared by several clients.
+
+    Args:
+        namespace: Prefix of the names of the Prometheus metrics.
+
+    Example:
+        >>> metrics = MetricsRegistry()
+        >>> api = AmazonCreatorsApi(..., hooks=metrics.hooks)
+        >>> api.get_items(["B01N5IB20Q"])
+        >>> print(metrics.to_prometheus())
+
+    """
+
+    def __init__(self, namespace: str = "amazon_api") -> None:
+        """Initialize an empty registry."""
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str], _RequestMetrics] = {}
+        self._caches: dict[str, list[int]] = {}
+
+    @property
+    def hooks(self) -> EventHooks:
+        """Return new event hooks feeding this registry."""
+        hooks = EventHooks()
+        self.register(hooks)
+        return hooks
+
+    def register(self, hooks: EventHooks) -> None:
+        """Add the hooks feeding this registry to existing event hooks."""
+        hooks.add("on_retry", self._record_attempt)
+        hooks.add("on_response", self._record_request)
+        hooks.add("on_error", self._record_request)
+
+    def reset(self) -> None:
+        """Remove all the metrics collected."""
+        with self._lock:
+            self._requests.clear()
+            self._caches.clear()
+
+    def _get_metrics(self, event: RequestEvent) -> _RequestMetrics:
+        key = (event.operation, event.marketplace)
+        if key not in self._requests:
+            self._requests[key] = _RequestMetrics()
+        return self._requests[key]
+
+    def _record_attempt(self, event: RequestEvent) -> None:
+        """Record an attempt of a request, failed or not."""
+        with self._lock:
+            metrics = self._get_metrics(event)
+            metrics.attempts += 1
+            metrics.bytes_sent += event.request_size or 0
+            metrics.bytes_received += event.response_size or 0
+            if event.status_code == TOO_MANY_REQUESTS:
+                metrics.throttled += 1
+            if event.retry_delay is not None:
+                metrics.retries += 1
+
+    def _record_request(self, event: RequestEvent) -> None:
+        """Record the last attempt and the outcome of a completed request."""
+        self._record_attempt(event)
+        with self._lock:
+            metrics = self._get_metrics(event)
+            metrics.requests += 1
+            if event.error is not None:
+                metrics.errors += 1
+            if event.duration is not None:
+                metrics.latency.record(event.duration)
+            for phase, seconds in event.timings.items():
+                if phase == THROTTLE:
+                    metrics.throttle_seconds += seconds
+                else:
+                    metrics.phase_seconds[phase] = (
+                        metrics.phase_seconds.get(phase, 0.0) + seconds
+                    )
+            for name, hit in event.caches.items():
+                counts = self._caches.setdefault(name, [0, 0])
+                counts[0 if hit else 1] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the metrics collected as a dict.
+
+        Returns:
+            A dict with the metrics of every operation and marketplace under
+            ``requests``, the hits, misses and hit ratio of every cache under
+            ``caches`` and the totals of all the requests under ``totals``.
+
+        """
+        with self._lock:
+            requests = []
+            totals: dict[str, Any] = {
+                "requests": 0,
+                "errors": 0,
+                "attempts": 0,
+                "retries": 0,
+                "throttled": 0,
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "throttle_seconds": 0.0,
+            }
+            for (operation, marketplace), metrics in sorted(self._requests.items()):
+                counters = {name: getattr(metrics, name) for name in totals}
+                for name, value in counters.items():
+                    totals[name] += value
+                requests.append(
+                    {
+                        "operation": operation,
+                        "marketplace": marketplace,
+                        **counters,
+                        "phase_seconds": dict(metrics.phase_seconds),
+                        "latency": metrics.latency.to_dict(),
+                    }
+                )
+            caches = {
+                name: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": hits / (hits + misses),
+                }
+                for name, (hits, misses) in sorted(self._caches.items())
+            }
+        return {"requests": requests, "caches": caches, "totals": totals}
+
+    def to_prometheus(self) -> str:
+        """Return the metrics collected in the Prometheus text format."""
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        def add(name: str, kind: str, description: str) -> str:
+            name = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            return name
+
+        counters = (
+            ("requests", "requests_total", "Requests completed."),
+            ("errors", "errors_total", "Requests failed."),
+            ("attempts", "attempts_total", "Attempts sent, including retries."),
+            ("retries", "retries_total", "Attempts retried."),
+            ("throttled", "throttled_total", "Responses with status 429."),
+            ("bytes_sent", "request_bytes_total", "Bytes of the request bodies."),
+            ("bytes_received", "response_bytes_total", "Bytes of the responses."),
+            (
+                "throttle_seconds",
+                "throttle_seconds_total",
+                "Seconds waited for the throttling interval.",
+            ),
+        )
+        for key, metric, description in counters:
+            name = add(metric, "counter", description)
+            for series in snapshot["requests"]:
+                labels = _format_labels(series)
+                lines.append(f"{name}{labels} {_format_value(series[key])}")
+
+        name = add("phase_seconds_total", "counter", "Seconds spent in each phase.")
+        for series in snapshot["requests"]:
+            for phase, seconds in sorted(series["phase_seconds"].items()):
+                labels = _format_labels(series, phase=phase)
+                lines.append(f"{name}{labels} {_format_value(seconds)}")
+
+        name = add("request_duration_seconds", "summary", "Duration of the requests.")
+        for series in snapshot["requests"]:
+            latency = series["latency"]
+            for quantile in QUANTILES:
+                labels = _format_labels(series, quantile=f"{quantile:g}")
+                value = latency[f"p{quantile * 100:g}"]
+                lines.append(f"{name}{labels} {_format_value(value)}")
+            labels = _format_labels(series)
+            lines.append(f"{name}_sum{labels} {_format_value(latency['sum'])}")
+            lines.append(f"{name}_count{labels} {latency['count']}")
+
+        name = add("cache_requests_total", "counter", "Requests by cache and result.")
+        for cache, counts in snapshot["caches"].items():
+            for result, key in (("hit", "hits"), ("miss", "misses")):
+                labels = _format_labels({}, cache=cache, result=result)
+                lines.append(f"{name}{labels} {counts[key]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(series: dict[str, Any], **extra: str) -> str:
+    """Return the Prometheus labels of a series, escaping their values."""
+    labels: dict[str, Any] = {
+        key: series[key] for key in ("operation", "marketplace") if key in series
+    }
+    labels.update(extra)
+    formatted = ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in labels.items()
+    )
+    return f"{{{formatted}}}"
+
+
+def _format_value(value: float) -> str:
+    """Return a number in the Prometheus text format."""
+    return repr(float(value)) if isinstance(value, float) else str(value)
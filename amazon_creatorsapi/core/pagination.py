@@ -0,0 +1,186 @@
+"""Iteration over the pages of the paginated operations, prefetching them.
+
+The first page is requested alone, as it reports how many pages there are. The
+next ones are requested a few at a time, throttled by the client as usual, and
+yielded in order, so the consumer gets a page while the following ones are
+already on their way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from amazon_creatorsapi.errors import InvalidArgumentError
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Generator,
+        Iterable,
+        Iterator,
+    )
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 10
+DEFAULT_PREFETCH = 2
+MAX_SEARCH_PAGES = 10
+
+
+def count_pages(total: float | None, per_page: int) -> int | None:
+    """Return the number of pages of a total of results, or None if unknown."""
+    if total is None:
+        return None
+    return -(-int(total) // per_page)
+
+
+def get_variations_page_count(result: Any) -> int | None:
+    """Return the number of pages of variations of a result, or None if unknown."""
+    summary = result.variation_summary
+    if summary is None or summary.page_count is None:
+        return None
+    return int(summary.page_count)
+
+
+def iter_pages(
+    get_page: Callable[[int], T],
+    get_page_count: Callable[[T], int | None],
+    *,
+    max_pages: int | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    end_errors: tuple[type[Exception], ...] = (),
+) -> Generator[T, None, None]:
+    """Yield all the pages of a paginated operation, in order.
+
+    Args:
+        get_page: Function returning a page given its number, starting at 1.
+        get_page_count: Function returning the number of pages from the first
+            one, or None if unknown, reading up to ``max_pages``.
+        max_pages: Maximum number of pages to read. Defaults to no limit.
+        prefetch: Number of pages requested at the same time. Defaults to 2.
+        end_errors: Errors raised for the pages past the last one, which stop
+            the iteration instead of being raised.
+
+    Raises:
+        InvalidArgumentError: If ``prefetch`` is lower than 1.
+
+    """
+    _check_prefetch(prefetch)
+    return _iter_pages(
+        get_page,
+        get_page_count,
+        max_pages=max_pages,
+        prefetch=prefetch,
+        end_errors=end_errors,
+    )
+
+
+def async_iter_pages(
+    get_page: Callable[[int], Awaitable[T]],
+    get_page_count: Callable[[T], int | None],
+    *,
+    max_pages: int | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    end_errors: tuple[type[Exception], ...] = (),
+) -> AsyncGenerator[T, None]:
+    """Yield all the pages of a paginated operation, in order.
+
+    Async version of ``iter_pages``.
+    """
+    _check_prefetch(prefetch)
+    return _async_iter_pages(
+        get_page,
+        get_page_count,
+        max_pages=max_pages,
+        prefetch=prefetch,
+        end_errors=end_errors,
+    )
+
+
+def _check_prefetch(prefetch: int) -> None:
+    """Raise an error if the number of pages requested at once is not valid."""
+    if not isinstance(prefetch, int) or prefetch < 1:
+        msg = "Arg prefetch should be an integer greater than 0."
+        raise InvalidArgumentError(msg)
+
+
+def _iter_pages(
+    get_page: Callable[[int], T],
+    get_page_count: Callable[[T], int | None],
+    *,
+    max_pages: int | None,
+    prefetch: int,
+    end_errors: tuple[type[Exception], ...],
+) -> Generator[T, None, None]:
+    """Yield the pages of a paginated operation, with validated arguments."""
+    first_page = get_page(1)
+    yield first_page
+    page_numbers = _get_page_numbers(get_page_count(first_page), max_pages)
+    pending: deque[Future[T]] = deque()
+    executor = ThreadPoolExecutor(prefetch)
+    try:
+        # The last None requests no page and waits for the pages in flight
+        for page_number in itertools.chain(page_numbers, [None]):
+            if page_number is not None:
+                get_next_page = functools.partial(get_page, page_number)
+                run = contextvars.copy_context().run
+                pending.append(executor.submit(run, get_next_page))
+            while pending and (page_number is None or len(pending) >= prefetch):
+                future = pending.popleft()
+                if isinstance(future.exception(), end_errors):
+                    return
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _async_iter_pages(
+    get_page: Callable[[int], Awaitable[T]],
+    get_page_count: Callable[[T], int | None],
+    *,
+    max_pages: int | None,
+    prefetch: int,
+    end_errors: tuple[type[Exception], ...],
+) -> AsyncGenerator[T, None]:
+    """Yield the pages of a paginated operation, with validated arguments."""
+    first_page = await get_page(1)
+    yield first_page
+    page_numbers = _get_page_numbers(get_page_count(first_page), max_pages)
+    pending: deque[asyncio.Future[T]] = deque()
+    try:
+        for page_number in itertools.chain(page_numbers, [None]):
+            if page_number is not None:
+                pending.append(asyncio.ensure_future(get_page(page_number)))
+            while pending and (page_number is None or len(pending) >= prefetch):
+                task = pending.popleft()
+                await asyncio.wait([task])
+                if isinstance(task.exception(), end_errors):
+                    return
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def iter_new_items(items: Iterable[Any] | None, seen: set[str]) -> Iterator[Any]:
+    """Yield the items whose ASIN is not in ``seen``, adding it."""
+    for item in items or ():
+        if item.asin not in seen:
+            seen.add(item.asin)
+            yield item
+
+
+def _get_page_numbers(page_count: int | None, max_pages: int | None) -> range:
+    """Return the numbers of the pages after the first one."""
+    if page_count is None:
+        page_count = max_pages or 1
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    return range(2, page_count + 1)
@@ -0,0 +1,265 @@
+"""Send pipeline shared by the clients of both APIs.
+
+Every request goes through the same steps: the circuit breaker is checked, the
+request is counted in the daily quota, throttled and sent, retrying it with the
+retry policy and reporting its lifecycle to the hooks and the tracer. The
+clients only tell how the request is called and which errors are raised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NoReturn, TypeVar
+
+from amazon_creatorsapi.core.hooks import RequestEvent, call_with_hooks, use_event
+from amazon_creatorsapi.core.retry import call_with_retry
+from amazon_creatorsapi.core.tracing import trace_request, trace_retry
+
+if TYPE_CHECKING:
+    import threading
+    from contextlib import AbstractContextManager
+
+    from amazon_creatorsapi.core.circuit_breaker import CircuitBreaker
+    from amazon_creatorsapi.core.deadline import Deadline
+    from amazon_creatorsapi.core.hooks import EventHooks
+    from amazon_creatorsapi.core.quota import QuotaTracker
+    from amazon_creatorsapi.core.results import ChunkMetadata
+    from amazon_creatorsapi.core.retry import RetryPolicy
+    from amazon_creatorsapi.core.scheduler import RequestScheduler
+
+T = TypeVar("T")
+
+
+class BaseRequestPipeline:
+    """Steps of the send pipeline not depending on sync or async requests.
+
+    Subclasses set the errors raised by the pipeline, which take the message,
+    and the quota error also the seconds to wait.
+    """
+
+    _DEADLINE_ERROR: ClassVar[type[Exception]]
+    _QUOTA_ERROR: ClassVar[type[Exception]]
+    _CIRCUIT_BREAKER_ERROR: ClassVar[type[Exception]]
+    _TRANSPORT_ERRORS: ClassVar[tuple[type[BaseException], ...]] = ()
+
+    marketplace: str
+    throttling: float
+    hooks: EventHooks | None
+    quota: QuotaTracker | None
+    scheduler: RequestScheduler | None
+    retry_policy: RetryPolicy | None
+    circuit_breaker: CircuitBreaker | None
+    _tracer: Any
+    _last_query_time: float
+
+    def _create_event(self, operation: str) -> RequestEvent | None:
+        """Return the event of a new request, or None without hooks nor tracing."""
+        if self.hooks:
+            return self.hooks.create_event(operation, self.marketplace)
+        if self._tracer is not None:
+            return RequestEvent(operation, self.marketplace)
+        return None
+
+    def _check_circuit_breaker(self, *, reserve: bool = True) -> None:
+        """Raise the circuit breaker error if the circuit breaker rejects requests."""
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow_request(reserve=reserve):
+            msg = (
+                f"Circuit breaker for {breaker.key} is open, retry after"
+                f" {breaker.retry_after:.1f} seconds"
+            )
+            raise self._CIRCUIT_BREAKER_ERROR(msg)
+
+    def _check_quota(self, wait_time: float) -> None:
+        """Raise the quota error if the daily quota is spent."""
+        if wait_time > 0:
+            msg = f"The daily quota is spent, retry after {wait_time:.0f} seconds"
+            raise self._QUOTA_ERROR(msg, wait_time)
+
+    def _track_request(self) -> AbstractContextManager[None]:
+        """Return a context recording the request in the circuit breaker."""
+        if self.circuit_breaker is None:
+            return contextlib.nullcontext()
+        return self.circuit_breaker.track(*self._TRANSPORT_ERRORS)
+
+    def _raise_deadline_exceeded(self, deadline: Deadline) -> NoReturn:
+        """Raise the deadline error of a call not completed in time."""
+        msg = f"The call did not complete in {deadline.timeout} seconds"
+        raise self._DEADLINE_ERROR(msg)
+
+
+class RequestPipeline(BaseRequestPipeline):
+    """Send pipeline of the sync clients.
+
+    Subclasses also set the base error of the API, re-raised as is.
+    """
+
+    _API_ERROR: ClassVar[type[Exception]]
+    _throttle_lock: threading.Lock
+
+    def _get_request_timeout(self, deadline: Deadline | None) -> Any:
+        """Return the value the requests are called with, limited by the deadline.
+
+        Defaults to the time left until the deadline, or None without a deadline.
+        """
+        return deadline.limit(None) if deadline else None
+
+    def _handle_send_error(self, error: Exception, deadline: Deadline | None) -> None:
+        """Raise the error of a request mapped to the errors of the client.
+
+        Errors not related to the API raise the deadline error once the deadline
+        has passed. Returning re-raises the error as is.
+        """
+        if isinstance(error, self._API_ERROR):
+            return
+        if deadline is not None and deadline.expired:
+            msg = f"The request did not complete in {deadline.timeout} seconds"
+            raise self._DEADLINE_ERROR(msg) from error
+
+    def _send(
+        self,
+        func: Callable[[Any], T],
+        deadline: Deadline | None = None,
+        chunk: ChunkMetadata | None = None,
+        event: RequestEvent | None = None,
+    ) -> T:
+        """Send a request after throttling, retrying it with the retry policy.
+
+        The function is called with the request timeout, limited by the deadline.
+        The lifecycle of the request is reported to the hooks if there is an event.
+        """
+
+        def send() -> T:
+            if event is not None:
+                event.start_attempt()
+            with trace_retry(self._tracer, event):
+                self._check_circuit_breaker(reserve=False)
+                self._acquire_quota(deadline)
+                try:
+                    self._throttle(deadline, event)
+                    self._check_circuit_breaker()
+                except BaseException:
+                    # The request is not sent, so it does not count in the quota
+                    self._release_quota()
+                    raise
+                request_timeout = self._get_request_timeout(deadline)
+                with self._track_request(), use_event(event):
+                    try:
+                        return func(request_timeout)
+                    except Exception as error:
+                        self._handle_send_error(error, deadline)
+                        raise
+
+        def on_retry(_retry: int, error: BaseException, delay: float) -> None:
+            if chunk is not None:
+                chunk.retries += 1
+            if event is not None:
+                event.retry(error, delay)
+
+        item_ids = chunk.item_ids if chunk is not None else None
+        with trace_request(self._tracer, event, item_ids):
+            return call_with_hooks(
+                lambda: call_with_retry(send, self.retry_policy, on_retry, deadline),
+                event,
+            )
+
+    def _acquire_quota(self, deadline: Deadline | None = None) -> None:
+        """Count the request in the daily quota, raising if it is spent."""
+        if self.quota is None:
+            return
+        self._check_quota(
+            self.quota.acquire(
+                timeout=deadline.remaining() if deadline is not None else None
+            )
+        )
+
+    def _release_quota(self) -> None:
+        """Uncount a request not sent from the daily quota."""
+        if self.quota is not None:
+            self.quota.release()
+
+    def _throttle(
+        self, deadline: Deadline | None = None, event: RequestEvent | None = None
+    ) -> None:
+        """Wait for the throttling interval to elapse since the last API call.
+
+        Raises the deadline error without waiting if the deadline would pass.
+        """
+        if self.scheduler is not None:
+            start = time.perf_counter()
+            if deadline is None:
+                self.scheduler.acquire()
+            elif not self.scheduler.acquire(timeout=deadline.remaining()):
+                self._raise_deadline_exceeded(deadline)
+            if event is not None:
+                event.throttle_wait(time.perf_counter() - start)
+            return
+        # The lock spaces the requests of the threads sharing the client
+        with self._throttle_lock:
+            wait_time = self.throttling - (time.time() - self._last_query_time)
+            if deadline is not None and max(wait_time, 0) >= deadline.remaining():
+                self._raise_deadline_exceeded(deadline)
+            if wait_time > 0:
+                time.sleep(wait_time)
+                if event is not None:
+                    event.throttle_wait(wait_time)
+            self._last_query_time = time.time()
+
+
+class AsyncRequestPipeline(BaseRequestPipeline):
+    """Throttling and quota steps of the send pipeline of the async clients."""
+
+    _throttle_lock: asyncio.Lock | None
+
+    async def _acquire_quota(self, deadline: Deadline | None = None) -> None:
+        """Count the request in the daily quota, raising if it is spent."""
+        if self.quota is None:
+            return
+        self._check_quota(
+            await self.quota.async_acquire(
+                timeout=deadline.remaining() if deadline is not None else None
+            )
+        )
+
+    async def _release_quota(self) -> None:
+        """Uncount a request not sent from the daily quota."""
+        if self.quota is not None:
+            await self.quota.async_release()
+
+    async def _throttle(
+        self, deadline: Deadline | None = None, event: RequestEvent | None = None
+    ) -> None:
+        """Wait for the throttling interval to elapse since the last API call.
+
+        Uses asyncio.Lock to prevent race conditions when multiple coroutines
+        attempt to make concurrent requests. The wait reported to the hooks
+        includes the time waiting for the other coroutines. Raises the deadline
+        error without waiting if the deadline would pass.
+        """
+        if self.scheduler is not None:
+            start = time.perf_counter()
+            if deadline is None:
+                await self.scheduler.async_acquire()
+            elif not await self.scheduler.async_acquire(timeout=deadline.remaining()):
+                self._raise_deadline_exceeded(deadline)
+            if event is not None:
+                event.throttle_wait(time.perf_counter() - start)
+            return
+
+        # Lazy initialization of the lock (ensures event loop is active)
+        if self._throttle_lock is None:
+            self._throttle_lock = asyncio.Lock()
+
+        start = time.perf_counter()
+        async with self._throttle_lock:
+            wait_time = self.throttling - (time.time() - self._last_query_time)
+            if deadline is not None and max(wait_time, 0) >= deadline.remaining():
+                self._raise_deadline_exceeded(deadline)
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            self._last_query_time = time.time()
+
+        if event is not None and wait_time > 0:
+            event.throttle_wait(time.perf_counter() - start)
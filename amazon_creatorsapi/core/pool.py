@@ -0,0 +1,353 @@
+"""Pools spreading the requests across the clients of several credentials.
+
+Every client is bound to one credential, with its own throttling, scheduler and
+daily quota. A pool sends each call with one of its clients, chosen with smooth
+weighted round robin in proportion to the requests per second of every client,
+so the throughput grows with the number of credentials. When a client fails
+with one of its ``FAILOVER_ERRORS``, like a 429 or an associate validation
+error, the call is sent again with the next client and the failed one is
+skipped until its cooldown ends. The calls to ``get_items`` with more items than
+a request fail over every chunk of items on its own, so the chunks already
+fetched are not requested again.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from .constants import ITEMS_PER_REQUEST
+from .deadline import Deadline
+from .results import ResultList, ResultMetadata
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+DEFAULT_COOLDOWN = 60.0
+
+ClientT = TypeVar("ClientT")
+
+
+class _Member:
+    """Client of a pool with its weight and health."""
+
+    __slots__ = ("client", "current_weight", "failed_until", "weight")
+
+    def __init__(self, client: Any, weight: float) -> None:
+        self.client = client
+        self.weight = weight
+        self.current_weight = 0.0
+        self.failed_until = 0.0
+
+
+class _BasePool(Generic[ClientT]):
+    """Selection of the clients shared by the sync and async pools."""
+
+    def __init__(
+        self,
+        clients: Sequence[ClientT],
+        *,
+        weights: Sequence[float] | None = None,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        if not clients:
+            msg = "The pool needs at least one client"
+            raise ValueError(msg)
+        if weights is None:
+            weights = _get_default_weights(clients)
+        elif len(weights) != len(clients):
+            msg = "There must be one weight for every client"
+            raise ValueError(msg)
+        self.cooldown = cooldown
+        self._members = [
+            _Member(client, weight) for client, weight in zip(clients, weights)
+        ]
+        self._lock = threading.Lock()
+
+    @property
+    def clients(self) -> list[ClientT]:
+        """Clients of the pool."""
+        return [member.client for member in self._members]
+
+    def get_available_clients(self) -> list[ClientT]:
+        """Return the clients not cooling down after a failover."""
+        now = time.monotonic()
+        return [member.client for member in self._members if member.failed_until <= now]
+
+    def _get_members(self) -> list[_Member]:
+        """Return the members to try for a call, the selected one first.
+
+        The first member is chosen with smooth weighted round robin among the
+        available members, followed by the other available members from the
+        highest weight. If every member is cooling down, the one recovering
+        first is tried.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                member for member in self._members if member.failed_until <= now
+            ]
+            if not available:
+                return [min(self._members, key=lambda member: member.failed_until)]
+            total = sum(member.weight for member in available)
+            for member in available:
+                member.current_weight += member.weight
+            selected = max(available, key=lambda member: member.current_weight)
+            selected.current_weight -= total
+        others = sorted(
+            (member for member in available if member is not selected),
+            key=lambda member: member.weight,
+            reverse=True,
+        )
+        return [selected, *others]
+
+    def _fail(self, member: _Member, error: BaseException) -> None:
+        """Skip a member until its cooldown, or the retry time of the error."""
+        retry_after = getattr(error, "retry_after", None)
+        cooldown = retry_after if retry_after is not None else self.cooldown
+        with self._lock:
+            member.failed_until = time.monotonic() + cooldown
+
+
+class CredentialPool(_BasePool[ClientT]):
+    """Pool of sync clients with different credentials.
+
+    Args:
+        clients: Clients of every credential, e.g. ``AmazonApi`` or
+            ``AmazonCreatorsApi`` instances, with their own throttling, scheduler
+            and quota.
+        weights: Share of the calls sent with every client. Defaults to the
+            requests per second allowed by their throttling, with the clients
+            without throttling as the fastest throttled one.
+        cooldown: Seconds a client is skipped after failing over. Errors with a
+            ``retry_after``, like a spent quota, use it instead. Defaults to 60.
+
+    Example:
+        >>> pool = CredentialPool([
+        ...     AmazonApi(key1, secret1, tag1, "US", throttling=1),
+        ...     AmazonApi(key2, secret2, tag2, "US", throttling=0.5),
+        ... ])
+        >>> pool.get_items(asins)  # Sent twice as often with the second account
+
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[ClientT],
+        *,
+        weights: Sequence[float] | None = None,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        """Initialize the pool."""
+        super().__init__(clients, weights=weights, cooldown=cooldown)
+
+    def get_items(self, items: str | list[str], *args: Any, **kwargs: Any) -> Any:
+        """Call ``get_items`` with the clients of the pool, chunk by chunk."""
+        chunks = _get_item_chunks(items)
+        if len(chunks) == 1:
+            return self._call("get_items", (items, *args), kwargs)
+        deadline = Deadline.from_timeout(kwargs.pop("timeout", None))
+        return _merge_results(
+            [
+                self._call(
+                    "get_items", (chunk, *args), _limit_timeout(kwargs, deadline)
+                )
+                for chunk in chunks
+            ]
+        )
+
+    def search_items(self, *args: Any, **kwargs: Any) -> Any:
+        """Call ``search_items`` with a client of the pool."""
+        return self._call("search_items", args, kwargs)
+
+    def get_variations(self, *args: Any, **kwargs: Any) -> Any:
+        """Call ``get_variations`` with a client of the pool."""
+        return self._call("get_variations", args, kwargs)
+
+    def get_browse_nodes(self, *args: Any, **kwargs: Any) -> Any:
+        """Call ``get_browse_nodes`` with a client of the pool."""
+        return self._call("get_browse_nodes", args, kwargs)
+
+    def _call(
+        self,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        members: list[_Member] | None = None,
+    ) -> Any:
+        """Call a method, failing over to the next client on failover errors."""
+        member, *others = members if members is not None else self._get_members()
+        try:
+            result = getattr(member.client, method)(*args, **kwargs)
+        except member.client.FAILOVER_ERRORS as error:
+            self._fail(member, error)
+            if not others:
+                raise
+        else:
+            # Partial results report the failover errors instead of raising
+            chunk_error = _get_failover_error(result, member.client.FAILOVER_ERRORS)
+            if chunk_error is None or not others:
+                return result
+            self._fail(member, chunk_error)
+        return self._call(method, args, kwargs, others)
+
+
+class AsyncCredentialPool(_BasePool[ClientT]):
+    """Pool of async clients with different credentials.
+
+    Async version of ``CredentialPool``. Use it as an async context manager to
+    open and close the connections of all its clients.
+
+    Args:
+        clients: ``AsyncAmazonCreatorsApi`` instances of every credential.
+        weights: Share of the calls sent with every client. Defaults to the
+            requests per second allowed by their throttling, with the clients
+            without throttling as the fastest throttled one.
+        cooldown: Seconds a client is skipped after failing over. Errors with a
+            ``retry_after``, like a spent quota, use it instead. Defaults to 60.
+
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[ClientT],
+        *,
+        weights: Sequence[float] | None = None,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        """Initialize the pool."""
+        super().__init__(clients, weights=weights, cooldown=cooldown)
+
+    async def __aenter__(self) -> AsyncCredentialPool[ClientT]:
+        """Enter the async context manager of every client."""
+        for member in self._members:
+            await member.client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the async context manager of every client."""
+        for member in self._members:
+            await member.client.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def get_items(self, items: str | list[str], *args: Any, **kwargs: Any) -> Any:
+        """Call ``get_items`` with the clients of the pool, chunk by chunk."""
+        chunks = _get_item_chunks(items)
+        if len(chunks) == 1:
+            return await self._call("get_items", (items, *args), kwargs)
+        deadline = Deadline.from_timeout(kwargs.pop("timeout", None))
+        return _merge_results(
+            [
+                await self._call(
+                    "get_items", (chunk, *args), _limit_timeout(kwargs, deadline)
+                )
+                for chunk in chunks
+            ]
+        )
+
+    async def search_items(self, *args: Any, **kwargs: Any) -> Any:
+        """Call ``search_items`` with a client of the pool."""
+        return await self._call("search_items", args, kwargs)
+
+    async def get_variations(self, *args: Any, **kwargs: Any) -> Any:
+        """Call ``get_variations`` with a client of the pool."""
+        return await self._call("get_variations", args, kwargs)
+
+    async def get_browse_nodes(self, *args: Any, **kwargs: Any) -> Any:
+        """Call ``get_browse_nodes`` with a client of the pool."""
+        return await self._call("get_browse_nodes", args, kwargs)
+
+    async def _call(
+        self,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        members: list[_Member] | None = None,
+    ) -> Any:
+        """Call a method, failing over to the next client on failover errors."""
+        member, *others = members if members is not None else self._get_members()
+        try:
+            result = await getattr(member.client, method)(*args, **kwargs)
+        except member.client.FAILOVER_ERRORS as error:
+            self._fail(member, error)
+            if not others:
+                raise
+        else:
+            # Partial results report the failover errors instead of raising
+            chunk_error = _get_failover_error(result, member.client.FAILOVER_ERRORS)
+            if chunk_error is None or not others:
+                return result
+            self._fail(member, chunk_error)
+        return await self._call(method, args, kwargs, others)
+
+
+def _get_default_weights(clients: Sequence[Any]) -> list[float]:
+    """Return the requests per second allowed to the clients, as their weights.
+
+    Clients without throttling are not limited, so they get the weight of the
+    fastest throttled client, or all the clients the same weight if none is
+    throttled.
+    """
+    rates = [_get_requests_per_second(client) for client in clients]
+    fastest = max((rate for rate in rates if rate is not None), default=1.0)
+    return [rate if rate is not None else fastest for rate in rates]
+
+
+def _get_requests_per_second(client: Any) -> float | None:
+    """Return the requests per second allowed by the throttling of a client.
+
+    Returns None if the client is not throttled.
+    """
+    scheduler = getattr(client, "scheduler", None)
+    throttling = scheduler.throttling if scheduler is not None else client.throttling
+    return 1 / throttling if throttling > 0 else None
+
+
+def _get_item_chunks(items: str | list[str]) -> list[Any]:
+    """Return the items of a call split in the chunks of items of a request."""
+    if isinstance(items, str):
+        items = [item.strip() for item in items.split(",")]
+    if not isinstance(items, list) or len(items) <= ITEMS_PER_REQUEST:
+        return [items]
+    return [
+        items[i : i + ITEMS_PER_REQUEST]
+        for i in range(0, len(items), ITEMS_PER_REQUEST)
+    ]
+
+
+def _limit_timeout(kwargs: dict[str, Any], deadline: Deadline | None) -> dict[str, Any]:
+    """Return the arguments of a chunk, with the time left until the deadline."""
+    if deadline is None:
+        return kwargs
+    return {**kwargs, "timeout": deadline.limit(None)}
+
+
+def _merge_results(results: list[Any]) -> ResultList[Any]:
+    """Return the items of the chunks in one list, with the metadata of all."""
+    merged: ResultList[Any] = ResultList()
+    for result in results:
+        merged.extend(result)
+        metadata = getattr(result, "metadata", None)
+        if isinstance(metadata, ResultMetadata):
+            merged.metadata.chunks.extend(metadata.chunks)
+            merged.metadata.errors.update(metadata.errors)
+    return merged
+
+
+def _get_failover_error(
+    result: Any, failover_errors: tuple[type[Exception], ...]
+) -> Exception | None:
+    """Return the failover error of a chunk reported in partial results."""
+    metadata = getattr(result, "metadata", None)
+    if not isinstance(metadata, ResultMetadata):
+        return None
+    for chunk in metadata.failed_chunks:
+        if isinstance(chunk.error, failover_errors):
+            return chunk.error
+    return None
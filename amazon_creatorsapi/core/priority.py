@@ -0,0 +1,58 @@
+"""Priority of the requests sent by the clients.
+
+The priority is set for a block of calls with ``use_priority``, so it reaches
+every request sent within the block, including the chunks and the retries,
+without an argument in every method.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from contextvars import ContextVar
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Priority(str, Enum):
+    """Priority of a request."""
+
+    HIGH = "high"
+    """User facing requests, which can use the reserved quota."""
+
+    NORMAL = "normal"
+    """Default priority of the requests."""
+
+    LOW = "low"
+    """Background requests, like batch jobs and refreshes."""
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "current_priority", default=Priority.NORMAL
+)
+
+
+def get_priority() -> Priority:
+    """Return the priority of the requests sent in the current context."""
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def use_priority(priority: Priority | str) -> Iterator[None]:
+    """Set the priority of the requests sent within the block.
+
+    Args:
+        priority: Priority of the requests.
+
+    Example:
+        >>> with use_priority(Priority.LOW):
+        ...     api.get_items(asins)
+
+    """
+    token = _current_priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
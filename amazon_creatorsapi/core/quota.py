@@ -0,0 +1,237 @@
+"""Daily quota of requests shared by the clients of an account.
+
+The APIs limit the requests per day (TPD) of every account on top of the
+requests per second. ``QuotaTracker`` counts the requests sent in a rolling
+window of 24 hours, in memory or in a file shared by several processes, and
+keeps a share of the quota for the high priority requests, so batch jobs cannot
+spend the budget of the user facing traffic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .files import SharedJsonFile
+from .priority import Priority, get_priority
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+DAY = 24 * 60 * 60.0
+DEFAULT_BUCKET_SECONDS = 60.0
+
+
+class QuotaTracker:
+    """Tracker of the requests sent in a rolling window, usually a day.
+
+    The requests are counted in buckets of ``bucket_seconds``, so the memory and
+    the size of the file do not depend on the number of requests. A bucket
+    leaves the window once all its requests are older than the window.
+
+    High priority requests can use the whole ``daily_limit``, while the rest stop
+    at ``1 - reserved_share`` of it. Requests over their limit wait up to
+    ``max_wait`` seconds for the oldest requests to leave the window and are
+    rejected otherwise.
+
+    Args:
+        daily_limit: Number of requests allowed in the window.
+        reserved_share: Share of the limit only available to high priority
+            requests. Defaults to 10%.
+        max_wait: Seconds a request over its limit waits for quota before being
+            rejected. Defaults to 0, rejecting it immediately.
+        path: JSON file where the requests are counted, shared by the processes
+            using the same path and kept across restarts. Defaults to memory.
+        window: Seconds of the rolling window. Defaults to 24 hours.
+        bucket_seconds: Seconds of the buckets where requests are counted.
+
+    Example:
+        >>> quota = QuotaTracker(8640, reserved_share=0.2, path="quota.json")
+        >>> api = AmazonApi(..., quota=quota)
+        >>> with use_priority(Priority.LOW):
+        ...     api.get_items(asins)  # Raises QuotaExceeded past 80% of the quota
+        >>> quota.get_remaining(Priority.HIGH)
+        1728
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        daily_limit: int,
+        *,
+        reserved_share: float = 0.1,
+        max_wait: float = 0,
+        path: str | os.PathLike[str] | None = None,
+        window: float = DAY,
+        bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+    ) -> None:
+        """Initialize the quota tracker."""
+        if not 0 <= reserved_share <= 1:
+            msg = "reserved_share must be between 0 and 1"
+            raise ValueError(msg)
+        self.daily_limit = daily_limit
+        self.reserved_share = reserved_share
+        self.max_wait = max_wait
+        self.window = window
+        self.bucket_seconds = bucket_seconds
+        self._file = SharedJsonFile(path) if path is not None else None
+        self._buckets: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_limit(self, priority: Priority | str | None = None) -> int:
+        """Return the requests allowed in the window for a priority.
+
+        Args:
+            priority: Priority of the requests. Defaults to the priority of the
+                current context.
+
+        """
+        priority = Priority(priority) if priority is not None else get_priority()
+        if priority is Priority.HIGH:
+            return self.daily_limit
+        return int(self.daily_limit * (1 - self.reserved_share))
+
+    def get_used(self) -> int:
+        """Return the number of requests sent in the window."""
+        with self._locked() as buckets:
+            return sum(buckets.values())
+
+    def get_remaining(self, priority: Priority | str | None = None) -> int:
+        """Return the number of requests a priority can still send in the window.
+
+        Args:
+            priority: Priority of the requests. Defaults to the priority of the
+                current context.
+
+        """
+        return max(self.get_limit(priority) - self.get_used(), 0)
+
+    def reserve(self, priority: Priority | str | None = None) -> float:
+        """Count a request if the priority has quota left.
+
+        Args:
+            priority: Priority of the request. Defaults to the priority of the
+                current context.
+
+        Returns:
+            0 if the request was counted, or the seconds until the oldest
+            requests leave the window and it can be sent otherwise.
+
+        """
+        limit = self.get_limit(priority)
+        with self._locked() as buckets:
+            used = sum(buckets.values())
+            if used < limit:
+                key = int(time.time() // self.bucket_seconds)
+                buckets[key] = buckets.get(key, 0) + 1
+                return 0.0
+            return self._get_wait_time(buckets, used - limit + 1)
+
+    def acquire(
+        self, priority: Priority | str | None = None, timeout: float | None = None
+    ) -> float:
+        """Count a request, waiting up to ``max_wait`` seconds for quota.
+
+        Args:
+            priority: Priority of the request. Defaults to the priority of the
+                current context.
+            timeout: Maximum seconds to wait, if lower than ``max_wait``.
+
+        Returns:
+            0 if the request was counted, or the seconds until it can be sent if
+            that is longer than the wait allowed.
+
+        """
+        priority = Priority(priority) if priority is not None else get_priority()
+        end = time.monotonic() + self._get_max_wait(timeout)
+        while True:
+            wait_time = self.reserve(priority)
+            if wait_time == 0 or wait_time > end - time.monotonic():
+                return wait_time
+            time.sleep(wait_time)
+
+    async def async_acquire(
+        self, priority: Priority | str | None = None, timeout: float | None = None
+    ) -> float:
+        """Count a request, waiting up to ``max_wait`` seconds for quota.
+
+        Async version of ``acquire``. With a file, the requests are counted in a
+        thread, so waiting for the lock of the file does not block the loop.
+        """
+        priority = Priority(priority) if priority is not None else get_priority()
+        end = time.monotonic() + self._get_max_wait(timeout)
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._file is None:
+                wait_time = self.reserve(priority)
+            else:
+                wait_time = await loop.run_in_executor(None, self.reserve, priority)
+            if wait_time == 0 or wait_time > end - time.monotonic():
+                return wait_time
+            await asyncio.sleep(wait_time)
+
+    def release(self) -> None:
+        """Uncount a request counted by ``reserve`` that was not sent.
+
+        The request is removed from the newest bucket, where it was counted
+        unless a new bucket has started since then.
+        """
+        with self._locked() as buckets:
+            if buckets:
+                key = max(buckets)
+                buckets[key] -= 1
+                if buckets[key] <= 0:
+                    del buckets[key]
+
+    async def async_release(self) -> None:
+        """Uncount a request counted by ``reserve`` that was not sent.
+
+        Async version of ``release``.
+        """
+        if self._file is None:
+            self.release()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self.release)
+
+    def _get_max_wait(self, timeout: float | None) -> float:
+        """Return the seconds a request can wait for quota."""
+        return self.max_wait if timeout is None else min(self.max_wait, timeout)
+
+    def _get_wait_time(self, buckets: dict[int, int], excess: int) -> float:
+        """Return the seconds until a number of requests leave the window."""
+        left = 0
+        for key in sorted(buckets):
+            left += buckets[key]
+            if left >= excess:
+                return max(
+                    (key + 1) * self.bucket_seconds + self.window - time.time(), 0
+                )
+        return self.window
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[dict[int, int]]:
+        """Hold the lock of the buckets in the window, saving their changes."""
+        oldest = int((time.time() - self.window) // self.bucket_seconds)
+        if self._file is None:
+            with self._lock:
+                self._buckets = {
+                    key: count for key, count in self._buckets.items() if key >= oldest
+                }
+                yield self._buckets
+            return
+
+        with self._file.locked():
+            data = self._file.read().get("buckets", {})
+            buckets = {
+                int(key): count
+                for key, count in data.items()
+                if key.isdigit() and isinstance(count, int) and int(key) >= oldest
+            }
+            saved = dict(buckets)
+            yield buckets
+            if buckets != saved or len(data) != len(saved):
+                self._file.write({"buckets": {str(k): v for k, v in buckets.items()}})
@@ -0,0 +1,303 @@
+"""Record real API traffic and replay it offline with a realistic latency.
+
+``RecordingTransport`` wraps a transport and appends every request and response
+to a JSON Lines file, with the time the response took. ``ReplayTransport`` serves
+the recorded responses back without network access, waiting the recorded or a
+configured latency, so parsing, throttling and concurrency can be benchmarked
+and load tested offline. Both have async versions for the async client.
+
+Credentials are never written to the recordings: authorization headers are
+dropped and the client secrets and access tokens in the bodies are redacted.
+
+Example:
+    >>> transport = RecordingTransport(Urllib3Transport(), "traffic.jsonl")
+    >>> api = AmazonCreatorsApi(..., transport=transport)
+    >>> api.get_items(["B0DLFMFBJW"])
+    >>> replay = ReplayTransport("traffic.jsonl", latency=0.2)
+    >>> api = AmazonCreatorsApi(..., transport=replay)
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+from amazon_creatorsapi.core.transport import TransportRequest, TransportResponse
+
+if TYPE_CHECKING:
+    from amazon_creatorsapi.core.transport import AsyncTransport, Transport
+
+Latency = Union[float, Callable[[TransportRequest], float], None]
+"""Fixed latency in seconds, function returning the latency of a request, or None
+to use the recorded latency."""
+
+REDACTED = "REDACTED"
+SENSITIVE_HEADERS = frozenset(
+    {"authorization", "cookie", "x-amz-date", "x-amz-security-token"}
+)
+_SENSITIVE_FIELDS = ("client_secret", "access_token")
+_JSON_FIELD_PATTERN = re.compile(
+    r'("(?:{})"\s*:\s*")[^"]*(")'.format("|".join(_SENSITIVE_FIELDS))
+)
+_FORM_FIELD_PATTERN = re.compile(r"((?:{})=)[^&]*".format("|".join(_SENSITIVE_FIELDS)))
+
+
+class NoRecordedResponseError(LookupError):
+    """Raised when a replayed request does not match any recorded request."""
+
+
+@dataclass
+class Exchange:
+    """Request and response recorded by ``RecordingTransport``.
+
+    Args:
+        request: Request sent, with the credentials redacted.
+        response: Response received, with the access tokens redacted.
+        latency: Seconds the response took.
+
+    """
+
+    request: TransportRequest
+    response: TransportResponse
+    latency: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the exchange as a JSON serializable dictionary."""
+        return {
+            "request": {
+                "method": self.request.method,
+                "url": self.request.url,
+                "headers": self.request.headers,
+                "body": _decode(self.request.body),
+            },
+            "response": {
+                "status": self.response.status,
+                "reason": self.response.reason,
+                "headers": self.response.headers,
+                "body": _decode(self.response.body),
+            },
+            "latency": self.latency,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Exchange:
+        """Create an exchange from a dictionary returned by ``to_dict``."""
+        request, response = data["request"], data["response"]
+        return cls(
+            request=TransportRequest(
+                method=request["method"],
+                url=request["url"],
+                headers=request.get("headers", {}),
+                body=_encode(request.get("body", "")),
+            ),
+            response=TransportResponse(
+                status=response["status"],
+                headers=response.get("headers", {}),
+                body=_encode(response.get("body", "")),
+                reason=response.get("reason", ""),
+            ),
+            latency=data.get("latency", 0.0),
+        )
+
+
+def redact_request(request: TransportRequest) -> TransportRequest:
+    """Return a copy of the request without credentials."""
+    return TransportRequest(
+        method=request.method,
+        url=request.url,
+        headers={
+            name: value
+            for name, value in request.headers.items()
+            if name.lower() not in SENSITIVE_HEADERS
+        },
+        body=_redact_body(request.body),
+        timeout=request.timeout,
+    )
+
+
+def redact_response(response: TransportResponse) -> TransportResponse:
+    """Return a copy of the response without access tokens."""
+    return TransportResponse(
+        status=response.status,
+        headers=response.headers,
+        body=_redact_body(response.body),
+        reason=response.reason,
+    )
+
+
+class _Recorder:
+    """Appends exchanges to a JSON Lines file, one line per exchange."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _record(
+        self,
+        request: TransportRequest,
+        response: TransportResponse,
+        latency: float,
+    ) -> None:
+        exchange = Exchange(redact_request(request), redact_response(response), latency)
+        line = json.dumps(exchange.to_dict()) + "\n"
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(line)
+
+
+class RecordingTransport(_Recorder):
+    """Transport recording the requests sent by another transport to a file.
+
+    Args:
+        transport: Transport sending the requests.
+        path: JSON Lines file where the exchanges are appended.
+
+    """
+
+    def __init__(self, transport: Transport, path: str | Path) -> None:
+        """Initialize the recording transport."""
+        super().__init__(path)
+        self.transport = transport
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request with the wrapped transport and record it."""
+        start = time.monotonic()
+        response = self.transport.send(request)
+        self._record(request, response, time.monotonic() - start)
+        return response
+
+
+class AsyncRecordingTransport(_Recorder):
+    """Async transport recording the requests sent by another one to a file.
+
+    Args:
+        transport: Async transport sending the requests.
+        path: JSON Lines file where the exchanges are appended.
+
+    """
+
+    def __init__(self, transport: AsyncTransport, path: str | Path) -> None:
+        """Initialize the recording transport."""
+        super().__init__(path)
+        self.transport = transport
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request with the wrapped transport and record it."""
+        start = time.monotonic()
+        response = await self.transport.send(request)
+        self._record(request, response, time.monotonic() - start)
+        return response
+
+
+class _Replayer:
+    """Finds the recorded exchange for a request and its replay latency."""
+
+    def __init__(
+        self,
+        exchanges: str | Path | list[Exchange],
+        latency: Latency = None,
+        *,
+        match_body: bool = True,
+    ) -> None:
+        if isinstance(exchanges, (str, Path)):
+            exchanges = load_exchanges(exchanges)
+        self.latency = latency
+        self.match_body = match_body
+        self._exchanges: dict[tuple[str, str, bytes], list[Exchange]] = {}
+        self._positions: dict[tuple[str, str, bytes], int] = {}
+        self._lock = threading.Lock()
+        for exchange in exchanges:
+            key = self._get_key(exchange.request)
+            self._exchanges.setdefault(key, []).append(exchange)
+
+    def _get_key(self, request: TransportRequest) -> tuple[str, str, bytes]:
+        body = _redact_body(request.body) if self.match_body else b""
+        return request.method.upper(), request.url, body
+
+    def _next_exchange(self, request: TransportRequest) -> tuple[Exchange, float]:
+        key = self._get_key(request)
+        exchanges = self._exchanges.get(key)
+        if not exchanges:
+            msg = f"No recorded response for {request.method} {request.url}"
+            raise NoRecordedResponseError(msg)
+
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        exchange = exchanges[position % len(exchanges)]
+
+        if self.latency is None:
+            latency = exchange.latency
+        elif callable(self.latency):
+            latency = self.latency(request)
+        else:
+            latency = self.latency
+        return exchange, max(latency, 0.0)
+
+
+class ReplayTransport(_Replayer):
+    """Transport serving recorded responses without network access.
+
+    Requests are matched by method, URL and body, ignoring the credentials. When
+    a request was recorded several times, its responses are served in order,
+    starting again after the last one.
+
+    Args:
+        exchanges: JSON Lines file written by ``RecordingTransport``, or a list of
+            exchanges.
+        latency: Seconds to wait before each response. A fixed number, a function
+            receiving the request, e.g. to sample a latency distribution, or None
+            to wait the recorded latency.
+        match_body: Match the requests also by body. Disable it to serve the
+            responses of an endpoint to any request. Defaults to True.
+
+    Raises:
+        NoRecordedResponseError: When sending a request that was not recorded.
+
+    """
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Wait the replay latency and return the recorded response."""
+        exchange, latency = self._next_exchange(request)
+        time.sleep(latency)
+        return exchange.response
+
+
+class AsyncReplayTransport(_Replayer):
+    """Async transport serving recorded responses without network access.
+
+    Accepts the same arguments as ``ReplayTransport``.
+    """
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Wait the replay latency and return the recorded response."""
+        exchange, latency = self._next_exchange(request)
+        await asyncio.sleep(latency)
+        return exchange.response
+
+
+def load_exchanges(path: str | Path) -> list[Exchange]:
+    """Load the exchanges recorded in a JSON Lines file."""
+    with Path(path).open(encoding="utf-8") as file:
+        return [Exchange.from_dict(json.loads(line)) for line in file if line.strip()]
+
+
+def _redact_body(body: bytes) -> bytes:
+    text = _decode(body)
+    text = _JSON_FIELD_PATTERN.sub(rf"\g<1>{REDACTED}\g<2>", text)
+    text = _FORM_FIELD_PATTERN.sub(rf"\g<1>{REDACTED}", text)
+    return _encode(text)
+
+
+def _decode(body: bytes) -> str:
+    return body.decode("utf-8", "surrogateescape")
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "surrogateescape")
@@ -0,0 +1,89 @@
+"""Result containers with metadata about the requests made to build them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class ChunkMetadata:
+    """Information about the request made for a chunk of item IDs.
+
+    Args:
+        item_ids: Item IDs requested in the chunk.
+        retries: Number of times the request was retried.
+        hedges: Number of duplicate requests sent because the request was slow.
+        error: Error raised by the request if it failed and partial results were
+            requested, or None.
+
+    """
+
+    item_ids: list[str]
+    retries: int = 0
+    hedges: int = 0
+    error: Exception | None = None
+
+
+@dataclass
+class ResultMetadata:
+    """Information about the requests made for a call, one per chunk.
+
+    Args:
+        chunks: Metadata of the requests made, one per chunk.
+        errors: Errors of the item IDs that could not be fetched, by item ID.
+
+    """
+
+    chunks: list[ChunkMetadata] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def failed_chunks(self) -> list[ChunkMetadata]:
+        """Chunks whose request failed."""
+        return [chunk for chunk in self.chunks if chunk.error is not None]
+
+    @property
+    def requests(self) -> int:
+        """Number of requests made, including retries and hedged requests."""
+        return len(self.chunks) + self.retries + self.hedges
+
+    @property
+    def hedges(self) -> int:
+        """Number of duplicate requests sent for all the chunks."""
+        return sum(chunk.hedges for chunk in self.chunks)
+
+    @property
+    def retries(self) -> int:
+        """Number of retries made for all the chunks."""
+        return sum(chunk.retries for chunk in self.chunks)
+
+    def add_chunk(self, item_ids: list[str]) -> ChunkMetadata:
+        """Add the metadata for a new chunk and return it."""
+        chunk = ChunkMetadata(item_ids=item_ids)
+        self.chunks.append(chunk)
+        return chunk
+
+
+class ResultList(list[T], Generic[T]):
+    """List of results with the metadata of the requests made to get them.
+
+    Behaves like a regular list, with an additional ``metadata`` attribute.
+
+    Example:
+        >>> items = api.get_items(asins)
+        >>> items.metadata.retries
+        2
+
+    """
+
+    def __init__(
+        self,
+        results: list[T] | None = None,
+        metadata: ResultMetadata | None = None,
+    ) -> None:
+        """Initialize the list with the results and their metadata."""
+        super().__init__(results or [])
+        self.metadata = metadata if metadata is not None else ResultMetadata()
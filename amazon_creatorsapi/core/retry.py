@@ -0,0 +1,258 @@
+"""Retry policy with jittered exponential backoff and a retry budget.
+
+Failed requests are retried when the response status or the raised exception is
+considered transient. The wait time between attempts follows an exponential
+backoff with full jitter, and a token bucket retry budget caps the share of the
+traffic spent on retries, so a degraded API is not flooded with retry storms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+import urllib3
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Collection
+
+    from amazon_creatorsapi.core.deadline import Deadline
+
+T = TypeVar("T")
+
+RetryCallback = Callable[[int, BaseException, float], None]
+"""Callback called before each retry with the attempt, the error and the delay."""
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    OSError,
+    urllib3.exceptions.HTTPError,
+)
+
+
+class RetryBudget:
+    """Token bucket limiting the number of retries to a share of the requests.
+
+    Every request deposits ``ratio`` tokens in the bucket, up to ``max_tokens``,
+    and every retry withdraws one token. Retries are not allowed while the bucket
+    is empty. The bucket starts full, so short bursts of errors can be retried.
+
+    Args:
+        ratio: Retries allowed per request, e.g. 0.1 for a 10% retry budget.
+        max_tokens: Maximum number of retries that can be saved up.
+
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        """Initialize a full retry budget."""
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of retries currently available."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Record a new request, earning a share of a retry."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted.
+
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+@dataclass
+class RetryPolicy:
+    """Rules to decide which failed requests are retried and when.
+
+    A failed request is retried if the HTTP status of the error is in
+    ``retry_statuses`` or the error is an instance of ``retry_exceptions``, as long
+    as there are attempts left and the retry budget allows it.
+
+    Args:
+        max_retries: Maximum number of retries for each request.
+        base_delay: Delay in seconds used for the first retry backoff.
+        max_delay: Maximum delay in seconds between attempts.
+        retry_statuses: HTTP statuses considered transient.
+        retry_exceptions: Exception types considered transient, like connection
+            errors.
+        budget: Retry budget shared by all the requests using this policy. Use
+            None to disable the budget.
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=5, retry_statuses={429, 503})
+        >>> api = AmazonCreatorsApi(..., retry_policy=policy)
+
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES
+    retry_exceptions: tuple[type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS
+    budget: RetryBudget | None = field(default_factory=RetryBudget)
+
+    def __post_init__(self) -> None:
+        """Accept any iterable of retryable statuses."""
+        self.retry_statuses = frozenset(self.retry_statuses)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Return whether the error is transient and the request can be retried."""
+        status_code = get_status_code(error)
+        if status_code is not None:
+            return status_code in self.retry_statuses
+        return any(
+            isinstance(cause, self.retry_exceptions) for cause in get_error_chain(error)
+        )
+
+    def with_exceptions(self, *exceptions: type[BaseException]) -> RetryPolicy:
+        """Return a copy of the policy retrying also the given exception types.
+
+        The copy shares the retry budget with the original policy.
+        """
+        return replace(self, retry_exceptions=(*self.retry_exceptions, *exceptions))
+
+    def get_delay(self, retry: int) -> float:
+        """Return the wait time before a retry using full jitter backoff.
+
+        Args:
+            retry: Number of the retry, starting at 1.
+
+        """
+        backoff = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        return random.uniform(0, backoff)  # noqa: S311
+
+    def should_retry(
+        self,
+        error: BaseException,
+        retry: int,
+        delay: float = 0,
+        deadline: Deadline | None = None,
+    ) -> bool:
+        """Return whether a failed request must be retried, consuming the budget.
+
+        Args:
+            error: The error raised by the last attempt.
+            retry: Number of the retry to be made, starting at 1.
+            delay: Seconds to wait before the retry.
+            deadline: Deadline of the call. Requests are not retried if the
+                deadline would pass while waiting.
+
+        """
+        if retry > self.max_retries or not self.is_retryable(error):
+            return False
+        if deadline is not None and delay >= deadline.remaining():
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+
+def get_status_code(error: BaseException) -> int | None:
+    """Return the HTTP status of an error or the errors it was raised from.
+
+    Looks for a ``status_code`` or ``status`` attribute in the error and its
+    chained causes and contexts.
+    """
+    for cause in get_error_chain(error):
+        for attribute in ("status_code", "status"):
+            status_code = getattr(cause, attribute, None)
+            if isinstance(status_code, int) and status_code > 0:
+                return status_code
+    return None
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    policy: RetryPolicy | None,
+    on_retry: RetryCallback | None = None,
+    deadline: Deadline | None = None,
+) -> T:
+    """Call a function, retrying it according to the retry policy.
+
+    Args:
+        func: Function making the request.
+        policy: Retry policy. If None, the function is called once.
+        on_retry: Callback called before each retry.
+        deadline: Deadline of the call, no retries are made after it.
+
+    Returns:
+        The value returned by the function.
+
+    Raises:
+        The error of the last attempt if it cannot be retried.
+
+    """
+    if policy is None:
+        return func()
+
+    if policy.budget is not None:
+        policy.budget.deposit()
+
+    retry = 1
+    while True:
+        try:
+            return func()
+        except Exception as error:
+            delay = policy.get_delay(retry)
+            if not policy.should_retry(error, retry, delay, deadline):
+                raise
+            if on_retry is not None:
+                on_retry(retry, error, delay)
+        time.sleep(delay)
+        retry += 1
+
+
+async def async_call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy | None,
+    on_retry: RetryCallback | None = None,
+    deadline: Deadline | None = None,
+) -> T:
+    """Await a coroutine function, retrying it according to the retry policy.
+
+    Async version of ``call_with_retry``, waiting with ``asyncio.sleep``.
+    """
+    if policy is None:
+        return await func()
+
+    if policy.budget is not None:
+        policy.budget.deposit()
+
+    retry = 1
+    while True:
+        try:
+            return await func()
+        except Exception as error:
+            delay = policy.get_delay(retry)
+            if not policy.should_retry(error, retry, delay, deadline):
+                raise
+            if on_retry is not None:
+                on_retry(retry, error, delay)
+        await asyncio.sleep(delay)
+        retry += 1
+
+
+def get_error_chain(error: BaseException) -> list[BaseException]:
+    """Return the error followed by the errors it was raised from."""
+    chain: list[BaseException] = []
+    current: BaseException | None = error
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
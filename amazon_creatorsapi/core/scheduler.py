@@ -0,0 +1,211 @@
+"""Scheduler sharing the throttling of a credential between priorities.
+
+Without a scheduler the requests are throttled first come first served, so a
+batch job sending thousands of requests makes the user facing requests wait
+behind it. ``RequestScheduler`` hands out the send slots of the throttling with
+weighted fair queuing: every waiting request gets a virtual finish time that
+grows with the inverse of the weight of its priority, and the next slot goes to
+the lowest one. High priority requests jump ahead of the batch work, which still
+gets its share of the slots and fills the capacity left.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from .priority import Priority, get_priority
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+DEFAULT_WEIGHTS = {Priority.HIGH: 100.0, Priority.NORMAL: 10.0, Priority.LOW: 1.0}
+
+
+class _Ticket:
+    """Request waiting for a send slot."""
+
+    __slots__ = ("finish", "sequence", "wake")
+
+    def __init__(
+        self, finish: float, sequence: int, wake: Callable[[], object]
+    ) -> None:
+        self.finish = finish
+        self.sequence = sequence
+        self.wake = wake
+
+    def __lt__(self, other: _Ticket) -> bool:
+        return (self.finish, self.sequence) < (other.finish, other.sequence)
+
+
+class RequestScheduler:
+    """Scheduler of the requests sent with a credential, by priority.
+
+    The requests are spaced by ``throttling`` seconds, like the throttling of the
+    clients, but when several requests are waiting the next slot goes to the one
+    with the lowest virtual finish time. With the default weights a high priority
+    request waits at most for the request being sent, while the low priority
+    requests get one slot of every eleven while normal ones are waiting.
+
+    Share the scheduler between the clients using the same credential, sync or
+    async, so they share its rate limit. The priority of the requests is set with
+    ``use_priority``.
+
+    Args:
+        throttling: Wait time in seconds between requests. Defaults to 1 second.
+        weights: Share of the slots of every priority while several are waiting.
+            Defaults to 100 for high, 10 for normal and 1 for low priority.
+
+    Example:
+        >>> scheduler = RequestScheduler(throttling=1)
+        >>> api = AmazonApi(..., scheduler=scheduler)
+        >>> with use_priority(Priority.LOW):
+        ...     api.get_items(asins)  # Waits behind the other priorities
+
+    """
+
+    def __init__(
+        self,
+        throttling: float = 1,
+        *,
+        weights: Mapping[Priority, float] | Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.throttling = float(throttling)
+        self.weights = dict(DEFAULT_WEIGHTS)
+        for priority, weight in (weights or {}).items():
+            if weight <= 0:
+                msg = "The weights must be greater than 0"
+                raise ValueError(msg)
+            self.weights[Priority(priority)] = float(weight)
+        self._lock = threading.Lock()
+        self._queue: list[_Ticket] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: dict[Priority, float] = {}
+        self._next_slot = time.monotonic()
+
+    @property
+    def queue_size(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._queue)
+
+    def acquire(
+        self, priority: Priority | str | None = None, timeout: float | None = None
+    ) -> bool:
+        """Wait for the send slot of a request.
+
+        Args:
+            priority: Priority of the request. Defaults to the priority of the
+                current context.
+            timeout: Maximum seconds to wait. Defaults to no limit.
+
+        Returns:
+            True when the request can be sent, or False if the slot would not
+            arrive within the timeout.
+
+        """
+        event = threading.Event()
+        ticket = self._push(priority, event.set)
+        end = time.monotonic() + timeout if timeout is not None else None
+        try:
+            while True:
+                wait_time = self._try_dispatch(ticket, end)
+                if wait_time == 0:
+                    return True
+                if wait_time is not None and wait_time < 0:
+                    break
+                event.wait(wait_time)
+                event.clear()
+        except BaseException:
+            self._remove(ticket)
+            raise
+        self._remove(ticket)
+        return False
+
+    async def async_acquire(
+        self, priority: Priority | str | None = None, timeout: float | None = None
+    ) -> bool:
+        """Wait for the send slot of a request.
+
+        Async version of ``acquire``.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        ticket = self._push(priority, lambda: loop.call_soon_threadsafe(event.set))
+        end = time.monotonic() + timeout if timeout is not None else None
+        try:
+            while True:
+                wait_time = self._try_dispatch(ticket, end)
+                if wait_time == 0:
+                    return True
+                if wait_time is not None and wait_time < 0:
+                    break
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), wait_time)
+                event.clear()
+        except BaseException:
+            self._remove(ticket)
+            raise
+        self._remove(ticket)
+        return False
+
+    def _push(
+        self, priority: Priority | str | None, wake: Callable[[], object]
+    ) -> _Ticket:
+        """Queue a request, waking the previous first request if it is ahead."""
+        priority = Priority(priority) if priority is not None else get_priority()
+        with self._lock:
+            start = max(self._virtual_time, self._last_finish.get(priority, 0))
+            finish = start + 1 / self.weights[priority]
+            self._last_finish[priority] = finish
+            ticket = _Ticket(finish, next(self._sequence), wake)
+            head = self._queue[0] if self._queue else None
+            heapq.heappush(self._queue, ticket)
+        if head is not None and ticket < head:
+            head.wake()
+        return ticket
+
+    def _try_dispatch(self, ticket: _Ticket, end: float | None) -> float | None:
+        """Give the slot to the request if it is its turn.
+
+        Returns 0 if the request got the slot, the seconds to wait before trying
+        again or None to wait until woken up, and a negative number if the slot
+        would not arrive before ``end``.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._queue[0] is ticket and now >= self._next_slot:
+                heapq.heappop(self._queue)
+                self._virtual_time = ticket.finish
+                self._next_slot = now + self.throttling
+                head = self._queue[0] if self._queue else None
+            else:
+                # The first request waits for the slot, the rest to be woken up
+                wait_time = self._next_slot - now if self._queue[0] is ticket else None
+                if end is None:
+                    return wait_time
+                if max(self._next_slot, now) >= end:
+                    return -1.0
+                if wait_time is None:
+                    return end - now
+                return min(wait_time, end - now)
+        if head is not None:
+            head.wake()
+        return 0.0
+
+    def _remove(self, ticket: _Ticket) -> None:
+        """Remove a request that stopped waiting, waking the next one."""
+        with self._lock:
+            if ticket not in self._queue:
+                return
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            head = self._queue[0] if self._queue else None
+        if head is not None:
+            head.wake()
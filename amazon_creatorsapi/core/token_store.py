@@ -0,0 +1,182 @@
+"""OAuth2 token stores shared between clients, processes and restarts.
+
+A token store keeps the last access token obtained for a credential and version,
+so that new clients and worker processes can reuse a valid token instead of
+requesting a new one from the OAuth2 endpoint.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from .files import SharedJsonFile
+
+if TYPE_CHECKING:
+    import os
+    from contextlib import AbstractContextManager
+
+
+class TokenStore(ABC):
+    """Base class for OAuth2 token stores.
+
+    Tokens are stored per credential ID and API version. Implementations must be
+    safe to use from several threads at the same time.
+    """
+
+    @abstractmethod
+    def get(self, credential_id: str, version: str) -> tuple[str, float] | None:
+        """Return the stored token and its expiration timestamp, if still valid.
+
+        Args:
+            credential_id: OAuth2 credential ID.
+            version: API version.
+
+        Returns:
+            A tuple with the access token and the expiration timestamp, or None if
+            there is no valid token stored.
+
+        """
+
+    @abstractmethod
+    def set(
+        self,
+        credential_id: str,
+        version: str,
+        access_token: str,
+        expires_at: float,
+    ) -> None:
+        """Store a token for the given credential ID and version.
+
+        Args:
+            credential_id: OAuth2 credential ID.
+            version: API version.
+            access_token: The access token.
+            expires_at: Timestamp after which the token must not be used.
+
+        """
+
+    def locked(self) -> AbstractContextManager[Any]:
+        """Return a lock held while a token is loaded and refreshed.
+
+        The token managers hold it across reading the store, refreshing the token
+        if it is still expired and saving it, so only one of the clients sharing
+        the store requests a new token. The stored token can be read and written
+        while holding it. The default lock does nothing.
+        """
+        return contextlib.nullcontext()
+
+    @staticmethod
+    def get_key(credential_id: str, version: str) -> str:
+        """Return the key used to store tokens for a credential and version."""
+        return f"{credential_id}:{version}"
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store kept in memory and shared by the clients of a process.
+
+    Example:
+        >>> store = MemoryTokenStore()
+        >>> api_es = AmazonCreatorsApi(..., country="ES", token_store=store)
+        >>> api_fr = AmazonCreatorsApi(..., country="FR", token_store=store)
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty memory token store."""
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def locked(self) -> AbstractContextManager[Any]:
+        """Return a lock held while a token is loaded and refreshed."""
+        return self._refresh_lock
+
+    def get(self, credential_id: str, version: str) -> tuple[str, float] | None:
+        """Return the stored token and its expiration timestamp, if still valid."""
+        with self._lock:
+            token = self._tokens.get(self.get_key(credential_id, version))
+        if token is None or token[1] <= time.time():
+            return None
+        return token
+
+    def set(
+        self,
+        credential_id: str,
+        version: str,
+        access_token: str,
+        expires_at: float,
+    ) -> None:
+        """Store a token for the given credential ID and version."""
+        with self._lock:
+            self._tokens[self.get_key(credential_id, version)] = (
+                access_token,
+                expires_at,
+            )
+
+
+class FileTokenStore(TokenStore):
+    """Token store persisted in a JSON file shared by several processes.
+
+    Reads and writes are protected with an exclusive lock on a sidecar ``.lock``
+    file, and the tokens file is replaced atomically, so concurrent workers never
+    read a partially written file. The file is created with owner-only
+    permissions because it contains access tokens.
+
+    Args:
+        path: Path of the JSON file where tokens are stored.
+
+    Example:
+        >>> store = FileTokenStore("/var/tmp/creatorsapi-tokens.json")
+        >>> api = AmazonCreatorsApi(..., token_store=store)
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize the file token store."""
+        self._file = SharedJsonFile(path)
+
+    def locked(self) -> AbstractContextManager[Any]:
+        """Return the lock of the file, held while a token is refreshed."""
+        return self._file.locked()
+
+    def get(self, credential_id: str, version: str) -> tuple[str, float] | None:
+        """Return the stored token and its expiration timestamp, if still valid."""
+        with self._file.locked():
+            tokens = self._file.read()
+        token = tokens.get(self.get_key(credential_id, version))
+        if not isinstance(token, dict):
+            return None
+        access_token = token.get("access_token")
+        expires_at = token.get("expires_at")
+        if not isinstance(access_token, str) or not isinstance(
+            expires_at, (int, float)
+        ):
+            return None
+        if expires_at <= time.time():
+            return None
+        return access_token, float(expires_at)
+
+    def set(
+        self,
+        credential_id: str,
+        version: str,
+        access_token: str,
+        expires_at: float,
+    ) -> None:
+        """Store a token for the given credential ID and version."""
+        with self._file.locked():
+            now = time.time()
+            tokens = {
+                key: value
+                for key, value in self._file.read().items()
+                if isinstance(value, dict) and value.get("expires_at", 0) > now
+            }
+            tokens[self.get_key(credential_id, version)] = {
+                "access_token": access_token,
+                "expires_at": expires_at,
+            }
+            self._file.write(tokens)
@@ -0,0 +1,195 @@
+"""Tracing of the API calls with OpenTelemetry.
+
+The clients open a span for every call of their public methods, with a child
+span for every request sent, every retry and every OAuth2 token refresh.
+Tracing is enabled by passing an OpenTelemetry tracer provider to the clients,
+so clients without one do not import OpenTelemetry nor create any span.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .hooks import RequestEvent
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+MARKETPLACE = "amazon.marketplace"
+OPERATION = "amazon.operation"
+ASIN_COUNT = "amazon.asin_count"
+RESPONSE_SIZE = "amazon.response_size"
+ATTEMPT = "amazon.attempt"
+STATUS_CODE = "http.response.status_code"
+
+_current_call: ContextVar[_Call | None] = ContextVar("current_call", default=None)
+
+
+@dataclass
+class _Call:
+    """Totals of the requests sent by a traced call."""
+
+    tracer: Tracer
+    operation: str | None = None
+    asin_count: int = 0
+    response_size: int = 0
+
+
+class Tracer:
+    """Tracer creating the spans of the API calls.
+
+    Args:
+        tracer_provider: OpenTelemetry tracer provider creating the spans.
+
+    Raises:
+        ImportError: If OpenTelemetry is not installed.
+
+    """
+
+    def __init__(self, tracer_provider: Any) -> None:
+        """Initialize the tracer with the OpenTelemetry tracer provider."""
+        try:
+            from opentelemetry import trace  # noqa: PLC0415
+        except ImportError as exc:  # pragma: no cover
+            msg = (
+                "Tracing requires OpenTelemetry. "
+                "Install it with: pip install python-amazon-paapi[tracing]"
+            )
+            raise ImportError(msg) from exc
+
+        self._tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Iterator[Any]:
+        """Open a span as the current one, leaving out the attributes set to None.
+
+        Errors raised within the block are recorded in the span.
+        """
+        attributes = {
+            key: value for key, value in attributes.items() if value is not None
+        }
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    @contextlib.contextmanager
+    def trace_call(self, name: str, marketplace: str) -> Iterator[None]:
+        """Open the span of a call, with the totals of its requests."""
+        call = _Call(self)
+        with self.start_span(name, {MARKETPLACE: marketplace}) as span:
+            token = _current_call.set(call)
+            try:
+                yield
+            finally:
+                _current_call.reset(token)
+                span.set_attributes(
+                    {
+                        key: value
+                        for key, value in (
+                            (OPERATION, call.operation),
+                            (ASIN_COUNT, call.asin_count or None),
+                            (RESPONSE_SIZE, call.response_size),
+                        )
+                        if value is not None
+                    }
+                )
+
+    @contextlib.contextmanager
+    def trace_request(
+        self, event: RequestEvent, item_ids: list[str] | None = None
+    ) -> Iterator[None]:
+        """Open the span of a request, including its retries."""
+        asin_count = len(item_ids) if item_ids is not None else None
+        attributes = {
+            OPERATION: event.operation,
+            MARKETPLACE: event.marketplace,
+            ASIN_COUNT: asin_count,
+        }
+        with self.start_span(event.operation, attributes) as span:
+            try:
+                yield
+            finally:
+                span.set_attribute(ATTEMPT, event.attempt)
+                if event.status_code is not None:
+                    span.set_attribute(STATUS_CODE, event.status_code)
+                if event.response_size is not None:
+                    span.set_attribute(RESPONSE_SIZE, event.response_size)
+
+                call = _current_call.get()
+                if call is not None:
+                    call.operation = call.operation or event.operation
+                    call.asin_count += asin_count or 0
+                    call.response_size += event.response_size or 0
+
+
+def get_tracer(tracer_provider: Any) -> Tracer | None:
+    """Return the tracer of a client, or None if there is no tracer provider."""
+    if tracer_provider is None:
+        return None
+    return Tracer(tracer_provider)
+
+
+def traced(func: F) -> F:
+    """Decorate a public method of a client to open a span for every call.
+
+    The span is named after the method, e.g. ``AmazonApi.get_items``, and only
+    opened if the client has a tracer.
+    """
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if self._tracer is None:
+                return await func(self, *args, **kwargs)
+            with self._tracer.trace_call(name, self.marketplace):
+                return await func(self, *args, **kwargs)
+
+        return cast("F", async_wrapper)
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self._tracer is None:
+            return func(self, *args, **kwargs)
+        with self._tracer.trace_call(name, self.marketplace):
+            return func(self, *args, **kwargs)
+
+    return cast("F", wrapper)
+
+
+def trace_request(
+    tracer: Tracer | None,
+    event: RequestEvent | None,
+    item_ids: list[str] | None = None,
+) -> contextlib.AbstractContextManager[None]:
+    """Return a context opening the span of a request, if there is a tracer."""
+    if tracer is None or event is None:
+        return contextlib.nullcontext()
+    return tracer.trace_request(event, item_ids)
+
+
+def trace_retry(
+    tracer: Tracer | None, event: RequestEvent | None
+) -> contextlib.AbstractContextManager[Any]:
+    """Return a context opening the span of a retried attempt of a request."""
+    if tracer is None or event is None or event.attempt == 1:
+        return contextlib.nullcontext()
+    return tracer.start_span(
+        f"{event.operation} retry",
+        {OPERATION: event.operation, ATTEMPT: event.attempt},
+    )
+
+
+def trace_token_refresh() -> contextlib.AbstractContextManager[Any]:
+    """Return a context opening the span of a token refresh in a traced call."""
+    call = _current_call.get()
+    if call is None:
+        return contextlib.nullcontext()
+    return call.tracer.start_span("OAuth2 token refresh", {})
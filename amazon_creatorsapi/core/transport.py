@@ -0,0 +1,193 @@
+"""Pluggable transports sending the HTTP requests of the API clients.
+
+A transport receives a fully built request, already signed or authenticated,
+and returns the response. The clients use their own HTTP libraries by default,
+and accept any object implementing ``Transport`` (sync clients) or
+``AsyncTransport`` (async client) instead, e.g. to record the traffic or replay
+it offline with ``amazon_creatorsapi.core.recording``.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+from urllib.parse import urlencode
+
+import urllib3
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Headers describing the encoding of the body on the wire, which no longer apply
+# to the decoded body of the responses returned by the transports
+ENCODING_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+@dataclass
+class TransportRequest:
+    """HTTP request sent by a transport.
+
+    Args:
+        method: HTTP method, e.g. "POST".
+        url: Absolute URL of the request.
+        headers: Request headers.
+        body: Request body.
+        timeout: Seconds to wait for the response, or None for no timeout.
+
+    """
+
+    method: str
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    timeout: float | None = None
+
+
+@dataclass
+class TransportResponse:
+    """HTTP response returned by a transport, with the body already decoded.
+
+    Args:
+        status: HTTP status code.
+        headers: Response headers.
+        body: Response body.
+        reason: HTTP reason phrase.
+
+    """
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    reason: str = ""
+
+
+class Transport(Protocol):
+    """Sends HTTP requests for the sync clients."""
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request and return its response."""
+        ...
+
+
+class AsyncTransport(Protocol):
+    """Sends HTTP requests for the async client."""
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request and return its response."""
+        ...
+
+
+def get_decoded_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Return the response headers without the ones about the wire encoding."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in ENCODING_HEADERS
+    }
+
+
+class Urllib3Transport:
+    """Transport sending the requests with a urllib3 pool manager.
+
+    Args:
+        pool_manager: Pool manager used to send the requests. Defaults to a new
+            one.
+
+    """
+
+    def __init__(self, pool_manager: urllib3.PoolManager | None = None) -> None:
+        """Initialize the transport."""
+        self.pool_manager = (
+            pool_manager if pool_manager is not None else urllib3.PoolManager()
+        )
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request and return its response."""
+        response = self.pool_manager.request(
+            request.method,
+            request.url,
+            body=request.body or None,
+            headers=request.headers,
+            timeout=request.timeout,
+        )
+        return TransportResponse(
+            status=response.status,
+            headers=get_decoded_headers(response.headers),
+            body=response.data,
+            reason=response.reason or "",
+        )
+
+
+class TransportPoolManager:
+    """Adapter exposing a transport as the urllib3 pool manager used by the SDKs.
+
+    Only implements the ``request`` method, returning urllib3 responses, so the
+    SDK clients send their requests through the transport unchanged.
+
+    Args:
+        transport: Transport sending the requests.
+
+    """
+
+    def __init__(self, transport: Transport) -> None:
+        """Initialize the adapter."""
+        self.transport = transport
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        body: str | bytes | None = None,
+        fields: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        *,
+        timeout: urllib3.Timeout | float | None = None,
+        preload_content: bool = True,
+        encode_multipart: bool = True,
+        **_kwargs: Any,
+    ) -> urllib3.HTTPResponse:
+        """Send a request through the transport, like ``PoolManager.request``."""
+        if fields and method.upper() in {"GET", "HEAD", "DELETE"}:
+            url = f"{url}?{urlencode(fields)}"
+        elif fields:
+            if encode_multipart:
+                msg = "Multipart requests are not supported by transports"
+                raise ValueError(msg)
+            body = urlencode(fields)
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        response = self.transport.send(
+            TransportRequest(
+                method=method.upper(),
+                url=url,
+                headers=dict(headers or {}),
+                body=body or b"",
+                timeout=_get_timeout_seconds(timeout),
+            )
+        )
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(response.body),
+            headers=response.headers,
+            status=response.status,
+            reason=response.reason,
+            preload_content=preload_content,
+            decode_content=False,
+        )
+
+
+def _get_timeout_seconds(timeout: urllib3.Timeout | float | None) -> float | None:
+    """Return the seconds of a urllib3 timeout, preferring the total timeout."""
+    if not isinstance(timeout, urllib3.Timeout):
+        return timeout
+    # The read timeout can only be computed from the total once connected
+    if isinstance(timeout.total, (int, float)):
+        return float(timeout.total)
+    for seconds in (timeout.read_timeout, timeout.connect_timeout):
+        if isinstance(seconds, (int, float)):
+            return float(seconds)
+    return None
@@ -1,8 +1,18 @@
 """Custom exceptions for the Amazon Creators API."""
 
+from __future__ import annotations
+
 
 class AmazonCreatorsApiError(Exception):
-    """Base exception for Amazon Creators API."""
+    """Base exception for Amazon Creators API.
+
+    Attributes:
+        status_code: HTTP status of the failed response, if the error was caused
+            by an API error response.
+
+    """
+
+    status_code: int | None = None
 
 
 class InvalidArgumentError(AmazonCreatorsApiError):
@@ -29,12 +39,36 @@ class AuthenticationError(AmazonCreatorsApiError):
     """Raised when OAuth2 authentication fails."""
 
 
+class CircuitBreakerOpenError(AmazonCreatorsApiError):
+    """Raised without sending the request while the circuit breaker is open."""
+
+
+class DeadlineExceededError(AmazonCreatorsApiError):
+    """Raised when the timeout of a call expires before it completes."""
+
+
+class QuotaExceededError(AmazonCreatorsApiError):
+    """Raised without sending the request when the daily quota is spent.
+
+    The ``retry_after`` attribute contains the seconds until the quota allows
+    the request again.
+    """
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        """Initialize the exception with a reason and the seconds to wait."""
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
 __all__ = [
     "AmazonCreatorsApiError",
     "AssociateValidationError",
     "AuthenticationError",
+    "CircuitBreakerOpenError",
+    "DeadlineExceededError",
     "InvalidArgumentError",
     "ItemsNotFoundError",
+    "QuotaExceededError",
     "RequestError",
     "TooManyRequestsError",
 ]
@@ -10,61 +10,129 @@ Example:
 
 """
 
-from creatorsapi_python_sdk.models.availability import Availability
-from creatorsapi_python_sdk.models.browse_node import BrowseNode
-from creatorsapi_python_sdk.models.browse_node_ancestor import BrowseNodeAncestor
-from creatorsapi_python_sdk.models.browse_node_child import BrowseNodeChild
-from creatorsapi_python_sdk.models.browse_node_info import BrowseNodeInfo
-from creatorsapi_python_sdk.models.by_line_info import ByLineInfo
-from creatorsapi_python_sdk.models.classifications import Classifications
-from creatorsapi_python_sdk.models.condition import Condition
-from creatorsapi_python_sdk.models.content_info import ContentInfo
-from creatorsapi_python_sdk.models.content_rating import ContentRating
-from creatorsapi_python_sdk.models.contributor import Contributor
-from creatorsapi_python_sdk.models.customer_reviews import CustomerReviews
-from creatorsapi_python_sdk.models.deal_details import DealDetails
-from creatorsapi_python_sdk.models.delivery_flag import DeliveryFlag
-from creatorsapi_python_sdk.models.external_ids import ExternalIds
-from creatorsapi_python_sdk.models.get_browse_nodes_resource import (
-    GetBrowseNodesResource,
-)
-from creatorsapi_python_sdk.models.get_items_resource import GetItemsResource
-from creatorsapi_python_sdk.models.get_variations_resource import GetVariationsResource
-from creatorsapi_python_sdk.models.image_size import ImageSize
-from creatorsapi_python_sdk.models.image_type import ImageType
-from creatorsapi_python_sdk.models.images import Images
-from creatorsapi_python_sdk.models.item import Item
-from creatorsapi_python_sdk.models.item_info import ItemInfo
-from creatorsapi_python_sdk.models.language_type import LanguageType
-from creatorsapi_python_sdk.models.languages import Languages
-from creatorsapi_python_sdk.models.manufacture_info import ManufactureInfo
-from creatorsapi_python_sdk.models.money import Money
-from creatorsapi_python_sdk.models.offer_availability_v2 import OfferAvailabilityV2
-from creatorsapi_python_sdk.models.offer_condition_v2 import OfferConditionV2
-from creatorsapi_python_sdk.models.offer_listing_v2 import OfferListingV2
-from creatorsapi_python_sdk.models.offer_loyalty_points_v2 import OfferLoyaltyPointsV2
-from creatorsapi_python_sdk.models.offer_merchant_info_v2 import OfferMerchantInfoV2
-from creatorsapi_python_sdk.models.offer_price_v2 import OfferPriceV2
-from creatorsapi_python_sdk.models.offer_saving_basis import OfferSavingBasis
-from creatorsapi_python_sdk.models.offer_savings import OfferSavings
-from creatorsapi_python_sdk.models.offer_type import OfferType
-from creatorsapi_python_sdk.models.offers_v2 import OffersV2
-from creatorsapi_python_sdk.models.product_info import ProductInfo
-from creatorsapi_python_sdk.models.refinement import Refinement
-from creatorsapi_python_sdk.models.refinement_bin import RefinementBin
-from creatorsapi_python_sdk.models.saving_basis_type import SavingBasisType
-from creatorsapi_python_sdk.models.search_items_resource import SearchItemsResource
-from creatorsapi_python_sdk.models.search_refinements import SearchRefinements
-from creatorsapi_python_sdk.models.search_result import SearchResult
-from creatorsapi_python_sdk.models.sort_by import SortBy
-from creatorsapi_python_sdk.models.technical_info import TechnicalInfo
-from creatorsapi_python_sdk.models.trade_in_info import TradeInInfo
-from creatorsapi_python_sdk.models.trade_in_price import TradeInPrice
-from creatorsapi_python_sdk.models.variation_attribute import VariationAttribute
-from creatorsapi_python_sdk.models.variation_dimension import VariationDimension
-from creatorsapi_python_sdk.models.variation_summary import VariationSummary
-from creatorsapi_python_sdk.models.variations_result import VariationsResult
-from creatorsapi_python_sdk.models.website_sales_rank import WebsiteSalesRank
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from creatorsapi_python_sdk.models.availability import Availability
+    from creatorsapi_python_sdk.models.browse_node import BrowseNode
+    from creatorsapi_python_sdk.models.browse_node_ancestor import BrowseNodeAncestor
+    from creatorsapi_python_sdk.models.browse_node_child import BrowseNodeChild
+    from creatorsapi_python_sdk.models.browse_node_info import BrowseNodeInfo
+    from creatorsapi_python_sdk.models.by_line_info import ByLineInfo
+    from creatorsapi_python_sdk.models.classifications import Classifications
+    from creatorsapi_python_sdk.models.condition import Condition
+    from creatorsapi_python_sdk.models.content_info import ContentInfo
+    from creatorsapi_python_sdk.models.content_rating import ContentRating
+    from creatorsapi_python_sdk.models.contributor import Contributor
+    from creatorsapi_python_sdk.models.customer_reviews import CustomerReviews
+    from creatorsapi_python_sdk.models.deal_details import DealDetails
+    from creatorsapi_python_sdk.models.delivery_flag import DeliveryFlag
+    from creatorsapi_python_sdk.models.external_ids import ExternalIds
+    from creatorsapi_python_sdk.models.get_browse_nodes_resource import (
+        GetBrowseNodesResource,
+    )
+    from creatorsapi_python_sdk.models.get_items_resource import GetItemsResource
+    from creatorsapi_python_sdk.models.get_variations_resource import (
+        GetVariationsResource,
+    )
+    from creatorsapi_python_sdk.models.image_size import ImageSize
+    from creatorsapi_python_sdk.models.image_type import ImageType
+    from creatorsapi_python_sdk.models.images import Images
+    from creatorsapi_python_sdk.models.item import Item
+    from creatorsapi_python_sdk.models.item_info import ItemInfo
+    from creatorsapi_python_sdk.models.language_type import LanguageType
+    from creatorsapi_python_sdk.models.languages import Languages
+    from creatorsapi_python_sdk.models.manufacture_info import ManufactureInfo
+    from creatorsapi_python_sdk.models.money import Money
+    from creatorsapi_python_sdk.models.offer_availability_v2 import OfferAvailabilityV2
+    from creatorsapi_python_sdk.models.offer_condition_v2 import OfferConditionV2
+    from creatorsapi_python_sdk.models.offer_listing_v2 import OfferListingV2
+    from creatorsapi_python_sdk.models.offer_loyalty_points_v2 import (
+        OfferLoyaltyPointsV2,
+    )
+    from creatorsapi_python_sdk.models.offer_merchant_info_v2 import OfferMerchantInfoV2
+    from creatorsapi_python_sdk.models.offer_price_v2 import OfferPriceV2
+    from creatorsapi_python_sdk.models.offer_saving_basis import OfferSavingBasis
+    from creatorsapi_python_sdk.models.offer_savings import OfferSavings
+    from creatorsapi_python_sdk.models.offer_type import OfferType
+    from creatorsapi_python_sdk.models.offers_v2 import OffersV2
+    from creatorsapi_python_sdk.models.product_info import ProductInfo
+    from creatorsapi_python_sdk.models.refinement import Refinement
+    from creatorsapi_python_sdk.models.refinement_bin import RefinementBin
+    from creatorsapi_python_sdk.models.saving_basis_type import SavingBasisType
+    from creatorsapi_python_sdk.models.search_items_resource import SearchItemsResource
+    from creatorsapi_python_sdk.models.search_refinements import SearchRefinements
+    from creatorsapi_python_sdk.models.search_result import SearchResult
+    from creatorsapi_python_sdk.models.sort_by import SortBy
+    from creatorsapi_python_sdk.models.technical_info import TechnicalInfo
+    from creatorsapi_python_sdk.models.trade_in_info import TradeInInfo
+    from creatorsapi_python_sdk.models.trade_in_price import TradeInPrice
+    from creatorsapi_python_sdk.models.variation_attribute import VariationAttribute
+    from creatorsapi_python_sdk.models.variation_dimension import VariationDimension
+    from creatorsapi_python_sdk.models.variation_summary import VariationSummary
+    from creatorsapi_python_sdk.models.variations_result import VariationsResult
+    from creatorsapi_python_sdk.models.website_sales_rank import WebsiteSalesRank
+
+# Models imported on first access (PEP 562), so importing the package does not
+# import and build every model
+_LAZY_IMPORTS = {
+    "Availability": "creatorsapi_python_sdk.models.availability",
+    "BrowseNode": "creatorsapi_python_sdk.models.browse_node",
+    "BrowseNodeAncestor": "creatorsapi_python_sdk.models.browse_node_ancestor",
+    "BrowseNodeChild": "creatorsapi_python_sdk.models.browse_node_child",
+    "BrowseNodeInfo": "creatorsapi_python_sdk.models.browse_node_info",
+    "ByLineInfo": "creatorsapi_python_sdk.models.by_line_info",
+    "Classifications": "creatorsapi_python_sdk.models.classifications",
+    "Condition": "creatorsapi_python_sdk.models.condition",
+    "ContentInfo": "creatorsapi_python_sdk.models.content_info",
+    "ContentRating": "creatorsapi_python_sdk.models.content_rating",
+    "Contributor": "creatorsapi_python_sdk.models.contributor",
+    "CustomerReviews": "creatorsapi_python_sdk.models.customer_reviews",
+    "DealDetails": "creatorsapi_python_sdk.models.deal_details",
+    "DeliveryFlag": "creatorsapi_python_sdk.models.delivery_flag",
+    "ExternalIds": "creatorsapi_python_sdk.models.external_ids",
+    "GetBrowseNodesResource": "creatorsapi_python_sdk.models.get_browse_nodes_resource",
+    "GetItemsResource": "creatorsapi_python_sdk.models.get_items_resource",
+    "GetVariationsResource": "creatorsapi_python_sdk.models.get_variations_resource",
+    "ImageSize": "creatorsapi_python_sdk.models.image_size",
+    "ImageType": "creatorsapi_python_sdk.models.image_type",
+    "Images": "creatorsapi_python_sdk.models.images",
+    "Item": "creatorsapi_python_sdk.models.item",
+    "ItemInfo": "creatorsapi_python_sdk.models.item_info",
+    "LanguageType": "creatorsapi_python_sdk.models.language_type",
+    "Languages": "creatorsapi_python_sdk.models.languages",
+    "ManufactureInfo": "creatorsapi_python_sdk.models.manufacture_info",
+    "Money": "creatorsapi_python_sdk.models.money",
+    "OfferAvailabilityV2": "creatorsapi_python_sdk.models.offer_availability_v2",
+    "OfferConditionV2": "creatorsapi_python_sdk.models.offer_condition_v2",
+    "OfferListingV2": "creatorsapi_python_sdk.models.offer_listing_v2",
+    "OfferLoyaltyPointsV2": "creatorsapi_python_sdk.models.offer_loyalty_points_v2",
+    "OfferMerchantInfoV2": "creatorsapi_python_sdk.models.offer_merchant_info_v2",
+    "OfferPriceV2": "creatorsapi_python_sdk.models.offer_price_v2",
+    "OfferSavingBasis": "creatorsapi_python_sdk.models.offer_saving_basis",
+    "OfferSavings": "creatorsapi_python_sdk.models.offer_savings",
+    "OfferType": "creatorsapi_python_sdk.models.offer_type",
+    "OffersV2": "creatorsapi_python_sdk.models.offers_v2",
+    "ProductInfo": "creatorsapi_python_sdk.models.product_info",
+    "Refinement": "creatorsapi_python_sdk.models.refinement",
+    "RefinementBin": "creatorsapi_python_sdk.models.refinement_bin",
+    "SavingBasisType": "creatorsapi_python_sdk.models.saving_basis_type",
+    "SearchItemsResource": "creatorsapi_python_sdk.models.search_items_resource",
+    "SearchRefinements": "creatorsapi_python_sdk.models.search_refinements",
+    "SearchResult": "creatorsapi_python_sdk.models.search_result",
+    "SortBy": "creatorsapi_python_sdk.models.sort_by",
+    "TechnicalInfo": "creatorsapi_python_sdk.models.technical_info",
+    "TradeInInfo": "creatorsapi_python_sdk.models.trade_in_info",
+    "TradeInPrice": "creatorsapi_python_sdk.models.trade_in_price",
+    "VariationAttribute": "creatorsapi_python_sdk.models.variation_attribute",
+    "VariationDimension": "creatorsapi_python_sdk.models.variation_dimension",
+    "VariationSummary": "creatorsapi_python_sdk.models.variation_summary",
+    "VariationsResult": "creatorsapi_python_sdk.models.variations_result",
+    "WebsiteSalesRank": "creatorsapi_python_sdk.models.website_sales_rank",
+}
 
 __all__ = [
     "Availability",
@@ -120,4 +188,45 @@ __all__ = [
     "VariationSummary",
     "VariationsResult",
     "WebsiteSalesRank",
+    "warm_up",
 ]
+
+
+def warm_up(*names: str) -> None:
+    """Build the validation schemas of the SDK models ahead of their first use.
+
+    The SDK models build their schemas the first time they are used, keeping the
+    imports fast. Call this at a chosen point, like the init phase of a
+    serverless function, so that the first request does not pay for it.
+
+    Args:
+        names: Names of the models to build, like ``"Item"``. Defaults to all
+            the models of the Creators API SDK.
+
+    Example:
+        >>> from amazon_creatorsapi.models import warm_up
+        >>> warm_up("GetItemsResponseContent", "SearchItemsResponseContent")
+
+    """
+    sdk_models = importlib.import_module("creatorsapi_python_sdk.models")
+    for name in names or sdk_models.__all__:
+        model = getattr(sdk_models, name)
+        # Enums have no schema to build
+        if hasattr(model, "model_rebuild"):
+            model.model_rebuild()
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the models not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
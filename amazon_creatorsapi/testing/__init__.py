@@ -0,0 +1,21 @@
+"""Local stand-ins for the Amazon APIs, for load tests and benchmarks."""
+
+from .catalog import SyntheticCatalog
+from .server import (
+    AsyncRedirectTransport,
+    RedirectTransport,
+    StubServer,
+    exponential_latency,
+    lognormal_latency,
+    uniform_latency,
+)
+
+__all__ = [
+    "AsyncRedirectTransport",
+    "RedirectTransport",
+    "StubServer",
+    "SyntheticCatalog",
+    "exponential_latency",
+    "lognormal_latency",
+    "uniform_latency",
+]
@@ -0,0 +1,260 @@
+"""Synthetic product catalogs served by the stub server.
+
+Items are generated on demand from their position in the catalog, so catalogs of
+any size use no memory and return the same data on every run with the same
+seed. Items are grouped in variation families sharing a parent ASIN, and spread
+over a fixed set of browse nodes.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+ASIN_LENGTH = 10
+ASIN_PREFIX = "B"
+PARENT_ASIN_PREFIX = "P"
+FIRST_BROWSE_NODE_ID = 1000
+TITLE_WORDS = (
+    "Camera",
+    "Headphones",
+    "Keyboard",
+    "Lamp",
+    "Backpack",
+    "Speaker",
+    "Watch",
+    "Blender",
+    "Monitor",
+    "Kettle",
+)
+COLORS = ("Black", "White", "Red", "Blue", "Green")
+SEARCH_CACHE_SIZE = 128
+
+
+class SyntheticCatalog:
+    """Deterministic catalog of generated items, in the PA-API 5 JSON format.
+
+    Args:
+        size: Number of items in the catalog.
+        variations: Number of items in each variation family.
+        browse_nodes: Number of browse nodes the items are spread over.
+        seed: Seed for the generated prices.
+        marketplace: Marketplace used in the item URLs.
+        currency: Currency of the item prices.
+
+    Example:
+        >>> catalog = SyntheticCatalog(100_000)
+        >>> catalog.get_asins(3)
+        ['B000000000', 'B000000001', 'B000000002']
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        size: int = 1000,
+        *,
+        variations: int = 5,
+        browse_nodes: int = 20,
+        seed: int = 0,
+        marketplace: str = "www.amazon.com",
+        currency: str = "USD",
+    ) -> None:
+        """Initialize the catalog."""
+        if size < 1 or variations < 1 or browse_nodes < 1:
+            msg = "Catalog size, variations and browse nodes must be positive"
+            raise ValueError(msg)
+        self.size = size
+        self.variations = variations
+        self.browse_nodes = browse_nodes
+        self.seed = seed
+        self.marketplace = marketplace
+        self.currency = currency
+        self._search_cache: dict[tuple[frozenset[str], str | None], list[str]] = {}
+
+    def get_asins(self, count: int | None = None) -> list[str]:
+        """Return the ASINs of the first items of the catalog.
+
+        Args:
+            count: Number of ASINs to return. Defaults to the whole catalog.
+
+        """
+        count = self.size if count is None else min(count, self.size)
+        return [_get_asin(index) for index in range(count)]
+
+    def get_item(self, asin: str) -> dict[str, Any] | None:
+        """Return the item with the ASIN, or None if it is not in the catalog."""
+        index = self._get_index(asin, ASIN_PREFIX)
+        return None if index is None else self._create_item(index)
+
+    def search(
+        self,
+        keywords: str | None = None,
+        browse_node_id: str | None = None,
+    ) -> list[str]:
+        """Return the ASINs of the items matching all the search criteria.
+
+        The results of the most recent searches are cached, so only the first
+        search with some criteria scans the catalog.
+
+        Args:
+            keywords: Words that must appear in the item titles, case insensitive.
+            browse_node_id: Browse node the items must belong to.
+
+        """
+        words = frozenset(word.lower() for word in (keywords or "").split())
+        key = (words, browse_node_id)
+        if key not in self._search_cache:
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                self._search_cache.clear()
+            self._search_cache[key] = self._search(words, browse_node_id)
+        return self._search_cache[key]
+
+    def get_variations(self, asin: str) -> list[str]:
+        """Return the ASINs of the variations of an item or parent ASIN."""
+        index = self._get_index(asin, ASIN_PREFIX)
+        if index is None:
+            family = self._get_index(asin, PARENT_ASIN_PREFIX, self._families)
+        else:
+            family = index // self.variations
+        if family is None:
+            return []
+        first = family * self.variations
+        last = min(first + self.variations, self.size)
+        return [_get_asin(index) for index in range(first, last)]
+
+    def get_browse_node(self, browse_node_id: str) -> dict[str, Any] | None:
+        """Return the browse node, or None if it is not in the catalog."""
+        node_index = self._get_browse_node_index(browse_node_id)
+        if node_index is None:
+            return None
+        name = _get_browse_node_name(node_index)
+        return {
+            "Id": browse_node_id,
+            "DisplayName": name,
+            "ContextFreeName": name,
+            "IsRoot": False,
+            "Ancestor": {
+                "Id": str(FIRST_BROWSE_NODE_ID - 1),
+                "DisplayName": "Categories",
+                "ContextFreeName": "Categories",
+            },
+        }
+
+    def _search(self, words: frozenset[str], browse_node_id: str | None) -> list[str]:
+        node_index = self._get_browse_node_index(browse_node_id)
+        if browse_node_id is not None and node_index is None:
+            return []
+
+        asins = []
+        for index in range(self.size):
+            if node_index is not None and index % self.browse_nodes != node_index:
+                continue
+            if words and not words <= set(self._get_title(index).lower().split()):
+                continue
+            asins.append(_get_asin(index))
+        return asins
+
+    @property
+    def _families(self) -> int:
+        return -(-self.size // self.variations)
+
+    def _get_index(
+        self,
+        asin: str,
+        prefix: str,
+        limit: int | None = None,
+    ) -> int | None:
+        limit = self.size if limit is None else limit
+        if len(asin) != ASIN_LENGTH or not asin.startswith(prefix):
+            return None
+        if not asin[1:].isdigit():
+            return None
+        index = int(asin[1:])
+        return index if index < limit else None
+
+    def _get_browse_node_index(self, browse_node_id: str | None) -> int | None:
+        if browse_node_id is None or not browse_node_id.isdigit():
+            return None
+        index = int(browse_node_id) - FIRST_BROWSE_NODE_ID
+        return index if 0 <= index < self.browse_nodes else None
+
+    def _get_title(self, index: int) -> str:
+        word = TITLE_WORDS[index // self.variations % len(TITLE_WORDS)]
+        return f"{word} {index // self.variations} {self._get_color(index)}"
+
+    def _get_color(self, index: int) -> str:
+        return COLORS[index % self.variations % len(COLORS)]
+
+    def _create_item(self, index: int) -> dict[str, Any]:
+        asin = _get_asin(index)
+        family = index // self.variations
+        rng = random.Random(self.seed * 1_000_003 + index)  # noqa: S311
+        amount = round(rng.uniform(5, 500), 2)
+        node_index = index % self.browse_nodes
+        return {
+            "ASIN": asin,
+            "ParentASIN": f"{PARENT_ASIN_PREFIX}{family:0{ASIN_LENGTH - 1}d}",
+            "DetailPageURL": f"https://{self.marketplace}/dp/{asin}",
+            "ItemInfo": {
+                "Title": {"DisplayValue": self._get_title(index)},
+                "ByLineInfo": {"Brand": {"DisplayValue": f"Brand {family % 50}"}},
+            },
+            "Images": {
+                "Primary": {
+                    "Large": {
+                        "URL": f"https://m.media-amazon.com/images/I/{asin}.jpg",
+                        "Height": 500,
+                        "Width": 500,
+                    }
+                }
+            },
+            "OffersV2": {
+                "Listings": [
+                    {
+                        "Price": {
+                            "Money": {
+                                "Amount": amount,
+                                "Currency": self.currency,
+                                "DisplayAmount": f"{amount:.2f} {self.currency}",
+                            }
+                        },
+                        "Availability": {"Type": "IN_STOCK"},
+                        "IsBuyBoxWinner": True,
+                    }
+                ]
+            },
+            "BrowseNodeInfo": {
+                "BrowseNodes": [
+                    {
+                        "Id": str(FIRST_BROWSE_NODE_ID + node_index),
+                        "DisplayName": _get_browse_node_name(node_index),
+                    }
+                ]
+            },
+            "VariationAttributes": [{"Name": "color", "Value": self._get_color(index)}],
+        }
+
+
+def to_camel_case(data: Any) -> Any:
+    """Return PA-API 5 JSON data with the camel case keys of the Creators API."""
+    if isinstance(data, dict):
+        return {to_camel_case_key(key): to_camel_case(v) for key, v in data.items()}
+    if isinstance(data, list):
+        return [to_camel_case(value) for value in data]
+    return data
+
+
+def to_camel_case_key(key: str) -> str:
+    """Return a PA-API 5 JSON key in the camel case of the Creators API."""
+    if key.isupper():
+        return key.lower()
+    return key[:1].lower() + key[1:]
+
+
+def _get_browse_node_name(node_index: int) -> str:
+    word = TITLE_WORDS[node_index % len(TITLE_WORDS)]
+    return word if word.endswith("s") else f"{word}s"
+
+
+def _get_asin(index: int) -> str:
+    return f"{ASIN_PREFIX}{index:0{ASIN_LENGTH - 1}d}"
@@ -0,0 +1,783 @@
+"""Local stub of the PA-API 5 and the Creators API for load tests and benchmarks.
+
+The stub server implements GetItems, SearchItems, GetVariations and GetBrowseNodes
+for both APIs, and the OAuth2 token endpoints of the Creators API, serving the
+items of a synthetic catalog. PA-API requests must be signed with AWS Signature
+Version 4 and Creators API requests must use a token issued by the server. It
+can add latency to the responses and reject requests over a TPS limit with 429
+errors, like the real APIs do.
+
+Run it from the command line:
+
+    python -m amazon_creatorsapi.testing.server --items 100000 --tps 1
+
+Or start it in a background thread, sending the requests of the clients to it
+with its transports:
+
+    >>> with StubServer(SyntheticCatalog(10_000), tps=10) as server:
+    ...     api = AmazonApi(KEY, SECRET, TAG, "US", transport=server.transport())
+    ...     api.get_items(server.catalog.get_asins(10))
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hmac
+import json
+import math
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+import warnings
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import parse_qsl, quote_plus, urlsplit, urlunsplit
+
+from amazon_creatorsapi.core.transport import (
+    TransportRequest,
+    TransportResponse,
+    Urllib3Transport,
+)
+from amazon_creatorsapi.testing.catalog import (
+    SyntheticCatalog,
+    to_camel_case,
+    to_camel_case_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from amazon_creatorsapi.core.transport import AsyncTransport, Transport
+
+LatencyDistribution = Callable[[], float]
+"""Function returning the latency of a response in seconds."""
+
+PAAPI_OPERATIONS = {
+    "/paapi5/getitems": "GetItems",
+    "/paapi5/searchitems": "SearchItems",
+    "/paapi5/getvariations": "GetVariations",
+    "/paapi5/getbrowsenodes": "GetBrowseNodes",
+}
+CREATORS_OPERATIONS = {
+    "/catalog/v1/getItems": "GetItems",
+    "/catalog/v1/searchItems": "SearchItems",
+    "/catalog/v1/getVariations": "GetVariations",
+    "/catalog/v1/getBrowseNodes": "GetBrowseNodes",
+}
+TOKEN_PATHS = frozenset({"/oauth2/token", "/auth/o2/token"})
+TOKEN_EXPIRATION = 3600
+POLL_INTERVAL = 0.05
+MAX_IDS = 10
+MAX_ITEM_PAGE = 10
+MAX_VARIATION_COUNT = 10
+PAAPI_MAX_ITEM_COUNT = 10
+CREATORS_MAX_ITEM_COUNT = 100
+SIGNATURE_PATTERN = re.compile(
+    r"AWS4-HMAC-SHA256 Credential=(?P<key>[^/]+)/(?P<date>\d{8})/(?P<region>[^/]+)/"
+    r"(?P<service>[^/]+)/aws4_request, SignedHeaders=(?P<headers>[^,]+), "
+    r"Signature=(?P<signature>[0-9a-f]+)"
+)
+
+
+def uniform_latency(
+    low: float,
+    high: float,
+    *,
+    seed: int | None = None,
+) -> LatencyDistribution:
+    """Return a latency distribution uniform between two values in seconds."""
+    rng = random.Random(seed)  # noqa: S311
+    return lambda: rng.uniform(low, high)
+
+
+def lognormal_latency(
+    median: float,
+    sigma: float = 0.5,
+    *,
+    seed: int | None = None,
+) -> LatencyDistribution:
+    """Return a log-normal latency distribution, with the long tail of real APIs.
+
+    Args:
+        median: Median latency in seconds.
+        sigma: Standard deviation of the latency logarithm. Higher values give
+            slower tail latencies.
+        seed: Seed of the random latencies.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+def exponential_latency(
+    mean: float,
+    *,
+    seed: int | None = None,
+) -> LatencyDistribution:
+    """Return an exponential latency distribution with a mean in seconds."""
+    rng = random.Random(seed)  # noqa: S311
+    return lambda: rng.expovariate(1 / mean)
+
+
+class StubError(Exception):
+    """Error response returned by the stub server."""
+
+    def __init__(
+        self,
+        status: int,
+        code: str,
+        message: str,
+        details: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the error with its HTTP status, code and message.
+
+        Args:
+            status: HTTP status of the response.
+            code: Error code.
+            message: Error message.
+            details: Extra fields of the Creators API error response.
+
+        """
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+        self.details = details or {}
+
+    def to_dict(self, *, creators: bool) -> dict[str, Any]:
+        """Return the error response in the format of the PA-API or Creators API."""
+        if creators:
+            return {"type": self.code, "message": self.message, **self.details}
+        return {
+            "__type": f"com.amazon.paapi5#{self.code}Exception",
+            "Errors": [{"Code": self.code, "Message": self.message}],
+        }
+
+
+class StubServer:
+    """Local server implementing the PA-API 5 and the Creators API.
+
+    The server is also a transport handling the requests in process, without
+    sockets, to measure the client overhead alone.
+
+    Args:
+        catalog: Catalog of the items served. Defaults to 1000 synthetic items.
+        host: Host the server listens on.
+        port: Port the server listens on. Defaults to a free port.
+        latency: Seconds to wait before each response, fixed or sampled from a
+            distribution like ``lognormal_latency``. Defaults to no latency.
+        tps: Requests per second allowed for each credential before responding
+            with 429 errors. Defaults to no limit.
+        burst: Requests allowed at once for each credential. Defaults to the TPS
+            limit, or one request if lower.
+        credentials: Valid PA-API access keys and Creators API credential IDs,
+            mapped to their secrets. Defaults to accepting any credential
+            without verifying the signatures.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        catalog: SyntheticCatalog | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float | LatencyDistribution | None = None,
+        tps: float | None = None,
+        burst: float | None = None,
+        credentials: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize a stopped server."""
+        self.catalog = catalog if catalog is not None else SyntheticCatalog()
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.credentials = dict(credentials) if credentials is not None else None
+        self.stats: Counter[str] = Counter()
+        self._rate_limiter = _RateLimiter(tps, burst) if tps is not None else None
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._server: _HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            msg = "The stub server is not running"
+            raise RuntimeError(msg)
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self) -> Self:
+        """Start the server in a background thread."""
+        self._server = _HTTPServer((self.host, self.port), self)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": POLL_INTERVAL},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to finish."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def serve_forever(self) -> None:
+        """Run the server in the current thread until interrupted."""
+        self._server = _HTTPServer((self.host, self.port), self)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def transport(self, transport: Transport | None = None) -> RedirectTransport:
+        """Return a transport sending the requests of a sync client to the server.
+
+        Args:
+            transport: Transport sending the redirected requests. Defaults to
+                ``Urllib3Transport``.
+
+        """
+        return RedirectTransport(self.url, transport)
+
+    def async_transport(
+        self,
+        transport: AsyncTransport | None = None,
+    ) -> AsyncRedirectTransport:
+        """Return a transport sending the requests of the async client to the server.
+
+        Args:
+            transport: Async transport sending the redirected requests. Defaults
+                to ``HttpxTransport``.
+
+        """
+        return AsyncRedirectTransport(self.url, transport)
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Handle a request and return its response."""
+        path = urlsplit(request.url).path
+        creators = path not in PAAPI_OPERATIONS
+        try:
+            if path in TOKEN_PATHS:
+                self._count("Token")
+                return _create_response(200, self._issue_token(request))
+            operation = PAAPI_OPERATIONS.get(path) or CREATORS_OPERATIONS.get(path)
+            if operation is None:
+                raise StubError(404, "UnknownOperation", f"Unknown operation {path}")  # noqa: TRY301
+
+            key = (
+                self._verify_token(request)
+                if creators
+                else self._verify_signature(request)
+            )
+            self._count(operation)
+            if self._rate_limiter is not None and not self._rate_limiter.acquire(key):
+                self._count("Throttled")
+                raise StubError(  # noqa: TRY301
+                    429,
+                    "TooManyRequests",
+                    "The request was denied due to request throttling.",
+                    {"type": "ThrottleException"},
+                )
+            self._wait()
+            status, data = self._handle_operation(
+                operation, _parse_json(request.body), creators=creators
+            )
+        except StubError as error:
+            self._count("Errors")
+            return _create_response(error.status, error.to_dict(creators=creators))
+        return _create_response(status, to_camel_case(data) if creators else data)
+
+    def _handle_operation(
+        self,
+        operation: str,
+        body: dict[str, Any],
+        *,
+        creators: bool,
+    ) -> tuple[int, dict[str, Any]]:
+        if not _get_field(body, "PartnerTag"):
+            raise StubError(
+                400, "InvalidPartnerTag", "The partner tag is invalid or not present."
+            )
+        if operation == "GetItems":
+            data = self._get_items(body)
+        elif operation == "SearchItems":
+            max_item_count = (
+                CREATORS_MAX_ITEM_COUNT if creators else PAAPI_MAX_ITEM_COUNT
+            )
+            data = self._search_items(body, max_item_count)
+        elif operation == "GetVariations":
+            data = self._get_variations(body)
+        else:
+            data = self._get_browse_nodes(body)
+
+        # The Creators API responds with 404 when nothing is found, while the
+        # PA-API only returns the errors
+        if creators and list(data) == ["Errors"]:
+            ids = _get_field(body, "ItemIds") or _get_field(body, "BrowseNodeIds")
+            raise StubError(
+                404,
+                "ResourceNotFoundException",
+                data["Errors"][0]["Message"],
+                {
+                    "resourceId": ",".join(ids or [_get_field(body, "ASIN") or ""]),
+                    "resourceType": operation.removeprefix("Get").removesuffix("s"),
+                },
+            )
+        return 200, data
+
+    def _get_items(self, body: dict[str, Any]) -> dict[str, Any]:
+        asins = _get_ids(body, "ItemIds")
+        items, errors = [], []
+        for asin in asins:
+            item = self.catalog.get_item(asin)
+            if item is None:
+                errors.append(_get_invalid_item_error(asin))
+            else:
+                items.append(item)
+        return _create_result(
+            "ItemsResult", {"Items": items} if items else None, errors
+        )
+
+    def _search_items(
+        self, body: dict[str, Any], max_item_count: int
+    ) -> dict[str, Any]:
+        keywords = _get_field(body, "Keywords")
+        browse_node_id = _get_field(body, "BrowseNodeId")
+        if not keywords and not browse_node_id:
+            msg = "Either Keywords or BrowseNodeId must be provided in the request."
+            raise StubError(400, "InvalidParameterValue", msg)
+        item_count = _get_int(body, "ItemCount", 10, max_item_count)
+        item_page = _get_int(body, "ItemPage", 1, MAX_ITEM_PAGE)
+
+        asins = self.catalog.search(keywords, browse_node_id)
+        start = (item_page - 1) * item_count
+        page = asins[start : start + item_count]
+        if not page:
+            return _create_result("SearchResult", None, [_get_no_results_error()])
+        search_url = (
+            f"https://{self.catalog.marketplace}/s?k={quote_plus(keywords or '')}"
+        )
+        return {
+            "SearchResult": {
+                "Items": [self.catalog.get_item(asin) for asin in page],
+                "TotalResultCount": len(asins),
+                "SearchURL": search_url,
+            }
+        }
+
+    def _get_variations(self, body: dict[str, Any]) -> dict[str, Any]:
+        asin = _get_field(body, "ASIN")
+        if not isinstance(asin, str):
+            raise StubError(400, "InvalidParameterValue", "ASIN must be provided.")
+        variation_count = _get_int(body, "VariationCount", 10, MAX_VARIATION_COUNT)
+        variation_page = _get_int(body, "VariationPage", 1, sys.maxsize)
+
+        asins = self.catalog.get_variations(asin)
+        if not asins:
+            return _create_result(
+                "VariationsResult", None, [_get_invalid_item_error(asin)]
+            )
+        start = (variation_page - 1) * variation_count
+        page = asins[start : start + variation_count]
+        if not page:
+            return _create_result("VariationsResult", None, [_get_no_results_error()])
+        return {
+            "VariationsResult": {
+                "Items": [self.catalog.get_item(asin) for asin in page],
+                "VariationSummary": {
+                    "PageCount": -(-len(asins) // variation_count),
+                    "VariationCount": len(asins),
+                },
+            }
+        }
+
+    def _get_browse_nodes(self, body: dict[str, Any]) -> dict[str, Any]:
+        browse_nodes, errors = [], []
+        for browse_node_id in _get_ids(body, "BrowseNodeIds"):
+            browse_node = self.catalog.get_browse_node(browse_node_id)
+            if browse_node is None:
+                msg = f"The BrowseNodeId {browse_node_id} provided is invalid."
+                errors.append({"Code": "InvalidParameterValue", "Message": msg})
+            else:
+                browse_nodes.append(browse_node)
+        result = {"BrowseNodes": browse_nodes} if browse_nodes else None
+        return _create_result("BrowseNodesResult", result, errors)
+
+    def _verify_signature(self, request: TransportRequest) -> str:
+        """Verify the AWS Signature Version 4 of a PA-API request.
+
+        Returns:
+            The access key of the request, used for rate limiting.
+
+        """
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        match = SIGNATURE_PATTERN.fullmatch(headers.get("authorization", ""))
+        if match is None:
+            raise StubError(401, "IncompleteSignature", "The request is not signed.")
+        access_key = match["key"]
+        if self.credentials is None:
+            return access_key
+        if access_key not in self.credentials:
+            msg = "The Access Key ID included in the request is invalid."
+            raise StubError(401, "UnrecognizedClient", msg)
+
+        # Sign the received request again with the SDK signer and the secret
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            from amazon_paapi.sdk.auth.sign_helper import AWSV4Auth  # noqa: PLC0415
+
+        signed_headers = {
+            name: headers.get(name, "") for name in match["headers"].split(";")
+        }
+        timestamp = datetime.strptime(
+            headers.get("x-amz-date", ""), "%Y%m%dT%H%M%SZ"
+        ).replace(tzinfo=timezone.utc)
+        auth = AWSV4Auth(
+            access_key=access_key,
+            secret_key=self.credentials[access_key],
+            host=headers.get("host", ""),
+            region=match["region"],
+            service=match["service"],
+            method_name=request.method,
+            timestamp=timestamp,
+            headers=signed_headers,
+            path=urlsplit(request.url).path,
+            payload=_parse_json(request.body),
+        )
+        expected = auth.get_headers()["Authorization"]
+        if not hmac.compare_digest(expected, match.group(0)):
+            msg = "The request signature does not match the calculated signature."
+            raise StubError(401, "InvalidSignature", msg)
+        return access_key
+
+    def _issue_token(self, request: TransportRequest) -> dict[str, Any]:
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        if "json" in headers.get("content-type", ""):
+            data = _parse_json(request.body)
+        else:
+            data = dict(parse_qsl(request.body.decode("utf-8")))
+
+        credential_id = str(data.get("client_id", ""))
+        if self.credentials is not None and (
+            credential_id not in self.credentials
+            or not hmac.compare_digest(
+                self.credentials[credential_id], str(data.get("client_secret", ""))
+            )
+        ):
+            raise StubError(401, "invalid_client", "Client authentication failed.")
+
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._tokens[token] = (credential_id, time.time() + TOKEN_EXPIRATION)
+        return {
+            "access_token": token,
+            "token_type": "bearer",
+            "expires_in": TOKEN_EXPIRATION,
+        }
+
+    def _verify_token(self, request: TransportRequest) -> str:
+        """Verify the OAuth2 token of a Creators API request.
+
+        Returns:
+            The credential ID of the token, used for rate limiting.
+
+        """
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        authorization = headers.get("authorization", "")
+        token = authorization.removeprefix("Bearer ").split(",")[0].strip()
+        with self._lock:
+            credential_id, expires_at = self._tokens.get(token, ("", 0.0))
+        if self.credentials is None:
+            return credential_id or token
+        if not credential_id or time.time() >= expires_at:
+            raise StubError(
+                401, "InvalidToken", "The access token is invalid or expired."
+            )
+        return credential_id
+
+    def _wait(self) -> None:
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+
+class RedirectTransport:
+    """Transport sending the requests to another host, keeping their paths.
+
+    Args:
+        base_url: URL of the host receiving the requests, like ``StubServer.url``.
+        transport: Transport sending the redirected requests. Defaults to
+            ``Urllib3Transport``.
+
+    """
+
+    def __init__(self, base_url: str, transport: Transport | None = None) -> None:
+        """Initialize the transport."""
+        self.base_url = base_url
+        self.transport = transport if transport is not None else Urllib3Transport()
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request to the base URL."""
+        return self.transport.send(_redirect(request, self.base_url))
+
+
+class AsyncRedirectTransport:
+    """Async transport sending the requests to another host, keeping their paths.
+
+    Args:
+        base_url: URL of the host receiving the requests, like ``StubServer.url``.
+        transport: Async transport sending the redirected requests. Defaults to
+            ``HttpxTransport``, which requires the ``async`` extra.
+
+    """
+
+    def __init__(self, base_url: str, transport: AsyncTransport | None = None) -> None:
+        """Initialize the transport."""
+        if transport is None:
+            from amazon_creatorsapi.aio.transport import HttpxTransport  # noqa: PLC0415
+
+            transport = HttpxTransport()
+        self.base_url = base_url
+        self.transport = transport
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Send the request to the base URL."""
+        return await self.transport.send(_redirect(request, self.base_url))
+
+
+class _RateLimiter:
+    """Token buckets limiting the requests per second of each credential."""
+
+    def __init__(self, tps: float, burst: float | None) -> None:
+        self.tps = tps
+        self.burst = burst if burst is not None else max(tps, 1.0)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.tps)
+            allowed = tokens >= 1
+            self._buckets[key] = (tokens - allowed, now)
+        return allowed
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], stub: StubServer) -> None:
+        self.stub = stub
+        super().__init__(address, _RequestHandler)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    # Keep the connections alive, like the real APIs, and answer without
+    # waiting for delayed acknowledgements
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        request = TransportRequest(
+            method="POST",
+            url=self.path,
+            headers=dict(self.headers.items()),
+            body=self.rfile.read(length),
+        )
+        response = self.server.stub.send(request)
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Do not log every request."""
+
+
+def _redirect(request: TransportRequest, base_url: str) -> TransportRequest:
+    base = urlsplit(base_url)
+    url = urlsplit(request.url)
+    return replace(
+        request,
+        url=urlunsplit((base.scheme, base.netloc, url.path, url.query, "")),
+    )
+
+
+def _create_response(status: int, data: dict[str, Any]) -> TransportResponse:
+    return TransportResponse(
+        status=status,
+        headers={"Content-Type": "application/json"},
+        body=json.dumps(data).encode("utf-8"),
+    )
+
+
+def _create_result(
+    name: str,
+    result: dict[str, Any] | None,
+    errors: list[dict[str, str]],
+) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    if result is not None:
+        data[name] = result
+    if errors:
+        data["Errors"] = errors
+    return data
+
+
+def _get_invalid_item_error(asin: str) -> dict[str, str]:
+    return {
+        "Code": "InvalidParameterValue",
+        "Message": f"The ItemId {asin} provided in the request is invalid.",
+    }
+
+
+def _get_no_results_error() -> dict[str, str]:
+    return {"Code": "NoResults", "Message": "No results found for your request."}
+
+
+def _parse_json(body: bytes) -> dict[str, Any]:
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError as exc:
+        raise StubError(
+            400, "InvalidRequest", "The request body is not valid JSON."
+        ) from exc
+    if not isinstance(data, dict):
+        raise StubError(400, "InvalidRequest", "The request body must be an object.")
+    return data
+
+
+def _get_field(body: dict[str, Any], name: str) -> Any:
+    """Return a request field by its PA-API name or its Creators API name."""
+    return body.get(name, body.get(to_camel_case_key(name)))
+
+
+def _get_ids(body: dict[str, Any], name: str) -> list[str]:
+    ids = _get_field(body, name)
+    if not isinstance(ids, list) or not 1 <= len(ids) <= MAX_IDS:
+        msg = f"{name} must contain between 1 and {MAX_IDS} values."
+        raise StubError(400, "InvalidParameterValue", msg)
+    return [str(value) for value in ids]
+
+
+def _get_int(body: dict[str, Any], name: str, default: int, maximum: int) -> int:
+    value = _get_field(body, name)
+    if value is None:
+        return default
+    if not isinstance(value, (int, float)) or not 1 <= value <= maximum:
+        msg = f"{name} must be a number between 1 and {maximum}."
+        raise StubError(400, "InvalidParameterValue", msg)
+    return int(value)
+
+
+def _parse_latency(value: str) -> float | LatencyDistribution:
+    """Parse a latency argument like 0.2, uniform:0.1,0.3 or lognormal:0.2,0.5."""
+    name, _, params = value.partition(":")
+    if not params:
+        return float(name)
+    args = [float(param) for param in params.split(",")]
+    distributions: dict[str, Callable[..., LatencyDistribution]] = {
+        "uniform": uniform_latency,
+        "lognormal": lognormal_latency,
+        "exponential": exponential_latency,
+    }
+    if name not in distributions:
+        msg = f"Unknown latency distribution: {name}"
+        raise argparse.ArgumentTypeError(msg)
+    return distributions[name](*args)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the stub server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="host to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument(
+        "--items", type=int, default=1000, help="number of items in the catalog"
+    )
+    parser.add_argument(
+        "--variations", type=int, default=5, help="items per variation family"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the catalog")
+    parser.add_argument(
+        "--latency",
+        type=_parse_latency,
+        default=None,
+        help="seconds, or uniform:LOW,HIGH, lognormal:MEDIAN,SIGMA or exponential:MEAN",
+    )
+    parser.add_argument("--tps", type=float, default=None, help="requests per second")
+    parser.add_argument("--burst", type=float, default=None, help="burst size")
+    parser.add_argument(
+        "--credential",
+        action="append",
+        default=None,
+        metavar="KEY:SECRET",
+        help="valid credential, repeat for several ones (default: accept any)",
+    )
+    args = parser.parse_args(argv)
+
+    credentials = None
+    if args.credential is not None:
+        credentials = dict(value.split(":", 1) for value in args.credential)
+    catalog = SyntheticCatalog(args.items, variations=args.variations, seed=args.seed)
+    server = StubServer(
+        catalog,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        tps=args.tps,
+        burst=args.burst,
+        credentials=credentials,
+    )
+    print(f"Serving {args.items} items on http://{args.host}:{args.port}")  # noqa: T201
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,8 @@ warnings.warn(
 )
 
 __author__ = "Sergio Abad"
-__all__ = ["AmazonApi", "get_asin"]
+__all__ = ["AmazonApi", "MultiMarketplaceApi", "get_asin"]
 
 from .api import AmazonApi  # noqa: E402
+from .marketplaces import MultiMarketplaceApi  # noqa: E402
 from .tools import get_asin  # noqa: E402
@@ -5,21 +5,71 @@ A simple Python wrapper for the last version of the Amazon Product Advertising A
 
 from __future__ import annotations
 
+import functools
+import threading
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from amazon_creatorsapi.core.deadline import Deadline
+from amazon_creatorsapi.core.hooks import (
+    BUILD,
+    DESERIALIZE,
+    NETWORK,
+    SIGN,
+    get_current_event,
+    measure,
+)
+from amazon_creatorsapi.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFETCH,
+    MAX_SEARCH_PAGES,
+    count_pages,
+    get_variations_page_count,
+    iter_new_items,
+    iter_pages,
+)
+from amazon_creatorsapi.core.pipeline import RequestPipeline
+from amazon_creatorsapi.core.results import ResultList, ResultMetadata
+from amazon_creatorsapi.core.tracing import (
+    get_tracer,
+    traced,
+)
+from amazon_creatorsapi.core.transport import TransportPoolManager
 
 from . import models
-from .errors import InvalidArgument
-from .helpers import arguments, requests
+from .errors import (
+    AmazonError,
+    AssociateValidationError,
+    CircuitBreakerOpen,
+    DeadlineExceeded,
+    InvalidArgument,
+    ItemsNotFound,
+    QuotaExceeded,
+    TooManyRequests,
+)
+from .helpers import arguments, connections, requests
 from .helpers.generators import get_list_chunks
 from .helpers.items import sort_items
 from .sdk.api.default_api import DefaultApi
+from .sdk.api_client import ApiClient
+from .sdk.rest import ApiException
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    import urllib3
+
+    from amazon_creatorsapi.core.circuit_breaker import CircuitBreakerRegistry
+    from amazon_creatorsapi.core.hooks import EventHooks
+    from amazon_creatorsapi.core.quota import QuotaTracker
+    from amazon_creatorsapi.core.retry import RetryPolicy
+    from amazon_creatorsapi.core.scheduler import RequestScheduler
+    from amazon_creatorsapi.core.transport import Transport
+
     from .models.regions import CountryCode
 
 
-class AmazonApi:
+class AmazonApi(RequestPipeline):
     """Provides methods to get information from Amazon using your API credentials.
 
     Args:
@@ -30,12 +80,61 @@ class AmazonApi:
             Use values from ``models.Country``, e.g. ``Country.ES``.
         throttling (``float``, optional): Wait time in seconds between API calls. Use it
             to avoid reaching Amazon limits. Defaults to 1 second.
+        pool_connections (``int``, optional): Number of hosts for which connection
+            pools are kept. Defaults to 4.
+        pool_maxsize (``int``, optional): Maximum number of connections kept alive
+            per host. Defaults to 5 per CPU.
+        keep_alive (``bool``, optional): Enable TCP keep-alive probes on idle
+            connections. Defaults to True.
+        connect_timeout (``float``, optional): Seconds to wait for a connection to be
+            established. Defaults to no timeout.
+        read_timeout (``float``, optional): Seconds to wait for the response after
+            the request is sent. Defaults to no timeout.
+        pool_manager (``urllib3.PoolManager``, optional): Pool manager used to send
+            the requests, e.g. shared by the instances for several marketplaces so
+            they reuse warm connections. Overrides ``pool_connections``,
+            ``pool_maxsize`` and ``keep_alive``.
+        retry_policy (``RetryPolicy``, optional): Policy used to retry requests
+            failing with transient errors, like 429, 5xx or connection errors. Each
+            ``get_items`` chunk is retried independently. Defaults to no retries.
+        circuit_breakers (``CircuitBreakerRegistry``, optional): Circuit breakers
+            used to fail fast with ``CircuitBreakerOpen`` while the host of the
+            marketplace is failing or slow. Share the registry between instances
+            to share the circuit breakers. Defaults to no circuit breaker.
+        transport (``Transport``, optional): Transport sending the signed requests
+            instead of urllib3, e.g. a ``RecordingTransport`` or a
+            ``ReplayTransport``. Overrides ``pool_manager``.
+        hooks (``EventHooks``, optional): Callbacks called during the lifecycle of
+            the requests with the time spent throttling, building, signing,
+            sending and deserializing them. Defaults to no hooks.
+        tracer_provider (``TracerProvider``, optional): OpenTelemetry tracer
+            provider used to trace the calls, with a span for every call and
+            child spans for its requests and retries. Defaults to no tracing.
+        quota (``QuotaTracker``, optional): Daily quota counting every request
+            sent, raising ``QuotaExceeded`` when the quota of the priority of
+            the request is spent. Defaults to no quota.
+        scheduler (``RequestScheduler``, optional): Scheduler sharing the
+            throttling between the clients of the credential, sending the
+            waiting requests by priority instead of first come first served.
+            Overrides ``throttling``. Defaults to no scheduler.
 
     Raises:
         ``InvalidArgumentException``
 
     """
 
+    FAILOVER_ERRORS: ClassVar[tuple[type[Exception], ...]] = (
+        AssociateValidationError,
+        QuotaExceeded,
+        TooManyRequests,
+    )
+    """Errors of a credential making ``CredentialPool`` fail over to another one."""
+
+    _API_ERROR = AmazonError
+    _DEADLINE_ERROR = DeadlineExceeded
+    _QUOTA_ERROR = QuotaExceeded
+    _CIRCUIT_BREAKER_ERROR = CircuitBreakerOpen
+
     def __init__(
         self,
         key: str,
@@ -43,14 +142,37 @@ class AmazonApi:
         tag: str,
         country: CountryCode,
         throttling: float = 1,
+        *,
+        pool_connections: int = connections.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = connections.DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        pool_manager: urllib3.PoolManager | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        transport: Transport | None = None,
+        hooks: EventHooks | None = None,
+        tracer_provider: Any = None,
+        quota: QuotaTracker | None = None,
+        scheduler: RequestScheduler | None = None,
     ) -> None:
         """Initialize the Amazon API client with the provided credentials."""
         self._key = key
         self._secret = secret
         self._last_query_time = time.time() - throttling
+        self._throttle_lock = threading.Lock()
         self.tag = tag
         self.country = country
         self.throttling = float(throttling)
+        self.request_timeout = connections.get_request_timeout(
+            connect_timeout, read_timeout
+        )
+        self.retry_policy = retry_policy
+        self.hooks = hooks
+        self.quota = quota
+        self.scheduler = scheduler
+        self._tracer = get_tracer(tracer_provider)
 
         try:
             self._host = "webservices.amazon." + models.regions.DOMAINS[country]
@@ -60,8 +182,28 @@ class AmazonApi:
             msg = "Country code is not correct"
             raise InvalidArgument(msg) from error
 
-        self.api = DefaultApi(key, secret, self._host, self.region)
+        self.circuit_breaker = (
+            circuit_breakers.get(self._host) if circuit_breakers is not None else None
+        )
+
+        if transport is not None:
+            pool_manager = TransportPoolManager(transport)  # type: ignore[assignment]
+        elif pool_manager is None:
+            pool_manager = connections.create_pool_manager(
+                pool_connections, pool_maxsize, keep_alive
+            )
+        # The phases of the requests are only measured with hooks or tracing
+        api_client_class = (
+            _InstrumentedApiClient
+            if hooks is not None or self._tracer is not None
+            else ApiClient
+        )
+        api_client = api_client_class(
+            key, secret, self._host, self.region, pool_manager=pool_manager
+        )
+        self.api = DefaultApi(api_client=api_client)
 
+    @traced
     def get_items(
         self,
         items: str | list[str],
@@ -70,8 +212,12 @@ class AmazonApi:
         currency_of_preference: str | None = None,
         languages_of_preference: list[str] | None = None,
         include_unavailable: bool = False,
+        *,
+        timeout: float | None = None,
+        partial_results: bool = False,
+        bisect_errors: bool = False,
         **kwargs: Any,
-    ) -> list[models.Item]:
+    ) -> ResultList[models.Item]:
         """Get items information from Amazon.
 
         Args:
@@ -89,16 +235,30 @@ class AmazonApi:
             include_unavailable (``bool``, optional): The returned list includes not
                 available items. Not available items have the ASIN and item_info equals
                 None. Defaults to False.
+            timeout (``float``, optional): Maximum seconds for the whole call,
+                including throttling waits, retries and requests. Defaults to no
+                limit.
+            partial_results (``bool``, optional): Return the items of the chunks
+                fetched successfully instead of raising if a chunk fails. The
+                errors are reported in ``metadata.errors`` by ASIN and in the
+                ``error`` of each chunk of ``metadata.chunks``. Defaults to False.
+            bisect_errors (``bool``, optional): Split the chunks failing with
+                ``InvalidArgument`` in halves until the invalid ASINs are isolated,
+                fetching the rest of the items. Implies ``partial_results``.
+                Defaults to False.
             kwargs (``dict``, optional): Other arguments to be passed to the Amazon API.
 
         Returns:
-            ``list[models.Item]``: A list of items with Amazon information.
+            ``list[models.Item]``: A list of items with Amazon information. The
+            ``metadata`` attribute of the list contains the chunks requested and
+            the retries made for each one.
 
         Raises:
             ``InvalidArgumentException``
             ``MalformedRequestException``
             ``ApiRequestException``
             ``ItemsNotFoundException``
+            ``DeadlineExceeded``
 
         """
         kwargs.update(
@@ -110,17 +270,39 @@ class AmazonApi:
             }
         )
 
+        deadline = Deadline.from_timeout(timeout)
         items_ids = arguments.get_items_ids(items)
         results = []
+        metadata = ResultMetadata()
 
-        for asin_chunk in get_list_chunks(list(set(items_ids)), chunk_size=10):
-            request = requests.get_items_request(self, asin_chunk, **kwargs)
-            self._throttle()
-            items_response = requests.get_items_response(self, request)
-            results.extend(items_response)
-
-        return sort_items(results, items_ids, include_unavailable=include_unavailable)
+        try:
+            for asin_chunk in get_list_chunks(list(set(items_ids)), chunk_size=10):
+                results.extend(
+                    self._get_chunk_items(
+                        asin_chunk,
+                        kwargs,
+                        deadline,
+                        metadata,
+                        partial_results=partial_results or bisect_errors,
+                        bisect_errors=bisect_errors,
+                    )
+                )
+        except DeadlineExceeded as error:
+            error.results = ResultList(
+                sort_items(results, items_ids, include_unavailable=False), metadata
+            )
+            raise
+
+        return ResultList(
+            sort_items(
+                results,
+                [asin for asin in items_ids if asin not in metadata.errors],
+                include_unavailable=include_unavailable,
+            ),
+            metadata,
+        )
 
+    @traced
     def search_items(
         self,  # NOSONAR
         item_count: int | None = None,
@@ -144,6 +326,8 @@ class AmazonApi:
         min_reviews_rating: int | None = None,
         search_index: str | None = None,
         sort_by: models.SortBy = None,
+        *,
+        timeout: float | None = None,
         **kwargs: Any,
     ) -> models.SearchResult:
         """Search for items on Amazon based on a search query.
@@ -195,6 +379,9 @@ class AmazonApi:
             search_index (``str``, optional): Indicates the product category to search.
                 Defaults to All.
             sort_by (``models.SortBy``, optional): The way in which items are sorted.
+            timeout (``float``, optional): Maximum seconds for the whole call,
+                including throttling waits, retries and requests. Defaults to no
+                limit.
             kwargs (``dict``, optional): Other arguments to be passed to the Amazon API.
 
         Returns:
@@ -205,6 +392,7 @@ class AmazonApi:
             ``MalformedRequestException``
             ``ApiRequestException``
             ``ItemsNotFoundException``
+            ``DeadlineExceeded``
 
         """
         kwargs.update(
@@ -234,10 +422,55 @@ class AmazonApi:
         )
 
         arguments.check_search_args(**kwargs)
-        request = requests.get_search_items_request(self, **kwargs)
-        self._throttle()
-        return requests.get_search_items_response(self, request)
+        event = self._create_event("SearchItems")
+        with measure(event, BUILD):
+            request = requests.get_search_items_request(self, **kwargs)
+        return self._send(
+            functools.partial(requests.get_search_items_response, self, request),
+            Deadline.from_timeout(timeout),
+            event=event,
+        )
+
+    def iter_search_items(
+        self, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> Generator[models.Item, None, None]:
+        """Search for items on Amazon, yielding the items of all the pages.
+
+        The pages are requested as the items are consumed, a few at a time, until
+        the ``total_result_count`` of the search or the 10 pages allowed by the
+        API are exhausted. Items returned in several pages are only yielded once.
+
+        Args:
+            prefetch (``int``, optional): Number of pages requested at the same
+                time, throttled as usual. Defaults to 2.
+            kwargs (``dict``, optional): Arguments of ``search_items``, except
+                ``item_page``.
 
+        Yields:
+            ``models.Item``: The items found, in the order of the pages.
+
+        Raises:
+            ``InvalidArgumentException``
+            ``MalformedRequestException``
+            ``ApiRequestException``
+            ``ItemsNotFoundException``
+            ``DeadlineExceeded``
+
+        """
+        arguments.check_prefetch_args(prefetch)
+        page_size = kwargs.get("item_count") or DEFAULT_PAGE_SIZE
+        pages = iter_pages(
+            lambda page: self.search_items(item_page=page, **kwargs),
+            lambda result: count_pages(result.total_result_count, page_size),
+            max_pages=MAX_SEARCH_PAGES,
+            prefetch=prefetch,
+            end_errors=(ItemsNotFound,),
+        )
+        seen: set[str] = set()
+        for page in pages:
+            yield from iter_new_items(page.items, seen)
+
+    @traced
     def get_variations(
         self,
         asin: str,
@@ -247,6 +480,8 @@ class AmazonApi:
         currency_of_preference: str | None = None,
         languages_of_preference: list[str] | None = None,
         merchant: models.Merchant = None,
+        *,
+        timeout: float | None = None,
         **kwargs: Any,
     ) -> models.VariationsResult:
         """Return a set of items that are the same product but differ by theme.
@@ -259,8 +494,7 @@ class AmazonApi:
             variation_count (``int``, optional): Number of items returned. Should be
                 between 1 and 10. Defaults to 10.
             variation_page (``int``, optional): The specific page of items to be
-                returned from the available results. Should be between 1 and 10.
-                Defaults to 1.
+                returned from the available results, starting at 1. Defaults to 1.
             condition (``models.Condition``, optional): Filters offers by condition
                 type. Defaults to Any.
             currency_of_preference (``str``, optional): Currency of preference in which
@@ -270,6 +504,9 @@ class AmazonApi:
                 preference in which the item information should be returned.
             merchant (``models.Merchant``, optional): Filters search results to return
                 items having at least an offer sold by target merchant. Defaults to All.
+            timeout (``float``, optional): Maximum seconds for the whole call,
+                including throttling waits, retries and requests. Defaults to no
+                limit.
             kwargs (``dict``, optional): Other arguments to be passed to the Amazon API.
 
         Returns:
@@ -280,6 +517,7 @@ class AmazonApi:
             ``MalformedRequestException``
             ``ApiRequestException``
             ``ItemsNotFoundException``
+            ``DeadlineExceeded``
 
         """
         asin = arguments.get_items_ids(asin)[0]
@@ -297,14 +535,86 @@ class AmazonApi:
         )
 
         arguments.check_variations_args(**kwargs)
-        request = requests.get_variations_request(self, **kwargs)
-        self._throttle()
-        return requests.get_variations_response(self, request)
+        event = self._create_event("GetVariations")
+        with measure(event, BUILD):
+            request = requests.get_variations_request(self, **kwargs)
+        return self._send(
+            functools.partial(requests.get_variations_response, self, request),
+            Deadline.from_timeout(timeout),
+            event=event,
+        )
+
+    def iter_variations(
+        self, asin: str, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> Generator[models.Item, None, None]:
+        """Return the variations of all the pages of a product, as they arrive.
+
+        The ``page_count`` of the first page tells how many pages to request,
+        ``prefetch`` at a time and throttled as usual, while the variations of
+        the previous ones are consumed.
 
+        Args:
+            asin (``str``): One item, using ASIN or product URL.
+            prefetch (``int``, optional): Number of pages requested at the same
+                time. Defaults to 2.
+            kwargs (``dict``, optional): Arguments of ``get_variations``, except
+                ``variation_page``.
+
+        Yields:
+            ``models.Item``: The variations, in the order of the pages.
+
+        Raises:
+            ``InvalidArgumentException``
+            ``MalformedRequestException``
+            ``ApiRequestException``
+            ``ItemsNotFoundException``
+            ``DeadlineExceeded``
+
+        """
+        seen: set[str] = set()
+        for page in self._iter_variations_pages(asin, prefetch, kwargs):
+            yield from iter_new_items(page.items, seen)
+
+    def get_all_variations(
+        self, asin: str, *, prefetch: int = DEFAULT_PREFETCH, **kwargs: Any
+    ) -> models.VariationsResult:
+        """Return the variations of all the pages of a product in one result.
+
+        Same as ``iter_variations``, but waiting for all the pages and returning
+        the first one with the variations of all of them.
+
+        Args:
+            asin (``str``): One item, using ASIN or product URL.
+            prefetch (``int``, optional): Number of pages requested at the same
+                time. Defaults to 2.
+            kwargs (``dict``, optional): Arguments of ``get_variations``, except
+                ``variation_page``.
+
+        Returns:
+            ``models.VariationsResult``: Variations result containing all the items.
+
+        Raises:
+            ``InvalidArgumentException``
+            ``MalformedRequestException``
+            ``ApiRequestException``
+            ``ItemsNotFoundException``
+            ``DeadlineExceeded``
+
+        """
+        pages = list(self._iter_variations_pages(asin, prefetch, kwargs))
+        seen: set[str] = set()
+        pages[0].items = [
+            item for page in pages for item in iter_new_items(page.items, seen)
+        ]
+        return pages[0]
+
+    @traced
     def get_browse_nodes(
         self,
         browse_node_ids: list[str],
         languages_of_preference: list[str] | None = None,
+        *,
+        timeout: float | None = None,
         **kwargs: Any,
     ) -> list[models.BrowseNode]:
         """Return the specified browse node's information.
@@ -317,6 +627,9 @@ class AmazonApi:
                 category/sub-category.
             languages_of_preference (``list[str]``, optional): Languages in order of
                 preference in which the item information should be returned.
+            timeout (``float``, optional): Maximum seconds for the whole call,
+                including throttling waits, retries and requests. Defaults to no
+                limit.
             kwargs (``dict``, optional): Other arguments to be passed to the Amazon API.
 
         Returns:
@@ -327,6 +640,7 @@ class AmazonApi:
             ``MalformedRequestException``
             ``ApiRequestException``
             ``ItemsNotFoundException``
+            ``DeadlineExceeded``
 
         """
         kwargs.update(
@@ -337,13 +651,112 @@ class AmazonApi:
         )
 
         arguments.check_browse_nodes_args(**kwargs)
-        request = requests.get_browse_nodes_request(self, **kwargs)
-        self._throttle()
-        return requests.get_browse_nodes_response(self, request)
-
-    def _throttle(self) -> None:
-        """Wait for the throttling interval to elapse since the last API call."""
-        wait_time = self.throttling - (time.time() - self._last_query_time)
-        if wait_time > 0:
-            time.sleep(wait_time)
-        self._last_query_time = time.time()
+        event = self._create_event("GetBrowseNodes")
+        with measure(event, BUILD):
+            request = requests.get_browse_nodes_request(self, **kwargs)
+        return self._send(
+            functools.partial(requests.get_browse_nodes_response, self, request),
+            Deadline.from_timeout(timeout),
+            event=event,
+        )
+
+    def _get_chunk_items(
+        self,
+        asin_chunk: list[str],
+        kwargs: dict[str, Any],
+        deadline: Deadline | None,
+        metadata: ResultMetadata,
+        *,
+        partial_results: bool,
+        bisect_errors: bool,
+    ) -> list[models.Item]:
+        """Get the items of a chunk, recording its errors if partial results."""
+        event = self._create_event("GetItems")
+        with measure(event, BUILD):
+            request = requests.get_items_request(self, asin_chunk, **kwargs)
+        chunk = metadata.add_chunk(asin_chunk)
+        try:
+            return self._send(
+                functools.partial(requests.get_items_response, self, request),
+                deadline,
+                chunk,
+                event,
+            )
+        except (AssociateValidationError, DeadlineExceeded):
+            raise
+        except Exception as exc:
+            if not partial_results:
+                raise
+            error = chunk.error = exc
+
+        if bisect_errors and len(asin_chunk) > 1 and isinstance(error, InvalidArgument):
+            middle = len(asin_chunk) // 2
+            return [
+                item
+                for half in (asin_chunk[:middle], asin_chunk[middle:])
+                for item in self._get_chunk_items(
+                    half,
+                    kwargs,
+                    deadline,
+                    metadata,
+                    partial_results=partial_results,
+                    bisect_errors=bisect_errors,
+                )
+            ]
+
+        for asin in asin_chunk:
+            metadata.errors[asin] = error
+        return []
+
+    def _iter_variations_pages(
+        self, asin: str, prefetch: int, kwargs: dict[str, Any]
+    ) -> Generator[models.VariationsResult, None, None]:
+        """Return the pages of variations of an item, up to its page count."""
+        arguments.check_prefetch_args(prefetch)
+        asin = arguments.get_items_ids(asin)[0]
+        return iter_pages(
+            lambda page: self.get_variations(asin, variation_page=page, **kwargs),
+            get_variations_page_count,
+            prefetch=prefetch,
+            end_errors=(ItemsNotFound,),
+        )
+
+    def _get_request_timeout(
+        self, deadline: Deadline | None
+    ) -> tuple[float | None, float | None] | None:
+        """Return the timeout of the requests, limited by the deadline."""
+        return connections.limit_request_timeout(self.request_timeout, deadline)
+
+
+class _InstrumentedApiClient(ApiClient):
+    """SDK client measuring the phases of the requests sent with an event.
+
+    Used instead of the SDK client when there are hooks, so the requests of the
+    clients without hooks are not measured.
+    """
+
+    def update_params_for_auth(self, *args: Any, **kwargs: Any) -> None:
+        """Sign the request, measuring the time spent."""
+        with measure(get_current_event(), SIGN):
+            super().update_params_for_auth(*args, **kwargs)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        """Send the request, recording the time spent and the payload sizes."""
+        event = get_current_event()
+        if event is None:
+            return super().request(*args, **kwargs)
+
+        event.set_request_body(kwargs.get("body"))
+        try:
+            with event.measure(NETWORK):
+                response = super().request(*args, **kwargs)
+        except ApiException as error:
+            event.set_response(error.status, error.body)
+            raise
+        event.set_response(response.status, response.data)
+        return response
+
+    def deserialize(self, *args: Any, **kwargs: Any) -> Any:
+        """Deserialize the response, measuring the time spent."""
+        with measure(get_current_event(), DESERIALIZE):
+            return super().deserialize(*args, **kwargs)
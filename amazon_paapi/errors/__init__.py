@@ -4,10 +4,13 @@ from .exceptions import (
     AmazonError,
     AsinNotFound,
     AssociateValidationError,
+    CircuitBreakerOpen,
+    DeadlineExceeded,
     InvalidArgument,
     InvalidPartnerTag,
     ItemsNotFound,
     MalformedRequest,
+    QuotaExceeded,
     RequestError,
     TooManyRequests,
 )
@@ -16,10 +19,13 @@ __all__ = [
     "AmazonError",
     "AsinNotFound",
     "AssociateValidationError",
+    "CircuitBreakerOpen",
+    "DeadlineExceeded",
     "InvalidArgument",
     "InvalidPartnerTag",
     "ItemsNotFound",
     "MalformedRequest",
+    "QuotaExceeded",
     "RequestError",
     "TooManyRequests",
 ]
@@ -1,5 +1,12 @@
 """Custom exceptions module."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from amazon_creatorsapi.core.results import ResultList
+
 
 class AmazonError(Exception):
     """Common base class for all Amazon API exceptions."""
@@ -22,6 +29,23 @@ class AssociateValidationError(AmazonError):
     """Raised when credentials are not valid for the selected country."""
 
 
+class CircuitBreakerOpen(AmazonError):
+    """Raised without sending the request while the circuit breaker is open."""
+
+
+class DeadlineExceeded(AmazonError):
+    """Raised when the timeout of a call expires before it completes.
+
+    The ``results`` attribute contains the items obtained before the deadline
+    for ``get_items`` calls, or None.
+    """
+
+    def __init__(self, reason: str, results: ResultList[Any] | None = None) -> None:
+        """Initialize the exception with a reason and the partial results."""
+        super().__init__(reason)
+        self.results = results
+
+
 class InvalidArgument(AmazonError):
     """Raised when arguments are not correct."""
 
@@ -38,6 +62,19 @@ class MalformedRequest(AmazonError):
     """Raised if the request for Amazon API is not correctly formed."""
 
 
+class QuotaExceeded(AmazonError):
+    """Raised without sending the request when the daily quota is spent.
+
+    The ``retry_after`` attribute contains the seconds until the quota allows
+    the request again.
+    """
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        """Initialize the exception with a reason and the seconds to wait."""
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
 class RequestError(AmazonError):
     """Raised if the request to Amazon API fails."""
 
@@ -72,18 +72,30 @@ def check_search_pagination_args(**kwargs: Any) -> None:
             raise InvalidArgument(error_message)
 
 
+def check_prefetch_args(prefetch: Any) -> None:
+    """Validate the number of pages requested at the same time."""
+    if not isinstance(prefetch, int) or prefetch < 1:
+        error_message = "Arg prefetch should be an integer greater than 0."
+        raise InvalidArgument(error_message)
+
+
 def check_variations_args(**kwargs: Any) -> None:
     """Validate variation arguments for get_variations requests."""
-    error_message = (
-        "Args variation_count and variation_page should be integers between 1 and 10."
-    )
-    variation_args = [kwargs.get("variation_count"), kwargs.get("variation_page")]
+    variation_count = kwargs.get("variation_count")
+    if variation_count is not None and (
+        not isinstance(variation_count, int)
+        or not 1 <= variation_count <= MAX_PAGINATION_VALUE
+    ):
+        error_message = "Arg variation_count should be an integer between 1 and 10."
+        raise InvalidArgument(error_message)
 
-    for arg in variation_args:
-        if arg is not None and (
-            not isinstance(arg, int) or not 1 <= arg <= MAX_PAGINATION_VALUE
-        ):
-            raise InvalidArgument(error_message)
+    # Products can have more than 10 pages of variations
+    variation_page = kwargs.get("variation_page")
+    if variation_page is not None and (
+        not isinstance(variation_page, int) or variation_page < 1
+    ):
+        error_message = "Arg variation_page should be a positive integer."
+        raise InvalidArgument(error_message)
 
 
 def check_browse_nodes_args(**kwargs: Any) -> None:
@@ -0,0 +1,91 @@
+"""Module with helper functions for managing HTTP connections."""
+
+from __future__ import annotations
+
+import multiprocessing
+import socket
+import ssl
+from typing import TYPE_CHECKING
+
+import certifi
+import urllib3
+from urllib3.connection import HTTPConnection
+
+if TYPE_CHECKING:
+    from amazon_creatorsapi.core.deadline import Deadline
+
+DEFAULT_POOL_CONNECTIONS = 4
+# Same default as the connection pool of the SDK configuration
+DEFAULT_POOL_MAXSIZE = multiprocessing.cpu_count() * 5
+
+
+def create_pool_manager(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    keep_alive: bool = True,
+) -> urllib3.PoolManager:
+    """Create a connection pool manager for the Amazon API.
+
+    The returned pool manager can be shared by several ``AmazonApi`` instances, for
+    example one per marketplace, so they reuse warm connections.
+
+    Args:
+        pool_connections: Number of hosts for which connection pools are kept.
+        pool_maxsize: Maximum number of connections kept alive per host.
+        keep_alive: Enable TCP keep-alive probes on idle pooled connections, so
+            they are not silently dropped by load balancers or NAT gateways.
+
+    Returns:
+        A ``urllib3.PoolManager`` verifying TLS certificates with certifi.
+
+    """
+    socket_options = list(HTTPConnection.default_socket_options)
+    if keep_alive:
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    return urllib3.PoolManager(
+        num_pools=pool_connections,
+        maxsize=pool_maxsize,
+        cert_reqs=ssl.CERT_REQUIRED,
+        ca_certs=certifi.where(),
+        socket_options=socket_options,
+    )
+
+
+def get_request_timeout(
+    connect_timeout: float | None,
+    read_timeout: float | None,
+) -> tuple[float | None, float | None] | None:
+    """Return the request timeout in the format expected by the SDK.
+
+    Args:
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send the response.
+
+    Returns:
+        A ``(connect, read)`` tuple, or None if no timeout is configured.
+
+    """
+    if connect_timeout is None and read_timeout is None:
+        return None
+    return connect_timeout, read_timeout
+
+
+def limit_request_timeout(
+    request_timeout: tuple[float | None, float | None] | None,
+    deadline: Deadline | None,
+) -> tuple[float | None, float | None] | None:
+    """Return the request timeout limited by the time left until the deadline.
+
+    Args:
+        request_timeout: The ``(connect, read)`` timeout configured for requests.
+        deadline: Deadline of the call, if any.
+
+    Returns:
+        A ``(connect, read)`` tuple, or None if there is no timeout nor deadline.
+
+    """
+    if deadline is None:
+        return request_timeout
+    connect_timeout, read_timeout = request_timeout or (None, None)
+    return deadline.limit(connect_timeout), deadline.limit(read_timeout)
@@ -55,10 +55,16 @@ def get_items_request(
         raise MalformedRequest(msg) from exc
 
 
-def get_items_response(amazon_api: AmazonApi, request: GetItemsRequest) -> list[Item]:
+def get_items_response(
+    amazon_api: AmazonApi,
+    request: GetItemsRequest,
+    request_timeout: tuple[float | None, float | None] | None = None,
+) -> list[Item]:
     """Execute a GetItemsRequest and return the list of items."""
     try:
-        response = amazon_api.api.get_items(request)
+        response = amazon_api.api.get_items(
+            request, _request_timeout=request_timeout or amazon_api.request_timeout
+        )
     except ApiException as exc:
         _manage_response_exceptions(exc)
 
@@ -88,11 +94,15 @@ def get_search_items_request(
 
 
 def get_search_items_response(
-    amazon_api: AmazonApi, request: SearchItemsRequest
+    amazon_api: AmazonApi,
+    request: SearchItemsRequest,
+    request_timeout: tuple[float | None, float | None] | None = None,
 ) -> SearchResult:
     """Execute a SearchItemsRequest and return the search result."""
     try:
-        response = amazon_api.api.search_items(request)
+        response = amazon_api.api.search_items(
+            request, _request_timeout=request_timeout or amazon_api.request_timeout
+        )
     except ApiException as exc:
         _manage_response_exceptions(exc)
 
@@ -122,11 +132,15 @@ def get_variations_request(
 
 
 def get_variations_response(
-    amazon_api: AmazonApi, request: GetVariationsRequest
+    amazon_api: AmazonApi,
+    request: GetVariationsRequest,
+    request_timeout: tuple[float | None, float | None] | None = None,
 ) -> VariationsResult:
     """Execute a GetVariationsRequest and return the variations result."""
     try:
-        response = amazon_api.api.get_variations(request)
+        response = amazon_api.api.get_variations(
+            request, _request_timeout=request_timeout or amazon_api.request_timeout
+        )
     except ApiException as exc:
         _manage_response_exceptions(exc)
 
@@ -156,11 +170,15 @@ def get_browse_nodes_request(
 
 
 def get_browse_nodes_response(
-    amazon_api: AmazonApi, request: GetBrowseNodesRequest
+    amazon_api: AmazonApi,
+    request: GetBrowseNodesRequest,
+    request_timeout: tuple[float | None, float | None] | None = None,
 ) -> list[BrowseNode]:
     """Execute a GetBrowseNodesRequest and return the list of browse nodes."""
     try:
-        response = amazon_api.api.get_browse_nodes(request)
+        response = amazon_api.api.get_browse_nodes(
+            request, _request_timeout=request_timeout or amazon_api.request_timeout
+        )
     except ApiException as exc:
         _manage_response_exceptions(exc)
 
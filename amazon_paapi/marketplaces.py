@@ -0,0 +1,228 @@
+"""Run the same Amazon API calls in several marketplaces concurrently."""
+
+from __future__ import annotations
+
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from amazon_creatorsapi.core.fanout import MarketplaceResults, fan_out
+
+from . import models
+from .api import AmazonApi
+from .errors import InvalidArgument
+from .helpers import connections
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from types import TracebackType
+
+    import urllib3
+    from typing_extensions import Self
+
+    from amazon_creatorsapi.core.results import ResultList
+
+    from .models.regions import CountryCode
+
+T = TypeVar("T")
+
+
+class MultiMarketplaceApi:
+    """Runs the same calls in several marketplaces concurrently.
+
+    Creates an ``AmazonApi`` for every country, each one with its own
+    throttling, sharing a single connection pool manager. The calls are sent to
+    all the marketplaces at the same time from a thread pool and the results are
+    returned by country code. The marketplaces where the call fails are reported
+    in the ``errors`` of the results, and the error is raised only if it fails
+    in all of them.
+
+    Args:
+        key (``str``): Your API key.
+        secret (``str``): Your API secret.
+        tag (``str`` | ``dict[str, str]``): Your affiliate tracking id, or the
+            tracking id of every country.
+        countries (``list[CountryCode]``): Country codes of the marketplaces,
+            e.g. ``["ES", "DE", "FR", "IT", "UK", "US"]``.
+        throttling (``float`` | ``dict[str, float]``, optional): Wait time in
+            seconds between API calls, or the wait time of every country. Each
+            marketplace is throttled independently. Defaults to 1 second.
+        max_workers (``int``, optional): Maximum number of calls running at the
+            same time. Defaults to one per country.
+        pool_manager (``urllib3.PoolManager``, optional): Pool manager shared by
+            the marketplaces. Defaults to a new one with a pool for every
+            marketplace.
+        kwargs (``dict``, optional): Other arguments of ``AmazonApi`` used for
+            all the marketplaces, like ``retry_policy`` or ``hooks``.
+
+    Raises:
+        ``InvalidArgument``
+
+    Example:
+        >>> amazon = MultiMarketplaceApi(key, secret, tags, ["ES", "DE", "US"])
+        >>> items = amazon.get_items(["B0DLFMFBJW"])
+        >>> items["DE"][0].offers_v2
+        >>> items.errors  # e.g. {"US": ItemsNotFound(...)}
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        key: str,
+        secret: str,
+        tag: str | Mapping[str, str],
+        countries: Sequence[CountryCode],
+        throttling: float | Mapping[str, float] = 1,
+        *,
+        max_workers: int | None = None,
+        pool_manager: urllib3.PoolManager | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the clients of every marketplace."""
+        if not countries:
+            msg = "At least one country is required"
+            raise InvalidArgument(msg)
+        invalid = [
+            country for country in countries if country not in models.regions.DOMAINS
+        ]
+        if invalid:
+            msg = f"Country codes are not correct: {', '.join(invalid)}"
+            raise InvalidArgument(msg)
+        for name, values in (("tag", tag), ("throttling", throttling)):
+            if isinstance(values, (str, int, float)):
+                continue
+            missing = [
+                country for country in dict.fromkeys(countries) if country not in values
+            ]
+            if missing:
+                msg = f"Missing {name} for the countries: {', '.join(missing)}"
+                raise InvalidArgument(msg)
+
+        if pool_manager is None and "transport" not in kwargs:
+            pool_manager = connections.create_pool_manager(
+                pool_connections=len(set(countries))
+            )
+        self.clients: dict[str, AmazonApi] = {
+            country: AmazonApi(
+                key,
+                secret,
+                tag if isinstance(tag, str) else tag[country],
+                country,
+                throttling
+                if isinstance(throttling, (int, float))
+                else throttling[country],
+                pool_manager=pool_manager,
+                **kwargs,
+            )
+            for country in dict.fromkeys(countries)
+        }
+        self.max_workers = max_workers or len(self.clients)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def regions(self) -> dict[str, str]:
+        """AWS region of the marketplace of every country."""
+        return {country: client.region for country, client in self.clients.items()}
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the context manager, stopping the threads."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the threads running the calls."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def get_items(
+        self, items: str | list[str], **kwargs: Any
+    ) -> MarketplaceResults[ResultList[models.Item]]:
+        """Get items information from every marketplace.
+
+        Args:
+            items (``str`` | ``list[str]``): One or more items, using ASIN or product
+                URL. Items in string format should be separated by commas.
+            kwargs (``dict``, optional): Other arguments of ``AmazonApi.get_items``.
+
+        Returns:
+            ``MarketplaceResults[list[models.Item]]``: The items of every
+            marketplace by country code.
+
+        """
+        return self._fan_out(lambda client: client.get_items(items, **kwargs))
+
+    def search_items(self, **kwargs: Any) -> MarketplaceResults[models.SearchResult]:
+        """Search for items in every marketplace.
+
+        Args:
+            kwargs (``dict``, optional): Arguments of ``AmazonApi.search_items``.
+
+        Returns:
+            ``MarketplaceResults[models.SearchResult]``: The search results of
+            every marketplace by country code.
+
+        """
+        return self._fan_out(lambda client: client.search_items(**kwargs))
+
+    def get_variations(
+        self, asin: str, **kwargs: Any
+    ) -> MarketplaceResults[models.VariationsResult]:
+        """Get the variations of an item in every marketplace.
+
+        Args:
+            asin (``str``): One item, using ASIN or product URL.
+            kwargs (``dict``, optional): Other arguments of
+                ``AmazonApi.get_variations``.
+
+        Returns:
+            ``MarketplaceResults[models.VariationsResult]``: The variations of
+            every marketplace by country code.
+
+        """
+        return self._fan_out(lambda client: client.get_variations(asin, **kwargs))
+
+    def get_browse_nodes(
+        self, browse_node_ids: list[str], **kwargs: Any
+    ) -> MarketplaceResults[list[models.BrowseNode]]:
+        """Get the browse nodes of every marketplace.
+
+        Args:
+            browse_node_ids (``list[str]``): List of browse node ids.
+            kwargs (``dict``, optional): Other arguments of
+                ``AmazonApi.get_browse_nodes``.
+
+        Returns:
+            ``MarketplaceResults[list[models.BrowseNode]]``: The browse nodes of
+            every marketplace by country code.
+
+        """
+        return self._fan_out(
+            lambda client: client.get_browse_nodes(browse_node_ids, **kwargs)
+        )
+
+    def _fan_out(self, call: Callable[[AmazonApi], T]) -> MarketplaceResults[T]:
+        """Run a call with the client of every marketplace."""
+        # The lock creates a single executor for the threads sharing the client
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers)
+            executor = self._executor
+        return fan_out(
+            {
+                country: functools.partial(call, client)
+                for country, client in self.clients.items()
+            },
+            executor,
+        )
@@ -25,121 +25,134 @@ from __future__ import absolute_import
     https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
 """
 
+import importlib
 
-# import auth into sdk package
-from .auth.sign_helper import AWSV4Auth
+# Import the names on first access (PEP 562), so importing the package or any of
+# its modules does not import and build every model
+_LAZY_IMPORTS = {
+    "AWSV4Auth": ".auth.sign_helper",
+    "DefaultApi": ".api.default_api",
+    "ApiClient": ".api_client",
+    "Configuration": ".configuration",
+    "Availability": ".models.availability",
+    "BigDecimal": ".models.big_decimal",
+    "BrowseNode": ".models.browse_node",
+    "BrowseNodeAncestor": ".models.browse_node_ancestor",
+    "BrowseNodeChild": ".models.browse_node_child",
+    "BrowseNodeInfo": ".models.browse_node_info",
+    "BrowseNodesResult": ".models.browse_nodes_result",
+    "ByLineInfo": ".models.by_line_info",
+    "Classifications": ".models.classifications",
+    "Condition": ".models.condition",
+    "ContentInfo": ".models.content_info",
+    "ContentRating": ".models.content_rating",
+    "Contributor": ".models.contributor",
+    "CustomerReviews": ".models.customer_reviews",
+    "DealDetails": ".models.deal_details",
+    "DeliveryFlag": ".models.delivery_flag",
+    "DimensionBasedAttribute": ".models.dimension_based_attribute",
+    "DurationPrice": ".models.duration_price",
+    "ErrorData": ".models.error_data",
+    "ExternalIds": ".models.external_ids",
+    "GetBrowseNodesRequest": ".models.get_browse_nodes_request",
+    "GetBrowseNodesResource": ".models.get_browse_nodes_resource",
+    "GetBrowseNodesResponse": ".models.get_browse_nodes_response",
+    "GetItemsRequest": ".models.get_items_request",
+    "GetItemsResource": ".models.get_items_resource",
+    "GetItemsResponse": ".models.get_items_response",
+    "GetVariationsRequest": ".models.get_variations_request",
+    "GetVariationsResource": ".models.get_variations_resource",
+    "GetVariationsResponse": ".models.get_variations_response",
+    "ImageSize": ".models.image_size",
+    "ImageType": ".models.image_type",
+    "Images": ".models.images",
+    "Item": ".models.item",
+    "ItemIdType": ".models.item_id_type",
+    "ItemInfo": ".models.item_info",
+    "ItemsResult": ".models.items_result",
+    "LanguageType": ".models.language_type",
+    "Languages": ".models.languages",
+    "ManufactureInfo": ".models.manufacture_info",
+    "MaxPrice": ".models.max_price",
+    "Merchant": ".models.merchant",
+    "MinPrice": ".models.min_price",
+    "MinReviewsRating": ".models.min_reviews_rating",
+    "MinSavingPercent": ".models.min_saving_percent",
+    "Money": ".models.money",
+    "MultiValuedAttribute": ".models.multi_valued_attribute",
+    "OfferAvailability": ".models.offer_availability",
+    "OfferAvailabilityV2": ".models.offer_availability_v2",
+    "OfferCondition": ".models.offer_condition",
+    "OfferConditionNote": ".models.offer_condition_note",
+    "OfferConditionV2": ".models.offer_condition_v2",
+    "OfferCount": ".models.offer_count",
+    "OfferDeliveryInfo": ".models.offer_delivery_info",
+    "OfferListing": ".models.offer_listing",
+    "OfferListingV2": ".models.offer_listing_v2",
+    "OfferListings": ".models.offer_listings",
+    "OfferListingsV2": ".models.offer_listings_v2",
+    "OfferLoyaltyPoints": ".models.offer_loyalty_points",
+    "OfferLoyaltyPointsV2": ".models.offer_loyalty_points_v2",
+    "OfferMerchantInfo": ".models.offer_merchant_info",
+    "OfferMerchantInfoV2": ".models.offer_merchant_info_v2",
+    "OfferPrice": ".models.offer_price",
+    "OfferPriceV2": ".models.offer_price_v2",
+    "OfferProgramEligibility": ".models.offer_program_eligibility",
+    "OfferPromotion": ".models.offer_promotion",
+    "OfferSavingBasis": ".models.offer_saving_basis",
+    "OfferSavings": ".models.offer_savings",
+    "OfferSavingsV2": ".models.offer_savings_v2",
+    "OfferShippingCharge": ".models.offer_shipping_charge",
+    "OfferSubCondition": ".models.offer_sub_condition",
+    "OfferSummary": ".models.offer_summary",
+    "OfferType": ".models.offer_type",
+    "Offers": ".models.offers",
+    "OffersV2": ".models.offers_v2",
+    "PartnerType": ".models.partner_type",
+    "Price": ".models.price",
+    "PriceType": ".models.price_type",
+    "ProductAdvertisingAPIClientException": ".models.product_advertising_api_client_exception",
+    "ProductAdvertisingAPIServiceException": ".models.product_advertising_api_service_exception",
+    "ProductInfo": ".models.product_info",
+    "Properties": ".models.properties",
+    "Rating": ".models.rating",
+    "Refinement": ".models.refinement",
+    "RefinementBin": ".models.refinement_bin",
+    "RentalOfferListing": ".models.rental_offer_listing",
+    "RentalOffers": ".models.rental_offers",
+    "SavingBasisType": ".models.saving_basis_type",
+    "SearchIndex": ".models.search_index",
+    "SearchItemsRequest": ".models.search_items_request",
+    "SearchItemsResource": ".models.search_items_resource",
+    "SearchItemsResponse": ".models.search_items_response",
+    "SearchRefinements": ".models.search_refinements",
+    "SearchResult": ".models.search_result",
+    "SingleBooleanValuedAttribute": ".models.single_boolean_valued_attribute",
+    "SingleIntegerValuedAttribute": ".models.single_integer_valued_attribute",
+    "SingleStringValuedAttribute": ".models.single_string_valued_attribute",
+    "SortBy": ".models.sort_by",
+    "TechnicalInfo": ".models.technical_info",
+    "TradeInInfo": ".models.trade_in_info",
+    "TradeInPrice": ".models.trade_in_price",
+    "UnitBasedAttribute": ".models.unit_based_attribute",
+    "VariationAttribute": ".models.variation_attribute",
+    "VariationDimension": ".models.variation_dimension",
+    "VariationSummary": ".models.variation_summary",
+    "VariationsResult": ".models.variations_result",
+    "WebsiteSalesRank": ".models.website_sales_rank",
+}
 
+__all__ = list(_LAZY_IMPORTS)
 
-# import apis into sdk package
-from .api.default_api import DefaultApi
 
-# import ApiClient
-from .api_client import ApiClient
-from .configuration import Configuration
-# import models into sdk package
-from .models.availability import Availability
-from .models.big_decimal import BigDecimal
-from .models.browse_node import BrowseNode
-from .models.browse_node_ancestor import BrowseNodeAncestor
-from .models.browse_node_child import BrowseNodeChild
-from .models.browse_node_info import BrowseNodeInfo
-from .models.browse_nodes_result import BrowseNodesResult
-from .models.by_line_info import ByLineInfo
-from .models.classifications import Classifications
-from .models.condition import Condition
-from .models.content_info import ContentInfo
-from .models.content_rating import ContentRating
-from .models.contributor import Contributor
-from .models.customer_reviews import CustomerReviews
-from .models.deal_details import DealDetails
-from .models.delivery_flag import DeliveryFlag
-from .models.dimension_based_attribute import DimensionBasedAttribute
-from .models.duration_price import DurationPrice
-from .models.error_data import ErrorData
-from .models.external_ids import ExternalIds
-from .models.get_browse_nodes_request import GetBrowseNodesRequest
-from .models.get_browse_nodes_resource import GetBrowseNodesResource
-from .models.get_browse_nodes_response import GetBrowseNodesResponse
-from .models.get_items_request import GetItemsRequest
-from .models.get_items_resource import GetItemsResource
-from .models.get_items_response import GetItemsResponse
-from .models.get_variations_request import GetVariationsRequest
-from .models.get_variations_resource import GetVariationsResource
-from .models.get_variations_response import GetVariationsResponse
-from .models.image_size import ImageSize
-from .models.image_type import ImageType
-from .models.images import Images
-from .models.item import Item
-from .models.item_id_type import ItemIdType
-from .models.item_info import ItemInfo
-from .models.items_result import ItemsResult
-from .models.language_type import LanguageType
-from .models.languages import Languages
-from .models.manufacture_info import ManufactureInfo
-from .models.max_price import MaxPrice
-from .models.merchant import Merchant
-from .models.min_price import MinPrice
-from .models.min_reviews_rating import MinReviewsRating
-from .models.min_saving_percent import MinSavingPercent
-from .models.money import Money
-from .models.multi_valued_attribute import MultiValuedAttribute
-from .models.offer_availability import OfferAvailability
-from .models.offer_availability_v2 import OfferAvailabilityV2
-from .models.offer_condition import OfferCondition
-from .models.offer_condition_note import OfferConditionNote
-from .models.offer_condition_v2 import OfferConditionV2
-from .models.offer_count import OfferCount
-from .models.offer_delivery_info import OfferDeliveryInfo
-from .models.offer_listing import OfferListing
-from .models.offer_listing_v2 import OfferListingV2
-from .models.offer_listings import OfferListings
-from .models.offer_listings_v2 import OfferListingsV2
-from .models.offer_loyalty_points import OfferLoyaltyPoints
-from .models.offer_loyalty_points_v2 import OfferLoyaltyPointsV2
-from .models.offer_merchant_info import OfferMerchantInfo
-from .models.offer_merchant_info_v2 import OfferMerchantInfoV2
-from .models.offer_price import OfferPrice
-from .models.offer_price_v2 import OfferPriceV2
-from .models.offer_program_eligibility import OfferProgramEligibility
-from .models.offer_promotion import OfferPromotion
-from .models.offer_saving_basis import OfferSavingBasis
-from .models.offer_savings import OfferSavings
-from .models.offer_savings_v2 import OfferSavingsV2
-from .models.offer_shipping_charge import OfferShippingCharge
-from .models.offer_sub_condition import OfferSubCondition
-from .models.offer_summary import OfferSummary
-from .models.offer_type import OfferType
-from .models.offers import Offers
-from .models.offers_v2 import OffersV2
-from .models.partner_type import PartnerType
-from .models.price import Price
-from .models.price_type import PriceType
-from .models.product_advertising_api_client_exception import ProductAdvertisingAPIClientException
-from .models.product_advertising_api_service_exception import ProductAdvertisingAPIServiceException
-from .models.product_info import ProductInfo
-from .models.properties import Properties
-from .models.rating import Rating
-from .models.refinement import Refinement
-from .models.refinement_bin import RefinementBin
-from .models.rental_offer_listing import RentalOfferListing
-from .models.rental_offers import RentalOffers
-from .models.saving_basis_type import SavingBasisType
-from .models.search_index import SearchIndex
-from .models.search_items_request import SearchItemsRequest
-from .models.search_items_resource import SearchItemsResource
-from .models.search_items_response import SearchItemsResponse
-from .models.search_refinements import SearchRefinements
-from .models.search_result import SearchResult
-from .models.single_boolean_valued_attribute import SingleBooleanValuedAttribute
-from .models.single_integer_valued_attribute import SingleIntegerValuedAttribute
-from .models.single_string_valued_attribute import SingleStringValuedAttribute
-from .models.sort_by import SortBy
-from .models.technical_info import TechnicalInfo
-from .models.trade_in_info import TradeInInfo
-from .models.trade_in_price import TradeInPrice
-from .models.unit_based_attribute import UnitBasedAttribute
-from .models.variation_attribute import VariationAttribute
-from .models.variation_dimension import VariationDimension
-from .models.variation_summary import VariationSummary
-from .models.variations_result import VariationsResult
-from .models.website_sales_rank import WebsiteSalesRank
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -32,6 +32,7 @@ from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
+import threading
 
 # python 2 and python 3 compatibility library
 import six
@@ -61,6 +62,8 @@ class ApiClient(object):
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param pool_manager: an optional urllib3.PoolManager used to send the
+        requests, e.g. to share connections between several clients.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
@@ -83,13 +86,17 @@ class ApiClient(object):
                  configuration=None,
                  header_name=None,
                  header_value=None,
-                 cookie=None):
+                 cookie=None,
+                 pool_manager=None):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
 
-        self.pool = ThreadPool()
-        self.rest_client = rest.RESTClientObject(configuration)
+        # The thread pool is only needed for async_req calls, so it is created
+        # on first use instead of spawning one idle thread per CPU here.
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.rest_client = rest.RESTClientObject(configuration, pool_manager=pool_manager)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -103,8 +110,19 @@ class ApiClient(object):
         self.region = region
 
     def __del__(self):
-        self.pool.close()
-        self.pool.join()
+        if getattr(self, '_pool', None) is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    @property
+    def pool(self):
+        """Thread pool used for async_req calls, created on first access"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPool()
+        return self._pool
 
     @property
     def user_agent(self):
@@ -25,111 +25,130 @@ from __future__ import absolute_import
     https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
 """
 
+import importlib
 
-# import models into model package
-from ..models.availability import Availability
-from ..models.big_decimal import BigDecimal
-from ..models.browse_node import BrowseNode
-from ..models.browse_node_ancestor import BrowseNodeAncestor
-from ..models.browse_node_child import BrowseNodeChild
-from ..models.browse_node_info import BrowseNodeInfo
-from ..models.browse_nodes_result import BrowseNodesResult
-from ..models.by_line_info import ByLineInfo
-from ..models.classifications import Classifications
-from ..models.condition import Condition
-from ..models.content_info import ContentInfo
-from ..models.content_rating import ContentRating
-from ..models.contributor import Contributor
-from ..models.customer_reviews import CustomerReviews
-from ..models.deal_details import DealDetails
-from ..models.delivery_flag import DeliveryFlag
-from ..models.dimension_based_attribute import DimensionBasedAttribute
-from ..models.duration_price import DurationPrice
-from ..models.error_data import ErrorData
-from ..models.external_ids import ExternalIds
-from ..models.get_browse_nodes_request import GetBrowseNodesRequest
-from ..models.get_browse_nodes_resource import GetBrowseNodesResource
-from ..models.get_browse_nodes_response import GetBrowseNodesResponse
-from ..models.get_items_request import GetItemsRequest
-from ..models.get_items_resource import GetItemsResource
-from ..models.get_items_response import GetItemsResponse
-from ..models.get_variations_request import GetVariationsRequest
-from ..models.get_variations_resource import GetVariationsResource
-from ..models.get_variations_response import GetVariationsResponse
-from ..models.image_size import ImageSize
-from ..models.image_type import ImageType
-from ..models.images import Images
-from ..models.item import Item
-from ..models.item_id_type import ItemIdType
-from ..models.item_info import ItemInfo
-from ..models.items_result import ItemsResult
-from ..models.language_type import LanguageType
-from ..models.languages import Languages
-from ..models.manufacture_info import ManufactureInfo
-from ..models.max_price import MaxPrice
-from ..models.merchant import Merchant
-from ..models.min_price import MinPrice
-from ..models.min_reviews_rating import MinReviewsRating
-from ..models.min_saving_percent import MinSavingPercent
-from ..models.money import Money
-from ..models.multi_valued_attribute import MultiValuedAttribute
-from ..models.offer_availability import OfferAvailability
-from ..models.offer_availability_v2 import OfferAvailabilityV2
-from ..models.offer_condition import OfferCondition
-from ..models.offer_condition_note import OfferConditionNote
-from ..models.offer_condition_v2 import OfferConditionV2
-from ..models.offer_count import OfferCount
-from ..models.offer_delivery_info import OfferDeliveryInfo
-from ..models.offer_listing import OfferListing
-from ..models.offer_listing_v2 import OfferListingV2
-from ..models.offer_listings import OfferListings
-from ..models.offer_listings_v2 import OfferListingsV2
-from ..models.offer_loyalty_points import OfferLoyaltyPoints
-from ..models.offer_loyalty_points_v2 import OfferLoyaltyPointsV2
-from ..models.offer_merchant_info import OfferMerchantInfo
-from ..models.offer_merchant_info_v2 import OfferMerchantInfoV2
-from ..models.offer_price import OfferPrice
-from ..models.offer_price_v2 import OfferPriceV2
-from ..models.offer_program_eligibility import OfferProgramEligibility
-from ..models.offer_promotion import OfferPromotion
-from ..models.offer_saving_basis import OfferSavingBasis
-from ..models.offer_savings import OfferSavings
-from ..models.offer_savings_v2 import OfferSavingsV2
-from ..models.offer_shipping_charge import OfferShippingCharge
-from ..models.offer_sub_condition import OfferSubCondition
-from ..models.offer_summary import OfferSummary
-from ..models.offer_type import OfferType
-from ..models.offers import Offers
-from ..models.offers_v2 import OffersV2
-from ..models.partner_type import PartnerType
-from ..models.price import Price
-from ..models.price_type import PriceType
-from ..models.product_advertising_api_client_exception import ProductAdvertisingAPIClientException
-from ..models.product_advertising_api_service_exception import ProductAdvertisingAPIServiceException
-from ..models.product_info import ProductInfo
-from ..models.properties import Properties
-from ..models.rating import Rating
-from ..models.refinement import Refinement
-from ..models.refinement_bin import RefinementBin
-from ..models.rental_offer_listing import RentalOfferListing
-from ..models.rental_offers import RentalOffers
-from ..models.saving_basis_type import SavingBasisType
-from ..models.search_index import SearchIndex
-from ..models.search_items_request import SearchItemsRequest
-from ..models.search_items_resource import SearchItemsResource
-from ..models.search_items_response import SearchItemsResponse
-from ..models.search_refinements import SearchRefinements
-from ..models.search_result import SearchResult
-from ..models.single_boolean_valued_attribute import SingleBooleanValuedAttribute
-from ..models.single_integer_valued_attribute import SingleIntegerValuedAttribute
-from ..models.single_string_valued_attribute import SingleStringValuedAttribute
-from ..models.sort_by import SortBy
-from ..models.technical_info import TechnicalInfo
-from ..models.trade_in_info import TradeInInfo
-from ..models.trade_in_price import TradeInPrice
-from ..models.unit_based_attribute import UnitBasedAttribute
-from ..models.variation_attribute import VariationAttribute
-from ..models.variation_dimension import VariationDimension
-from ..models.variation_summary import VariationSummary
-from ..models.variations_result import VariationsResult
-from ..models.website_sales_rank import WebsiteSalesRank
+# Import the names on first access (PEP 562), so importing the package or any of
+# its modules does not import and build every model
+_LAZY_IMPORTS = {
+    "Availability": ".availability",
+    "BigDecimal": ".big_decimal",
+    "BrowseNode": ".browse_node",
+    "BrowseNodeAncestor": ".browse_node_ancestor",
+    "BrowseNodeChild": ".browse_node_child",
+    "BrowseNodeInfo": ".browse_node_info",
+    "BrowseNodesResult": ".browse_nodes_result",
+    "ByLineInfo": ".by_line_info",
+    "Classifications": ".classifications",
+    "Condition": ".condition",
+    "ContentInfo": ".content_info",
+    "ContentRating": ".content_rating",
+    "Contributor": ".contributor",
+    "CustomerReviews": ".customer_reviews",
+    "DealDetails": ".deal_details",
+    "DeliveryFlag": ".delivery_flag",
+    "DimensionBasedAttribute": ".dimension_based_attribute",
+    "DurationPrice": ".duration_price",
+    "ErrorData": ".error_data",
+    "ExternalIds": ".external_ids",
+    "GetBrowseNodesRequest": ".get_browse_nodes_request",
+    "GetBrowseNodesResource": ".get_browse_nodes_resource",
+    "GetBrowseNodesResponse": ".get_browse_nodes_response",
+    "GetItemsRequest": ".get_items_request",
+    "GetItemsResource": ".get_items_resource",
+    "GetItemsResponse": ".get_items_response",
+    "GetVariationsRequest": ".get_variations_request",
+    "GetVariationsResource": ".get_variations_resource",
+    "GetVariationsResponse": ".get_variations_response",
+    "ImageSize": ".image_size",
+    "ImageType": ".image_type",
+    "Images": ".images",
+    "Item": ".item",
+    "ItemIdType": ".item_id_type",
+    "ItemInfo": ".item_info",
+    "ItemsResult": ".items_result",
+    "LanguageType": ".language_type",
+    "Languages": ".languages",
+    "ManufactureInfo": ".manufacture_info",
+    "MaxPrice": ".max_price",
+    "Merchant": ".merchant",
+    "MinPrice": ".min_price",
+    "MinReviewsRating": ".min_reviews_rating",
+    "MinSavingPercent": ".min_saving_percent",
+    "Money": ".money",
+    "MultiValuedAttribute": ".multi_valued_attribute",
+    "OfferAvailability": ".offer_availability",
+    "OfferAvailabilityV2": ".offer_availability_v2",
+    "OfferCondition": ".offer_condition",
+    "OfferConditionNote": ".offer_condition_note",
+    "OfferConditionV2": ".offer_condition_v2",
+    "OfferCount": ".offer_count",
+    "OfferDeliveryInfo": ".offer_delivery_info",
+    "OfferListing": ".offer_listing",
+    "OfferListingV2": ".offer_listing_v2",
+    "OfferListings": ".offer_listings",
+    "OfferListingsV2": ".offer_listings_v2",
+    "OfferLoyaltyPoints": ".offer_loyalty_points",
+    "OfferLoyaltyPointsV2": ".offer_loyalty_points_v2",
+    "OfferMerchantInfo": ".offer_merchant_info",
+    "OfferMerchantInfoV2": ".offer_merchant_info_v2",
+    "OfferPrice": ".offer_price",
+    "OfferPriceV2": ".offer_price_v2",
+    "OfferProgramEligibility": ".offer_program_eligibility",
+    "OfferPromotion": ".offer_promotion",
+    "OfferSavingBasis": ".offer_saving_basis",
+    "OfferSavings": ".offer_savings",
+    "OfferSavingsV2": ".offer_savings_v2",
+    "OfferShippingCharge": ".offer_shipping_charge",
+    "OfferSubCondition": ".offer_sub_condition",
+    "OfferSummary": ".offer_summary",
+    "OfferType": ".offer_type",
+    "Offers": ".offers",
+    "OffersV2": ".offers_v2",
+    "PartnerType": ".partner_type",
+    "Price": ".price",
+    "PriceType": ".price_type",
+    "ProductAdvertisingAPIClientException": ".product_advertising_api_client_exception",
+    "ProductAdvertisingAPIServiceException": ".product_advertising_api_service_exception",
+    "ProductInfo": ".product_info",
+    "Properties": ".properties",
+    "Rating": ".rating",
+    "Refinement": ".refinement",
+    "RefinementBin": ".refinement_bin",
+    "RentalOfferListing": ".rental_offer_listing",
+    "RentalOffers": ".rental_offers",
+    "SavingBasisType": ".saving_basis_type",
+    "SearchIndex": ".search_index",
+    "SearchItemsRequest": ".search_items_request",
+    "SearchItemsResource": ".search_items_resource",
+    "SearchItemsResponse": ".search_items_response",
+    "SearchRefinements": ".search_refinements",
+    "SearchResult": ".search_result",
+    "SingleBooleanValuedAttribute": ".single_boolean_valued_attribute",
+    "SingleIntegerValuedAttribute": ".single_integer_valued_attribute",
+    "SingleStringValuedAttribute": ".single_string_valued_attribute",
+    "SortBy": ".sort_by",
+    "TechnicalInfo": ".technical_info",
+    "TradeInInfo": ".trade_in_info",
+    "TradeInPrice": ".trade_in_price",
+    "UnitBasedAttribute": ".unit_based_attribute",
+    "VariationAttribute": ".variation_attribute",
+    "VariationDimension": ".variation_dimension",
+    "VariationSummary": ".variation_summary",
+    "VariationsResult": ".variations_result",
+    "WebsiteSalesRank": ".website_sales_rank",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark AmazonApi construction time, threads and resident memory.
+
+Builds many ``AmazonApi`` instances, as processes holding one client per
+marketplace do, and reports the time per construction together with the
+threads and resident memory they keep alive. The ``eager`` mode touches the SDK
+thread pool after construction to reproduce the previous behavior.
+
+Usage:
+    python benchmarks/api_client_construction.py [--clients 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import resource
+import sys
+import threading
+import time
+import warnings
+from pathlib import Path
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+
+PAGE_SIZE = resource.getpagesize()
+STATM_PATH = Path("/proc/self/statm")
+
+
+def get_rss_bytes() -> int:
+    """Return the current resident set size of the process in bytes."""
+    if STATM_PATH.exists():
+        return int(STATM_PATH.read_text().split()[1]) * PAGE_SIZE
+    # Fallback for platforms without procfs, reports the peak instead
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run(clients: int, *, eager: bool) -> dict[str, float]:
+    """Construct the given number of clients and measure their cost."""
+    gc.collect()
+    threads_before = threading.active_count()
+    rss_before = get_rss_bytes()
+
+    instances = []
+    start = time.perf_counter()
+    for _ in range(clients):
+        api = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+        if eager:
+            api.api.api_client.pool  # noqa: B018
+        instances.append(api)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "construction_ms": elapsed / clients * 1000,
+        "threads": threading.active_count() - threads_before,
+        "rss_mib": (get_rss_bytes() - rss_before) / 2**20,
+    }
+
+    for api in instances:
+        api.api.api_client.__del__()
+    return result
+
+
+def main() -> int:
+    """Run the construction benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'ms/client':>12}{'threads':>10}{'rss MiB':>10}")
+    for mode in ("lazy", "eager"):
+        result = run(args.clients, eager=mode == "eager")
+        print(
+            f"{mode:<8}{result['construction_ms']:>12.3f}"
+            f"{result['threads']:>10.0f}{result['rss_mib']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
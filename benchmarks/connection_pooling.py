@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark AmazonApi request latency with different connection pool settings.
+
+Sends ``get_items`` requests to a local HTTP/1.1 keep-alive stub server and
+reports the latency percentiles and the number of TCP connections the server
+accepted for each scenario:
+
+- ``cold``: a new ``AmazonApi`` per request, each one with its own pool.
+- ``shared``: a new ``AmazonApi`` per request sharing one ``PoolManager``.
+- ``concurrent``: one ``AmazonApi`` used by several threads, with a pool that
+  is smaller than, and then as large as, the number of threads.
+
+Usage:
+    python benchmarks/connection_pooling.py [--requests 200] [--threads 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, ClassVar
+
+import urllib3
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+    from amazon_paapi.helpers import connections
+
+RESPONSE_BODY = json.dumps(
+    {"ItemsResult": {"Items": [{"ASIN": "B000000001", "DetailPageURL": "url"}]}}
+).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """PA-API stub answering every request with a single item."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections: ClassVar[int] = 0
+    counter_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def setup(self) -> None:
+        """Count every accepted TCP connection."""
+        super().setup()
+        with StubHandler.counter_lock:
+            StubHandler.connections += 1
+
+    def do_POST(self) -> None:
+        """Return a GetItems response."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, *args: object) -> None:
+        """Silence request logging."""
+
+
+class LocalPoolManager(urllib3.PoolManager):
+    """Pool manager sending the requests for any host to the local stub server."""
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        """Initialize the pool manager with the stub server base URL."""
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def urlopen(self, method: str, url: str, **kwargs: Any) -> Any:  # type: ignore[override]
+        """Rewrite the scheme and host of the URL before sending the request."""
+        path = url.split("/", 3)[3]
+        return super().urlopen(method, f"{self.base_url}/{path}", **kwargs)
+
+
+def create_local_pool_manager(base_url: str, pool_maxsize: int) -> LocalPoolManager:
+    """Create a local pool manager with the library defaults."""
+    default = connections.create_pool_manager(pool_maxsize=pool_maxsize)
+    return LocalPoolManager(base_url, **default.connection_pool_kw)
+
+
+def measure(
+    send: Callable[[], object], requests: int, threads: int = 1
+) -> dict[str, float]:
+    """Send requests and return latency percentiles in milliseconds."""
+    StubHandler.connections = 0
+    latencies: list[float] = []
+
+    def timed_send() -> None:
+        start = time.perf_counter()
+        send()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(timed_send) for _ in range(requests)]:
+            future.result()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": quantiles[49],
+        "p99": quantiles[98],
+        "connections": StubHandler.connections,
+    }
+
+
+def main() -> int:
+    """Run the connection pooling benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    # Discarded connections of undersized pools are expected in this benchmark
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def create_api(pool_manager: urllib3.PoolManager) -> AmazonApi:
+        return AmazonApi(
+            "key", "secret", "tag", "ES", throttling=0, pool_manager=pool_manager
+        )
+
+    shared_pool_manager = create_local_pool_manager(base_url, pool_maxsize=10)
+    small_pool_api = create_api(create_local_pool_manager(base_url, pool_maxsize=1))
+    large_pool_api = create_api(
+        create_local_pool_manager(base_url, pool_maxsize=args.threads)
+    )
+
+    scenarios: dict[str, tuple[Callable[[], object], int]] = {
+        "cold": (
+            lambda: create_api(
+                create_local_pool_manager(base_url, pool_maxsize=10)
+            ).get_items("B000000001"),
+            1,
+        ),
+        "shared": (
+            lambda: create_api(shared_pool_manager).get_items("B000000001"),
+            1,
+        ),
+        "concurrent, pool_maxsize=1": (
+            lambda: small_pool_api.get_items("B000000001"),
+            args.threads,
+        ),
+        f"concurrent, pool_maxsize={args.threads}": (
+            lambda: large_pool_api.get_items("B000000001"),
+            args.threads,
+        ),
+    }
+
+    print(f"{'scenario':<32}{'p50 ms':>10}{'p99 ms':>10}{'connections':>13}")
+    for name, (send, threads) in scenarios.items():
+        result = measure(send, args.requests, threads)
+        print(
+            f"{name:<32}{result['p50']:>10.3f}{result['p99']:>10.3f}"
+            f"{result['connections']:>13.0f}"
+        )
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark AsyncHttpClient fan-out over HTTP/1.1 and HTTP/2.
+
+Starts a local stub server speaking HTTP/1.1 or cleartext HTTP/2 (prior
+knowledge) that answers every request after a fixed delay, fires bursts of
+concurrent ``post`` requests through ``AsyncHttpClient`` and reports the
+latency percentiles and the number of TCP connections the server accepted.
+
+Scenarios:
+
+- ``http1``: the default client, one connection per in-flight request.
+- ``http1-limited``: HTTP/1.1 with ``max_connections`` connections.
+- ``http2``: HTTP/2 multiplexing the burst as streams over one connection.
+- ``http2-streams``: HTTP/2 with ``max_concurrent_streams`` in flight.
+
+Requires the ``h2`` package: ``pip install python-amazon-paapi[http2]``.
+
+Usage:
+    python benchmarks/http2_fanout.py [--concurrency 100] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Any
+
+import httpx
+
+from amazon_creatorsapi.aio.client import USER_AGENT, AsyncHttpClient
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # pragma: no cover
+    sys.exit("h2 is required: pip install python-amazon-paapi[http2]")
+
+RESPONSE_BODY = json.dumps(
+    {"itemsResult": {"items": [{"asin": "B000000001", "detailPageURL": "url"}]}}
+).encode()
+
+
+class StubServer:
+    """Local stub server counting accepted connections."""
+
+    def __init__(self, *, http2: bool, delay: float) -> None:
+        """Initialize the stub server."""
+        self.http2 = http2
+        self.delay = delay
+        self.connections = 0
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> str:
+        """Start listening on a random local port and return the base URL."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            if self.http2:
+                await self._handle_http2(reader, writer)
+            else:
+                await self._handle_http1(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_http1(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            await asyncio.sleep(self.delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(RESPONSE_BODY), RESPONSE_BODY)
+            )
+            await writer.drain()
+
+    async def _handle_http2(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+        pending: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.delay)
+            connection.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(RESPONSE_BODY))),
+                ],
+            )
+            connection.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while True:
+            data = await reader.read(65535)
+            if not data:
+                return
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    connection.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            await writer.drain()
+
+
+class CleartextAsyncHttpClient(AsyncHttpClient):
+    """Client speaking HTTP/2 over cleartext to the local stub server.
+
+    The real API negotiates HTTP/2 with ALPN over TLS. The stub server has no
+    TLS, so HTTP/1.1 is disabled to make httpx use HTTP/2 prior knowledge.
+    """
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self._host,
+            timeout=self._timeout,
+            headers={"User-Agent": USER_AGENT},
+            http1=not self._http2,
+            http2=self._http2,
+            limits=self._limits,
+        )
+
+
+async def run_scenario(
+    *, http2: bool, concurrency: int, rounds: int, delay: float, **kwargs: Any
+) -> dict[str, float]:
+    """Run the bursts of concurrent requests and return the statistics."""
+    server = StubServer(http2=http2, delay=delay)
+    base_url = await server.start()
+    latencies: list[float] = []
+
+    async def timed_post(client: AsyncHttpClient) -> None:
+        start = time.perf_counter()
+        response = await client.post("/catalog/v1/getItems", {}, {"itemIds": []})
+        latencies.append(time.perf_counter() - start)
+        response.json()
+
+    try:
+        async with CleartextAsyncHttpClient(
+            host=base_url, http2=http2, **kwargs
+        ) as client:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                await asyncio.gather(*(timed_post(client) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+    finally:
+        await server.stop()
+
+    latencies.sort()
+    return {
+        "connections": server.connections,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "rps": len(latencies) / elapsed,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run all the scenarios and print the results table."""
+    limited = max(1, args.concurrency // 10)
+    scenarios: list[tuple[str, dict[str, Any]]] = [
+        ("http1", {"http2": False}),
+        ("http1-limited", {"http2": False, "max_connections": limited}),
+        ("http2", {"http2": True}),
+        ("http2-streams", {"http2": True, "max_concurrent_streams": limited}),
+    ]
+    print(
+        f"{args.rounds} bursts of {args.concurrency} concurrent requests, "
+        f"{args.delay * 1000:.0f} ms server latency, limit {limited}\n"
+    )
+    print(f"{'scenario':<15}{'conns':>7}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+    for name, kwargs in scenarios:
+        result = await run_scenario(
+            concurrency=args.concurrency,
+            rounds=args.rounds,
+            delay=args.delay,
+            **kwargs,
+        )
+        print(
+            f"{name:<15}{result['connections']:>7}{result['p50']:>10.1f}"
+            f"{result['p99']:>10.1f}{result['rps']:>10.0f}"
+        )
+
+
+def main() -> int:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--delay", type=float, default=0.02, help="server latency in seconds"
+    )
+    asyncio.run(run(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
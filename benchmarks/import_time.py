@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark the import time of the packages with ``python -X importtime``.
+
+Runs every import statement in a new interpreter several times and reports the
+median time spent importing modules, leaving out the interpreter startup, and
+the number of modules imported. The SDK packages and ``amazon_creatorsapi``
+import their models lazily, so a regression shows up as a jump in both.
+
+Pass ``--max-ms`` to exit with an error when a statement is slower, e.g. in CI:
+
+Usage:
+    python benchmarks/import_time.py [--runs 7] [--max-ms 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import amazon_creatorsapi",
+    "from amazon_creatorsapi.models import Item",
+    "from amazon_creatorsapi import AmazonCreatorsApi",
+    "from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi",
+    "from amazon_paapi import AmazonApi",
+)
+
+
+def get_import_times(statement: str) -> list[tuple[str, int, bool]]:
+    """Run a statement and return the imported modules.
+
+    Returns:
+        The name of every module imported, its cumulative import time in
+        microseconds and whether it was imported at the top level.
+
+    """
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():  # noqa: PLR2004
+            continue
+        name = fields[2].rstrip()
+        imports.append((name.strip(), int(fields[1]), not name.startswith("  ")))
+    return imports
+
+
+def measure(statement: str, startup: set[str]) -> tuple[float, int]:
+    """Return the milliseconds and the number of modules imported by a statement."""
+    imports = [i for i in get_import_times(statement) if i[0] not in startup]
+    # Nested imports are included in the cumulative time of the top level ones
+    total = sum(time for _, time, top_level in imports if top_level)
+    return total / 1000, len(imports)
+
+
+def main() -> int:
+    """Run the import time benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument(
+        "--max-ms", type=float, default=None, help="fail above this median"
+    )
+    args = parser.parse_args()
+
+    startup = {name for name, _, _ in get_import_times("pass")}
+
+    print(f"{'statement':<60}{'median ms':>12}{'modules':>10}")
+    failed = False
+    for statement in STATEMENTS:
+        results = [measure(statement, startup) for _ in range(args.runs)]
+        median = statistics.median(result[0] for result in results)
+        print(f"{statement:<60}{median:>12.1f}{results[0][1]:>10}")
+        failed = failed or (args.max_ms is not None and median > args.max_ms)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""Benchmark every stage of the request pipeline of the three API clients.
+
+Measures each stage of a ``get_items`` call over a fixed synthetic corpus:
+building the request model, serializing it, signing it (PA-API only), sending
+it to the local stub server, deserializing the response and sorting the items,
+and the end-to-end calls of ``AmazonApi``, ``AmazonCreatorsApi`` and
+``AsyncAmazonCreatorsApi``:
+
+- ``*.inprocess``: the stub server handles the requests in process, measuring
+  the client overhead alone.
+- ``*.http``: the requests go through HTTP to the stub server.
+- ``async.throughput``: concurrent async requests over HTTP.
+
+The results can be saved as JSON with ``--output`` and compared with a previous
+run with ``--compare``, reporting the change of every median.
+
+Usage:
+    python benchmarks/pipeline.py [--scale 1.0] [--filter paapi]
+        [--output results.json] [--compare baseline.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+import httpx
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi, HttpxTransport
+from amazon_creatorsapi.core.transport import (
+    TransportRequest,
+    TransportResponse,
+    Urllib3Transport,
+)
+from amazon_creatorsapi.testing import StubServer, SyntheticCatalog
+from amazon_creatorsapi.testing.catalog import to_camel_case
+from creatorsapi_python_sdk.models.get_items_request_content import (
+    GetItemsRequestContent,
+)
+from creatorsapi_python_sdk.models.get_items_resource import GetItemsResource
+from creatorsapi_python_sdk.models.item import Item
+
+if TYPE_CHECKING:
+    from amazon_creatorsapi.core.transport import AsyncTransport
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+    from amazon_paapi.helpers import requests
+    from amazon_paapi.helpers.items import sort_items
+    from amazon_paapi.sdk.auth.sign_helper import AWSV4Auth
+
+RESULTS_VERSION = 1
+CORPUS_SIZE = 10_000
+CORPUS_SEED = 0
+CHUNK_SIZE = 10
+CHUNKS = 10
+SIGNED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+PAAPI_HOST = "webservices.amazon.com"
+PAAPI_PATH = "/paapi5/getitems"
+
+
+class InProcessAsyncTransport:
+    """Async transport handling the requests in the stub server, without sockets."""
+
+    def __init__(self, server: StubServer) -> None:
+        """Initialize the transport with the server handling the requests."""
+        self.server = server
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Handle the request in the stub server."""
+        return self.server.send(request)
+
+
+class RawResponse:
+    """Response holding the body deserialized by the PA-API SDK."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize the response with its body."""
+        self.data = data
+
+
+class Corpus:
+    """Fixed ASIN chunks of the synthetic catalog, with their response bodies."""
+
+    def __init__(self) -> None:
+        """Build the corpus."""
+        self.catalog = SyntheticCatalog(CORPUS_SIZE, seed=CORPUS_SEED)
+        step = CORPUS_SIZE // CHUNKS
+        self.chunks = [
+            self.catalog.get_asins(index * step + CHUNK_SIZE)[index * step :]
+            for index in range(CHUNKS)
+        ]
+        self.items = [[self.catalog.get_item(asin) for asin in c] for c in self.chunks]
+        self.paapi_bodies = [
+            json.dumps({"ItemsResult": {"Items": items}}).encode()
+            for items in self.items
+        ]
+        self.creators_items = [to_camel_case(items) for items in self.items]
+        self.creators_bodies = [
+            json.dumps({"itemsResult": {"items": items}})
+            for items in self.creators_items
+        ]
+        self._next = 0
+
+    def next_index(self) -> int:
+        """Return the index of the next chunk, cycling through the corpus."""
+        index = self._next
+        self._next = (index + 1) % CHUNKS
+        return index
+
+    def describe(self) -> dict[str, int]:
+        """Return the corpus parameters, saved with the results."""
+        return {
+            "size": CORPUS_SIZE,
+            "seed": CORPUS_SEED,
+            "chunks": CHUNKS,
+            "chunk_size": CHUNK_SIZE,
+        }
+
+
+def measure(func: Callable[[], object], iterations: int) -> dict[str, float]:
+    """Call a function and return its latency statistics in microseconds."""
+    for _ in range(max(1, iterations // 10)):
+        func()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return summarize(latencies, iterations, sum(latencies) / 1_000_000)
+
+
+def summarize(
+    latencies: list[float], operations: int, elapsed: float
+) -> dict[str, float]:
+    """Return the statistics of some latencies in microseconds."""
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    return {
+        "iterations": operations,
+        "mean_us": statistics.fmean(latencies),
+        "median_us": statistics.median(latencies),
+        "p99_us": quantiles[98] if quantiles else latencies[0],
+        "ops_per_second": operations / elapsed,
+    }
+
+
+def paapi_benchmarks(
+    corpus: Corpus, server: StubServer
+) -> dict[str, tuple[Callable[[], object], int]]:
+    """Return the PA-API benchmarks with their iterations."""
+    api = AmazonApi("key", "secret", "tag", "US", throttling=0, transport=server)
+    http_api = AmazonApi(
+        "key", "secret", "tag", "US", throttling=0, transport=server.transport()
+    )
+    api_client = api.api.api_client
+    request = requests.get_items_request(api, corpus.chunks[0])
+    payload = api_client.sanitize_for_serialization(request)
+    headers = {
+        "content-encoding": "amz-1.0",
+        "content-type": "application/json; charset=utf-8",
+        "host": PAAPI_HOST,
+        "x-amz-date": SIGNED_AT.strftime("%Y%m%dT%H%M%SZ"),
+        "x-amz-target": "com.amazon.paapi5.v1.ProductAdvertisingAPIv1.GetItems",
+    }
+    items = api_client.deserialize(
+        RawResponse(corpus.paapi_bodies[0]), "GetItemsResponse"
+    ).items_result.items
+    reversed_asins = corpus.chunks[0][::-1]
+
+    def sign() -> dict[str, str]:
+        auth = AWSV4Auth(
+            access_key="key",
+            secret_key="secret",  # noqa: S106
+            host=PAAPI_HOST,
+            region="us-east-1",
+            service="ProductAdvertisingAPI",
+            method_name="POST",
+            timestamp=SIGNED_AT,
+            headers=dict(headers),
+            payload=payload,
+            path=PAAPI_PATH,
+        )
+        signed_headers: dict[str, str] = auth.get_headers()
+        return signed_headers
+
+    signed_request = TransportRequest(
+        "POST",
+        f"{server.url}{PAAPI_PATH}",
+        sign(),
+        json.dumps(payload).encode(),
+    )
+    transport = Urllib3Transport()
+
+    return {
+        "paapi.build": (
+            lambda: requests.get_items_request(api, corpus.chunks[corpus.next_index()]),
+            5000,
+        ),
+        "paapi.serialize": (
+            lambda: json.dumps(api_client.sanitize_for_serialization(request)),
+            5000,
+        ),
+        "paapi.sign": (sign, 5000),
+        "paapi.transport": (lambda: transport.send(signed_request), 500),
+        "paapi.deserialize": (
+            lambda: api_client.deserialize(
+                RawResponse(corpus.paapi_bodies[corpus.next_index()]),
+                "GetItemsResponse",
+            ),
+            500,
+        ),
+        "paapi.sort_items": (
+            lambda: sort_items(items, reversed_asins, include_unavailable=True),
+            5000,
+        ),
+        "paapi.get_items.inprocess": (
+            lambda: api.get_items(corpus.chunks[corpus.next_index()]),
+            300,
+        ),
+        "paapi.get_items.http": (
+            lambda: http_api.get_items(corpus.chunks[corpus.next_index()]),
+            300,
+        ),
+    }
+
+
+def creators_benchmarks(
+    corpus: Corpus, server: StubServer
+) -> dict[str, tuple[Callable[[], object], int]]:
+    """Return the Creators API benchmarks with their iterations."""
+    api = AmazonCreatorsApi(
+        "id", "secret", "2.1", "tag", "US", throttling=0, transport=server
+    )
+    http_api = AmazonCreatorsApi(
+        "id", "secret", "2.1", "tag", "US", throttling=0, transport=server.transport()
+    )
+    api_client = api._api_client  # noqa: SLF001
+    resources = list(GetItemsResource)
+
+    def build() -> GetItemsRequestContent:
+        return GetItemsRequestContent(
+            partnerTag="tag",
+            itemIds=corpus.chunks[corpus.next_index()],
+            resources=resources,
+        )
+
+    request = build()
+    return {
+        "creators.build": (build, 5000),
+        "creators.serialize": (
+            lambda: json.dumps(api_client.sanitize_for_serialization(request)),
+            5000,
+        ),
+        "creators.deserialize": (
+            lambda: api_client.deserialize(
+                corpus.creators_bodies[corpus.next_index()],
+                "GetItemsResponseContent",
+                "application/json",
+            ),
+            500,
+        ),
+        "creators.get_items.inprocess": (
+            lambda: api.get_items(corpus.chunks[corpus.next_index()]),
+            300,
+        ),
+        "creators.get_items.http": (
+            lambda: http_api.get_items(corpus.chunks[corpus.next_index()]),
+            300,
+        ),
+    }
+
+
+def async_benchmarks(
+    corpus: Corpus, server: StubServer, loop: asyncio.AbstractEventLoop
+) -> dict[str, tuple[Callable[[], object], int]]:
+    """Return the async client benchmarks with their iterations."""
+    inprocess_api = loop.run_until_complete(
+        create_async_api(InProcessAsyncTransport(server))
+    )
+    http_api = loop.run_until_complete(create_async_api(create_http_transport(server)))
+    return {
+        "async.deserialize": (
+            lambda: [
+                Item.from_dict(item)
+                for item in corpus.creators_items[corpus.next_index()]
+            ],
+            500,
+        ),
+        "async.get_items.inprocess": (
+            lambda: loop.run_until_complete(
+                inprocess_api.get_items(corpus.chunks[corpus.next_index()])
+            ),
+            300,
+        ),
+        "async.get_items.http": (
+            lambda: loop.run_until_complete(
+                http_api.get_items(corpus.chunks[corpus.next_index()])
+            ),
+            300,
+        ),
+    }
+
+
+async def create_async_api(transport: AsyncTransport) -> AsyncAmazonCreatorsApi:
+    """Create an async client with an open connection pool."""
+    api = AsyncAmazonCreatorsApi(
+        "id", "secret", "3.1", "tag", "US", throttling=0, transport=transport
+    )
+    return await api.__aenter__()
+
+
+def create_http_transport(server: StubServer) -> AsyncTransport:
+    """Create an async transport reusing its connections to the stub server."""
+    return server.async_transport(HttpxTransport(httpx.AsyncClient()))
+
+
+async def measure_async_throughput(
+    corpus: Corpus, server: StubServer, requests: int, concurrency: int
+) -> dict[str, float]:
+    """Send concurrent async requests over HTTP and return their throughput."""
+    api = await create_async_api(create_http_transport(server))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get_items() -> None:
+        async with semaphore:
+            await api.get_items(corpus.chunks[corpus.next_index()])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(get_items() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await api.__aexit__(None, None, None)
+    return summarize([elapsed * 1_000_000 / requests], requests, elapsed)
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print the change of the medians against a baseline run."""
+    print(f"\n{'benchmark':<32}{'baseline us':>14}{'current us':>14}{'change':>10}")
+    for name, result in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            continue
+        change = result["median_us"] / previous["median_us"] - 1
+        print(
+            f"{name:<32}{previous['median_us']:>14.1f}{result['median_us']:>14.1f}"
+            f"{change:>+10.1%}"
+        )
+
+
+def main() -> int:
+    """Run the pipeline benchmarks and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplier of the iterations"
+    )
+    parser.add_argument("--filter", default="", help="run the matching benchmarks")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", type=Path, help="save the results as JSON")
+    parser.add_argument("--compare", type=Path, help="compare with saved results")
+    args = parser.parse_args()
+
+    corpus = Corpus()
+    results: dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": corpus.describe(),
+        "benchmarks": {},
+    }
+
+    print(f"{'benchmark':<32}{'median us':>12}{'p99 us':>12}{'ops/s':>12}")
+    loop = asyncio.new_event_loop()
+    with StubServer(corpus.catalog) as server:
+        benchmarks = {
+            **paapi_benchmarks(corpus, server),
+            **creators_benchmarks(corpus, server),
+            **async_benchmarks(corpus, server, loop),
+        }
+        for name, (func, iterations) in benchmarks.items():
+            if args.filter not in name:
+                continue
+            result = measure(func, max(1, round(iterations * args.scale)))
+            results["benchmarks"][name] = result
+            print(
+                f"{name:<32}{result['median_us']:>12.1f}{result['p99_us']:>12.1f}"
+                f"{result['ops_per_second']:>12.0f}"
+            )
+
+        if args.filter in "async.throughput":
+            requests = max(args.concurrency, round(500 * args.scale))
+            result = loop.run_until_complete(
+                measure_async_throughput(corpus, server, requests, args.concurrency)
+            )
+            results["benchmarks"]["async.throughput"] = result
+            print(
+                f"{'async.throughput':<32}{result['median_us']:>12.1f}"
+                f"{'':>12}{result['ops_per_second']:>12.0f}"
+            )
+
+    loop.close()
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare is not None:
+        compare(results, json.loads(args.compare.read_text()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ permissions and limitations under the License.
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import validate_call, ConfigDict, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -43,6 +43,10 @@ from creatorsapi_python_sdk.api_client import ApiClient, RequestSerialized
 from creatorsapi_python_sdk.api_response import ApiResponse
 from creatorsapi_python_sdk.rest import RESTResponseType
 
+# Build the argument validators on the first call instead of on import, like the
+# schemas of the models
+VALIDATE_CALL_CONFIG = ConfigDict(defer_build=True)
+
 
 class DefaultApi:
     """NOTE: This class is auto generated by OpenAPI Generator
@@ -57,7 +61,7 @@ class DefaultApi:
         self.api_client = api_client
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_browse_nodes(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale. Type: String Default Value: None Example: 'www.amazon.com'")],
@@ -134,7 +138,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_browse_nodes_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale. Type: String Default Value: None Example: 'www.amazon.com'")],
@@ -211,7 +215,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_browse_nodes_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale. Type: String Default Value: None Example: 'www.amazon.com'")],
@@ -361,7 +365,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_feed(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -438,7 +442,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_feed_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -515,7 +519,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_feed_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -665,7 +669,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_items(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -741,7 +745,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_items_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -817,7 +821,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_items_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -966,7 +970,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_report(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1043,7 +1047,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_report_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1120,7 +1124,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_report_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1270,7 +1274,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_variations(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale. This specifies the marketplace where the items should be searched. Example: 'www.amazon.com'")],
@@ -1347,7 +1351,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_variations_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale. This specifies the marketplace where the items should be searched. Example: 'www.amazon.com'")],
@@ -1424,7 +1428,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def get_variations_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale. This specifies the marketplace where the items should be searched. Example: 'www.amazon.com'")],
@@ -1574,7 +1578,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def list_feeds(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1647,7 +1651,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def list_feeds_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1720,7 +1724,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def list_feeds_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1850,7 +1854,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def list_reports(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1923,7 +1927,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def list_reports_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -1996,7 +2000,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def list_reports_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -2126,7 +2130,7 @@ class DefaultApi:
 
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def search_items(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -2202,7 +2206,7 @@ class DefaultApi:
         ).data
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def search_items_with_http_info(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
@@ -2278,7 +2282,7 @@ class DefaultApi:
         )
 
 
-    @validate_call
+    @validate_call(config=VALIDATE_CALL_CONFIG)
     def search_items_without_preload_content(
         self,
         x_marketplace: Annotated[str, Field(strict=True, max_length=1000, description="Target Amazon Locale.")],
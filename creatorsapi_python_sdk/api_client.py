@@ -64,6 +64,8 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API https://creatorsapi.amazon
+    :param pool_manager: an optional urllib3.PoolManager used to send the
+        requests, including the OAuth2 token requests.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -90,7 +92,9 @@ class ApiClient:
         credential_secret: Optional[str] = None,
         version: Optional[str] = None,
         host="https://creatorsapi.amazon",
-        auth_endpoint: Optional[str] = None
+        auth_endpoint: Optional[str] = None,
+        token_store=None,
+        pool_manager=None
     ) -> None:
         # use default configuration if none is provided
         if configuration is None:
@@ -101,7 +105,9 @@ class ApiClient:
             
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = rest.RESTClientObject(configuration, pool_manager=pool_manager)
+        # Optional pool manager also used for the OAuth2 token requests
+        self.pool_manager = pool_manager
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -115,6 +121,8 @@ class ApiClient:
         self._credential_secret: Optional[str] = credential_secret
         self._version: Optional[str] = version
         self._auth_endpoint: Optional[str] = auth_endpoint
+        # Optional token store shared with other clients and processes
+        self.token_store = token_store
         
         # OAuth2 token manager - reused across requests for token caching
         self._token_manager: Optional[OAuth2TokenManager] = None
@@ -375,18 +383,7 @@ class ApiClient:
 
         # Get OAuth2 token (cached after first fetch) and add Authorization header
         try:
-            # Initialize OAuth2TokenManager once - reused across requests for token caching
-            if self._token_manager is None:
-                with self._token_manager_lock:
-                    # Double-check after acquiring lock
-                    if self._token_manager is None:
-                        config = OAuth2Config(
-                            self.credential_id, self.credential_secret,
-                            self.version, self.auth_endpoint
-                        )
-                        self._token_manager = OAuth2TokenManager(config)
-            # Get token (will use cached token if valid)
-            token = self._token_manager.get_token()
+            token = self.get_token(_request_timeout)
             # Add Authorization headers - Version only for v2.x
             if self.version.startswith("3."):
                 header_params['Authorization'] = 'Bearer {}'.format(token)
@@ -409,6 +406,26 @@ class ApiClient:
 
         return response_data
 
+    def get_token(self, _request_timeout=None) -> str:
+        """Returns the OAuth2 access token, cached after the first fetch.
+        :param _request_timeout: timeout setting for the token request.
+        :return: The access token.
+        """
+        # Initialize OAuth2TokenManager once - reused across requests for token caching
+        if self._token_manager is None:
+            with self._token_manager_lock:
+                # Double-check after acquiring lock
+                if self._token_manager is None:
+                    config = OAuth2Config(
+                        self.credential_id, self.credential_secret,
+                        self.version, self.auth_endpoint
+                    )
+                    self._token_manager = OAuth2TokenManager(
+                        config, self.token_store, self.pool_manager
+                    )
+        # Get token (will use cached token if valid)
+        return self._token_manager.get_token(_request_timeout)
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
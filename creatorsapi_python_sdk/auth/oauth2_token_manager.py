@@ -22,34 +22,108 @@ Note: ApiClient automatically manages token caching for optimal performance.
 Direct instantiation is only needed for advanced use cases.
 """
 
+import contextlib
 import requests
+import threading
 import time
 import json
+from urllib.parse import urlencode
+
+import urllib3
 
 
 class OAuth2TokenManager:
-    """Manages OAuth2 token lifecycle including acquisition, caching, and automatic refresh"""
+    """Manages OAuth2 token lifecycle including acquisition, caching, and automatic refresh
+
+    The manager is thread-safe: when the cached token expires and several threads
+    request a token at the same time, only one of them calls the OAuth2 endpoint
+    and the others reuse the refreshed token.
+    """
 
-    def __init__(self, config):
+    def __init__(self, config, token_store=None, pool_manager=None):
         """
         Creates an OAuth2TokenManager instance
         
         :param config: The OAuth2Config instance
+        :param token_store: Optional store shared with other managers and processes,
+            providing get(credential_id, version) and
+            set(credential_id, version, access_token, expires_at), and optionally
+            locked() returning a lock held while the token is refreshed
+        :param pool_manager: Optional urllib3.PoolManager used to send the token
+            requests instead of requests, e.g. the one of the API client
         """
         self.config = config
+        self.token_store = token_store
+        self.pool_manager = pool_manager
         self.access_token = None
         self.expires_at = None
+        self._lock = threading.Lock()
 
-    def get_token(self):
+    def get_token(self, timeout=None):
         """
         Gets a valid OAuth2 access token, refreshing if necessary
         
+        :param timeout: Optional timeout for the token request, in seconds or as
+            a (connect, read) tuple
         :return: A valid access token
         :raises Exception: If token acquisition fails
         """
-        if self.is_token_valid():
-            return self.access_token
-        return self.refresh_token()
+        token = self._get_valid_token()
+        if token is not None:
+            return token
+
+        # Need to refresh - use lock to prevent concurrent refreshes
+        with self._lock:
+            # Double-check after acquiring lock, another thread may have refreshed
+            token = self._get_valid_token()
+            if token is not None:
+                return token
+            # Hold the store lock across reading, refreshing and saving the token,
+            # so only one of the processes sharing the store requests a new one
+            with self._lock_store():
+                if self.load_stored_token():
+                    token = self._get_valid_token()
+                if token is None:
+                    token = self.refresh_token(timeout)
+            return token
+
+    def _lock_store(self):
+        """
+        Returns the lock of the token store, held while the token is refreshed
+        
+        :return: A context manager, doing nothing if the store has no lock
+        """
+        locked = getattr(self.token_store, 'locked', None)
+        if locked is None:
+            return contextlib.nullcontext()
+        return locked()
+
+    def load_stored_token(self):
+        """
+        Loads a valid token from the token store, if one is configured
+        
+        :return: True if a valid token was loaded, false otherwise
+        """
+        if self.token_store is None:
+            return False
+        stored_token = self.token_store.get(self.config.get_credential_id(), self.config.get_version())
+        if stored_token is None:
+            return False
+        self.access_token, self.expires_at = stored_token
+        return True
+
+    def _get_valid_token(self):
+        """
+        Returns the cached token if it is valid, reading the token and its
+        expiration once so that a concurrent clear_token() cannot change them
+        between the check and the return
+        
+        :return: The access token, or None if there is no valid token
+        """
+        access_token, expires_at = self.access_token, self.expires_at
+        if access_token and expires_at and time.time() < expires_at:
+            return access_token
+        return None
 
     def is_token_valid(self):
         """
@@ -59,10 +133,12 @@ class OAuth2TokenManager:
         """
         return self.access_token and self.expires_at and time.time() < self.expires_at
 
-    def refresh_token(self):
+    def refresh_token(self, timeout=None):
         """
         Refreshes the OAuth2 access token using client credentials grant
         
+        :param timeout: Optional timeout for the token request, in seconds or as
+            a (connect, read) tuple
         :return: The new access token
         :raises Exception: If token refresh fails
         """
@@ -76,11 +152,15 @@ class OAuth2TokenManager:
                     'scope': self.config.get_scope()
                 }
                 headers = {'Content-Type': 'application/json'}
-                response = requests.post(
-                    self.config.get_cognito_endpoint(),
-                    json=request_data,
-                    headers=headers
-                )
+                if self.pool_manager is not None:
+                    response = self._post(json.dumps(request_data), headers, timeout)
+                else:
+                    response = requests.post(
+                        self.config.get_cognito_endpoint(),
+                        json=request_data,
+                        headers=headers,
+                        timeout=timeout
+                    )
             else:
                 # Cognito (v2.x) uses form-encoded
                 request_data = {
@@ -90,11 +170,15 @@ class OAuth2TokenManager:
                     'scope': self.config.get_scope()
                 }
                 headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-                response = requests.post(
-                    self.config.get_cognito_endpoint(),
-                    data=request_data,
-                    headers=headers
-                )
+                if self.pool_manager is not None:
+                    response = self._post(urlencode(request_data), headers, timeout)
+                else:
+                    response = requests.post(
+                        self.config.get_cognito_endpoint(),
+                        data=request_data,
+                        headers=headers,
+                        timeout=timeout
+                    )
 
             if response.status_code != 200:
                 raise Exception("OAuth2 token request failed with status {}: {}".format(response.status_code, response.text))
@@ -104,15 +188,22 @@ class OAuth2TokenManager:
             if 'access_token' not in data:
                 raise Exception('No access token received from OAuth2 endpoint')
 
-            self.access_token = data['access_token']
+            access_token = data['access_token']
             # Set expiration time with a 30-second buffer to avoid edge cases
             expires_in = data.get('expires_in', 3600)  # Default to 1 hour if not provided
             expires_in_with_buffer = expires_in - 30
-            self.expires_at = time.time() + expires_in_with_buffer
+            expires_at = time.time() + expires_in_with_buffer
+            self.access_token, self.expires_at = access_token, expires_at
+
+            if self.token_store is not None:
+                self.token_store.set(
+                    self.config.get_credential_id(), self.config.get_version(),
+                    access_token, expires_at
+                )
             
-            return self.access_token
+            return access_token
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             # Clear existing token on failure
             self.clear_token()
             raise Exception("OAuth2 token request failed: {}".format(str(e)))
@@ -125,9 +216,40 @@ class OAuth2TokenManager:
             self.clear_token()
             raise e
 
+    def _post(self, body, headers, timeout):
+        """
+        Sends the token request with the pool manager
+        
+        :param body: The encoded request body
+        :param headers: The request headers
+        :param timeout: Optional timeout, in seconds or as a (connect, read) tuple
+        :return: The response, with the status_code, text and json() of requests
+        """
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        response = self.pool_manager.request(
+            'POST',
+            self.config.get_cognito_endpoint(),
+            body=body,
+            headers=headers,
+            timeout=timeout
+        )
+        return _PoolManagerResponse(response.status, response.data)
+
     def clear_token(self):
         """
         Clears the cached token, forcing a refresh on the next get_token() call
         """
         self.access_token = None
         self.expires_at = None
+
+
+class _PoolManagerResponse:
+    """Token response sent with a pool manager, exposing the requests interface"""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.text = content.decode('utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.text)
@@ -17,95 +17,114 @@ permissions and limitations under the License.
 
 """  # noqa: E501
 
+import importlib
 
-# import models into model package
-from creatorsapi_python_sdk.models.access_denied_exception_response_content import AccessDeniedExceptionResponseContent
-from creatorsapi_python_sdk.models.access_denied_reason import AccessDeniedReason
-from creatorsapi_python_sdk.models.availability import Availability
-from creatorsapi_python_sdk.models.browse_node import BrowseNode
-from creatorsapi_python_sdk.models.browse_node_ancestor import BrowseNodeAncestor
-from creatorsapi_python_sdk.models.browse_node_child import BrowseNodeChild
-from creatorsapi_python_sdk.models.browse_node_info import BrowseNodeInfo
-from creatorsapi_python_sdk.models.browse_nodes_result import BrowseNodesResult
-from creatorsapi_python_sdk.models.by_line_info import ByLineInfo
-from creatorsapi_python_sdk.models.classifications import Classifications
-from creatorsapi_python_sdk.models.condition import Condition
-from creatorsapi_python_sdk.models.content_info import ContentInfo
-from creatorsapi_python_sdk.models.content_rating import ContentRating
-from creatorsapi_python_sdk.models.contributor import Contributor
-from creatorsapi_python_sdk.models.customer_reviews import CustomerReviews
-from creatorsapi_python_sdk.models.deal_details import DealDetails
-from creatorsapi_python_sdk.models.delivery_flag import DeliveryFlag
-from creatorsapi_python_sdk.models.dimension_based_attribute import DimensionBasedAttribute
-from creatorsapi_python_sdk.models.error_data import ErrorData
-from creatorsapi_python_sdk.models.external_ids import ExternalIds
-from creatorsapi_python_sdk.models.feed import Feed
-from creatorsapi_python_sdk.models.get_browse_nodes_request_content import GetBrowseNodesRequestContent
-from creatorsapi_python_sdk.models.get_browse_nodes_resource import GetBrowseNodesResource
-from creatorsapi_python_sdk.models.get_browse_nodes_response_content import GetBrowseNodesResponseContent
-from creatorsapi_python_sdk.models.get_feed_request_content import GetFeedRequestContent
-from creatorsapi_python_sdk.models.get_feed_response_content import GetFeedResponseContent
-from creatorsapi_python_sdk.models.get_items_request_content import GetItemsRequestContent
-from creatorsapi_python_sdk.models.get_items_resource import GetItemsResource
-from creatorsapi_python_sdk.models.get_items_response_content import GetItemsResponseContent
-from creatorsapi_python_sdk.models.get_report_request_content import GetReportRequestContent
-from creatorsapi_python_sdk.models.get_report_response_content import GetReportResponseContent
-from creatorsapi_python_sdk.models.get_variations_request_content import GetVariationsRequestContent
-from creatorsapi_python_sdk.models.get_variations_resource import GetVariationsResource
-from creatorsapi_python_sdk.models.get_variations_response_content import GetVariationsResponseContent
-from creatorsapi_python_sdk.models.image_size import ImageSize
-from creatorsapi_python_sdk.models.image_type import ImageType
-from creatorsapi_python_sdk.models.images import Images
-from creatorsapi_python_sdk.models.internal_server_exception_response_content import InternalServerExceptionResponseContent
-from creatorsapi_python_sdk.models.item import Item
-from creatorsapi_python_sdk.models.item_info import ItemInfo
-from creatorsapi_python_sdk.models.items_result import ItemsResult
-from creatorsapi_python_sdk.models.language_type import LanguageType
-from creatorsapi_python_sdk.models.languages import Languages
-from creatorsapi_python_sdk.models.list_feeds_response_content import ListFeedsResponseContent
-from creatorsapi_python_sdk.models.list_reports_response_content import ListReportsResponseContent
-from creatorsapi_python_sdk.models.manufacture_info import ManufactureInfo
-from creatorsapi_python_sdk.models.money import Money
-from creatorsapi_python_sdk.models.multi_valued_attribute import MultiValuedAttribute
-from creatorsapi_python_sdk.models.offer_availability_v2 import OfferAvailabilityV2
-from creatorsapi_python_sdk.models.offer_condition_v2 import OfferConditionV2
-from creatorsapi_python_sdk.models.offer_listing_v2 import OfferListingV2
-from creatorsapi_python_sdk.models.offer_loyalty_points_v2 import OfferLoyaltyPointsV2
-from creatorsapi_python_sdk.models.offer_merchant_info_v2 import OfferMerchantInfoV2
-from creatorsapi_python_sdk.models.offer_price_v2 import OfferPriceV2
-from creatorsapi_python_sdk.models.offer_saving_basis import OfferSavingBasis
-from creatorsapi_python_sdk.models.offer_savings import OfferSavings
-from creatorsapi_python_sdk.models.offer_type import OfferType
-from creatorsapi_python_sdk.models.offers_v2 import OffersV2
-from creatorsapi_python_sdk.models.product_info import ProductInfo
-from creatorsapi_python_sdk.models.rating import Rating
-from creatorsapi_python_sdk.models.refinement import Refinement
-from creatorsapi_python_sdk.models.refinement_bin import RefinementBin
-from creatorsapi_python_sdk.models.report_metadata import ReportMetadata
-from creatorsapi_python_sdk.models.resource_not_found_exception_response_content import ResourceNotFoundExceptionResponseContent
-from creatorsapi_python_sdk.models.saving_basis_type import SavingBasisType
-from creatorsapi_python_sdk.models.search_items_request_content import SearchItemsRequestContent
-from creatorsapi_python_sdk.models.search_items_resource import SearchItemsResource
-from creatorsapi_python_sdk.models.search_items_response_content import SearchItemsResponseContent
-from creatorsapi_python_sdk.models.search_refinements import SearchRefinements
-from creatorsapi_python_sdk.models.search_result import SearchResult
-from creatorsapi_python_sdk.models.single_boolean_valued_attribute import SingleBooleanValuedAttribute
-from creatorsapi_python_sdk.models.single_integer_valued_attribute import SingleIntegerValuedAttribute
-from creatorsapi_python_sdk.models.single_string_valued_attribute import SingleStringValuedAttribute
-from creatorsapi_python_sdk.models.sort_by import SortBy
-from creatorsapi_python_sdk.models.technical_info import TechnicalInfo
-from creatorsapi_python_sdk.models.throttle_exception_response_content import ThrottleExceptionResponseContent
-from creatorsapi_python_sdk.models.trade_in_info import TradeInInfo
-from creatorsapi_python_sdk.models.trade_in_price import TradeInPrice
-from creatorsapi_python_sdk.models.unauthorized_exception_reason import UnauthorizedExceptionReason
-from creatorsapi_python_sdk.models.unauthorized_exception_response_content import UnauthorizedExceptionResponseContent
-from creatorsapi_python_sdk.models.unit_based_attribute import UnitBasedAttribute
-from creatorsapi_python_sdk.models.validation_exception_field import ValidationExceptionField
-from creatorsapi_python_sdk.models.validation_exception_reason import ValidationExceptionReason
-from creatorsapi_python_sdk.models.validation_exception_response_content import ValidationExceptionResponseContent
-from creatorsapi_python_sdk.models.variation_attribute import VariationAttribute
-from creatorsapi_python_sdk.models.variation_dimension import VariationDimension
-from creatorsapi_python_sdk.models.variation_summary import VariationSummary
-from creatorsapi_python_sdk.models.variation_summary_price import VariationSummaryPrice
-from creatorsapi_python_sdk.models.variations_result import VariationsResult
-from creatorsapi_python_sdk.models.website_sales_rank import WebsiteSalesRank
+# Import the names on first access (PEP 562), so importing the package or any of
+# its modules does not import and build every model
+_LAZY_IMPORTS = {
+    "AccessDeniedExceptionResponseContent": "creatorsapi_python_sdk.models.access_denied_exception_response_content",
+    "AccessDeniedReason": "creatorsapi_python_sdk.models.access_denied_reason",
+    "Availability": "creatorsapi_python_sdk.models.availability",
+    "BrowseNode": "creatorsapi_python_sdk.models.browse_node",
+    "BrowseNodeAncestor": "creatorsapi_python_sdk.models.browse_node_ancestor",
+    "BrowseNodeChild": "creatorsapi_python_sdk.models.browse_node_child",
+    "BrowseNodeInfo": "creatorsapi_python_sdk.models.browse_node_info",
+    "BrowseNodesResult": "creatorsapi_python_sdk.models.browse_nodes_result",
+    "ByLineInfo": "creatorsapi_python_sdk.models.by_line_info",
+    "Classifications": "creatorsapi_python_sdk.models.classifications",
+    "Condition": "creatorsapi_python_sdk.models.condition",
+    "ContentInfo": "creatorsapi_python_sdk.models.content_info",
+    "ContentRating": "creatorsapi_python_sdk.models.content_rating",
+    "Contributor": "creatorsapi_python_sdk.models.contributor",
+    "CustomerReviews": "creatorsapi_python_sdk.models.customer_reviews",
+    "DealDetails": "creatorsapi_python_sdk.models.deal_details",
+    "DeliveryFlag": "creatorsapi_python_sdk.models.delivery_flag",
+    "DimensionBasedAttribute": "creatorsapi_python_sdk.models.dimension_based_attribute",
+    "ErrorData": "creatorsapi_python_sdk.models.error_data",
+    "ExternalIds": "creatorsapi_python_sdk.models.external_ids",
+    "Feed": "creatorsapi_python_sdk.models.feed",
+    "GetBrowseNodesRequestContent": "creatorsapi_python_sdk.models.get_browse_nodes_request_content",
+    "GetBrowseNodesResource": "creatorsapi_python_sdk.models.get_browse_nodes_resource",
+    "GetBrowseNodesResponseContent": "creatorsapi_python_sdk.models.get_browse_nodes_response_content",
+    "GetFeedRequestContent": "creatorsapi_python_sdk.models.get_feed_request_content",
+    "GetFeedResponseContent": "creatorsapi_python_sdk.models.get_feed_response_content",
+    "GetItemsRequestContent": "creatorsapi_python_sdk.models.get_items_request_content",
+    "GetItemsResource": "creatorsapi_python_sdk.models.get_items_resource",
+    "GetItemsResponseContent": "creatorsapi_python_sdk.models.get_items_response_content",
+    "GetReportRequestContent": "creatorsapi_python_sdk.models.get_report_request_content",
+    "GetReportResponseContent": "creatorsapi_python_sdk.models.get_report_response_content",
+    "GetVariationsRequestContent": "creatorsapi_python_sdk.models.get_variations_request_content",
+    "GetVariationsResource": "creatorsapi_python_sdk.models.get_variations_resource",
+    "GetVariationsResponseContent": "creatorsapi_python_sdk.models.get_variations_response_content",
+    "ImageSize": "creatorsapi_python_sdk.models.image_size",
+    "ImageType": "creatorsapi_python_sdk.models.image_type",
+    "Images": "creatorsapi_python_sdk.models.images",
+    "InternalServerExceptionResponseContent": "creatorsapi_python_sdk.models.internal_server_exception_response_content",
+    "Item": "creatorsapi_python_sdk.models.item",
+    "ItemInfo": "creatorsapi_python_sdk.models.item_info",
+    "ItemsResult": "creatorsapi_python_sdk.models.items_result",
+    "LanguageType": "creatorsapi_python_sdk.models.language_type",
+    "Languages": "creatorsapi_python_sdk.models.languages",
+    "ListFeedsResponseContent": "creatorsapi_python_sdk.models.list_feeds_response_content",
+    "ListReportsResponseContent": "creatorsapi_python_sdk.models.list_reports_response_content",
+    "ManufactureInfo": "creatorsapi_python_sdk.models.manufacture_info",
+    "Money": "creatorsapi_python_sdk.models.money",
+    "MultiValuedAttribute": "creatorsapi_python_sdk.models.multi_valued_attribute",
+    "OfferAvailabilityV2": "creatorsapi_python_sdk.models.offer_availability_v2",
+    "OfferConditionV2": "creatorsapi_python_sdk.models.offer_condition_v2",
+    "OfferListingV2": "creatorsapi_python_sdk.models.offer_listing_v2",
+    "OfferLoyaltyPointsV2": "creatorsapi_python_sdk.models.offer_loyalty_points_v2",
+    "OfferMerchantInfoV2": "creatorsapi_python_sdk.models.offer_merchant_info_v2",
+    "OfferPriceV2": "creatorsapi_python_sdk.models.offer_price_v2",
+    "OfferSavingBasis": "creatorsapi_python_sdk.models.offer_saving_basis",
+    "OfferSavings": "creatorsapi_python_sdk.models.offer_savings",
+    "OfferType": "creatorsapi_python_sdk.models.offer_type",
+    "OffersV2": "creatorsapi_python_sdk.models.offers_v2",
+    "ProductInfo": "creatorsapi_python_sdk.models.product_info",
+    "Rating": "creatorsapi_python_sdk.models.rating",
+    "Refinement": "creatorsapi_python_sdk.models.refinement",
+    "RefinementBin": "creatorsapi_python_sdk.models.refinement_bin",
+    "ReportMetadata": "creatorsapi_python_sdk.models.report_metadata",
+    "ResourceNotFoundExceptionResponseContent": "creatorsapi_python_sdk.models.resource_not_found_exception_response_content",
+    "SavingBasisType": "creatorsapi_python_sdk.models.saving_basis_type",
+    "SearchItemsRequestContent": "creatorsapi_python_sdk.models.search_items_request_content",
+    "SearchItemsResource": "creatorsapi_python_sdk.models.search_items_resource",
+    "SearchItemsResponseContent": "creatorsapi_python_sdk.models.search_items_response_content",
+    "SearchRefinements": "creatorsapi_python_sdk.models.search_refinements",
+    "SearchResult": "creatorsapi_python_sdk.models.search_result",
+    "SingleBooleanValuedAttribute": "creatorsapi_python_sdk.models.single_boolean_valued_attribute",
+    "SingleIntegerValuedAttribute": "creatorsapi_python_sdk.models.single_integer_valued_attribute",
+    "SingleStringValuedAttribute": "creatorsapi_python_sdk.models.single_string_valued_attribute",
+    "SortBy": "creatorsapi_python_sdk.models.sort_by",
+    "TechnicalInfo": "creatorsapi_python_sdk.models.technical_info",
+    "ThrottleExceptionResponseContent": "creatorsapi_python_sdk.models.throttle_exception_response_content",
+    "TradeInInfo": "creatorsapi_python_sdk.models.trade_in_info",
+    "TradeInPrice": "creatorsapi_python_sdk.models.trade_in_price",
+    "UnauthorizedExceptionReason": "creatorsapi_python_sdk.models.unauthorized_exception_reason",
+    "UnauthorizedExceptionResponseContent": "creatorsapi_python_sdk.models.unauthorized_exception_response_content",
+    "UnitBasedAttribute": "creatorsapi_python_sdk.models.unit_based_attribute",
+    "ValidationExceptionField": "creatorsapi_python_sdk.models.validation_exception_field",
+    "ValidationExceptionReason": "creatorsapi_python_sdk.models.validation_exception_reason",
+    "ValidationExceptionResponseContent": "creatorsapi_python_sdk.models.validation_exception_response_content",
+    "VariationAttribute": "creatorsapi_python_sdk.models.variation_attribute",
+    "VariationDimension": "creatorsapi_python_sdk.models.variation_dimension",
+    "VariationSummary": "creatorsapi_python_sdk.models.variation_summary",
+    "VariationSummaryPrice": "creatorsapi_python_sdk.models.variation_summary_price",
+    "VariationsResult": "creatorsapi_python_sdk.models.variations_result",
+    "WebsiteSalesRank": "creatorsapi_python_sdk.models.website_sales_rank",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
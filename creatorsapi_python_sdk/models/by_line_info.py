@@ -43,6 +43,7 @@ class ByLineInfo(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
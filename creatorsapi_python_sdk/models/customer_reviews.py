@@ -41,6 +41,7 @@ class CustomerReviews(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
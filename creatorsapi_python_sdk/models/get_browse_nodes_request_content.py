@@ -51,6 +51,7 @@ class GetBrowseNodesRequestContent(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
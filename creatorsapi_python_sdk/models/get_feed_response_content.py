@@ -39,6 +39,7 @@ class GetFeedResponseContent(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
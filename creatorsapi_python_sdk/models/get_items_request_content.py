@@ -65,6 +65,7 @@ class GetItemsRequestContent(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
@@ -74,6 +74,7 @@ class GetVariationsRequestContent(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
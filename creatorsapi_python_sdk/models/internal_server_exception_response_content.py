@@ -40,6 +40,7 @@ class InternalServerExceptionResponseContent(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
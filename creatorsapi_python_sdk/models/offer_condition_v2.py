@@ -41,6 +41,7 @@ class OfferConditionV2(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
@@ -54,6 +54,7 @@ class OfferListingV2(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
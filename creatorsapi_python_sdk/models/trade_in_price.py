@@ -41,6 +41,7 @@ class TradeInPrice(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
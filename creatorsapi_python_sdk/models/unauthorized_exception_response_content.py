@@ -42,6 +42,7 @@ class UnauthorizedExceptionResponseContent(BaseModel):
         populate_by_name=True,
         validate_assignment=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
@@ -1,18 +1,39 @@
 """Unit tests for AsyncAmazonCreatorsApi class."""
 
+import asyncio
+import json
+import time
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+
 from amazon_creatorsapi.aio import (
     AsyncAmazonCreatorsApi,
 )
+from amazon_creatorsapi.aio.auth import AsyncOAuth2TokenManager
+from amazon_creatorsapi.core.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from amazon_creatorsapi.core.hedging import HedgingPolicy
+from amazon_creatorsapi.core.hooks import EventHooks, RequestEvent
+from amazon_creatorsapi.core.quota import QuotaTracker
+from amazon_creatorsapi.core.recording import AsyncReplayTransport, Exchange
+from amazon_creatorsapi.core.retry import RetryPolicy
+from amazon_creatorsapi.core.transport import TransportRequest, TransportResponse
 from amazon_creatorsapi.errors import (
     AssociateValidationError,
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
     InvalidArgumentError,
     ItemsNotFoundError,
+    QuotaExceededError,
     RequestError,
     TooManyRequestsError,
 )
+from amazon_creatorsapi.testing import StubServer
 from creatorsapi_python_sdk.models.condition import Condition
 from creatorsapi_python_sdk.models.delivery_flag import DeliveryFlag
 from creatorsapi_python_sdk.models.get_browse_nodes_resource import (
@@ -157,6 +178,33 @@ class TestAsyncAmazonCreatorsApiContextManager(unittest.IsolatedAsyncioTestCase)
 
         mock_client.__aexit__.assert_called_once()
 
+    @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+    @patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+    async def test_context_manager_passes_connection_settings(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager: MagicMock,
+    ) -> None:
+        """Test HTTP/2 and pool settings are passed to the HTTP client."""
+        mock_http_client_class.return_value = AsyncMock()
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            http2=True,
+            max_connections=4,
+            max_concurrent_streams=50,
+        ):
+            pass
+
+        kwargs = mock_http_client_class.call_args.kwargs
+        self.assertTrue(kwargs["http2"])
+        self.assertEqual(kwargs["max_connections"], 4)
+        self.assertEqual(kwargs["max_concurrent_streams"], 50)
+
     @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
     async def test_context_manager_exit_without_client(
         self,
@@ -203,7 +251,7 @@ class TestAsyncAmazonCreatorsApiGetItems(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -238,7 +286,7 @@ class TestAsyncAmazonCreatorsApiGetItems(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -275,7 +323,7 @@ class TestAsyncAmazonCreatorsApiGetItems(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -315,7 +363,7 @@ class TestAsyncAmazonCreatorsApiSearchItemsDeliveryFlags(
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -356,7 +404,7 @@ class TestAsyncAmazonCreatorsApiSearchItemsDeliveryFlags(
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -403,7 +451,7 @@ class TestAsyncAmazonCreatorsApiSearchItems(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -436,7 +484,7 @@ class TestAsyncAmazonCreatorsApiSearchItems(unittest.IsolatedAsyncioTestCase):
         mock_client.post.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -468,7 +516,7 @@ class TestAsyncAmazonCreatorsApiSearchItems(unittest.IsolatedAsyncioTestCase):
         mock_client.post.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -506,7 +554,7 @@ class TestAsyncAmazonCreatorsApiErrorHandling(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -538,7 +586,7 @@ class TestAsyncAmazonCreatorsApiErrorHandling(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -570,7 +618,7 @@ class TestAsyncAmazonCreatorsApiErrorHandling(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -586,6 +634,358 @@ class TestAsyncAmazonCreatorsApiErrorHandling(unittest.IsolatedAsyncioTestCase):
                 await api.get_items(["B0DLFMFBJW"])
 
 
+@patch("amazon_creatorsapi.core.retry.asyncio.sleep", new_callable=AsyncMock)
+@patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+@patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+class TestAsyncAmazonCreatorsApiRetries(unittest.IsolatedAsyncioTestCase):
+    """Tests for retries with a retry policy."""
+
+    def _create_api(
+        self, mock_token_manager_class: MagicMock
+    ) -> AsyncAmazonCreatorsApi:
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
+        mock_token_manager.get_token.return_value = "test_token"
+        mock_token_manager_class.return_value = mock_token_manager
+        return AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+            retry_policy=RetryPolicy(),
+        )
+
+    async def test_retries_transient_errors(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+        mock_sleep: AsyncMock,
+    ) -> None:
+        """Test 5xx responses and transport errors are retried."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "itemsResult": {"items": [{"asin": "B0DLFMFBJW"}]}
+        }
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = [
+            MagicMock(status_code=503, text="Service Unavailable"),
+            httpx.ConnectError("Connection refused"),
+            mock_response,
+        ]
+        mock_http_client_class.return_value = mock_client
+
+        async with self._create_api(mock_token_manager_class) as api:
+            items = await api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items.metadata.retries, 2)
+        self.assertEqual(mock_client.post.await_count, 3)
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    async def test_does_not_retry_permanent_errors(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+        mock_sleep: AsyncMock,
+    ) -> None:
+        """Test 404 responses are raised without retrying."""
+        mock_client = AsyncMock()
+        mock_client.post.return_value = MagicMock(status_code=404, text="Not Found")
+        mock_http_client_class.return_value = mock_client
+
+        async with self._create_api(mock_token_manager_class) as api:
+            with self.assertRaises(ItemsNotFoundError) as context:
+                await api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(context.exception.status_code, 404)
+        mock_client.post.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+
+class TestAsyncAmazonCreatorsApiHedging(unittest.IsolatedAsyncioTestCase):
+    """Tests for hedged requests."""
+
+    @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+    @patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+    async def test_slow_request_is_hedged(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+    ) -> None:
+        """Test a duplicate request is sent when the first one is slow."""
+        responses = iter([5, 0])
+
+        async def post(*_args: object) -> MagicMock:
+            await asyncio.sleep(next(responses))
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "itemsResult": {"items": [{"asin": "B0DLFMFBJW"}]}
+            }
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = post
+        mock_http_client_class.return_value = mock_client
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
+        mock_token_manager.get_token.return_value = "test_token"
+        mock_token_manager_class.return_value = mock_token_manager
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+            hedging=HedgingPolicy(initial_delay=0.01),
+        ) as api:
+            items = await asyncio.wait_for(api.get_items(["B0DLFMFBJW"]), 1)
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items.metadata.hedges, 1)
+        self.assertEqual(mock_client.post.await_count, 2)
+
+    @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+    @patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+    async def test_only_the_response_used_is_recorded(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+    ) -> None:
+        """Test the event of a hedged request reports the response used."""
+        body = '{"itemsResult": {"items": [{"asin": "B0DLFMFBJW"}]}}'
+        responses = iter([(0.2, 200, body), (0.15, 429, "Too many requests")])
+
+        async def post(*_args: object) -> MagicMock:
+            delay, status_code, text = next(responses)
+            await asyncio.sleep(delay)
+            response = MagicMock(status_code=status_code, body=text, text=text)
+            response.json.return_value = json.loads(body)
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = post
+        mock_http_client_class.return_value = mock_client
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
+        mock_token_manager.get_token.return_value = "test_token"
+        mock_token_manager.is_token_valid = MagicMock(return_value=True)
+        mock_token_manager_class.return_value = mock_token_manager
+        hooks = EventHooks()
+        events: list[RequestEvent] = []
+        hooks.add("on_response", events.append)
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+            hedging=HedgingPolicy(initial_delay=0.01),
+            hooks=hooks,
+        ) as api:
+            items = await api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(items.metadata.hedges, 1)
+        self.assertEqual(events[0].status_code, 200)
+        self.assertEqual(events[0].response_size, len(body))
+        self.assertGreaterEqual(events[0].timings["network"], 0.2)
+        self.assertLess(events[0].timings["network"], 0.3)
+
+    @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+    @patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+    async def test_hedged_requests_count_in_the_quota(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+    ) -> None:
+        """Test hedged requests are only sent with quota left, and counted."""
+
+        async def post(*_args: object) -> MagicMock:
+            await asyncio.sleep(0.05)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "itemsResult": {"items": [{"asin": "B0DLFMFBJW"}]}
+            }
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = post
+        mock_http_client_class.return_value = mock_client
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
+        mock_token_manager.get_token.return_value = "test_token"
+        mock_token_manager_class.return_value = mock_token_manager
+        quota = QuotaTracker(3, reserved_share=0)
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+            hedging=HedgingPolicy(initial_delay=0.01),
+            quota=quota,
+        ) as api:
+            await api.get_items(["B0DLFMFBJW"])
+            items = await api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(quota.get_used(), 3)
+        self.assertEqual(mock_client.post.await_count, 3)
+
+
+class TestAsyncAmazonCreatorsApiTimeout(unittest.IsolatedAsyncioTestCase):
+    """Tests for the timeout of the API calls."""
+
+    @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+    @patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+    async def test_slow_request_raises_deadline_exceeded(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+    ) -> None:
+        """Test a request slower than the timeout is cancelled."""
+        cancelled = asyncio.Event()
+
+        async def post(*_args: object) -> MagicMock:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = post
+        mock_http_client_class.return_value = mock_client
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
+        mock_token_manager.get_token.return_value = "test_token"
+        mock_token_manager_class.return_value = mock_token_manager
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+        ) as api:
+            with self.assertRaises(DeadlineExceededError):
+                await api.get_items(["B0DLFMFBJW"], timeout=0.05)
+
+        self.assertTrue(cancelled.is_set())
+
+    async def test_waits_past_the_deadline_fail_fast(self) -> None:
+        """Test throttling and quota waits longer than the timeout are not made."""
+        quota = QuotaTracker(1, reserved_share=0, max_wait=60)
+        with StubServer(credentials={"key": "secret"}) as server:
+            async with AsyncAmazonCreatorsApi(
+                credential_id="key",
+                credential_secret="secret",
+                version="3.1",
+                tag="test-tag",
+                country="ES",
+                throttling=10,
+                transport=server.async_transport(),
+                quota=quota,
+            ) as api:
+                await api.get_items(["B000000001"])
+                start = time.monotonic()
+                with self.assertRaises(QuotaExceededError):
+                    await api.get_items(["B000000001"], timeout=5)
+                api.quota = None
+                with self.assertRaises(DeadlineExceededError):
+                    await api.get_items(["B000000001"], timeout=5)
+
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class TestAsyncAmazonCreatorsApiCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """Tests for the circuit breaker."""
+
+    @patch("amazon_creatorsapi.aio.api.AsyncOAuth2TokenManager")
+    @patch("amazon_creatorsapi.aio.api.AsyncHttpClient")
+    async def test_circuit_breaker_fails_fast(
+        self,
+        mock_http_client_class: MagicMock,
+        mock_token_manager_class: MagicMock,
+    ) -> None:
+        """Test requests are not sent while the marketplace circuit is open."""
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = httpx.ConnectError("Connection refused")
+        mock_http_client_class.return_value = mock_client
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
+        mock_token_manager.get_token.return_value = "test_token"
+        mock_token_manager_class.return_value = mock_token_manager
+        breakers = CircuitBreakerRegistry(CircuitBreakerPolicy(min_requests=2))
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+            circuit_breakers=breakers,
+        ) as api:
+            for _ in range(2):
+                with self.assertRaises(httpx.ConnectError):
+                    await api.get_items(["B0DLFMFBJW"])
+            with self.assertRaises(CircuitBreakerOpenError):
+                await api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(mock_client.post.await_count, 2)
+        self.assertEqual(breakers.states(), {"www.amazon.es": CircuitState.OPEN})
+
+
+class TestAsyncAmazonCreatorsApiTransport(unittest.IsolatedAsyncioTestCase):
+    """Tests for pluggable transports."""
+
+    async def test_transport(self) -> None:
+        """Test token and catalog requests are sent through the transport."""
+        transport = AsyncReplayTransport(
+            [
+                Exchange(
+                    TransportRequest(
+                        "POST",
+                        "https://creatorsapi.auth.eu-south-2.amazoncognito.com/oauth2/token",
+                    ),
+                    TransportResponse(200, body=b'{"access_token": "token"}'),
+                    latency=0,
+                ),
+                Exchange(
+                    TransportRequest(
+                        "POST", "https://creatorsapi.amazon/catalog/v1/getItems"
+                    ),
+                    TransportResponse(
+                        200,
+                        body=b'{"itemsResult": {"items": [{"asin": "B0DLFMFBJW"}]}}',
+                    ),
+                    latency=0,
+                ),
+            ],
+            match_body=False,
+        )
+
+        async with AsyncAmazonCreatorsApi(
+            credential_id="test_id",
+            credential_secret="test_secret",
+            version="2.2",
+            tag="test-tag",
+            country="ES",
+            throttling=0,
+            transport=transport,
+        ) as api:
+            items = await api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual([item.asin for item in items], ["B0DLFMFBJW"])
+
+
 class TestAsyncAmazonCreatorsApiThrottling(unittest.IsolatedAsyncioTestCase):
     """Tests for throttling mechanism."""
 
@@ -610,7 +1010,7 @@ class TestAsyncAmazonCreatorsApiThrottling(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -656,7 +1056,7 @@ class TestAsyncAmazonCreatorsApiGetVariations(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -689,7 +1089,7 @@ class TestAsyncAmazonCreatorsApiGetVariations(unittest.IsolatedAsyncioTestCase):
         mock_client.post.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -726,7 +1126,7 @@ class TestAsyncAmazonCreatorsApiGetVariations(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -766,7 +1166,7 @@ class TestAsyncAmazonCreatorsApiGetVariations(unittest.IsolatedAsyncioTestCase):
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -806,7 +1206,7 @@ class TestAsyncAmazonCreatorsApiGetBrowseNodes(unittest.IsolatedAsyncioTestCase)
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -841,7 +1241,7 @@ class TestAsyncAmazonCreatorsApiGetBrowseNodes(unittest.IsolatedAsyncioTestCase)
         mock_client.post.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -877,7 +1277,7 @@ class TestAsyncAmazonCreatorsApiGetBrowseNodes(unittest.IsolatedAsyncioTestCase)
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -913,7 +1313,7 @@ class TestAsyncAmazonCreatorsApiGetBrowseNodes(unittest.IsolatedAsyncioTestCase)
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -945,7 +1345,7 @@ class TestAsyncAmazonCreatorsApiGetBrowseNodes(unittest.IsolatedAsyncioTestCase)
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -981,7 +1381,7 @@ class TestAsyncAmazonCreatorsApiErrorHandlingExtended(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1013,7 +1413,7 @@ class TestAsyncAmazonCreatorsApiErrorHandlingExtended(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1045,7 +1445,7 @@ class TestAsyncAmazonCreatorsApiErrorHandlingExtended(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1077,7 +1477,7 @@ class TestAsyncAmazonCreatorsApiErrorHandlingExtended(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1118,7 +1518,7 @@ class TestAsyncAmazonCreatorsApiSearchItemsExtended(unittest.IsolatedAsyncioTest
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1169,7 +1569,7 @@ class TestAsyncAmazonCreatorsApiSearchItemsExtended(unittest.IsolatedAsyncioTest
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1206,7 +1606,7 @@ class TestAsyncAmazonCreatorsApiSearchItemsExtended(unittest.IsolatedAsyncioTest
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1248,7 +1648,7 @@ class TestAsyncAmazonCreatorsApiWithoutContextManager(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1284,7 +1684,7 @@ class TestAsyncAmazonCreatorsApiWithoutContextManager(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1321,7 +1721,7 @@ class TestAsyncAmazonCreatorsApiWithoutContextManager(unittest.IsolatedAsyncioTe
         mock_client.__aenter__.return_value = mock_client
         mock_http_client_class.return_value = mock_client
 
-        mock_token_manager = AsyncMock()
+        mock_token_manager = AsyncMock(spec=AsyncOAuth2TokenManager)
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
@@ -1,5 +1,6 @@
 """Unit tests for AsyncHttpClient."""
 
+import asyncio
 import subprocess
 import sys
 import unittest
@@ -7,6 +8,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from amazon_creatorsapi.aio.client import (
     DEFAULT_HOST,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_TIMEOUT,
     AsyncHttpClient,
     AsyncHttpResponse,
@@ -112,6 +115,88 @@ class TestAsyncHttpClient(unittest.IsolatedAsyncioTestCase):
             mock_client_instance.post.assert_called_once()
 
 
+class TestAsyncHttpClientConnectionSettings(unittest.IsolatedAsyncioTestCase):
+    """Tests for AsyncHttpClient HTTP/2 and connection pool settings."""
+
+    @patch("amazon_creatorsapi.aio.client.httpx.AsyncClient")
+    async def test_defaults_use_http1_and_default_limits(
+        self, mock_client_cls: MagicMock
+    ) -> None:
+        """Test the httpx client keeps HTTP/1.1 and the default limits."""
+        mock_client_cls.return_value = AsyncMock()
+        async with AsyncHttpClient():
+            pass
+
+        kwargs = mock_client_cls.call_args.kwargs
+        self.assertFalse(kwargs["http2"])
+        self.assertEqual(kwargs["limits"].max_connections, DEFAULT_MAX_CONNECTIONS)
+        self.assertEqual(
+            kwargs["limits"].max_keepalive_connections,
+            DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        )
+
+    @patch("amazon_creatorsapi.aio.client.httpx.AsyncClient")
+    async def test_http2_and_custom_limits(self, mock_client_cls: MagicMock) -> None:
+        """Test HTTP/2 and pool limits are passed to the httpx client."""
+        mock_client_cls.return_value = AsyncMock()
+        client = AsyncHttpClient(
+            http2=True,
+            max_connections=4,
+            max_keepalive_connections=2,
+            keepalive_expiry=30,
+        )
+        async with client:
+            pass
+
+        kwargs = mock_client_cls.call_args.kwargs
+        self.assertTrue(kwargs["http2"])
+        self.assertEqual(kwargs["limits"].max_connections, 4)
+        self.assertEqual(kwargs["limits"].max_keepalive_connections, 2)
+        self.assertEqual(kwargs["limits"].keepalive_expiry, 30)
+
+    @patch("amazon_creatorsapi.aio.client.httpx.AsyncClient")
+    async def test_standalone_request_uses_settings(
+        self, mock_client_cls: MagicMock
+    ) -> None:
+        """Test temporary clients are created with the same settings."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.__aenter__.return_value = mock_client_instance
+        mock_client_instance.post.return_value = MagicMock(
+            status_code=200, headers={}, content=b"{}", text="{}"
+        )
+        mock_client_cls.return_value = mock_client_instance
+
+        await AsyncHttpClient(http2=True).post("/test", {}, {})
+
+        self.assertTrue(mock_client_cls.call_args.kwargs["http2"])
+
+    async def test_without_stream_limit_has_no_semaphore(self) -> None:
+        """Test concurrent requests are not limited by default."""
+        self.assertIsNone(AsyncHttpClient().streams_semaphore)
+
+    async def test_max_concurrent_streams_limits_requests(self) -> None:
+        """Test no more than max_concurrent_streams requests are in flight."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_post(*_args: object, **_kwargs: object) -> MagicMock:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(status_code=200, headers={}, content=b"{}", text="{}")
+
+        client = AsyncHttpClient(max_concurrent_streams=3)
+        client._client = MagicMock()
+        client._client.post = slow_post
+
+        await asyncio.gather(*(client.post("/test", {}, {}) for _ in range(10)))
+
+        self.assertEqual(max_in_flight, 3)
+        self.assertIs(client.streams_semaphore, client.streams_semaphore)
+
+
 class TestAsyncHttpResponse(unittest.TestCase):
     """Tests for AsyncHttpResponse."""
 
@@ -0,0 +1,55 @@
+"""Unit tests for the async multi-marketplace client."""
+
+from __future__ import annotations
+
+import unittest
+
+from amazon_creatorsapi.aio import AsyncMultiMarketplaceApi
+from amazon_creatorsapi.errors import InvalidArgumentError
+from amazon_creatorsapi.testing import StubServer
+
+CREDENTIALS = {"key": "secret"}
+
+
+class TestAsyncMultiMarketplaceApi(unittest.IsolatedAsyncioTestCase):
+    async def test_get_items(self) -> None:
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncMultiMarketplaceApi(
+                "key",
+                "secret",
+                "3.2",
+                "tag",
+                ["ES", "DE", "FR"],
+                throttling=0,
+                transport=server.async_transport(),
+            ) as amazon:
+                items = await amazon.get_items(["B000000001"])
+                results = await amazon.search_items(keywords="camera")
+
+        self.assertEqual(list(items), ["ES", "DE", "FR"])
+        self.assertEqual(items["FR"][0].asin, "B000000001")
+        self.assertTrue(results["DE"].items)
+        self.assertEqual(amazon.clients["FR"].marketplace, "www.amazon.fr")
+
+    async def test_shares_connections_and_token(self) -> None:
+        amazon = AsyncMultiMarketplaceApi("key", "secret", "3.2", "tag", ["ES", "DE"])
+        es, de = amazon.clients.values()
+
+        self.assertIs(es._transport, de._transport)
+        self.assertIs(es._token_manager._token_store, de._token_manager._token_store)
+
+        async with amazon:
+            self.assertIsNotNone(amazon._transport.client)  # type: ignore[union-attr]
+        self.assertIsNone(amazon._transport.client)  # type: ignore[union-attr]
+
+    def test_invalid_countries(self) -> None:
+        with self.assertRaises(InvalidArgumentError):
+            AsyncMultiMarketplaceApi("key", "secret", "3.2", "tag", ["XX"])  # type: ignore[list-item]
+
+    def test_missing_tag_or_throttling(self) -> None:
+        with self.assertRaisesRegex(InvalidArgumentError, "tag for the countries: DE"):
+            AsyncMultiMarketplaceApi("key", "secret", "3.2", {"ES": "t"}, ["ES", "DE"])
+        with self.assertRaisesRegex(InvalidArgumentError, "throttling for .*: DE"):
+            AsyncMultiMarketplaceApi(
+                "key", "secret", "3.2", "tag", ["ES", "DE"], throttling={"ES": 1}
+            )
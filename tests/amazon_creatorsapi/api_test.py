@@ -9,8 +9,18 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.core.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from amazon_creatorsapi.core.recording import Exchange, ReplayTransport
+from amazon_creatorsapi.core.retry import RetryPolicy
+from amazon_creatorsapi.core.transport import TransportRequest, TransportResponse
 from amazon_creatorsapi.errors import (
     AssociateValidationError,
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
     InvalidArgumentError,
     ItemsNotFoundError,
     RequestError,
@@ -158,6 +168,128 @@ class TestAmazonCreatorsApi(unittest.TestCase):
         self.assertIsInstance(result, list)
         mock_api.get_items.assert_called_once()
 
+    @mock.patch("amazon_creatorsapi.api.DefaultApi")
+    @mock.patch("amazon_creatorsapi.api.ApiClient")
+    def test_get_items_with_timeout(
+        self,
+        _mock_client_class: MagicMock,
+        mock_api_class: MagicMock,
+    ) -> None:
+        """Test the timeout limits the request timeout of the API call."""
+        mock_api = MagicMock()
+        mock_api_class.return_value = mock_api
+        mock_api.get_items.return_value.items_result.items = [MagicMock()]
+
+        api = AmazonCreatorsApi(
+            credential_id=self.credential_id,
+            credential_secret=self.credential_secret,
+            version=self.version,
+            tag=self.tag,
+            country=self.country,
+            throttling=0,
+        )
+        api.get_items(["B0DLFMFBJW"], timeout=5)
+
+        request_timeout = mock_api.get_items.call_args.kwargs["_request_timeout"]
+        self.assertGreater(request_timeout, 4)
+        self.assertLessEqual(request_timeout, 5)
+
+    @mock.patch("amazon_creatorsapi.api.DefaultApi")
+    @mock.patch("amazon_creatorsapi.api.ApiClient")
+    def test_get_items_timeout_expires_while_throttling(
+        self,
+        _mock_client_class: MagicMock,
+        mock_api_class: MagicMock,
+    ) -> None:
+        """Test the call fails fast if the throttling wait exceeds the timeout."""
+        mock_api = MagicMock()
+        mock_api_class.return_value = mock_api
+
+        api = AmazonCreatorsApi(
+            credential_id=self.credential_id,
+            credential_secret=self.credential_secret,
+            version=self.version,
+            tag=self.tag,
+            country=self.country,
+            throttling=10,
+        )
+        api._last_query_time = time.time()
+        with self.assertRaises(DeadlineExceededError):
+            api.get_items(["B0DLFMFBJW"], timeout=1)
+        mock_api.get_items.assert_not_called()
+
+    @mock.patch("amazon_creatorsapi.api.DefaultApi")
+    @mock.patch("amazon_creatorsapi.api.ApiClient")
+    def test_circuit_breaker_fails_fast(
+        self,
+        _mock_client_class: MagicMock,
+        mock_api_class: MagicMock,
+    ) -> None:
+        """Test requests are not sent while the marketplace circuit is open."""
+        mock_api = MagicMock()
+        mock_api_class.return_value = mock_api
+        mock_api.get_items.side_effect = ApiException(
+            status=503, reason="Service Unavailable"
+        )
+        breakers = CircuitBreakerRegistry(CircuitBreakerPolicy(min_requests=2))
+
+        api = AmazonCreatorsApi(
+            credential_id=self.credential_id,
+            credential_secret=self.credential_secret,
+            version=self.version,
+            tag=self.tag,
+            country=self.country,
+            throttling=0,
+            circuit_breakers=breakers,
+        )
+        for _ in range(2):
+            with self.assertRaises(RequestError):
+                api.get_items(["B0DLFMFBJW"])
+        with self.assertRaises(CircuitBreakerOpenError):
+            api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(mock_api.get_items.call_count, 2)
+        self.assertEqual(breakers.states(), {"www.amazon.es": CircuitState.OPEN})
+
+    def test_transport(self) -> None:
+        """Test token and catalog requests are sent through the transport."""
+        transport = ReplayTransport(
+            [
+                Exchange(
+                    TransportRequest(
+                        "POST",
+                        "https://creatorsapi.auth.eu-south-2.amazoncognito.com/oauth2/token",
+                    ),
+                    TransportResponse(200, body=b'{"access_token": "token"}'),
+                    latency=0,
+                ),
+                Exchange(
+                    TransportRequest(
+                        "POST", "https://creatorsapi.amazon/catalog/v1/getItems"
+                    ),
+                    TransportResponse(
+                        200,
+                        body=b'{"itemsResult": {"items": [{"asin": "B0DLFMFBJW"}]}}',
+                    ),
+                    latency=0,
+                ),
+            ],
+            match_body=False,
+        )
+        api = AmazonCreatorsApi(
+            credential_id=self.credential_id,
+            credential_secret=self.credential_secret,
+            version=self.version,
+            tag=self.tag,
+            country=self.country,
+            throttling=0,
+            transport=transport,
+        )
+
+        items = api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual([item.asin for item in items], ["B0DLFMFBJW"])
+
     @mock.patch("amazon_creatorsapi.api.DefaultApi")
     @mock.patch("amazon_creatorsapi.api.ApiClient")
     def test_search_items(
@@ -292,6 +424,75 @@ class TestAmazonCreatorsApi(unittest.TestCase):
         with self.assertRaises(RequestError):
             api.get_items(["B0DLFMFBJW"])
 
+    @mock.patch("amazon_creatorsapi.core.retry.time.sleep")
+    @mock.patch("amazon_creatorsapi.api.DefaultApi")
+    @mock.patch("amazon_creatorsapi.api.ApiClient")
+    def test_get_items_retries_transient_errors(
+        self,
+        _mock_client_class: MagicMock,
+        mock_api_class: MagicMock,
+        mock_sleep: MagicMock,
+    ) -> None:
+        """Test get_items retries 429 and 5xx errors with a retry policy."""
+        mock_api = MagicMock()
+        mock_api_class.return_value = mock_api
+        mock_response = MagicMock()
+        mock_response.items_result.items = [MagicMock()]
+        mock_api.get_items.side_effect = [
+            ApiException(status=429, reason="Too Many Requests"),
+            ApiException(status=503, reason="Service Unavailable"),
+            mock_response,
+        ]
+
+        api = AmazonCreatorsApi(
+            credential_id=self.credential_id,
+            credential_secret=self.credential_secret,
+            version=self.version,
+            tag=self.tag,
+            country=self.country,
+            throttling=0,
+            retry_policy=RetryPolicy(),
+        )
+        result = api.get_items(["B0DLFMFBJW"])
+
+        self.assertEqual(result, mock_response.items_result.items)
+        self.assertEqual(result.metadata.retries, 2)
+        self.assertEqual(result.metadata.chunks[0].item_ids, ["B0DLFMFBJW"])
+        self.assertEqual(mock_api.get_items.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @mock.patch("amazon_creatorsapi.core.retry.time.sleep")
+    @mock.patch("amazon_creatorsapi.api.DefaultApi")
+    @mock.patch("amazon_creatorsapi.api.ApiClient")
+    def test_search_items_does_not_retry_permanent_errors(
+        self,
+        _mock_client_class: MagicMock,
+        mock_api_class: MagicMock,
+        mock_sleep: MagicMock,
+    ) -> None:
+        """Test client errors are raised without retrying."""
+        mock_api = MagicMock()
+        mock_api_class.return_value = mock_api
+        mock_api.search_items.side_effect = ApiException(
+            status=400, reason="Bad Request", body="InvalidParameterValue"
+        )
+
+        api = AmazonCreatorsApi(
+            credential_id=self.credential_id,
+            credential_secret=self.credential_secret,
+            version=self.version,
+            tag=self.tag,
+            country=self.country,
+            throttling=0,
+            retry_policy=RetryPolicy(),
+        )
+        with self.assertRaises(InvalidArgumentError) as context:
+            api.search_items(keywords="test")
+
+        self.assertEqual(context.exception.status_code, 400)
+        mock_api.search_items.assert_called_once()
+        mock_sleep.assert_not_called()
+
     @mock.patch("amazon_creatorsapi.api.DefaultApi")
     @mock.patch("amazon_creatorsapi.api.ApiClient")
     def test_search_items_no_results(
@@ -0,0 +1 @@
+"""Tests for amazon_creatorsapi.core package."""
@@ -0,0 +1,184 @@
+"""Unit tests for the streaming bulk refresh of items."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.bulk import (
+    async_bulk_get_items,
+    bulk_get_items,
+    iter_item_ids,
+)
+from amazon_creatorsapi.errors import ItemsNotFoundError, TooManyRequestsError
+from amazon_creatorsapi.testing import StubServer, SyntheticCatalog
+
+ASINS = ["B000000001", "B000000002", "B000000003"]
+CREDENTIALS = {"key": "secret"}
+
+
+def create_client(**kwargs: Any) -> MagicMock:
+    """Return a mocked client returning one item per item ID."""
+    client = MagicMock(**kwargs)
+    client.FAILOVER_ERRORS = AmazonCreatorsApi.FAILOVER_ERRORS
+    client.get_items.side_effect = lambda item_ids: [f"item-{i}" for i in item_ids]
+    return client
+
+
+class TestIterItemIds(unittest.TestCase):
+    def test_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "asins.txt"
+            path.write_text(
+                "# Nightly refresh\nB000000001\n\n"
+                " https://www.amazon.es/dp/B000000002 \n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(list(iter_item_ids(path)), ["B000000001", "B000000002"])
+            self.assertEqual(len(list(iter_item_ids(str(path)))), 2)
+
+    def test_iterable(self) -> None:
+        self.assertEqual(list(iter_item_ids(iter(["B000000001", ""]))), ["B000000001"])
+
+
+class TestBulkGetItems(unittest.TestCase):
+    def test_chunks_in_order(self) -> None:
+        server = StubServer(SyntheticCatalog(100), credentials=CREDENTIALS)
+        amazon = AmazonCreatorsApi(
+            "key", "secret", "2.1", "tag", "US", throttling=0, transport=server
+        )
+        asins = server.catalog.get_asins(25)
+
+        results = list(bulk_get_items(amazon, asins))
+
+        self.assertEqual([len(result.item_ids) for result in results], [10, 10, 5])
+        self.assertEqual(
+            [item.asin for result in results for item in result.items], asins
+        )
+        self.assertIsNone(results[0].error)
+
+    def test_bounded_concurrency_and_backpressure(self) -> None:
+        lock = threading.Lock()
+        in_flight = [0, 0]  # Current and maximum requests in flight
+        read = []
+
+        def get_items(item_ids: list[str]) -> list[str]:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return item_ids
+
+        def source() -> Any:
+            for i in range(1000):
+                read.append(i)
+                yield f"B{i:09d}"
+
+        client = create_client()
+        client.get_items.side_effect = get_items
+        results = bulk_get_items(client, source(), chunk_size=10, max_concurrency=3)
+
+        next(results)
+
+        self.assertLessEqual(len(read), 40)
+        self.assertEqual(len(list(results)), 99)
+        self.assertLessEqual(in_flight[1], 3)
+
+    def test_errors(self) -> None:
+        client = create_client()
+        error = ItemsNotFoundError("No items found")
+        client.get_items.side_effect = [["item"], error, ["item"]]
+
+        results = list(bulk_get_items(client, ASINS, chunk_size=1))
+
+        self.assertEqual([result.error for result in results], [None, error, None])
+        self.assertEqual(results[1].items, [])
+
+    def test_failover_errors_stop_the_job(self) -> None:
+        client = create_client()
+        client.get_items.side_effect = TooManyRequestsError("Too many requests")
+
+        with self.assertRaises(TooManyRequestsError):
+            list(bulk_get_items(client, ASINS[:2], chunk_size=1))
+
+    def test_resumes_from_checkpoint(self) -> None:
+        asins = [f"B{i:09d}" for i in range(35)]
+        client = create_client()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint = Path(temp_dir) / "job.json"
+            results = bulk_get_items(client, asins, checkpoint=checkpoint)
+            next(results)
+            next(results)
+            next(results)
+            results.close()
+
+            # The last result taken may not have been processed
+            self.assertEqual(json.loads(checkpoint.read_text())["done"], 20)
+            client.get_items.reset_mock()
+
+            resumed = list(bulk_get_items(client, asins, checkpoint=checkpoint))
+
+            self.assertEqual(
+                [result.item_ids[0] for result in resumed], ["B000000020", "B000000030"]
+            )
+            self.assertEqual(client.get_items.call_count, 2)
+            self.assertFalse(checkpoint.exists())
+
+
+class TestAsyncBulkGetItems(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client(self) -> None:
+        with StubServer(SyntheticCatalog(100), credentials=CREDENTIALS) as server:
+            asins = server.catalog.get_asins(15)
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+            ) as amazon:
+                results = [
+                    result
+                    async for result in async_bulk_get_items(
+                        amazon, asins, max_concurrency=2
+                    )
+                ]
+
+        self.assertEqual(
+            [item.asin for result in results for item in result.items], asins
+        )
+
+    async def test_checkpoint_and_errors(self) -> None:
+        async def get_items(item_ids: list[str]) -> list[str]:
+            if item_ids == ASINS[1:2]:
+                msg = "Too many requests"
+                raise TooManyRequestsError(msg)
+            return item_ids
+
+        client = create_client()
+        client.get_items.side_effect = get_items
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint = Path(temp_dir) / "job.json"
+            items = []
+            with self.assertRaises(TooManyRequestsError):
+                async for result in async_bulk_get_items(
+                    client, ASINS, chunk_size=1, checkpoint=checkpoint
+                ):
+                    items.extend(result.items)
+
+            self.assertEqual(items, ASINS[:1])
+            self.assertEqual(json.loads(checkpoint.read_text())["done"], 1)
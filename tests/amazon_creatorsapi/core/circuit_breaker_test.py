@@ -0,0 +1,167 @@
+"""Unit tests for the circuit breakers."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import urllib3
+
+from amazon_creatorsapi.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from amazon_creatorsapi.errors import ItemsNotFoundError
+
+
+class StatusError(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+class TestCircuitBreakerPolicy(unittest.TestCase):
+    def test_failures(self) -> None:
+        policy = CircuitBreakerPolicy()
+        self.assertTrue(policy.is_failure(StatusError(503)))
+        self.assertTrue(policy.is_failure(urllib3.exceptions.ProtocolError()))
+        self.assertTrue(policy.is_failure(ConnectionResetError()))
+        self.assertFalse(policy.is_failure(StatusError(404)))
+        self.assertFalse(policy.is_failure(StatusError(429)))
+        self.assertFalse(policy.is_failure(ItemsNotFoundError()))
+
+    def test_extra_exceptions(self) -> None:
+        policy = CircuitBreakerPolicy()
+        self.assertFalse(policy.is_failure(ValueError()))
+        self.assertTrue(policy.is_failure(ValueError(), (ValueError,)))
+
+
+@patch("amazon_creatorsapi.core.circuit_breaker.time.monotonic", return_value=0)
+class TestCircuitBreaker(unittest.TestCase):
+    def _create_breaker(self, **kwargs: Any) -> CircuitBreaker:
+        policy = CircuitBreakerPolicy(
+            window_size=4, min_requests=4, open_duration=10, **kwargs
+        )
+        return CircuitBreaker("webservices.amazon.es", policy)
+
+    def _open(self, breaker: CircuitBreaker) -> None:
+        for _ in range(4):
+            breaker.record(0.1, StatusError(503))
+
+    def test_opens_on_failure_rate(self, _mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker(failure_rate=0.5)
+        breaker.record(0.1)
+        breaker.record(0.1)
+        breaker.record(0.1, StatusError(503))
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+        breaker.record(0.1, StatusError(500))
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_needs_min_requests(self, _mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker()
+        for _ in range(3):
+            breaker.record(0.1, StatusError(503))
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+        self.assertEqual(breaker.failure_rate, 1)
+
+    def test_healthy_errors_do_not_open(self, _mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker()
+        for _ in range(4):
+            breaker.record(0.1, ItemsNotFoundError())
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_opens_on_slow_requests(self, _mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker(slow_call_duration=1, slow_call_rate=0.5)
+        breaker.record(0.5)
+        breaker.record(0.5)
+        breaker.record(2)
+        breaker.record(3)
+        self.assertEqual(breaker.slow_call_rate, 0.5)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+    def test_half_open_probes_close(self, mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker(half_open_requests=2)
+        self._open(breaker)
+        self.assertEqual(breaker.retry_after, 10)
+
+        mock_monotonic.return_value = 10
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        self.assertFalse(breaker.allow_request(reserve=False))
+
+        breaker.record(0.1)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        breaker.record(0.1)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+        self.assertEqual(breaker.failure_rate, 0)
+
+    def test_failed_probe_opens_again(self, mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker()
+        self._open(breaker)
+
+        mock_monotonic.return_value = 10
+        self.assertTrue(breaker.allow_request())
+        breaker.record(0.1, ConnectionResetError())
+
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        self.assertEqual(breaker.retry_after, 10)
+
+    def test_cancelled_probe_is_released(self, mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker(half_open_requests=1)
+        self._open(breaker)
+
+        mock_monotonic.return_value = 10
+        self.assertTrue(breaker.allow_request())
+        breaker.record(0.1, asyncio.CancelledError())
+
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+
+    def test_track_records_outcome(self, _mock_monotonic: MagicMock) -> None:
+        breaker = self._create_breaker()
+        for _ in range(4):
+            with self.assertRaises(StatusError), breaker.track():
+                raise StatusError(503)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+    def test_state_change_callback(self, _mock_monotonic: MagicMock) -> None:
+        on_state_change = MagicMock()
+        breaker = self._create_breaker()
+        breaker.on_state_change = on_state_change
+
+        self._open(breaker)
+        breaker.reset()
+
+        self.assertEqual(
+            [c.args for c in on_state_change.call_args_list],
+            [
+                ("webservices.amazon.es", CircuitState.CLOSED, CircuitState.OPEN),
+                ("webservices.amazon.es", CircuitState.OPEN, CircuitState.CLOSED),
+            ],
+        )
+
+
+class TestCircuitBreakerRegistry(unittest.TestCase):
+    def test_one_breaker_per_key(self) -> None:
+        registry = CircuitBreakerRegistry()
+        self.assertIs(registry.get("www.amazon.es"), registry.get("www.amazon.es"))
+        self.assertIsNot(registry.get("www.amazon.es"), registry.get("www.amazon.fr"))
+        self.assertIs(registry.get("www.amazon.es").policy, registry.policy)
+
+    def test_states(self) -> None:
+        registry = CircuitBreakerRegistry(CircuitBreakerPolicy(min_requests=1))
+        registry.get("www.amazon.es").record(0.1, StatusError(503))
+        registry.get("www.amazon.fr").record(0.1)
+
+        self.assertEqual(
+            registry.states(),
+            {"www.amazon.es": CircuitState.OPEN, "www.amazon.fr": CircuitState.CLOSED},
+        )
@@ -0,0 +1,43 @@
+"""Unit tests for call deadlines."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from amazon_creatorsapi.core.deadline import MIN_REQUEST_TIMEOUT, Deadline
+
+
+@patch("amazon_creatorsapi.core.deadline.time.monotonic")
+class TestDeadline(unittest.TestCase):
+    def test_remaining(self, mock_monotonic: unittest.mock.MagicMock) -> None:
+        mock_monotonic.return_value = 100
+        deadline = Deadline(5)
+
+        mock_monotonic.return_value = 102
+        self.assertEqual(deadline.remaining(), 3)
+        self.assertFalse(deadline.expired)
+
+        mock_monotonic.return_value = 110
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertTrue(deadline.expired)
+
+    def test_limit(self, mock_monotonic: unittest.mock.MagicMock) -> None:
+        mock_monotonic.return_value = 100
+        deadline = Deadline(5)
+
+        self.assertEqual(deadline.limit(None), 5)
+        self.assertEqual(deadline.limit(2), 2)
+        self.assertEqual(deadline.limit(10), 5)
+
+        mock_monotonic.return_value = 110
+        self.assertEqual(deadline.limit(10), MIN_REQUEST_TIMEOUT)
+
+    def test_from_timeout(self, mock_monotonic: unittest.mock.MagicMock) -> None:
+        mock_monotonic.return_value = 0
+        self.assertIsNone(Deadline.from_timeout(None))
+
+        deadline = Deadline.from_timeout(1.5)
+        self.assertIsNotNone(deadline)
+        assert deadline is not None
+        self.assertEqual(deadline.timeout, 1.5)
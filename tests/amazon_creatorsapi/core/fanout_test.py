@@ -0,0 +1,80 @@
+"""Unit tests for the calls fanned out across marketplaces."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from amazon_creatorsapi.core.fanout import MarketplaceResults, async_fan_out, fan_out
+from amazon_creatorsapi.core.priority import Priority, get_priority, use_priority
+
+
+class TestFanOut(unittest.TestCase):
+    def setUp(self) -> None:
+        self.executor = ThreadPoolExecutor(2)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_runs_calls_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=1)
+
+        def call(result: str) -> str:
+            barrier.wait()
+            return result
+
+        results = fan_out(
+            {"ES": lambda: call("es"), "DE": lambda: call("de")}, self.executor
+        )
+
+        self.assertEqual(results, {"ES": "es", "DE": "de"})
+        self.assertEqual(list(results), ["ES", "DE"])
+        self.assertEqual(results.errors, {})
+
+    def test_keeps_the_context(self) -> None:
+        with use_priority(Priority.HIGH):
+            results = fan_out({"ES": get_priority}, self.executor)
+
+        self.assertEqual(results["ES"], Priority.HIGH)
+
+    def test_records_errors(self) -> None:
+        error = ValueError("Not found")
+
+        def fail() -> str:
+            raise error
+
+        results = fan_out({"ES": lambda: "es", "DE": fail}, self.executor)
+
+        self.assertEqual(results, {"ES": "es"})
+        self.assertEqual(results.errors, {"DE": error})
+
+    def test_raises_if_all_failed(self) -> None:
+        def fail() -> str:
+            msg = "Not found"
+            raise ValueError(msg)
+
+        with self.assertRaises(ValueError):
+            fan_out({"ES": fail, "DE": fail}, self.executor)
+
+    def test_empty_results(self) -> None:
+        results: MarketplaceResults[str] = MarketplaceResults()
+
+        results.raise_if_all_failed()
+        self.assertEqual(results.errors, {})
+
+
+class TestAsyncFanOut(unittest.IsolatedAsyncioTestCase):
+    async def test_records_errors(self) -> None:
+        async def succeed() -> str:
+            return "es"
+
+        async def fail() -> str:
+            msg = "Not found"
+            raise ValueError(msg)
+
+        results = await async_fan_out({"ES": succeed, "DE": fail})
+
+        self.assertEqual(results, {"ES": "es"})
+        self.assertIsInstance(results.errors["DE"], ValueError)
+
+        with self.assertRaises(ValueError):
+            await async_fan_out({"DE": fail})
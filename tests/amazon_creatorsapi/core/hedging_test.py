@@ -0,0 +1,183 @@
+"""Unit tests for hedged requests."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from amazon_creatorsapi.core.hedging import (
+    HedgingPolicy,
+    LatencyTracker,
+    hedge_request,
+)
+from amazon_creatorsapi.core.retry import RetryBudget
+
+
+class TestLatencyTracker(unittest.TestCase):
+    def test_percentile(self) -> None:
+        tracker = LatencyTracker()
+        for latency in range(1, 101):
+            tracker.record(latency / 1000)
+
+        self.assertEqual(tracker.percentile(50), 0.05)
+        self.assertEqual(tracker.percentile(95), 0.095)
+        self.assertEqual(tracker.percentile(100), 0.1)
+
+    def test_percentile_empty(self) -> None:
+        self.assertIsNone(LatencyTracker().percentile(95))
+
+    def test_window_keeps_recent_latencies(self) -> None:
+        tracker = LatencyTracker(window_size=3)
+        for latency in (10, 1, 2, 3):
+            tracker.record(latency)
+
+        self.assertEqual(len(tracker), 3)
+        self.assertEqual(tracker.percentile(100), 3)
+
+    def test_hedging_delay(self) -> None:
+        policy = HedgingPolicy(initial_delay=2, min_samples=3, min_delay=0.05)
+        tracker = LatencyTracker()
+        tracker.record(0.5)
+        self.assertEqual(tracker.get_hedging_delay(policy), 2)
+
+        tracker.record(0.01)
+        tracker.record(0.01)
+        self.assertEqual(tracker.get_hedging_delay(policy), 0.5)
+
+        policy.percentile = 50
+        self.assertEqual(tracker.get_hedging_delay(policy), 0.05)
+
+
+class TestHedgeRequest(unittest.IsolatedAsyncioTestCase):
+    def _create_request(self, *delays: float) -> tuple[MagicMock, list[str]]:
+        """Return a request taking the given delays and a list of finished calls."""
+        finished: list[str] = []
+        calls = iter(enumerate(delays))
+
+        async def request() -> str:
+            number, delay = next(calls)
+            await asyncio.sleep(delay)
+            finished.append(f"request {number}")
+            return f"request {number}"
+
+        return MagicMock(side_effect=request), finished
+
+    async def test_without_policy(self) -> None:
+        request, _ = self._create_request(0)
+        result = await hedge_request(request, None, LatencyTracker())
+        self.assertEqual(result, "request 0")
+
+    async def test_fast_request_is_not_hedged(self) -> None:
+        request, _ = self._create_request(0)
+        tracker = LatencyTracker()
+        on_hedge = MagicMock()
+
+        result = await hedge_request(
+            request, HedgingPolicy(initial_delay=1), tracker, on_hedge=on_hedge
+        )
+
+        self.assertEqual(result, "request 0")
+        request.assert_called_once()
+        on_hedge.assert_not_called()
+        self.assertEqual(len(tracker), 1)
+
+    async def test_slow_request_is_hedged_and_cancelled(self) -> None:
+        request, finished = self._create_request(5, 0)
+        on_hedge = MagicMock()
+        before_hedge = MagicMock(side_effect=lambda: asyncio.sleep(0))
+
+        result = await hedge_request(
+            request,
+            HedgingPolicy(initial_delay=0.01),
+            LatencyTracker(),
+            before_hedge=before_hedge,
+            on_hedge=on_hedge,
+        )
+
+        self.assertEqual(result, "request 1")
+        self.assertEqual(finished, ["request 1"])
+        on_hedge.assert_called_once()
+        before_hedge.assert_called_once()
+
+    async def test_hedging_delay_does_not_shrink_after_hedges(self) -> None:
+        policy = HedgingPolicy(initial_delay=0.02, min_samples=1, min_delay=0)
+        tracker = LatencyTracker()
+
+        for _ in range(5):
+            request, _ = self._create_request(5, 0)
+            await hedge_request(request, policy, tracker)
+
+        # The cancelled first requests took at least the hedging delay
+        self.assertGreaterEqual(tracker.get_hedging_delay(policy), 0.02)
+
+    async def test_duplicate_request_function(self) -> None:
+        request, finished = self._create_request(5)
+        hedge, hedge_finished = self._create_request(0)
+
+        result = await hedge_request(
+            request, HedgingPolicy(initial_delay=0.01), LatencyTracker(), hedge=hedge
+        )
+
+        self.assertEqual(result, "request 0")
+        self.assertEqual((finished, hedge_finished), ([], ["request 0"]))
+        request.assert_called_once()
+
+    async def test_first_response_wins(self) -> None:
+        request, _ = self._create_request(0.05, 5)
+        result = await hedge_request(
+            request, HedgingPolicy(initial_delay=0.01), LatencyTracker()
+        )
+        self.assertEqual(result, "request 0")
+        self.assertEqual(request.call_count, 2)
+
+    async def test_budget_limits_hedged_requests(self) -> None:
+        request, _ = self._create_request(0.05)
+        policy = HedgingPolicy(
+            initial_delay=0.01, budget=RetryBudget(ratio=0, max_tokens=0)
+        )
+
+        result = await hedge_request(request, policy, LatencyTracker())
+
+        self.assertEqual(result, "request 0")
+        request.assert_called_once()
+
+    async def test_failed_duplicate_waits_for_first_request(self) -> None:
+        async def request() -> str:
+            if request_mock.call_count == 1:
+                await asyncio.sleep(0.05)
+                return "request 0"
+            msg = "Duplicate failed"
+            raise ConnectionError(msg)
+
+        request_mock = MagicMock(side_effect=request)
+        result = await hedge_request(
+            request_mock, HedgingPolicy(initial_delay=0.01), LatencyTracker()
+        )
+        self.assertEqual(result, "request 0")
+
+    async def test_raises_first_error_if_all_fail(self) -> None:
+        async def request() -> str:
+            number = request_mock.call_count
+            await asyncio.sleep(0.05 if number == 1 else 0)
+            msg = f"request {number - 1} failed"
+            raise ConnectionError(msg)
+
+        request_mock = MagicMock(side_effect=request)
+        with self.assertRaisesRegex(ConnectionError, "request 0 failed"):
+            await hedge_request(
+                request_mock, HedgingPolicy(initial_delay=0.01), LatencyTracker()
+            )
+
+    async def test_cancellation_cancels_requests(self) -> None:
+        request, finished = self._create_request(5, 5)
+        task = asyncio.ensure_future(
+            hedge_request(request, HedgingPolicy(initial_delay=0.01), LatencyTracker())
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(finished, [])
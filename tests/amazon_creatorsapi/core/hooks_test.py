@@ -0,0 +1,340 @@
+"""Unit tests for the event hooks."""
+
+from __future__ import annotations
+
+import time
+import unittest
+import warnings
+from unittest.mock import MagicMock, patch
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.hooks import (
+    EventHooks,
+    RequestEvent,
+    async_call_with_hooks,
+    call_with_hooks,
+    get_current_event,
+    measure,
+    use_event,
+)
+from amazon_creatorsapi.core.retry import RetryPolicy
+from amazon_creatorsapi.errors import TooManyRequestsError
+from amazon_creatorsapi.testing import StubServer, SyntheticCatalog
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+    from amazon_paapi.errors import ItemsNotFound
+
+CREDENTIALS = {"key": "secret"}
+
+
+class RecordingHooks(EventHooks):
+    """Hooks recording the name of the events and a copy of their timings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, int, dict[str, float]]] = []
+        self.events: list[RequestEvent] = []
+        for name in (
+            "on_request_start",
+            "on_throttle_wait",
+            "on_response",
+            "on_retry",
+            "on_error",
+        ):
+            self.add(name, self._recorder(name))
+
+    def _recorder(self, name: str) -> MagicMock:
+        def record(event: RequestEvent) -> None:
+            self.calls.append((name, event.attempt, dict(event.timings)))
+            if all(event is not known for known in self.events):
+                self.events.append(event)
+
+        return MagicMock(side_effect=record)
+
+    @property
+    def names(self) -> list[str]:
+        return [name for name, _, _ in self.calls]
+
+
+class TestEventHooks(unittest.TestCase):
+    def test_accepts_hooks_and_lists_of_hooks(self) -> None:
+        first, second = MagicMock(), MagicMock()
+        hooks = EventHooks(on_response=first, on_error=[first, second])
+        event = hooks.create_event("GetItems", "www.amazon.es")
+
+        event.succeed()
+        event.fail(ValueError("error"))
+
+        self.assertEqual(first.call_count, 2)
+        second.assert_called_once_with(event)
+        self.assertIsInstance(event.error, ValueError)
+
+    def test_bool(self) -> None:
+        hooks = EventHooks()
+        self.assertFalse(hooks)
+
+        hooks.add("on_retry", MagicMock())
+        self.assertTrue(hooks)
+
+    def test_unknown_hook(self) -> None:
+        with self.assertRaises(ValueError):
+            EventHooks().add("on_unknown", MagicMock())
+
+    def test_event_lifecycle(self) -> None:
+        on_retry = MagicMock()
+        event = EventHooks(on_retry=on_retry).create_event("GetItems", "www.amazon.es")
+        error = TooManyRequestsError("throttled")
+
+        event.start_attempt()
+        event.throttle_wait(0.5)
+        event.retry(error, 0.25)
+        on_retry.assert_called_once_with(event)
+        self.assertEqual((event.error, event.retry_delay), (error, 0.25))
+
+        event.start_attempt()
+        event.throttle_wait(0.5)
+        event.set_request_body({"itemIds": ["B000000001"]})
+        event.set_response(200, "{}")
+        event.succeed()
+
+        self.assertEqual(event.attempt, 2)
+        self.assertIsNone(event.error)
+        self.assertEqual(event.timings, {"throttle": 1.0})
+        self.assertEqual(event.request_size, len('{"itemIds": ["B000000001"]}'))
+        self.assertEqual((event.status_code, event.response_size), (200, 2))
+        self.assertIsNotNone(event.duration)
+
+    def test_measure(self) -> None:
+        event = RequestEvent("GetItems", "www.amazon.es")
+        with patch("time.perf_counter", side_effect=[1.0, 1.5, 2.0, 2.25]):
+            with measure(event, "network"):
+                pass
+            with measure(event, "network"):
+                pass
+
+        self.assertEqual(event.timings, {"network": 0.75})
+        with measure(None, "network"):
+            pass
+
+    def test_attempt_events(self) -> None:
+        event = RequestEvent("GetItems", "www.amazon.es", attempt=2)
+        event.add_timing("throttle", 1.0)
+        attempt = event.create_attempt()
+        attempt.add_timing("network", 0.5)
+        attempt.set_response(200, "{}")
+        attempt.record_cache("token", hit=True)
+
+        self.assertEqual((attempt.attempt, attempt.timings), (2, {"network": 0.5}))
+        self.assertIsNone(event.status_code)
+
+        event.merge_attempt(attempt)
+
+        self.assertEqual(event.timings, {"throttle": 1.0, "network": 0.5})
+        self.assertEqual((event.status_code, event.response_size), (200, 2))
+        self.assertEqual(event.caches, {"token": True})
+
+    def test_use_event(self) -> None:
+        event = RequestEvent("GetItems", "www.amazon.es")
+        with use_event(event):
+            self.assertIs(get_current_event(), event)
+        self.assertIsNone(get_current_event())
+
+    def test_call_with_hooks(self) -> None:
+        hooks = RecordingHooks()
+        event = hooks.create_event("GetItems", "www.amazon.es")
+
+        self.assertEqual(call_with_hooks(lambda: 1, event), 1)
+        self.assertEqual(call_with_hooks(lambda: 2, None), 2)
+        with self.assertRaises(ZeroDivisionError):
+            call_with_hooks(lambda: 1 / 0, event)
+
+        self.assertEqual(hooks.names, ["on_response", "on_error"])
+
+
+class TestAsyncCallWithHooks(unittest.IsolatedAsyncioTestCase):
+    async def test_async_call_with_hooks(self) -> None:
+        hooks = RecordingHooks()
+        event = hooks.create_event("GetItems", "www.amazon.es")
+
+        async def succeed() -> int:
+            return 1
+
+        async def fail() -> int:
+            raise ZeroDivisionError
+
+        self.assertEqual(await async_call_with_hooks(succeed, event), 1)
+        self.assertEqual(await async_call_with_hooks(succeed, None), 1)
+        with self.assertRaises(ZeroDivisionError):
+            await async_call_with_hooks(fail, event)
+
+        self.assertEqual(hooks.names, ["on_response", "on_error"])
+
+
+class TestClientHooks(unittest.TestCase):
+    """Tests for the hooks called by the sync clients."""
+
+    def setUp(self) -> None:
+        self.server = StubServer(SyntheticCatalog(100), credentials=CREDENTIALS)
+        self.hooks = RecordingHooks()
+
+    def test_paapi_phases(self) -> None:
+        amazon = AmazonApi(
+            "key", "secret", "tag", "US", throttling=0, transport=self.server
+        )
+        amazon.hooks = self.hooks
+
+        amazon.get_items(self.server.catalog.get_asins(12))
+
+        self.assertEqual(self.hooks.names, ["on_request_start", "on_response"] * 2)
+        event = self.hooks.events[0]
+        self.assertEqual(
+            (event.operation, event.marketplace), ("GetItems", "www.amazon.com")
+        )
+        # The SDK phases are only measured with hooks given to the constructor
+        self.assertEqual(set(event.timings), {"build"})
+        self.assertIsNone(event.status_code)
+
+    def test_paapi_sdk_phases(self) -> None:
+        amazon = AmazonApi(
+            "key",
+            "secret",
+            "tag",
+            "US",
+            throttling=0,
+            transport=self.server,
+            hooks=self.hooks,
+        )
+
+        amazon.search_items(keywords="camera")
+        with self.assertRaises(ItemsNotFound):
+            amazon.get_items("B000000100")
+
+        self.assertEqual(
+            self.hooks.names,
+            ["on_request_start", "on_response", "on_request_start", "on_error"],
+        )
+        search, get_items = self.hooks.events
+        self.assertEqual(search.operation, "SearchItems")
+        self.assertEqual(
+            set(search.timings), {"build", "sign", "network", "deserialize"}
+        )
+        self.assertLessEqual(sum(search.timings.values()), search.duration or 0)
+        self.assertEqual(get_items.status_code, 200)
+        self.assertGreater(get_items.request_size or 0, 0)
+        self.assertGreater(get_items.response_size or 0, 0)
+        self.assertIsInstance(get_items.error, ItemsNotFound)
+
+    def test_creators_phases(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=0,
+            transport=self.server,
+            hooks=self.hooks,
+        )
+
+        amazon.get_items(["B000000001"])
+        amazon.get_variations("B000000001")
+
+        self.assertEqual(self.hooks.names, ["on_request_start", "on_response"] * 2)
+        get_items, get_variations = self.hooks.events
+        self.assertEqual(get_variations.operation, "GetVariations")
+        self.assertEqual(
+            set(get_items.timings),
+            {"build", "serialize", "token", "network", "deserialize"},
+        )
+        self.assertEqual(get_items.status_code, 200)
+        self.assertGreater(get_items.request_size or 0, 0)
+        self.assertGreater(get_items.response_size or 0, 0)
+
+    def test_throttle_and_retries(self) -> None:
+        server = StubServer(tps=0.1)
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=0.05,
+            transport=server,
+            retry_policy=RetryPolicy(max_retries=1, base_delay=0.001, budget=None),
+            hooks=self.hooks,
+        )
+
+        with self.assertRaises(TooManyRequestsError):
+            amazon.get_items(["B000000001"])
+            amazon.get_items(["B000000001"])
+
+        self.assertEqual(
+            self.hooks.names,
+            [
+                "on_request_start",
+                "on_response",
+                "on_request_start",
+                "on_throttle_wait",
+                "on_retry",
+                "on_request_start",
+                "on_throttle_wait",
+                "on_error",
+            ],
+        )
+        event = self.hooks.events[-1]
+        self.assertEqual(event.attempt, 2)
+        self.assertEqual(event.status_code, 429)
+        self.assertGreater(event.timings["throttle"], 0)
+
+    def test_no_hooks(self) -> None:
+        with patch("amazon_creatorsapi.api._InstrumentedApiClient") as mock_client:
+            amazon = AmazonCreatorsApi(
+                "key", "secret", "2.1", "tag", "US", transport=self.server
+            )
+        mock_client.assert_not_called()
+        self.assertIsNone(amazon._create_event("GetItems"))
+
+        amazon.hooks = EventHooks()
+        self.assertIsNone(amazon._create_event("GetItems"))
+
+
+class TestAsyncClientHooks(unittest.IsolatedAsyncioTestCase):
+    """Tests for the hooks called by the async client."""
+
+    async def test_phases(self) -> None:
+        hooks = RecordingHooks()
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0.05,
+                transport=server.async_transport(),
+                hooks=hooks,
+            ) as amazon:
+                await amazon.get_items(["B000000001", "B000000002"])
+                amazon._last_query_time = time.time()
+                await amazon.search_items(keywords="camera")
+
+        self.assertEqual(
+            hooks.names,
+            [
+                "on_request_start",
+                "on_response",
+                "on_request_start",
+                "on_throttle_wait",
+                "on_response",
+            ],
+        )
+        get_items, search = hooks.events
+        self.assertEqual(search.operation, "SearchItems")
+        self.assertEqual(set(get_items.timings), {"token", "network", "deserialize"})
+        self.assertEqual(get_items.status_code, 200)
+        self.assertGreater(get_items.request_size or 0, 0)
+        self.assertGreater(get_items.response_size or 0, 0)
+        self.assertGreater(search.timings["throttle"], 0)
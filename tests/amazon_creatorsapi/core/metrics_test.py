@@ -0,0 +1,211 @@
+"""Unit tests for the metrics registry."""
+
+from __future__ import annotations
+
+import unittest
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.hooks import EventHooks
+from amazon_creatorsapi.core.metrics import LatencyHistogram, MetricsRegistry
+from amazon_creatorsapi.core.retry import RetryPolicy
+from amazon_creatorsapi.errors import TooManyRequestsError
+from amazon_creatorsapi.testing import StubServer
+
+CREDENTIALS = {"key": "secret"}
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_empty(self) -> None:
+        histogram = LatencyHistogram()
+
+        self.assertEqual(histogram.get_quantile(0.5), 0.0)
+        self.assertEqual(histogram.to_dict()["count"], 0)
+
+    def test_quantiles(self) -> None:
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        for quantile in (0.5, 0.9, 0.99):
+            with self.subTest(quantile=quantile):
+                self.assertAlmostEqual(
+                    histogram.get_quantile(quantile), quantile, delta=quantile * 0.032
+                )
+        self.assertEqual(histogram.get_quantile(1), 1.0)
+        summary = histogram.to_dict()
+        self.assertEqual((summary["count"], summary["min"]), (1000, 0.001))
+        self.assertAlmostEqual(summary["sum"] or 0, 500.5)
+        self.assertEqual(
+            set(summary), {"count", "sum", "min", "max", "p50", "p90", "p99"}
+        )
+
+    def test_fixed_memory(self) -> None:
+        histogram = LatencyHistogram(max_seconds=1)
+        buckets = len(histogram._counts)
+
+        histogram.record(-1)
+        histogram.record(10_000)
+
+        self.assertEqual(len(histogram._counts), buckets)
+        self.assertEqual(histogram.count, 2)
+        self.assertEqual(histogram.get_quantile(0.5), 0.0)
+        self.assertAlmostEqual(histogram.get_quantile(1), 1.0, delta=0.032)
+        self.assertEqual(histogram.max, 10_000)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.metrics = MetricsRegistry()
+        self.hooks = self.metrics.hooks
+
+    def test_records_requests(self) -> None:
+        event = self.hooks.create_event("GetItems", "www.amazon.es")
+        event.start_attempt()
+        event.set_request_body({"itemIds": ["B000000001"]})
+        event.set_response(429, "{}")
+        event.retry(TooManyRequestsError("throttled"), 0.1)
+        event.start_attempt()
+        event.throttle_wait(0.25)
+        event.add_timing("network", 0.5)
+        event.record_cache("token", hit=True)
+        event.set_request_body({"itemIds": ["B000000001"]})
+        event.set_response(200, "{}")
+        event.succeed()
+
+        event = self.hooks.create_event("GetItems", "www.amazon.es")
+        event.record_cache("token", hit=False)
+        event.fail(ValueError("error"))
+
+        snapshot = self.metrics.snapshot()
+        (series,) = snapshot["requests"]
+        self.assertEqual(
+            (series["operation"], series["marketplace"]), ("GetItems", "www.amazon.es")
+        )
+        self.assertEqual(series["requests"], 2)
+        self.assertEqual(series["errors"], 1)
+        self.assertEqual(series["attempts"], 3)
+        self.assertEqual(series["retries"], 1)
+        self.assertEqual(series["throttled"], 1)
+        self.assertEqual(series["bytes_sent"], 54)
+        self.assertEqual(series["bytes_received"], 4)
+        self.assertEqual(series["throttle_seconds"], 0.25)
+        self.assertEqual(series["phase_seconds"], {"network": 0.5})
+        self.assertEqual(series["latency"]["count"], 2)
+        self.assertEqual(
+            snapshot["caches"], {"token": {"hits": 1, "misses": 1, "hit_ratio": 0.5}}
+        )
+        self.assertEqual(snapshot["totals"]["requests"], 2)
+
+    def test_series_per_operation_and_marketplace(self) -> None:
+        for operation, marketplace in (
+            ("GetItems", "www.amazon.es"),
+            ("GetItems", "www.amazon.com"),
+            ("SearchItems", "www.amazon.es"),
+            ("GetItems", "www.amazon.es"),
+        ):
+            self.hooks.create_event(operation, marketplace).succeed()
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(
+            [
+                (series["operation"], series["marketplace"], series["requests"])
+                for series in snapshot["requests"]
+            ],
+            [
+                ("GetItems", "www.amazon.com", 1),
+                ("GetItems", "www.amazon.es", 2),
+                ("SearchItems", "www.amazon.es", 1),
+            ],
+        )
+        self.assertEqual(snapshot["totals"]["requests"], 4)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot()["requests"], [])
+
+    def test_register(self) -> None:
+        hooks = EventHooks()
+        self.metrics.register(hooks)
+
+        hooks.create_event("GetItems", "www.amazon.es").succeed()
+
+        self.assertEqual(self.metrics.snapshot()["totals"]["requests"], 1)
+
+    def test_to_prometheus(self) -> None:
+        metrics = MetricsRegistry(namespace="amazon")
+        event = metrics.hooks.create_event("GetItems", 'www."amazon".es')
+        event.add_timing("network", 0.5)
+        event.record_cache("token", hit=True)
+        event.succeed()
+
+        text = metrics.to_prometheus()
+
+        labels = 'operation="GetItems",marketplace="www.\\"amazon\\".es"'
+        self.assertIn("# TYPE amazon_requests_total counter\n", text)
+        self.assertIn(f"amazon_requests_total{{{labels}}} 1\n", text)
+        self.assertIn(
+            f'amazon_phase_seconds_total{{{labels},phase="network"}} 0.5', text
+        )
+        self.assertIn("# TYPE amazon_request_duration_seconds summary\n", text)
+        self.assertIn(
+            f'amazon_request_duration_seconds{{{labels},quantile="0.99"}}', text
+        )
+        self.assertIn(f"amazon_request_duration_seconds_count{{{labels}}} 1\n", text)
+        self.assertIn('amazon_cache_requests_total{cache="token",result="hit"} 1', text)
+        self.assertTrue(text.endswith("\n"))
+
+
+class TestClientMetrics(unittest.TestCase):
+    def test_creators_client(self) -> None:
+        metrics = MetricsRegistry()
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=0.05,
+            transport=StubServer(credentials=CREDENTIALS, tps=0.1),
+            retry_policy=RetryPolicy(max_retries=1, base_delay=0.001, budget=None),
+            hooks=metrics.hooks,
+        )
+
+        amazon.get_items(["B000000001"])
+        with self.assertRaises(TooManyRequestsError):
+            amazon.get_items(["B000000001"])
+
+        (series,) = metrics.snapshot()["requests"]
+        self.assertEqual((series["requests"], series["errors"]), (2, 1))
+        self.assertEqual((series["attempts"], series["throttled"]), (3, 2))
+        self.assertGreater(series["throttle_seconds"], 0)
+        self.assertGreater(series["bytes_sent"], 0)
+        self.assertEqual(
+            metrics.snapshot()["caches"]["token"],
+            {"hits": 1, "misses": 1, "hit_ratio": 0.5},
+        )
+
+
+class TestAsyncClientMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client(self) -> None:
+        metrics = MetricsRegistry()
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+                hooks=metrics.hooks,
+            ) as amazon:
+                await amazon.get_items(["B000000001"])
+                await amazon.search_items(keywords="camera")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(
+            [series["operation"] for series in snapshot["requests"]],
+            ["GetItems", "SearchItems"],
+        )
+        self.assertGreater(snapshot["totals"]["bytes_received"], 0)
+        self.assertEqual(snapshot["caches"]["token"]["hits"], 1)
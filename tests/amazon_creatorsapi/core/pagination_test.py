@@ -0,0 +1,246 @@
+"""Unit tests for the iteration over the pages of the paginated operations."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+import warnings
+from types import SimpleNamespace
+from unittest import mock
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.pagination import (
+    async_iter_pages,
+    count_pages,
+    iter_new_items,
+    iter_pages,
+)
+from amazon_creatorsapi.errors import InvalidArgumentError
+from amazon_creatorsapi.testing import StubServer, SyntheticCatalog
+from amazon_paapi.errors import InvalidArgument
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+
+CREDENTIALS = {"key": "secret"}
+
+
+class TestIterPages(unittest.TestCase):
+    def test_pages_in_order(self) -> None:
+        pages = iter_pages(lambda page: page, lambda _: 5, prefetch=3)
+
+        self.assertEqual(list(pages), [1, 2, 3, 4, 5])
+
+    def test_prefetch(self) -> None:
+        lock = threading.Lock()
+        in_flight = [0, 0]  # Current and maximum pages in flight
+
+        def get_page(page: int) -> int:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return page
+
+        pages = list(iter_pages(get_page, lambda _: 10, prefetch=3))
+
+        self.assertEqual(pages, list(range(1, 11)))
+        self.assertEqual(in_flight[1], 3)
+
+    def test_max_pages_and_unknown_count(self) -> None:
+        self.assertEqual(list(iter_pages(str, lambda _: 20, max_pages=3)), list("123"))
+        self.assertEqual(list(iter_pages(str, lambda _: None, max_pages=2)), list("12"))
+        self.assertEqual(list(iter_pages(str, lambda _: None)), ["1"])
+
+    def test_end_errors(self) -> None:
+        def get_page(page: int) -> int:
+            if page > 2:  # noqa: PLR2004
+                msg = "No items"
+                raise LookupError(msg)
+            return page
+
+        pages = iter_pages(
+            get_page, lambda _: None, max_pages=10, end_errors=(LookupError,)
+        )
+        self.assertEqual(list(pages), [1, 2])
+
+        with self.assertRaises(LookupError):
+            list(iter_pages(get_page, lambda _: 3, end_errors=(KeyError,)))
+
+    def test_invalid_prefetch(self) -> None:
+        get_page = mock.Mock()
+
+        for prefetch in (0, 1.5):
+            with self.assertRaises(InvalidArgumentError):
+                iter_pages(get_page, lambda _: 5, prefetch=prefetch)  # type: ignore[arg-type]
+
+        get_page.assert_not_called()
+
+    def test_count_pages(self) -> None:
+        self.assertEqual(count_pages(25, 10), 3)
+        self.assertEqual(count_pages(20.0, 10), 2)
+        self.assertIsNone(count_pages(None, 10))
+
+    def test_iter_new_items(self) -> None:
+        items = [SimpleNamespace(asin=asin) for asin in ["A", "B", "A"]]
+        seen = {"B"}
+
+        self.assertEqual(list(iter_new_items(items, seen)), [items[0]])
+        self.assertEqual(seen, {"A", "B"})
+        self.assertEqual(list(iter_new_items(None, seen)), [])
+
+
+class TestAsyncIterPages(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_and_end_errors(self) -> None:
+        async def get_page(page: int) -> int:
+            if page > 3:  # noqa: PLR2004
+                raise KeyError(page)
+            return page
+
+        pages = async_iter_pages(
+            get_page, lambda _: None, max_pages=10, end_errors=(KeyError,)
+        )
+
+        self.assertEqual([page async for page in pages], [1, 2, 3])
+
+    async def test_invalid_prefetch(self) -> None:
+        with self.assertRaises(InvalidArgumentError):
+            async_iter_pages(mock.AsyncMock(), lambda _: 5, prefetch=0)
+
+
+class TestIterSearchItems(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer(SyntheticCatalog(250), credentials=CREDENTIALS)
+
+    def test_amazon_api(self) -> None:
+        amazon = AmazonApi("key", "secret", "tag", "US", transport=self.server)
+        amazon.throttling = 0
+
+        with mock.patch.object(
+            amazon, "search_items", wraps=amazon.search_items
+        ) as search_items:
+            items = list(amazon.iter_search_items(keywords="camera"))
+
+        self.assertEqual(len(items), 25)
+        self.assertEqual(len({item.asin for item in items}), 25)
+        self.assertEqual(search_items.call_count, 3)
+
+    def test_invalid_prefetch(self) -> None:
+        amazon = AmazonApi("key", "secret", "tag", "US", transport=self.server)
+
+        with self.assertRaises(InvalidArgument):
+            next(amazon.iter_search_items(keywords="camera", prefetch=0))
+        with self.assertRaises(InvalidArgument):
+            amazon.get_all_variations("B000000001", prefetch=0)
+
+    def test_max_pages(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key", "secret", "2.1", "tag", "US", throttling=0, transport=self.server
+        )
+
+        items = list(amazon.iter_search_items(keywords="black", item_count=4))
+
+        self.assertEqual(len(items), 40)
+
+    def test_skips_duplicates(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key", "secret", "2.1", "tag", "US", throttling=0, transport=self.server
+        )
+        first_page = amazon.search_items(keywords="camera")
+        items = first_page.items or []
+        second_page = first_page.model_copy(update={"items": [*items[5:], *items[:5]]})
+
+        with mock.patch.object(
+            amazon, "search_items", side_effect=[first_page, second_page, second_page]
+        ):
+            items = list(amazon.iter_search_items(keywords="camera"))
+
+        self.assertEqual(len(items), 10)
+
+
+class TestAsyncIterSearchItems(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client(self) -> None:
+        with StubServer(SyntheticCatalog(250), credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+            ) as amazon:
+                items = [
+                    item
+                    async for item in amazon.iter_search_items(
+                        keywords="camera", prefetch=3
+                    )
+                ]
+
+        self.assertEqual(len({item.asin for item in items}), 25)
+
+
+class TestVariations(unittest.TestCase):
+    def setUp(self) -> None:
+        catalog = SyntheticCatalog(1000, variations=200)
+        self.server = StubServer(catalog, credentials=CREDENTIALS)
+        self.asins = catalog.get_variations("B000000001")
+
+    def test_amazon_api(self) -> None:
+        amazon = AmazonApi("key", "secret", "tag", "US", transport=self.server)
+        amazon.throttling = 0
+
+        with mock.patch.object(
+            amazon, "get_variations", wraps=amazon.get_variations
+        ) as get_variations:
+            result = amazon.get_all_variations("B000000001", prefetch=4)
+
+        self.assertEqual([item.asin for item in result.items], self.asins)
+        self.assertEqual(result.variation_summary.page_count, 20)
+        self.assertEqual(get_variations.call_count, 20)
+
+    def test_iter_variations(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key", "secret", "2.1", "tag", "US", throttling=0, transport=self.server
+        )
+
+        items = amazon.iter_variations(
+            "https://www.amazon.com/dp/B000000001", variation_count=8
+        )
+
+        self.assertEqual([item.asin for item in items], self.asins)
+
+    def test_get_all_variations(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key", "secret", "2.1", "tag", "US", throttling=0, transport=self.server
+        )
+
+        result = amazon.get_all_variations("B000000001")
+
+        self.assertEqual([item.asin for item in result.items or []], self.asins)
+
+
+class TestAsyncVariations(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client(self) -> None:
+        catalog = SyntheticCatalog(1000, variations=30)
+        with StubServer(catalog, credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+            ) as amazon:
+                result = await amazon.get_all_variations("B000000001", prefetch=3)
+                items = [item async for item in amazon.iter_variations("B000000001")]
+
+        asins = catalog.get_variations("B000000001")
+        self.assertEqual([item.asin for item in result.items or []], asins)
+        self.assertEqual([item.asin for item in items], asins)
@@ -0,0 +1,230 @@
+"""Unit tests for the credential pools."""
+
+from __future__ import annotations
+
+import unittest
+import warnings
+from collections import Counter
+from typing import Any
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.pool import AsyncCredentialPool, CredentialPool
+from amazon_creatorsapi.core.results import ResultList, ResultMetadata
+from amazon_creatorsapi.errors import QuotaExceededError, TooManyRequestsError
+from amazon_creatorsapi.testing import StubServer
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+    from amazon_paapi.errors import TooManyRequests
+
+CREDENTIALS = {"key": "secret"}
+
+
+def create_client(name: str, throttling: float = 1) -> MagicMock:
+    """Return a mocked client returning its name."""
+    client = MagicMock(throttling=throttling, scheduler=None)
+    client.FAILOVER_ERRORS = AmazonCreatorsApi.FAILOVER_ERRORS
+    client.get_items.return_value = name
+    return client
+
+
+class TestCredentialPool(unittest.TestCase):
+    def test_spreads_calls_by_throttling(self) -> None:
+        pool = CredentialPool(
+            [create_client("slow", throttling=1), create_client("fast", 0.5)]
+        )
+
+        calls = [pool.get_items(["B000000001"]) for _ in range(6)]
+
+        self.assertEqual(Counter(calls), {"slow": 2, "fast": 4})
+        # Smooth weighted round robin interleaves the clients
+        self.assertNotEqual(calls[:2], ["fast", "fast"])
+
+    def test_clients_without_throttling(self) -> None:
+        pool = CredentialPool(
+            [create_client("fast", throttling=0.5), create_client("unlimited", 0)]
+        )
+
+        calls = [pool.get_items([]) for _ in range(6)]
+
+        self.assertEqual(Counter(calls), {"fast": 3, "unlimited": 3})
+
+        pool = CredentialPool([create_client("first", 0), create_client("second", 0)])
+        self.assertEqual([member.weight for member in pool._members], [1.0, 1.0])
+
+    def test_custom_weights(self) -> None:
+        pool = CredentialPool(
+            [create_client("first"), create_client("second")], weights=[3, 1]
+        )
+
+        calls = [pool.get_items([]) for _ in range(4)]
+
+        self.assertEqual(Counter(calls), {"first": 3, "second": 1})
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            CredentialPool([])
+        with self.assertRaises(ValueError):
+            CredentialPool([create_client("first")], weights=[1, 2])
+
+    @patch("amazon_creatorsapi.core.pool.time.monotonic")
+    def test_fails_over_and_cools_down(self, mock_monotonic: MagicMock) -> None:
+        mock_monotonic.return_value = 100.0
+        first, second = create_client("first"), create_client("second")
+        first.get_items.side_effect = TooManyRequestsError("Too many requests")
+        pool = CredentialPool([first, second], cooldown=10)
+
+        self.assertEqual(pool.get_items([]), "second")
+        self.assertEqual(pool.get_available_clients(), [second])
+        self.assertEqual(pool.get_items([]), "second")
+        first.get_items.assert_called_once()
+
+        mock_monotonic.return_value = 110.0
+        self.assertEqual(pool.get_available_clients(), [first, second])
+
+    @patch("amazon_creatorsapi.core.pool.time.monotonic")
+    def test_uses_retry_after_of_the_error(self, mock_monotonic: MagicMock) -> None:
+        mock_monotonic.return_value = 100.0
+        first = create_client("first")
+        first.get_items.side_effect = QuotaExceededError("Quota spent", 3600)
+        pool = CredentialPool([first, create_client("second")], cooldown=10)
+
+        pool.get_items([])
+
+        mock_monotonic.return_value = 200.0
+        self.assertEqual(len(pool.get_available_clients()), 1)
+
+    def test_raises_when_every_client_fails(self) -> None:
+        first, second = create_client("first"), create_client("second")
+        first.get_items.side_effect = TooManyRequestsError("first")
+        second.get_items.side_effect = TooManyRequestsError("second")
+        pool = CredentialPool([first, second])
+
+        with self.assertRaises(TooManyRequestsError):
+            pool.get_items([])
+        self.assertEqual(pool.get_available_clients(), [])
+
+        # The client recovering first is still tried
+        first.get_items.side_effect = None
+        self.assertEqual(pool.get_items([]), "first")
+
+    def test_other_errors_are_raised(self) -> None:
+        first, second = create_client("first"), create_client("second")
+        first.get_items.side_effect = ValueError("Invalid")
+        pool = CredentialPool([first, second])
+
+        with self.assertRaises(ValueError):
+            pool.get_items([])
+        second.get_items.assert_not_called()
+
+    def test_fails_over_every_chunk_on_its_own(self) -> None:
+        asins = [f"B{i:09d}" for i in range(25)]
+        first, second = create_client("first"), create_client("second")
+
+        def get_items(item_ids: list[str], **_kwargs: Any) -> ResultList[str]:
+            if asins[10] in item_ids:
+                msg = "Too many requests"
+                raise TooManyRequestsError(msg)
+            return ResultList(item_ids)
+
+        first.get_items.side_effect = get_items
+        second.get_items.side_effect = lambda item_ids, **_kwargs: item_ids
+        pool = CredentialPool([first, second], weights=[1, 0])
+
+        items = pool.get_items(",".join(asins), timeout=10)
+
+        self.assertEqual(items, asins)
+        # The first chunk is not requested again, and the first client cools down
+        self.assertEqual(first.get_items.call_count, 2)
+        self.assertEqual(
+            second.get_items.call_args_list,
+            [call(asins[10:20], timeout=ANY), call(asins[20:], timeout=ANY)],
+        )
+
+    def test_fails_over_the_errors_of_partial_results(self) -> None:
+        first, second = create_client("first"), create_client("second")
+        metadata = ResultMetadata()
+        metadata.add_chunk(["B000000001"]).error = TooManyRequestsError("429")
+        first.get_items.return_value = ResultList([], metadata)
+        pool = CredentialPool([first, second])
+
+        self.assertEqual(pool.get_items(["B000000001"], partial_results=True), "second")
+        self.assertEqual(pool.get_available_clients(), [second])
+
+        # Without other clients, the partial results are returned
+        results = CredentialPool([first]).get_items(["B000000001"])
+        self.assertIs(results, first.get_items.return_value)
+
+    def test_paapi_clients(self) -> None:
+        limited = AmazonApi(
+            "key",
+            "secret",
+            "tag",
+            "US",
+            throttling=0,
+            transport=StubServer(credentials=CREDENTIALS, tps=0.001),
+        )
+        other = AmazonApi(
+            "key",
+            "secret",
+            "tag",
+            "US",
+            throttling=0,
+            transport=StubServer(credentials=CREDENTIALS),
+        )
+        pool = CredentialPool([limited, other])
+
+        for _ in range(4):
+            pool.get_items(["B000000001"])
+
+        self.assertEqual(pool.get_available_clients(), [other])
+        self.assertIn(TooManyRequests, AmazonApi.FAILOVER_ERRORS)
+
+
+class TestAsyncCredentialPool(unittest.IsolatedAsyncioTestCase):
+    async def test_fails_over(self) -> None:
+        first, second = create_client("first"), create_client("second")
+        first.get_items = AsyncMock(side_effect=TooManyRequestsError("first"))
+        second.get_items = AsyncMock(return_value="second")
+
+        pool = AsyncCredentialPool([first, second])
+
+        self.assertEqual(await pool.get_items([]), "second")
+        self.assertEqual(await pool.get_items([]), "second")
+        first.get_items.assert_awaited_once()
+
+    async def test_fails_over_every_chunk_on_its_own(self) -> None:
+        asins = [f"B{i:09d}" for i in range(15)]
+        first, second = create_client("first"), create_client("second")
+        first.get_items = AsyncMock(
+            side_effect=[ResultList(asins[:10]), TooManyRequestsError("429")]
+        )
+        second.get_items = AsyncMock(side_effect=lambda item_ids: item_ids)
+        pool = AsyncCredentialPool([first, second], weights=[1, 0])
+
+        items = await pool.get_items(asins)
+
+        self.assertEqual(items, asins)
+        second.get_items.assert_awaited_once_with(asins[10:])
+
+    async def test_context_manager(self) -> None:
+        with StubServer(credentials=CREDENTIALS) as server:
+            clients = [
+                AsyncAmazonCreatorsApi(
+                    "key",
+                    "secret",
+                    "3.1",
+                    "tag",
+                    "US",
+                    throttling=0,
+                    transport=server.async_transport(),
+                )
+                for _ in range(2)
+            ]
+            async with AsyncCredentialPool(clients) as pool:
+                items = await pool.get_items(["B000000001"])
+
+        self.assertEqual(items[0].asin, "B000000001")
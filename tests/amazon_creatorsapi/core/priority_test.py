@@ -0,0 +1,32 @@
+"""Unit tests for the priority of the requests."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from amazon_creatorsapi.core.priority import Priority, get_priority, use_priority
+
+
+class TestPriority(unittest.TestCase):
+    def test_default_priority(self) -> None:
+        self.assertIs(get_priority(), Priority.NORMAL)
+
+    def test_use_priority(self) -> None:
+        with use_priority("low"):
+            self.assertIs(get_priority(), Priority.LOW)
+            with use_priority(Priority.HIGH):
+                self.assertIs(get_priority(), Priority.HIGH)
+            self.assertIs(get_priority(), Priority.LOW)
+        self.assertIs(get_priority(), Priority.NORMAL)
+
+    def test_invalid_priority(self) -> None:
+        with self.assertRaises(ValueError), use_priority("urgent"):
+            pass
+
+    def test_priority_reaches_tasks(self) -> None:
+        async def main() -> Priority:
+            with use_priority(Priority.LOW):
+                return await asyncio.create_task(asyncio.sleep(0, get_priority()))
+
+        self.assertIs(asyncio.run(main()), Priority.LOW)
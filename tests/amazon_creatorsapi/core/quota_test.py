@@ -0,0 +1,253 @@
+"""Unit tests for the daily quota tracker."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import unittest
+import warnings
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+)
+from amazon_creatorsapi.core.priority import Priority, use_priority
+from amazon_creatorsapi.core.quota import QuotaTracker
+from amazon_creatorsapi.errors import (
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
+    QuotaExceededError,
+)
+from amazon_creatorsapi.testing import StubServer
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+    from amazon_paapi.errors import QuotaExceeded
+
+CREDENTIALS = {"key": "secret"}
+
+
+class TestQuotaTracker(unittest.TestCase):
+    def test_reserved_share(self) -> None:
+        quota = QuotaTracker(10, reserved_share=0.2)
+
+        for _ in range(8):
+            self.assertEqual(quota.reserve(Priority.LOW), 0)
+        self.assertGreater(quota.reserve(Priority.NORMAL), 0)
+        self.assertEqual(quota.get_remaining(Priority.LOW), 0)
+        self.assertEqual(quota.get_remaining(Priority.HIGH), 2)
+
+        self.assertEqual(quota.reserve(Priority.HIGH), 0)
+        self.assertEqual(quota.reserve("high"), 0)
+        self.assertGreater(quota.reserve(Priority.HIGH), 0)
+        self.assertEqual(quota.get_used(), 10)
+
+    def test_uses_the_priority_of_the_context(self) -> None:
+        quota = QuotaTracker(10, reserved_share=0.5)
+
+        self.assertEqual(quota.get_limit(), 5)
+        with use_priority(Priority.HIGH):
+            self.assertEqual(quota.get_limit(), 10)
+
+    def test_invalid_reserved_share(self) -> None:
+        with self.assertRaises(ValueError):
+            QuotaTracker(10, reserved_share=1.5)
+
+    @patch("amazon_creatorsapi.core.quota.time.time")
+    def test_rolling_window(self, mock_time: MagicMock) -> None:
+        quota = QuotaTracker(2, reserved_share=0, window=3600, bucket_seconds=60)
+        mock_time.return_value = 1000.0
+        quota.reserve()
+        mock_time.return_value = 1500.0
+        quota.reserve()
+
+        # The first request was made in the bucket from 960 to 1020
+        self.assertEqual(quota.reserve(), 1020 + 3600 - 1500)
+
+        mock_time.return_value = 1020.0 + 3600
+        self.assertEqual(quota.get_used(), 1)
+        self.assertEqual(quota.reserve(), 0)
+
+    @patch("amazon_creatorsapi.core.quota.time.sleep")
+    @patch("amazon_creatorsapi.core.quota.QuotaTracker.reserve")
+    def test_acquire_waits_up_to_max_wait(
+        self, mock_reserve: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        quota = QuotaTracker(10, max_wait=5)
+        mock_reserve.side_effect = [2.0, 0.0]
+
+        self.assertEqual(quota.acquire(), 0)
+        mock_sleep.assert_called_once_with(2.0)
+
+        mock_reserve.side_effect = [10.0]
+        self.assertEqual(quota.acquire(), 10.0)
+
+        mock_reserve.side_effect = [2.0]
+        self.assertEqual(quota.acquire(timeout=1), 2.0)
+        mock_sleep.assert_called_once()
+
+    def test_release(self) -> None:
+        quota = QuotaTracker(2, reserved_share=0)
+        quota.reserve()
+        quota.reserve()
+
+        quota.release()
+
+        self.assertEqual(quota.get_used(), 1)
+        self.assertEqual(quota.reserve(), 0)
+        quota.release()
+        quota.release()
+        quota.release()
+        self.assertEqual(quota.get_used(), 0)
+
+    def test_shared_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "quota.json"
+            first = QuotaTracker(3, reserved_share=0, path=path)
+            second = QuotaTracker(3, reserved_share=0, path=path)
+
+            first.reserve()
+            second.reserve()
+
+            self.assertEqual(first.get_used(), 2)
+            self.assertEqual(QuotaTracker(3, path=path).get_remaining(), 0)
+            buckets = json.loads(path.read_text(encoding="utf-8"))["buckets"]
+            self.assertEqual(sum(buckets.values()), 2)
+
+    def test_ignores_corrupted_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "quota.json"
+            path.write_text('{"buckets": {"x": 1, "1": "y"}}', encoding="utf-8")
+
+            quota = QuotaTracker(3, path=path)
+
+            self.assertEqual(quota.get_used(), 0)
+            self.assertEqual(quota.reserve(), 0)
+
+
+class TestClientQuota(unittest.TestCase):
+    def test_paapi(self) -> None:
+        quota = QuotaTracker(2, reserved_share=0.5)
+        amazon = AmazonApi(
+            "key",
+            "secret",
+            "tag",
+            "US",
+            throttling=0,
+            transport=StubServer(credentials=CREDENTIALS),
+            quota=quota,
+        )
+
+        amazon.get_items(["B000000001"])
+        with self.assertRaises(QuotaExceeded) as context:
+            amazon.get_items(["B000000001"])
+        self.assertGreater(context.exception.retry_after, 0)
+
+        with use_priority(Priority.HIGH):
+            amazon.get_items(["B000000001"])
+        self.assertEqual(quota.get_used(), 2)
+
+    def test_creators(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=0,
+            transport=StubServer(credentials=CREDENTIALS),
+            quota=QuotaTracker(1, reserved_share=0),
+        )
+
+        amazon.get_items(["B000000001"])
+        with self.assertRaises(QuotaExceededError):
+            amazon.get_items(["B000000001"])
+
+    def test_requests_not_sent_do_not_count(self) -> None:
+        quota = QuotaTracker(5)
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=10,
+            transport=StubServer(credentials=CREDENTIALS),
+            quota=quota,
+        )
+        amazon.get_items(["B000000001"])
+
+        with self.assertRaises(DeadlineExceededError):
+            amazon.get_items(["B000000001"], timeout=1)
+
+        self.assertEqual(quota.get_used(), 1)
+
+
+class TestAsyncQuotaTracker(unittest.IsolatedAsyncioTestCase):
+    async def test_file_is_locked_outside_the_loop(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            quota = QuotaTracker(3, reserved_share=0, path=Path(temp_dir) / "q.json")
+            threads = []
+            reserve = quota.reserve
+
+            def record_thread(priority: Priority | None = None) -> float:
+                threads.append(threading.get_ident())
+                return reserve(priority)
+
+            with patch.object(quota, "reserve", side_effect=record_thread):
+                self.assertEqual(await quota.async_acquire(), 0)
+
+            self.assertNotIn(threading.get_ident(), threads)
+            self.assertEqual(quota.get_used(), 1)
+
+
+class TestAsyncClientQuota(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client(self) -> None:
+        quota = QuotaTracker(2, reserved_share=0.5)
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+                quota=quota,
+            ) as amazon:
+                with use_priority(Priority.LOW):
+                    await amazon.get_items(["B000000001"])
+                    with self.assertRaises(QuotaExceededError):
+                        await amazon.get_items(["B000000001"])
+                with use_priority(Priority.HIGH):
+                    await amazon.get_items(["B000000001"])
+
+        self.assertEqual(quota.get_used(), 2)
+
+    async def test_requests_not_sent_do_not_count(self) -> None:
+        quota = QuotaTracker(5)
+        breakers = CircuitBreakerRegistry(CircuitBreakerPolicy(min_requests=1))
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+                quota=quota,
+                circuit_breakers=breakers,
+            ) as amazon:
+                breaker = breakers.get(amazon.marketplace)
+                with patch.object(breaker, "allow_request", side_effect=[True, False]):
+                    with self.assertRaises(CircuitBreakerOpenError):
+                        await amazon.get_items(["B000000001"])
+
+        self.assertEqual(quota.get_used(), 0)
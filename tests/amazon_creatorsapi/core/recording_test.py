@@ -0,0 +1,148 @@
+"""Unit tests for recording and replaying transports."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from amazon_creatorsapi.core.recording import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    Exchange,
+    NoRecordedResponseError,
+    RecordingTransport,
+    ReplayTransport,
+    load_exchanges,
+)
+from amazon_creatorsapi.core.transport import TransportRequest, TransportResponse
+
+TOKEN_URL = "https://api.amazon.com/auth/o2/token"
+ITEMS_URL = "https://creatorsapi.amazon/catalog/v1/getItems"
+
+
+def _token_request(secret: str = "secret") -> TransportRequest:  # noqa: S107
+    body = json.dumps({"client_id": "id", "client_secret": secret})
+    return TransportRequest("POST", TOKEN_URL, body=body.encode())
+
+
+def _items_request(asin: str = "B0DLFMFBJW") -> TransportRequest:
+    return TransportRequest(
+        "POST",
+        ITEMS_URL,
+        headers={"Authorization": "Bearer token", "x-marketplace": "www.amazon.es"},
+        body=json.dumps({"itemIds": [asin]}).encode(),
+    )
+
+
+class RecordingTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "traffic.jsonl"
+
+
+class TestRecordingTransport(RecordingTestCase):
+    def test_records_redacted_exchanges(self) -> None:
+        transport = MagicMock()
+        transport.send.side_effect = [
+            TransportResponse(200, body=b'{"access_token": "token", "expires_in": 1}'),
+            TransportResponse(200, {"X-Amzn-RequestId": "1"}, b'{"itemsResult": {}}'),
+        ]
+        recorder = RecordingTransport(transport, self.path)
+
+        response = recorder.send(_token_request())
+        recorder.send(_items_request())
+
+        self.assertEqual(response.body, b'{"access_token": "token", "expires_in": 1}')
+        token_exchange, items_exchange = load_exchanges(self.path)
+        self.assertNotIn(b'"secret"', token_exchange.request.body)
+        self.assertNotIn(b'"token"', token_exchange.response.body)
+        self.assertEqual(
+            items_exchange.request.headers, {"x-marketplace": "www.amazon.es"}
+        )
+        self.assertEqual(items_exchange.response.headers, {"X-Amzn-RequestId": "1"})
+        self.assertGreaterEqual(items_exchange.latency, 0)
+
+    def test_redacts_form_bodies(self) -> None:
+        transport = MagicMock()
+        transport.send.return_value = TransportResponse(200)
+        recorder = RecordingTransport(transport, self.path)
+
+        recorder.send(
+            TransportRequest("POST", TOKEN_URL, body=b"client_id=id&client_secret=s")
+        )
+
+        (exchange,) = load_exchanges(self.path)
+        self.assertEqual(exchange.request.body, b"client_id=id&client_secret=REDACTED")
+
+
+class TestReplayTransport(RecordingTestCase):
+    def _record(self, *responses: bytes) -> None:
+        transport = MagicMock()
+        transport.send.side_effect = [TransportResponse(200, body=r) for r in responses]
+        recorder = RecordingTransport(transport, self.path)
+        for _ in responses:
+            recorder.send(_items_request())
+
+    @patch("amazon_creatorsapi.core.recording.time.sleep")
+    def test_replays_in_order(self, mock_sleep: MagicMock) -> None:
+        self._record(b"first", b"second")
+        replay = ReplayTransport(self.path, latency=0.25)
+
+        bodies = [replay.send(_items_request()).body for _ in range(3)]
+
+        self.assertEqual(bodies, [b"first", b"second", b"first"])
+        mock_sleep.assert_called_with(0.25)
+
+    @patch("amazon_creatorsapi.core.recording.time.sleep")
+    def test_matches_ignoring_credentials(self, _mock_sleep: MagicMock) -> None:
+        exchange = Exchange(_token_request(), TransportResponse(200, body=b"ok"), 0)
+        replay = ReplayTransport([exchange])
+
+        response = replay.send(_token_request(secret="other"))
+
+        self.assertEqual(response.body, b"ok")
+
+    @patch("amazon_creatorsapi.core.recording.time.sleep")
+    def test_latency(self, mock_sleep: MagicMock) -> None:
+        exchange = Exchange(_items_request(), TransportResponse(200), 0.5)
+
+        ReplayTransport([exchange]).send(_items_request())
+        mock_sleep.assert_called_with(0.5)
+
+        ReplayTransport([exchange], latency=lambda _: 2).send(_items_request())
+        mock_sleep.assert_called_with(2)
+
+    def test_unknown_request(self) -> None:
+        replay = ReplayTransport(
+            [Exchange(_items_request(), TransportResponse(200), 0)], latency=0
+        )
+
+        with self.assertRaises(NoRecordedResponseError):
+            replay.send(_items_request("B01N5IB20Q"))
+        with self.assertRaises(NoRecordedResponseError):
+            replay.send(TransportRequest("GET", ITEMS_URL))
+
+    def test_without_matching_body(self) -> None:
+        exchange = Exchange(_items_request(), TransportResponse(200, body=b"ok"), 0)
+        replay = ReplayTransport([exchange], latency=0, match_body=False)
+
+        self.assertEqual(replay.send(_items_request("B01N5IB20Q")).body, b"ok")
+
+
+class TestAsyncTransports(unittest.IsolatedAsyncioTestCase):
+    async def test_record_and_replay(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "traffic.jsonl"
+            transport = MagicMock()
+            transport.send = AsyncMock(return_value=TransportResponse(200, body=b"ok"))
+
+            await AsyncRecordingTransport(transport, path).send(_items_request())
+            response = await AsyncReplayTransport(path, latency=0).send(
+                _items_request()
+            )
+
+        self.assertEqual(response.body, b"ok")
@@ -0,0 +1,213 @@
+"""Unit tests for the retry policy and retry budget."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import urllib3
+
+from amazon_creatorsapi.core.deadline import Deadline
+from amazon_creatorsapi.core.results import ResultList, ResultMetadata
+from amazon_creatorsapi.core.retry import (
+    RetryBudget,
+    RetryPolicy,
+    async_call_with_retry,
+    call_with_retry,
+    get_status_code,
+)
+from amazon_creatorsapi.errors import ItemsNotFoundError, TooManyRequestsError
+
+
+class StatusError(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_starts_full(self) -> None:
+        budget = RetryBudget(max_tokens=2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_deposit_earns_retries_by_ratio(self) -> None:
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        budget.withdraw()
+        budget.withdraw()
+
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+    def test_deposit_is_capped(self) -> None:
+        budget = RetryBudget(ratio=1, max_tokens=3)
+        for _ in range(10):
+            budget.deposit()
+        self.assertEqual(budget.tokens, 3)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_retryable_statuses(self) -> None:
+        policy = RetryPolicy()
+        for status in (429, 500, 502, 503, 504):
+            self.assertTrue(policy.is_retryable(StatusError(status)))
+        for status in (400, 401, 404):
+            self.assertFalse(policy.is_retryable(StatusError(status)))
+
+    def test_custom_retry_statuses(self) -> None:
+        policy = RetryPolicy(retry_statuses={503})
+        self.assertTrue(policy.is_retryable(StatusError(503)))
+        self.assertFalse(policy.is_retryable(StatusError(429)))
+
+    def test_status_from_chained_error(self) -> None:
+        error = TooManyRequestsError("Rate limit exceeded")
+        error.__context__ = StatusError(429)
+        self.assertEqual(get_status_code(error), 429)
+        self.assertTrue(RetryPolicy().is_retryable(error))
+
+    def test_status_code_attribute(self) -> None:
+        error = TooManyRequestsError("Rate limit exceeded")
+        error.status_code = 429
+        self.assertEqual(get_status_code(error), 429)
+
+    def test_retryable_exceptions(self) -> None:
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable(ConnectionResetError()))
+        self.assertTrue(policy.is_retryable(urllib3.exceptions.ProtocolError()))
+        self.assertFalse(policy.is_retryable(ItemsNotFoundError()))
+        self.assertFalse(RetryPolicy(retry_exceptions=()).is_retryable(OSError()))
+
+    def test_with_exceptions_shares_budget(self) -> None:
+        policy = RetryPolicy()
+        extended = policy.with_exceptions(ValueError)
+        self.assertTrue(extended.is_retryable(ValueError()))
+        self.assertFalse(policy.is_retryable(ValueError()))
+        self.assertIs(extended.budget, policy.budget)
+
+    def test_delay_uses_full_jitter(self) -> None:
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        with patch("amazon_creatorsapi.core.retry.random.uniform") as mock_uniform:
+            mock_uniform.side_effect = lambda _low, high: high
+            self.assertEqual(policy.get_delay(1), 1)
+            self.assertEqual(policy.get_delay(3), 4)
+            self.assertEqual(policy.get_delay(10), 5)
+        mock_uniform.assert_called_with(0, 5)
+
+    def test_should_retry_limits_retries(self) -> None:
+        policy = RetryPolicy(max_retries=2, budget=None)
+        self.assertTrue(policy.should_retry(StatusError(503), 2))
+        self.assertFalse(policy.should_retry(StatusError(503), 3))
+
+    def test_should_retry_consumes_budget(self) -> None:
+        policy = RetryPolicy(budget=RetryBudget(max_tokens=1))
+        self.assertTrue(policy.should_retry(StatusError(503), 1))
+        self.assertFalse(policy.should_retry(StatusError(503), 1))
+
+    def test_should_retry_respects_deadline(self) -> None:
+        policy = RetryPolicy(budget=None)
+        deadline = Deadline(1)
+        self.assertTrue(policy.should_retry(StatusError(503), 1, 0.5, deadline))
+        self.assertFalse(policy.should_retry(StatusError(503), 1, 2, deadline))
+
+
+@patch("amazon_creatorsapi.core.retry.time.sleep")
+class TestCallWithRetry(unittest.TestCase):
+    def test_without_policy_calls_once(self, mock_sleep: MagicMock) -> None:
+        func = MagicMock(side_effect=StatusError(503))
+        with self.assertRaises(StatusError):
+            call_with_retry(func, None)
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retries_until_success(self, mock_sleep: MagicMock) -> None:
+        func = MagicMock(side_effect=[StatusError(503), OSError(), "result"])
+        on_retry = MagicMock()
+
+        result = call_with_retry(func, RetryPolicy(), on_retry)
+
+        self.assertEqual(result, "result")
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual([c.args[0] for c in on_retry.call_args_list], [1, 2])
+
+    def test_raises_after_max_retries(self, mock_sleep: MagicMock) -> None:
+        func = MagicMock(side_effect=StatusError(503))
+        with self.assertRaises(StatusError):
+            call_with_retry(func, RetryPolicy(max_retries=2))
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_does_not_retry_permanent_errors(self, mock_sleep: MagicMock) -> None:
+        func = MagicMock(side_effect=StatusError(400))
+        with self.assertRaises(StatusError):
+            call_with_retry(func, RetryPolicy())
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_budget_caps_retries(self, mock_sleep: MagicMock) -> None:
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.1, max_tokens=2))
+        func = MagicMock(side_effect=StatusError(503))
+
+        for _ in range(5):
+            with self.assertRaises(StatusError):
+                call_with_retry(func, policy)
+
+        # 2 saved retries plus 0.1 earned per call
+        self.assertEqual(func.call_count, 5 + 2)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_does_not_retry_past_deadline(self, mock_sleep: MagicMock) -> None:
+        policy = RetryPolicy(base_delay=10, max_delay=10, budget=None)
+        func = MagicMock(side_effect=StatusError(503))
+
+        with patch("amazon_creatorsapi.core.retry.random.uniform", return_value=10):
+            with self.assertRaises(StatusError):
+                call_with_retry(func, policy, deadline=Deadline(5))
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
+@patch("amazon_creatorsapi.core.retry.asyncio.sleep", new_callable=AsyncMock)
+class TestAsyncCallWithRetry(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_until_success(self, mock_sleep: AsyncMock) -> None:
+        func = AsyncMock(side_effect=[StatusError(429), "result"])
+
+        result = await async_call_with_retry(func, RetryPolicy())
+
+        self.assertEqual(result, "result")
+        self.assertEqual(func.await_count, 2)
+        mock_sleep.assert_awaited_once()
+
+    async def test_without_policy_calls_once(self, mock_sleep: AsyncMock) -> None:
+        func = AsyncMock(side_effect=StatusError(429))
+        with self.assertRaises(StatusError):
+            await async_call_with_retry(func, None)
+        func.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+
+class TestResultList(unittest.TestCase):
+    def test_behaves_like_a_list(self) -> None:
+        result = ResultList([1, 2, 3])
+        self.assertEqual(result, [1, 2, 3])
+        self.assertEqual(result.metadata.requests, 0)
+
+    def test_metadata_counts_requests_and_retries(self) -> None:
+        metadata = ResultMetadata()
+        metadata.add_chunk(["A"]).retries = 2
+        metadata.add_chunk(["B"])
+
+        self.assertEqual(metadata.retries, 2)
+        self.assertEqual(metadata.requests, 4)
+
+    def test_metadata_reports_failed_chunks(self) -> None:
+        metadata = ResultMetadata()
+        metadata.add_chunk(["A"])
+        failed = metadata.add_chunk(["B"])
+        failed.error = TooManyRequestsError("Rate limit exceeded")
+
+        self.assertEqual(metadata.failed_chunks, [failed])
@@ -0,0 +1,171 @@
+"""Unit tests for the priority request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+import warnings
+
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.priority import Priority, use_priority
+from amazon_creatorsapi.core.scheduler import RequestScheduler
+from amazon_creatorsapi.errors import DeadlineExceededError
+from amazon_creatorsapi.testing import StubServer
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+    from amazon_paapi.errors import DeadlineExceeded
+
+CREDENTIALS = {"key": "secret"}
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    async def acquire_all(
+        self, scheduler: RequestScheduler, priorities: list[Priority]
+    ) -> list[Priority]:
+        """Queue requests behind a sent one, returning the order they get slots."""
+        order: list[Priority] = []
+
+        async def acquire(priority: Priority) -> None:
+            await scheduler.async_acquire(priority)
+            order.append(priority)
+
+        await scheduler.async_acquire(Priority.LOW)
+        await asyncio.gather(*(acquire(priority) for priority in priorities))
+        return order
+
+    async def test_high_priority_jumps_the_queue(self) -> None:
+        scheduler = RequestScheduler(throttling=0.01)
+
+        order = await self.acquire_all(
+            scheduler, [Priority.LOW] * 5 + [Priority.NORMAL, Priority.HIGH]
+        )
+
+        self.assertEqual(order, [Priority.HIGH, Priority.NORMAL] + [Priority.LOW] * 5)
+        self.assertEqual(scheduler.queue_size, 0)
+
+    async def test_weighted_fair_queuing(self) -> None:
+        scheduler = RequestScheduler(throttling=0.005, weights={"normal": 2, "low": 1})
+
+        order = await self.acquire_all(
+            scheduler, [Priority.LOW] * 4 + [Priority.NORMAL] * 4
+        )
+
+        # Low priority requests keep getting a share of the slots
+        self.assertEqual(
+            [priority.value for priority in order[:6]],
+            ["normal", "low", "normal", "normal", "low", "normal"],
+        )
+
+    async def test_requests_are_spaced(self) -> None:
+        scheduler = RequestScheduler(throttling=0.02)
+        start = time.monotonic()
+
+        await asyncio.gather(*(scheduler.async_acquire() for _ in range(3)))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    async def test_timeout(self) -> None:
+        scheduler = RequestScheduler(throttling=10)
+        await scheduler.async_acquire()
+
+        self.assertFalse(await scheduler.async_acquire(timeout=0.01))
+        self.assertEqual(scheduler.queue_size, 0)
+
+    async def test_cancelled_requests_leave_the_queue(self) -> None:
+        scheduler = RequestScheduler(throttling=0.05)
+        await scheduler.async_acquire()
+        task = asyncio.ensure_future(scheduler.async_acquire(Priority.HIGH))
+        waiting = asyncio.ensure_future(scheduler.async_acquire(Priority.LOW))
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertTrue(await waiting)
+        self.assertEqual(scheduler.queue_size, 0)
+
+    def test_threads(self) -> None:
+        scheduler = RequestScheduler(throttling=0.02)
+        scheduler.acquire()
+        order: list[str] = []
+
+        def acquire(priority: Priority) -> None:
+            scheduler.acquire(priority)
+            order.append(priority.value)
+
+        threads = [
+            threading.Thread(target=acquire, args=(priority,))
+            for priority in (Priority.LOW, Priority.LOW, Priority.HIGH)
+        ]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.002)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, ["high", "low", "low"])
+        self.assertFalse(scheduler.acquire(timeout=0))
+        self.assertEqual(scheduler.queue_size, 0)
+
+    def test_invalid_weights(self) -> None:
+        with self.assertRaises(ValueError):
+            RequestScheduler(weights={Priority.LOW: 0})
+
+
+class TestClientScheduler(unittest.TestCase):
+    def test_paapi_shares_the_scheduler(self) -> None:
+        scheduler = RequestScheduler(throttling=0.05)
+        server = StubServer(credentials=CREDENTIALS)
+        clients = [
+            AmazonApi(
+                "key", "secret", "tag", country, transport=server, scheduler=scheduler
+            )
+            for country in ("US", "ES")
+        ]
+
+        start = time.monotonic()
+        for amazon in clients:
+            amazon.get_items(["B000000001"])
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        with self.assertRaises(DeadlineExceeded):
+            clients[0].get_items(["B000000001"], timeout=0.01)
+
+
+class TestAsyncClientScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_interactive_requests_jump_the_queue(self) -> None:
+        scheduler = RequestScheduler(throttling=0.1)
+        order: list[str] = []
+
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                transport=server.async_transport(),
+                scheduler=scheduler,
+            ) as amazon:
+
+                async def get_items(priority: Priority) -> None:
+                    with use_priority(priority):
+                        await amazon.get_items(["B000000001"])
+                    order.append(priority.value)
+
+                # Warm up the client, then take the slot so all the requests queue
+                await get_items(Priority.LOW)
+                await scheduler.async_acquire(Priority.LOW)
+                await asyncio.gather(
+                    *(get_items(Priority.LOW) for _ in range(3)),
+                    get_items(Priority.HIGH),
+                )
+                with self.assertRaises(DeadlineExceededError):
+                    await amazon.get_items(["B000000001"], timeout=0.001)
+
+        self.assertEqual(order, ["low", "high", "low", "low", "low"])
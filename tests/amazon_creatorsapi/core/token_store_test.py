@@ -0,0 +1,393 @@
+"""Unit tests for OAuth2 token stores."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.aio.auth import AsyncOAuth2TokenManager
+from amazon_creatorsapi.core.token_store import FileTokenStore, MemoryTokenStore
+from creatorsapi_python_sdk.auth.oauth2_config import OAuth2Config
+from creatorsapi_python_sdk.auth.oauth2_token_manager import OAuth2TokenManager
+
+PROCESSES = 4
+REFRESH_CODE = """
+import sys
+import time
+from pathlib import Path
+
+from amazon_creatorsapi.core.token_store import FileTokenStore
+from creatorsapi_python_sdk.auth.oauth2_config import OAuth2Config
+from creatorsapi_python_sdk.auth.oauth2_token_manager import OAuth2TokenManager
+
+path, endpoint, start = sys.argv[1:]
+config = OAuth2Config("id", "secret", "2.2", endpoint)
+manager = OAuth2TokenManager(config, FileTokenStore(path))
+while not Path(start).exists():
+    time.sleep(0.01)
+print(manager.get_token())
+"""
+
+
+class TokenHandler(BaseHTTPRequestHandler):
+    """Local OAuth2 token endpoint counting the token requests."""
+
+    requests_count: ClassVar[int] = 0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        TokenHandler.requests_count += 1
+        token = f"token-{TokenHandler.requests_count}"
+        # Slow response to widen the window in which the processes race
+        time.sleep(0.1)
+        body = json.dumps({"access_token": token, "expires_in": 3600}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Silence request logging."""
+
+
+class TestMemoryTokenStore(unittest.TestCase):
+    """Tests for MemoryTokenStore."""
+
+    def setUp(self) -> None:
+        self.store = MemoryTokenStore()
+
+    def test_returns_none_when_empty(self) -> None:
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+    def test_returns_stored_token(self) -> None:
+        expires_at = time.time() + 100
+        self.store.set("id", "2.2", "token", expires_at)
+
+        self.assertEqual(self.store.get("id", "2.2"), ("token", expires_at))
+
+    def test_tokens_are_stored_per_credential_and_version(self) -> None:
+        self.store.set("id", "2.2", "token", time.time() + 100)
+
+        self.assertIsNone(self.store.get("id", "3.1"))
+        self.assertIsNone(self.store.get("other", "2.2"))
+
+    def test_ignores_expired_token(self) -> None:
+        self.store.set("id", "2.2", "token", time.time() - 1)
+
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+
+class TestFileTokenStore(unittest.TestCase):
+    """Tests for FileTokenStore."""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "tokens.json"
+        self.store = FileTokenStore(self.path)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_returns_none_when_file_does_not_exist(self) -> None:
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+    def test_returns_none_when_file_is_corrupted(self) -> None:
+        self.path.write_text("{not json", encoding="utf-8")
+
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+    def test_returns_none_when_entry_is_invalid(self) -> None:
+        self.path.write_text('{"id:2.2": {"access_token": 1}}', encoding="utf-8")
+
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+    def test_returns_none_when_file_is_not_a_dict(self) -> None:
+        self.path.write_text("[]", encoding="utf-8")
+
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+    def test_token_is_shared_between_instances(self) -> None:
+        expires_at = time.time() + 100
+        self.store.set("id", "2.2", "token", expires_at)
+
+        self.assertEqual(
+            FileTokenStore(self.path).get("id", "2.2"), ("token", expires_at)
+        )
+
+    def test_ignores_expired_token(self) -> None:
+        self.store.set("id", "2.2", "token", time.time() - 1)
+
+        self.assertIsNone(self.store.get("id", "2.2"))
+
+    def test_removes_expired_tokens_when_saving(self) -> None:
+        self.store.set("expired", "2.2", "old", time.time() - 1)
+        self.store.set("id", "2.2", "token", time.time() + 100)
+
+        self.assertNotIn("expired", self.path.read_text(encoding="utf-8"))
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX file permissions")
+    def test_file_is_only_readable_by_owner(self) -> None:
+        self.store.set("id", "2.2", "token", time.time() + 100)
+
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o600)
+
+    @patch("amazon_creatorsapi.core.files.json.dump")
+    def test_failed_write_keeps_previous_file(self, mock_dump: MagicMock) -> None:
+        expires_at = time.time() + 100
+        self.path.write_text(
+            json.dumps({"id:2.2": {"access_token": "token", "expires_at": expires_at}}),
+            encoding="utf-8",
+        )
+        mock_dump.side_effect = OSError("disk full")
+
+        with self.assertRaises(OSError):
+            self.store.set("id", "2.2", "new_token", expires_at)
+
+        self.assertEqual(self.store.get("id", "2.2"), ("token", expires_at))
+        self.assertEqual(
+            sorted(path.name for path in Path(self.temp_dir.name).iterdir()),
+            ["tokens.json", "tokens.json.lock"],
+        )
+
+    def test_concurrent_writes_keep_file_valid(self) -> None:
+        expires_at = time.time() + 100
+
+        def worker(index: int) -> None:
+            FileTokenStore(self.path).set(f"id{index}", "2.2", "token", expires_at)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index in range(16):
+            self.assertIsNotNone(self.store.get(f"id{index}", "2.2"))
+
+    def test_token_is_shared_between_processes(self) -> None:
+        expires_at = time.time() + 100
+        self.store.set("id", "2.2", "token", expires_at)
+        code = (
+            "import sys\n"
+            "from amazon_creatorsapi.core.token_store import FileTokenStore\n"
+            "print(FileTokenStore(sys.argv[1]).get('id', '2.2')[0])\n"
+        )
+
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code, str(self.path)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "token")
+
+
+class TestFileTokenStoreRefresh(unittest.TestCase):
+    """Tests for the token refreshes of several processes sharing a file."""
+
+    def setUp(self) -> None:
+        TokenHandler.requests_count = 0
+        server = ThreadingHTTPServer(("127.0.0.1", 0), TokenHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.endpoint = f"http://127.0.0.1:{server.server_address[1]}/token"
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+
+    def test_processes_refresh_the_expired_token_once(self) -> None:
+        path = self.temp_dir / "tokens.json"
+        FileTokenStore(path).set("id", "2.2", "expired", time.time() - 1)
+        start = self.temp_dir / "start"
+        processes = [
+            subprocess.Popen(  # noqa: S603
+                [sys.executable, "-c", REFRESH_CODE, str(path), self.endpoint, start],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(PROCESSES)
+        ]
+
+        start.touch()
+        tokens = {process.communicate(timeout=30)[0].strip() for process in processes}
+
+        self.assertEqual(TokenHandler.requests_count, 1)
+        self.assertEqual(tokens, {"token-1"})
+
+    def test_async_managers_refresh_the_expired_token_once(self) -> None:
+        path = self.temp_dir / "tokens.json"
+        FileTokenStore(path).set("id", "2.2", "expired", time.time() - 1)
+        managers = [
+            AsyncOAuth2TokenManager(
+                "id", "secret", "2.2", self.endpoint, FileTokenStore(path)
+            )
+            for _ in range(PROCESSES)
+        ]
+
+        async def get_tokens() -> list[str]:
+            return await asyncio.gather(*(manager.get_token() for manager in managers))
+
+        tokens = asyncio.run(get_tokens())
+
+        self.assertEqual(TokenHandler.requests_count, 1)
+        self.assertEqual(set(tokens), {"token-1"})
+
+    def test_lock_is_reentrant(self) -> None:
+        store = FileTokenStore(self.temp_dir / "tokens.json")
+
+        with store.locked():
+            store.set("id", "2.2", "token", time.time() + 100)
+            self.assertIsNotNone(store.get("id", "2.2"))
+
+
+class TestSyncTokenManagerWithStore(unittest.TestCase):
+    """Tests for the sync OAuth2 token manager using a token store."""
+
+    def setUp(self) -> None:
+        self.store = MemoryTokenStore()
+        self.config = OAuth2Config("id", "secret", "2.2", None)
+
+    @patch("creatorsapi_python_sdk.auth.oauth2_token_manager.requests.post")
+    def test_loads_stored_token_without_refreshing(self, mock_post: MagicMock) -> None:
+        self.store.set("id", "2.2", "stored_token", time.time() + 100)
+        manager = OAuth2TokenManager(self.config, self.store)
+
+        self.assertEqual(manager.get_token(), "stored_token")
+        mock_post.assert_not_called()
+
+    @patch("creatorsapi_python_sdk.auth.oauth2_token_manager.requests.post")
+    def test_saves_refreshed_token(self, mock_post: MagicMock) -> None:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {
+            "access_token": "new_token",
+            "expires_in": 3600,
+        }
+        manager = OAuth2TokenManager(self.config, self.store)
+
+        self.assertEqual(manager.get_token(), "new_token")
+
+        stored_token = self.store.get("id", "2.2")
+        self.assertIsNotNone(stored_token)
+        self.assertEqual(stored_token[0] if stored_token else None, "new_token")
+
+    @patch("creatorsapi_python_sdk.auth.oauth2_token_manager.requests.post")
+    def test_managers_share_one_token(self, mock_post: MagicMock) -> None:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"access_token": "shared"}
+
+        first = OAuth2TokenManager(self.config, self.store).get_token()
+        second = OAuth2TokenManager(self.config, self.store).get_token()
+
+        self.assertEqual(first, second)
+        mock_post.assert_called_once()
+
+
+class TestAsyncTokenManagerWithStore(unittest.IsolatedAsyncioTestCase):
+    """Tests for the async OAuth2 token manager using a token store."""
+
+    def setUp(self) -> None:
+        self.store = MemoryTokenStore()
+
+    @patch("amazon_creatorsapi.aio.auth.httpx.AsyncClient")
+    async def test_loads_stored_token_without_refreshing(
+        self, mock_client_cls: MagicMock
+    ) -> None:
+        self.store.set("id", "2.2", "stored_token", time.time() + 100)
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2", token_store=self.store)
+
+        self.assertEqual(await manager.get_token(), "stored_token")
+        self.assertTrue(manager.is_token_valid())
+        mock_client_cls.assert_not_called()
+
+    @patch.object(AsyncOAuth2TokenManager, "refresh_token")
+    async def test_refreshes_when_store_is_empty(self, mock_refresh: MagicMock) -> None:
+        mock_refresh.return_value = "new_token"
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2", token_store=self.store)
+
+        self.assertEqual(await manager.get_token(), "new_token")
+        mock_refresh.assert_called_once()
+
+    @patch("amazon_creatorsapi.aio.auth.httpx.AsyncClient")
+    async def test_saves_refreshed_token(self, mock_client_cls: MagicMock) -> None:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "new_token"}
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        mock_client.__aenter__.return_value = mock_client
+        mock_client_cls.return_value = mock_client
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2", token_store=self.store)
+
+        await manager.refresh_token()
+
+        stored_token = self.store.get("id", "2.2")
+        self.assertEqual(stored_token[0] if stored_token else None, "new_token")
+
+    async def test_without_store_returns_none(self) -> None:
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2")
+
+        self.assertIsNone(await manager.load_stored_token())
+
+    async def test_store_calls_do_not_block_the_loop(self) -> None:
+        threads = set()
+
+        class ThreadsTokenStore(MemoryTokenStore):
+            def get(self, credential_id: str, version: str) -> tuple[str, float] | None:
+                threads.add(threading.get_ident())
+                return super().get(credential_id, version)
+
+        self.store = ThreadsTokenStore()
+        self.store.set("id", "2.2", "stored_token", time.time() + 100)
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2", token_store=self.store)
+
+        self.assertEqual(await manager.get_token(), "stored_token")
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_cancellation_while_acquiring_releases_the_lock(self) -> None:
+        lock = self.store._refresh_lock
+        lock.acquire()
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2", token_store=self.store)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(manager.get_token(), 0.05)
+        # The store thread takes the lock after the caller was cancelled
+        lock.release()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if not lock.locked():
+                break
+
+        self.assertFalse(lock.locked())
+
+    async def test_close_shuts_down_the_store_thread(self) -> None:
+        self.store.set("id", "2.2", "stored_token", time.time() + 100)
+        manager = AsyncOAuth2TokenManager("id", "secret", "2.2", token_store=self.store)
+        await manager.get_token()
+        executor = manager._store_executor
+
+        async with AsyncAmazonCreatorsApi("id", "secret", "2.2", "tag", "US") as amazon:
+            amazon._token_manager = manager
+
+        self.assertIsNone(manager._store_executor)
+        self.assertTrue(executor is not None and executor._shutdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
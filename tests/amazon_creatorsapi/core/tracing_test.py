@@ -0,0 +1,185 @@
+"""Unit tests for the tracing of the API calls."""
+
+from __future__ import annotations
+
+import unittest
+import warnings
+from typing import Any
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.hooks import RequestEvent
+from amazon_creatorsapi.core.retry import RetryPolicy
+from amazon_creatorsapi.core.tracing import (
+    get_tracer,
+    trace_request,
+    trace_retry,
+    trace_token_refresh,
+)
+from amazon_creatorsapi.errors import TooManyRequestsError
+from amazon_creatorsapi.testing import StubServer, SyntheticCatalog
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from amazon_paapi import AmazonApi
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:  # pragma: no cover
+    HAS_OPENTELEMETRY = False
+else:
+    HAS_OPENTELEMETRY = True
+
+CREDENTIALS = {"key": "secret"}
+
+
+def get_spans(exporter: InMemorySpanExporter) -> list[Any]:
+    """Return the spans finished, in order."""
+    return list(exporter.get_finished_spans())
+
+
+class TestWithoutTracing(unittest.TestCase):
+    def test_no_tracer_provider(self) -> None:
+        event = RequestEvent("GetItems", "www.amazon.es")
+
+        self.assertIsNone(get_tracer(None))
+        with trace_request(None, event), trace_retry(None, event):
+            pass
+        with trace_token_refresh() as span:
+            self.assertIsNone(span)
+
+    def test_clients_without_tracing(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key", "secret", "2.1", "tag", "US", transport=StubServer()
+        )
+
+        self.assertIsNone(amazon._tracer)
+        self.assertIsNone(amazon._create_event("GetItems"))
+
+
+@unittest.skipUnless(HAS_OPENTELEMETRY, "Needs the OpenTelemetry SDK")
+class TestTracing(unittest.TestCase):
+    """Tests for the spans of the sync clients."""
+
+    def setUp(self) -> None:
+        self.exporter = InMemorySpanExporter()
+        self.provider = TracerProvider()
+        self.provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.server = StubServer(SyntheticCatalog(100), credentials=CREDENTIALS)
+
+    def get_spans_by_name(self) -> dict[str, Any]:
+        return {span.name: span for span in get_spans(self.exporter)}
+
+    def test_paapi_chunks(self) -> None:
+        amazon = AmazonApi(
+            "key",
+            "secret",
+            "tag",
+            "US",
+            throttling=0,
+            transport=self.server,
+            tracer_provider=self.provider,
+        )
+
+        amazon.get_items(self.server.catalog.get_asins(12))
+
+        spans = get_spans(self.exporter)
+        self.assertEqual(
+            [span.name for span in spans],
+            ["GetItems", "GetItems", "AmazonApi.get_items"],
+        )
+        call = spans[-1]
+        self.assertIsNone(call.parent)
+        self.assertEqual(
+            {span.parent.span_id for span in spans[:2] if span.parent},
+            {call.context.span_id},
+        )
+        self.assertEqual(
+            sorted(span.attributes["amazon.asin_count"] for span in spans[:2]), [2, 10]
+        )
+        self.assertEqual(spans[0].attributes["http.response.status_code"], 200)
+        self.assertEqual(call.attributes["amazon.marketplace"], "www.amazon.com")
+        self.assertEqual(call.attributes["amazon.operation"], "GetItems")
+        self.assertEqual(call.attributes["amazon.asin_count"], 12)
+        self.assertEqual(
+            call.attributes["amazon.response_size"],
+            sum(span.attributes["amazon.response_size"] for span in spans[:2]),
+        )
+
+    def test_creators_token_refresh_and_retries(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=0.05,
+            transport=StubServer(credentials=CREDENTIALS, tps=0.1),
+            retry_policy=RetryPolicy(max_retries=1, base_delay=0.001, budget=None),
+            tracer_provider=self.provider,
+        )
+
+        amazon.get_items(["B000000001"])
+        with self.assertRaises(TooManyRequestsError):
+            amazon.search_items(keywords="camera")
+
+        names = [span.name for span in get_spans(self.exporter)]
+        self.assertEqual(
+            names,
+            [
+                "OAuth2 token refresh",
+                "GetItems",
+                "AmazonCreatorsApi.get_items",
+                "SearchItems retry",
+                "SearchItems",
+                "AmazonCreatorsApi.search_items",
+            ],
+        )
+        spans = self.get_spans_by_name()
+        self.assertEqual(
+            spans["OAuth2 token refresh"].parent.span_id,
+            spans["GetItems"].context.span_id,
+        )
+        self.assertEqual(spans["SearchItems retry"].attributes["amazon.attempt"], 2)
+        search = spans["SearchItems"]
+        self.assertEqual(search.attributes["http.response.status_code"], 429)
+        self.assertFalse(search.status.is_ok)
+        self.assertEqual(search.events[0].name, "exception")
+        self.assertFalse(spans["AmazonCreatorsApi.search_items"].status.is_ok)
+
+
+@unittest.skipUnless(HAS_OPENTELEMETRY, "Needs the OpenTelemetry SDK")
+class TestAsyncTracing(unittest.IsolatedAsyncioTestCase):
+    """Tests for the spans of the async client."""
+
+    async def test_spans(self) -> None:
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+                tracer_provider=provider,
+            ) as amazon:
+                await amazon.get_items(["B000000001", "B000000002"])
+
+        token, request, call = get_spans(exporter)
+        self.assertEqual(
+            [token.name, request.name, call.name],
+            ["OAuth2 token refresh", "GetItems", "AsyncAmazonCreatorsApi.get_items"],
+        )
+        self.assertEqual(token.parent.span_id, request.context.span_id)
+        self.assertEqual(request.parent.span_id, call.context.span_id)
+        self.assertEqual(call.attributes["amazon.asin_count"], 2)
+        self.assertGreater(call.attributes["amazon.response_size"], 0)
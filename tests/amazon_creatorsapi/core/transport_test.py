@@ -0,0 +1,108 @@
+"""Unit tests for the pluggable transports."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+import urllib3
+
+from amazon_creatorsapi.core.transport import (
+    TransportPoolManager,
+    TransportRequest,
+    TransportResponse,
+    Urllib3Transport,
+    get_decoded_headers,
+)
+
+
+class TestUrllib3Transport(unittest.TestCase):
+    def test_send(self) -> None:
+        pool_manager = MagicMock()
+        pool_manager.request.return_value = urllib3.HTTPResponse(
+            body=b'{"ok": true}',
+            headers={"Content-Type": "application/json", "Content-Length": "12"},
+            status=200,
+            reason="OK",
+        )
+        transport = Urllib3Transport(pool_manager)
+
+        response = transport.send(
+            TransportRequest("POST", "https://example.com", body=b"{}", timeout=2)
+        )
+
+        pool_manager.request.assert_called_once_with(
+            "POST", "https://example.com", body=b"{}", headers={}, timeout=2
+        )
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.body, b'{"ok": true}')
+        self.assertEqual(response.headers, {"Content-Type": "application/json"})
+        self.assertEqual(response.reason, "OK")
+
+
+class TestTransportPoolManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = MagicMock()
+        self.transport.send.return_value = TransportResponse(
+            200, {"Content-Type": "application/json"}, b'{"ok": true}', "OK"
+        )
+        self.pool_manager = TransportPoolManager(self.transport)
+
+    def _get_request(self) -> TransportRequest:
+        request: TransportRequest = self.transport.send.call_args.args[0]
+        return request
+
+    def test_request_with_body(self) -> None:
+        response = self.pool_manager.request(
+            "post",
+            "https://example.com/path",
+            body='{"a": 1}',
+            headers={"X-Test": "1"},
+            timeout=urllib3.Timeout(total=3),
+            preload_content=False,
+        )
+
+        self.assertEqual(
+            self._get_request(),
+            TransportRequest(
+                "POST", "https://example.com/path", {"X-Test": "1"}, b'{"a": 1}', 3
+            ),
+        )
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.reason, "OK")
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        self.assertEqual(response.data, b'{"ok": true}')
+
+    def test_request_with_fields(self) -> None:
+        self.pool_manager.request("GET", "https://example.com", fields={"q": "a b"})
+        self.assertEqual(self._get_request().url, "https://example.com?q=a+b")
+
+        self.pool_manager.request(
+            "POST", "https://example.com", fields={"q": "a"}, encode_multipart=False
+        )
+        self.assertEqual(self._get_request().body, b"q=a")
+
+        with self.assertRaises(ValueError):
+            self.pool_manager.request("POST", "https://example.com", fields={"q": "a"})
+
+    def test_timeouts(self) -> None:
+        for timeout, expected in (
+            (None, None),
+            (5, 5),
+            (urllib3.Timeout(connect=1, read=4), 4),
+            (urllib3.Timeout(connect=1), 1),
+        ):
+            with self.subTest(timeout=timeout):
+                self.pool_manager.request("GET", "https://example.com", timeout=timeout)
+                self.assertEqual(self._get_request().timeout, expected)
+
+
+class TestGetDecodedHeaders(unittest.TestCase):
+    def test_removes_encoding_headers(self) -> None:
+        headers = {
+            "Content-Encoding": "gzip",
+            "Content-Length": "10",
+            "Transfer-Encoding": "chunked",
+            "X-Amzn-RequestId": "1",
+        }
+        self.assertEqual(get_decoded_headers(headers), {"X-Amzn-RequestId": "1"})
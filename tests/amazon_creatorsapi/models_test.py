@@ -0,0 +1,48 @@
+"""Unit tests for the models module."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+
+from amazon_creatorsapi import models
+
+
+def _run(code: str) -> str:
+    """Run code in a new interpreter, with no model used yet, and return its output."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestDeferredModels(unittest.TestCase):
+    def test_models_build_their_schemas_on_first_use(self) -> None:
+        output = _run(
+            "from amazon_creatorsapi.models import Item\n"
+            "print(Item.__pydantic_complete__)\n"
+            "Item.from_dict({'asin': 'B0DLFMFBJW'})\n"
+            "print(Item.__pydantic_complete__)"
+        )
+        self.assertEqual(output.split(), ["False", "True"])
+
+    def test_warm_up(self) -> None:
+        output = _run(
+            "from amazon_creatorsapi.models import Item, SearchResult, warm_up\n"
+            "warm_up('Item')\n"
+            "print(Item.__pydantic_complete__, SearchResult.__pydantic_complete__)"
+        )
+        self.assertEqual(output.split(), ["True", "False"])
+
+    def test_warm_up_all_models(self) -> None:
+        models.warm_up()
+
+        self.assertTrue(models.Item.__pydantic_complete__)
+        self.assertTrue(models.WebsiteSalesRank.__pydantic_complete__)
+
+    def test_warm_up_unknown_model(self) -> None:
+        with self.assertRaises(AttributeError):
+            models.warm_up("Unknown")
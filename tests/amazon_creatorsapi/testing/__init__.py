@@ -0,0 +1 @@
+"""Tests for amazon_creatorsapi.testing package."""
@@ -0,0 +1,88 @@
+"""Unit tests for the synthetic catalogs of the stub server."""
+
+from __future__ import annotations
+
+import unittest
+
+from amazon_creatorsapi.testing.catalog import SyntheticCatalog, to_camel_case
+
+
+class TestSyntheticCatalog(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalog = SyntheticCatalog(100, variations=4, browse_nodes=5)
+
+    def test_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            SyntheticCatalog(0)
+
+    def test_get_asins(self) -> None:
+        self.assertEqual(self.catalog.get_asins(2), ["B000000000", "B000000001"])
+        self.assertEqual(len(self.catalog.get_asins()), 100)
+        self.assertEqual(len(self.catalog.get_asins(1000)), 100)
+
+    def test_get_item(self) -> None:
+        item = self.catalog.get_item("B000000005")
+
+        assert item is not None
+        self.assertEqual(item["ASIN"], "B000000005")
+        self.assertEqual(item["ParentASIN"], "P000000001")
+        self.assertEqual(
+            item["ItemInfo"]["Title"]["DisplayValue"], "Headphones 1 White"
+        )
+        self.assertEqual(item["BrowseNodeInfo"]["BrowseNodes"][0]["Id"], "1000")
+        self.assertEqual(item, self.catalog.get_item("B000000005"))
+
+    def test_prices_depend_on_seed(self) -> None:
+        def get_price(catalog: SyntheticCatalog) -> float:
+            item = catalog.get_item("B000000000")
+            assert item is not None
+            return float(item["OffersV2"]["Listings"][0]["Price"]["Money"]["Amount"])
+
+        self.assertEqual(get_price(SyntheticCatalog()), get_price(SyntheticCatalog()))
+        self.assertNotEqual(
+            get_price(SyntheticCatalog()), get_price(SyntheticCatalog(seed=1))
+        )
+
+    def test_missing_items(self) -> None:
+        for asin in ("B000000100", "B00000000X", "P000000000", "B0001"):
+            with self.subTest(asin=asin):
+                self.assertIsNone(self.catalog.get_item(asin))
+
+    def test_search(self) -> None:
+        self.assertEqual(
+            self.catalog.search("camera black"),
+            ["B000000000", "B000000040", "B000000080"],
+        )
+        self.assertEqual(len(self.catalog.search(browse_node_id="1001")), 20)
+        self.assertEqual(
+            self.catalog.search("camera", browse_node_id="1001"),
+            ["B000000001", "B000000041", "B000000081"],
+        )
+        self.assertEqual(self.catalog.search(browse_node_id="999"), [])
+
+    def test_get_variations(self) -> None:
+        expected = ["B000000004", "B000000005", "B000000006", "B000000007"]
+        self.assertEqual(self.catalog.get_variations("B000000006"), expected)
+        self.assertEqual(self.catalog.get_variations("P000000001"), expected)
+        self.assertEqual(self.catalog.get_variations("P000000025"), [])
+        self.assertEqual(
+            SyntheticCatalog(10, variations=4).get_variations("B000000009"),
+            ["B000000008", "B000000009"],
+        )
+
+    def test_get_browse_node(self) -> None:
+        browse_node = self.catalog.get_browse_node("1001")
+
+        assert browse_node is not None
+        self.assertEqual(browse_node["DisplayName"], "Headphones")
+        self.assertIsNone(self.catalog.get_browse_node("1005"))
+        self.assertIsNone(self.catalog.get_browse_node("node"))
+
+
+class TestToCamelCase(unittest.TestCase):
+    def test_converts_nested_keys(self) -> None:
+        data = {"ASIN": "B0", "ItemInfo": {"Title": 1}, "Items": [{"DetailPageURL": 1}]}
+        self.assertEqual(
+            to_camel_case(data),
+            {"asin": "B0", "itemInfo": {"title": 1}, "items": [{"detailPageURL": 1}]},
+        )
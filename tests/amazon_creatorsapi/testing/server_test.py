@@ -0,0 +1,369 @@
+"""Unit tests for the stub server."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from amazon_creatorsapi import AmazonCreatorsApi
+from amazon_creatorsapi.aio import AsyncAmazonCreatorsApi
+from amazon_creatorsapi.core.transport import TransportRequest, TransportResponse
+from amazon_creatorsapi.errors import (
+    ItemsNotFoundError,
+    TooManyRequestsError,
+)
+from amazon_creatorsapi.testing import (
+    RedirectTransport,
+    StubServer,
+    SyntheticCatalog,
+    exponential_latency,
+    lognormal_latency,
+    uniform_latency,
+)
+from amazon_creatorsapi.testing.server import _parse_latency, main
+from amazon_paapi import AmazonApi
+from amazon_paapi.errors import ItemsNotFound, RequestError, TooManyRequests
+
+CREDENTIALS = {"key": "secret"}
+PAAPI_URL = "https://webservices.amazon.com/paapi5/"
+CREATORS_URL = "https://creatorsapi.amazon/catalog/v1/"
+
+
+def _send(
+    server: StubServer,
+    url: str,
+    body: dict[str, Any],
+    headers: dict[str, str] | None = None,
+) -> tuple[int, dict[str, Any]]:
+    response = server.send(
+        TransportRequest("POST", url, headers or {}, json.dumps(body).encode())
+    )
+    return response.status, json.loads(response.body)
+
+
+def _get_token(server: StubServer, secret: str = "secret") -> str:  # noqa: S107
+    status, data = _send(
+        server,
+        "https://api.amazon.com/auth/o2/token",
+        {"client_id": "key", "client_secret": secret},
+        {"content-type": "application/json"},
+    )
+    if status != 200:  # noqa: PLR2004
+        raise AssertionError(data)
+    return str(data["access_token"])
+
+
+class TestStubServerOperations(unittest.TestCase):
+    """Tests for the operations handled in process."""
+
+    def setUp(self) -> None:
+        self.server = StubServer(SyntheticCatalog(100))
+        self.headers = {"Authorization": f"Bearer {_get_token(self.server)}"}
+
+    def _send(self, operation: str, body: dict[str, Any]) -> tuple[int, Any]:
+        return _send(
+            self.server,
+            CREATORS_URL + operation,
+            {"partnerTag": "tag", **body},
+            self.headers,
+        )
+
+    def test_get_items(self) -> None:
+        status, data = self._send("getItems", {"itemIds": ["B000000001", "B000000100"]})
+
+        self.assertEqual(status, 200)
+        self.assertEqual(data["itemsResult"]["items"][0]["asin"], "B000000001")
+        self.assertEqual(data["errors"][0]["code"], "InvalidParameterValue")
+        self.assertEqual(self.server.stats["GetItems"], 1)
+
+    def test_items_not_found(self) -> None:
+        status, data = self._send("getItems", {"itemIds": ["B000000100"]})
+
+        self.assertEqual(status, 404)
+        self.assertEqual(data["type"], "ResourceNotFoundException")
+        self.assertEqual(data["resourceId"], "B000000100")
+
+    def test_search_items(self) -> None:
+        status, data = self._send(
+            "searchItems", {"keywords": "camera", "itemCount": 2, "itemPage": 2}
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(data["searchResult"]["totalResultCount"], 10)
+        self.assertEqual(
+            [item["asin"] for item in data["searchResult"]["items"]],
+            ["B000000002", "B000000003"],
+        )
+
+        status, data = self._send("searchItems", {"keywords": "camera", "itemPage": 2})
+        self.assertEqual(status, 404)
+        self.assertEqual(data["message"], "No results found for your request.")
+
+    def test_get_variations(self) -> None:
+        status, data = self._send(
+            "getVariations", {"asin": "B000000001", "variationCount": 2}
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(data["variationsResult"]["variationSummary"]["pageCount"], 3)
+        self.assertEqual(len(data["variationsResult"]["items"]), 2)
+
+    def test_get_browse_nodes(self) -> None:
+        status, data = self._send("getBrowseNodes", {"browseNodeIds": ["1000"]})
+
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            data["browseNodesResult"]["browseNodes"][0]["displayName"], "Cameras"
+        )
+
+    def test_invalid_requests(self) -> None:
+        for operation, body in (
+            ("getItems", {"itemIds": []}),
+            ("getItems", {"itemIds": ["B000000001"] * 11}),
+            ("searchItems", {}),
+            ("searchItems", {"keywords": "camera", "itemPage": 11}),
+            ("getVariations", {}),
+            ("getItems", {"itemIds": ["B000000001"], "partnerTag": None}),
+        ):
+            with self.subTest(operation=operation, body=body):
+                status, data = self._send(operation, body)
+                self.assertEqual(status, 400)
+                self.assertIn("message", data)
+
+    def test_unknown_operation(self) -> None:
+        status, _ = self._send("getOffers", {})
+        self.assertEqual(status, 404)
+
+    def test_invalid_token(self) -> None:
+        self.headers = {"Authorization": "Bearer token"}
+        self.server.credentials = CREDENTIALS
+
+        status, data = self._send("getItems", {"itemIds": ["B000000001"]})
+
+        self.assertEqual(status, 401)
+        self.assertEqual(data["type"], "InvalidToken")
+
+    def test_paapi_errors(self) -> None:
+        status, data = _send(self.server, PAAPI_URL + "getitems", {})
+
+        self.assertEqual(status, 401)
+        self.assertEqual(
+            data["__type"], "com.amazon.paapi5#IncompleteSignatureException"
+        )
+
+    def test_issues_tokens_with_form_bodies(self) -> None:
+        self.server.credentials = CREDENTIALS
+
+        response = self.server.send(
+            TransportRequest(
+                "POST",
+                "https://creatorsapi.auth.us-east-1.amazoncognito.com/oauth2/token",
+                {"Content-Type": "application/x-www-form-urlencoded"},
+                b"client_id=key&client_secret=secret",
+            )
+        )
+
+        self.assertEqual(response.status, 200)
+        with self.assertRaises(AssertionError):
+            _get_token(self.server, secret="wrong")
+
+    @patch("amazon_creatorsapi.testing.server.time.sleep")
+    def test_latency(self, mock_sleep: MagicMock) -> None:
+        self.server.latency = lambda: 0.25
+
+        self._send("getItems", {"itemIds": ["B000000001"]})
+
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_throttling(self) -> None:
+        server = StubServer(tps=0.1)
+        headers = {"Authorization": f"Bearer {_get_token(server)}"}
+        body = {"partnerTag": "tag", "itemIds": ["B000000001"]}
+
+        statuses = [
+            _send(server, CREATORS_URL + "getItems", body, headers)[0] for _ in range(3)
+        ]
+
+        self.assertEqual(statuses, [200, 429, 429])
+        self.assertEqual(server.stats["Throttled"], 2)
+
+
+class TestStubServerClients(unittest.TestCase):
+    """Tests for the clients sending their requests to a running server."""
+
+    server: StubServer
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = StubServer(SyntheticCatalog(100), credentials=CREDENTIALS)
+        cls.server.start()
+        cls.addClassCleanup(cls.server.stop)
+
+    def test_url(self) -> None:
+        self.assertTrue(self.server.url.startswith("http://127.0.0.1:"))
+        with self.assertRaises(RuntimeError):
+            _ = StubServer().url
+
+    def test_paapi_client(self) -> None:
+        amazon = AmazonApi(
+            "key",
+            "secret",
+            "tag",
+            "US",
+            throttling=0,
+            transport=self.server.transport(),
+        )
+
+        items = amazon.get_items(self.server.catalog.get_asins(12))
+        search_result = amazon.search_items(keywords="camera")
+        variations = amazon.get_variations("B000000001")
+        browse_nodes = amazon.get_browse_nodes(["1000"])
+
+        self.assertEqual(len(items), 12)
+        self.assertEqual(search_result.total_result_count, 10)
+        self.assertEqual(variations.variation_summary.variation_count, 5)
+        self.assertEqual(browse_nodes[0].display_name, "Cameras")
+        with self.assertRaises(ItemsNotFound):
+            amazon.get_items("B000000100")
+
+    def test_paapi_signature(self) -> None:
+        for key, secret in (("key", "wrong"), ("other", "secret")):
+            with self.subTest(key=key):
+                amazon = AmazonApi(
+                    key,
+                    secret,
+                    "tag",
+                    "US",
+                    throttling=0,
+                    transport=self.server.transport(),
+                )
+                with self.assertRaises(RequestError):
+                    amazon.get_items("B000000001")
+
+    def test_creators_client(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key",
+            "secret",
+            "2.1",
+            "tag",
+            "US",
+            throttling=0,
+            transport=self.server.transport(),
+        )
+
+        items = amazon.get_items(["B000000001"])
+        search_result = amazon.search_items(keywords="camera", item_count=20)
+
+        self.assertEqual(items[0].asin, "B000000001")
+        self.assertEqual(len(search_result.items or []), 10)
+        with self.assertRaises(ItemsNotFoundError):
+            amazon.get_items(["B000000100"])
+
+    def test_creators_credentials(self) -> None:
+        amazon = AmazonCreatorsApi(
+            "key",
+            "wrong",
+            "3.1",
+            "tag",
+            "US",
+            throttling=0,
+            transport=self.server.transport(),
+        )
+
+        with self.assertRaisesRegex(Exception, "OAuth2 token request failed"):
+            amazon.get_items(["B000000001"])
+
+
+class TestStubServerAsyncClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for the async client sending its requests to a running server."""
+
+    async def test_async_client(self) -> None:
+        with StubServer(credentials=CREDENTIALS) as server:
+            async with AsyncAmazonCreatorsApi(
+                "key",
+                "secret",
+                "3.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.async_transport(),
+            ) as amazon:
+                items = await amazon.get_items(["B000000001", "B000000002"])
+
+        self.assertEqual([item.asin for item in items], ["B000000001", "B000000002"])
+
+
+class TestStubServerThrottling(unittest.TestCase):
+    def test_clients_raise_throttling_errors(self) -> None:
+        with StubServer(tps=0.1) as server:
+            paapi = AmazonApi(
+                "key", "secret", "tag", "US", throttling=0, transport=server.transport()
+            )
+            creators = AmazonCreatorsApi(
+                "id",
+                "secret",
+                "2.1",
+                "tag",
+                "US",
+                throttling=0,
+                transport=server.transport(),
+            )
+            paapi.get_items("B000000001")
+            creators.get_items(["B000000001"])
+
+            with self.assertRaises(TooManyRequests):
+                paapi.get_items("B000000001")
+            with self.assertRaises(TooManyRequestsError):
+                creators.get_items(["B000000001"])
+
+
+class TestRedirectTransport(unittest.TestCase):
+    def test_keeps_the_path(self) -> None:
+        transport = MagicMock()
+        transport.send.return_value = TransportResponse(200)
+
+        RedirectTransport("http://127.0.0.1:8080", transport).send(
+            TransportRequest("POST", PAAPI_URL + "getitems?a=1", {"Host": "amazon"})
+        )
+
+        request = transport.send.call_args.args[0]
+        self.assertEqual(request.url, "http://127.0.0.1:8080/paapi5/getitems?a=1")
+        self.assertEqual(request.headers, {"Host": "amazon"})
+
+
+class TestLatencyDistributions(unittest.TestCase):
+    def test_distributions(self) -> None:
+        for distribution, low, high in (
+            (uniform_latency(0.1, 0.3, seed=1), 0.1, 0.3),
+            (lognormal_latency(0.2, seed=1), 0, 10),
+            (exponential_latency(0.2, seed=1), 0, 10),
+        ):
+            with self.subTest(distribution=distribution):
+                latencies = [distribution() for _ in range(100)]
+                self.assertTrue(all(low <= latency <= high for latency in latencies))
+
+    def test_parse_latency(self) -> None:
+        self.assertEqual(_parse_latency("0.5"), 0.5)
+        self.assertTrue(callable(_parse_latency("uniform:0.1,0.3")))
+        self.assertTrue(callable(_parse_latency("lognormal:0.2,0.5")))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            _parse_latency("normal:0.1")
+
+
+class TestMain(unittest.TestCase):
+    @patch("amazon_creatorsapi.testing.server.print")
+    @patch.object(StubServer, "serve_forever", side_effect=KeyboardInterrupt)
+    def test_main(self, mock_serve_forever: MagicMock, _mock_print: MagicMock) -> None:
+        with patch.object(
+            StubServer, "__init__", autospec=True, return_value=None
+        ) as mock_init:
+            result = main(["--items", "10", "--tps", "2", "--credential", "key:a:b"])
+
+        self.assertEqual(result, 0)
+        mock_serve_forever.assert_called_once()
+        self.assertEqual(mock_init.call_args.kwargs["tps"], 2)
+        self.assertEqual(mock_init.call_args.kwargs["credentials"], {"key": "a:b"})
+        self.assertEqual(mock_init.call_args.args[1].size, 10)
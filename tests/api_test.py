@@ -2,12 +2,31 @@
 
 import time
 import unittest
+from typing import Any
 from unittest import mock
 from unittest.mock import MagicMock
 
+import urllib3
+
+from amazon_creatorsapi.core.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from amazon_creatorsapi.core.deadline import Deadline
+from amazon_creatorsapi.core.recording import Exchange, ReplayTransport
+from amazon_creatorsapi.core.retry import RetryPolicy
+from amazon_creatorsapi.core.transport import TransportRequest, TransportResponse
 from amazon_paapi import AmazonApi, models
-from amazon_paapi.errors.exceptions import InvalidArgument
+from amazon_paapi.errors.exceptions import (
+    CircuitBreakerOpen,
+    DeadlineExceeded,
+    InvalidArgument,
+    TooManyRequests,
+)
 from amazon_paapi.helpers import requests
+from amazon_paapi.sdk.models.get_items_request import GetItemsRequest
+from amazon_paapi.sdk.rest import ApiException
 
 
 class TestApi(unittest.TestCase):
@@ -33,6 +52,29 @@ class TestApi(unittest.TestCase):
 
         self.assertTrue(start < int(time.time() * 10))
 
+    def test_api_uses_shared_pool_manager(self):
+        pool_manager = urllib3.PoolManager()
+        amazon_es = AmazonApi("key", "secret", "tag", "ES", pool_manager=pool_manager)
+        amazon_fr = AmazonApi("key", "secret", "tag", "FR", pool_manager=pool_manager)
+
+        self.assertIs(amazon_es.api.api_client.rest_client.pool_manager, pool_manager)
+        self.assertIs(amazon_fr.api.api_client.rest_client.pool_manager, pool_manager)
+
+    def test_api_pool_settings(self):
+        amazon = AmazonApi("key", "secret", "tag", "ES", pool_maxsize=20)
+        pool_manager = amazon.api.api_client.rest_client.pool_manager
+
+        self.assertEqual(pool_manager.connection_pool_kw["maxsize"], 20)
+
+    def test_api_request_timeout(self):
+        amazon = AmazonApi("key", "secret", "tag", "ES")
+        self.assertIsNone(amazon.request_timeout)
+
+        amazon = AmazonApi(
+            "key", "secret", "tag", "ES", connect_timeout=2, read_timeout=10
+        )
+        self.assertEqual(amazon.request_timeout, (2, 10))
+
     @mock.patch.object(requests, "get_items_response")
     def test_get_items(self, mocked_get_items_response: MagicMock):
         mocked_get_items_response.return_value = []
@@ -40,6 +82,191 @@ class TestApi(unittest.TestCase):
         response = amazon.get_items("ABCDEFGHIJ")
         self.assertTrue(isinstance(response, list))
 
+    @mock.patch.object(requests, "get_items_response")
+    def test_get_items_reports_chunks_metadata(
+        self, mocked_get_items_response: MagicMock
+    ):
+        mocked_get_items_response.return_value = []
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+        asins = [f"ASIN{i:06d}" for i in range(15)]
+        response = amazon.get_items(asins)
+
+        self.assertEqual(len(response.metadata.chunks), 2)
+        self.assertEqual(response.metadata.retries, 0)
+        self.assertEqual(
+            sorted(asin for c in response.metadata.chunks for asin in c.item_ids),
+            asins,
+        )
+
+    @mock.patch("amazon_creatorsapi.core.retry.time.sleep")
+    def test_get_items_retries_failed_chunk(self, mocked_sleep: MagicMock):
+        item = models.Item(asin="ABCDEFGHIJ")
+        response = MagicMock()
+        response.items_result.items = [item]
+        amazon = AmazonApi(
+            "key", "secret", "tag", "ES", throttling=0, retry_policy=RetryPolicy()
+        )
+        amazon.api = MagicMock()
+        amazon.api.get_items.side_effect = [ApiException(status=429), response]
+
+        result = amazon.get_items("ABCDEFGHIJ")
+
+        self.assertEqual(result, [item])
+        self.assertEqual(result.metadata.retries, 1)
+        self.assertEqual(amazon.api.get_items.call_count, 2)
+        mocked_sleep.assert_called_once()
+
+    @mock.patch.object(requests, "get_items_response")
+    def test_get_items_without_retry_policy(self, mocked_get_items_response: MagicMock):
+        mocked_get_items_response.side_effect = ConnectionResetError()
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+        with self.assertRaises(ConnectionResetError):
+            amazon.get_items("ABCDEFGHIJ")
+        mocked_get_items_response.assert_called_once()
+
+    def test_throttle_raises_if_deadline_would_pass(self):
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=10)
+        amazon._throttle()
+        with self.assertRaises(DeadlineExceeded):
+            amazon._throttle(Deadline(1))
+
+    @mock.patch.object(requests, "get_items_response")
+    def test_get_items_limits_request_timeout(
+        self, mocked_get_items_response: MagicMock
+    ):
+        mocked_get_items_response.return_value = []
+        amazon = AmazonApi(
+            "key", "secret", "tag", "ES", connect_timeout=2, read_timeout=30
+        )
+        amazon.get_items("ABCDEFGHIJ", timeout=5)
+
+        connect_timeout, read_timeout = mocked_get_items_response.call_args.args[2]
+        self.assertEqual(connect_timeout, 2)
+        self.assertLessEqual(read_timeout, 5)
+
+    @mock.patch.object(requests, "get_items_response")
+    def test_get_items_deadline_returns_partial_results(
+        self, mocked_get_items_response: MagicMock
+    ):
+        item = models.Item(asin="ASIN000000")
+        mocked_get_items_response.return_value = [item]
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0.5)
+        asins = [f"ASIN{i:06d}" for i in range(15)]
+
+        with self.assertRaises(DeadlineExceeded) as context:
+            amazon.get_items(asins, timeout=0.2)
+
+        results = context.exception.results
+        assert results is not None
+        self.assertEqual(results, [item])
+        self.assertEqual(len(results.metadata.chunks), 2)
+        mocked_get_items_response.assert_called_once()
+
+    def _mock_items_api(self, amazon: AmazonApi, invalid_asins: set[str]) -> None:
+        """Mock the SDK to fail any request including one of the invalid ASINs."""
+
+        def get_items(request: GetItemsRequest, **_kwargs: Any) -> MagicMock:
+            if invalid_asins.intersection(request.item_ids):
+                error = ApiException(status=400, reason="Bad Request")
+                error.body = '{"Errors": [{"Code": "InvalidParameterValue"}]}'
+                raise error
+            response = MagicMock()
+            response.items_result.items = [
+                models.Item(asin=asin) for asin in request.item_ids
+            ]
+            return response
+
+        amazon.api = MagicMock()
+        amazon.api.get_items.side_effect = get_items
+
+    def test_get_items_partial_results(self):
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+        self._mock_items_api(amazon, {"ASIN000003"})
+        asins = [f"ASIN{i:06d}" for i in range(15)]
+
+        result = amazon.get_items(asins, partial_results=True, include_unavailable=True)
+
+        failed_chunk = result.metadata.failed_chunks[0]
+        self.assertEqual(len(result.metadata.failed_chunks), 1)
+        self.assertIn("ASIN000003", failed_chunk.item_ids)
+        self.assertIsInstance(failed_chunk.error, InvalidArgument)
+        self.assertEqual(sorted(result.metadata.errors), sorted(failed_chunk.item_ids))
+        self.assertEqual(
+            [item.asin for item in result],
+            [asin for asin in asins if asin not in failed_chunk.item_ids],
+        )
+
+    def test_get_items_bisect_errors(self):
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+        self._mock_items_api(amazon, {"ASIN000003", "ASIN000011"})
+        asins = [f"ASIN{i:06d}" for i in range(15)]
+
+        result = amazon.get_items(asins, bisect_errors=True)
+
+        self.assertEqual(sorted(result.metadata.errors), ["ASIN000003", "ASIN000011"])
+        self.assertEqual(
+            [item.asin for item in result],
+            [asin for asin in asins if asin not in result.metadata.errors],
+        )
+        for asin in result.metadata.errors:
+            self.assertIn([asin], [c.item_ids for c in result.metadata.failed_chunks])
+
+    @mock.patch.object(requests, "get_items_response")
+    def test_get_items_bisect_only_invalid_arguments(
+        self, mocked_get_items_response: MagicMock
+    ):
+        mocked_get_items_response.side_effect = TooManyRequests("Limit reached")
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+
+        result = amazon.get_items(["ASIN000001", "ASIN000002"], bisect_errors=True)
+
+        self.assertEqual(result, [])
+        self.assertEqual(len(result.metadata.chunks), 1)
+        self.assertEqual(len(result.metadata.errors), 2)
+
+    @mock.patch.object(requests, "get_items_response")
+    def test_get_items_raises_without_partial_results(
+        self, mocked_get_items_response: MagicMock
+    ):
+        mocked_get_items_response.side_effect = InvalidArgument("Invalid ASIN")
+        amazon = AmazonApi("key", "secret", "tag", "ES", throttling=0)
+        with self.assertRaises(InvalidArgument):
+            amazon.get_items("ASIN000001")
+
+    @mock.patch.object(requests, "get_items_response")
+    def test_circuit_breaker_fails_fast(self, mocked_get_items_response: MagicMock):
+        mocked_get_items_response.side_effect = ConnectionResetError()
+        breakers = CircuitBreakerRegistry(CircuitBreakerPolicy(min_requests=2))
+        amazon = AmazonApi(
+            "key", "secret", "tag", "ES", throttling=0, circuit_breakers=breakers
+        )
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionResetError):
+                amazon.get_items("ABCDEFGHIJ")
+        with self.assertRaises(CircuitBreakerOpen):
+            amazon.get_items("ABCDEFGHIJ")
+
+        self.assertEqual(mocked_get_items_response.call_count, 2)
+        self.assertEqual(
+            breakers.states(), {"webservices.amazon.es": CircuitState.OPEN}
+        )
+
+    def test_transport(self):
+        exchange = Exchange(
+            TransportRequest("POST", "https://webservices.amazon.es/paapi5/getitems"),
+            TransportResponse(
+                200, body=b'{"ItemsResult": {"Items": [{"ASIN": "ABCDEFGHIJ"}]}}'
+            ),
+            latency=0,
+        )
+        transport = ReplayTransport([exchange], match_body=False)
+        amazon = AmazonApi("key", "secret", "tag", "ES", transport=transport)
+
+        items = amazon.get_items("ABCDEFGHIJ")
+
+        self.assertEqual([item.asin for item in items], ["ABCDEFGHIJ"])
+
     @mock.patch.object(requests, "get_search_items_response")
     def test_search_items(self, mocked_get_search_items_response: MagicMock):
         mocked_response = models.SearchResult()
@@ -0,0 +1 @@
+"""Tests for creatorsapi_python_sdk package."""
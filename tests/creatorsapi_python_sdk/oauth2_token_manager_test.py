@@ -0,0 +1,177 @@
+"""Unit and load tests for the sync OAuth2 token manager."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from unittest.mock import MagicMock, patch
+
+from creatorsapi_python_sdk.auth.oauth2_config import OAuth2Config
+from creatorsapi_python_sdk.auth.oauth2_token_manager import OAuth2TokenManager
+
+THREADS = 32
+EXPIRY_CYCLES = 3
+
+
+class StubAuthHandler(BaseHTTPRequestHandler):
+    """Local OAuth2 token endpoint that counts the token requests it serves."""
+
+    requests_count: ClassVar[int] = 0
+    counter_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        with StubAuthHandler.counter_lock:
+            StubAuthHandler.requests_count += 1
+            token = f"token-{StubAuthHandler.requests_count}"
+        # Slow response to widen the window in which threads race for a refresh
+        time.sleep(0.05)
+        body = json.dumps({"access_token": token, "expires_in": 3600}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Silence request logging."""
+
+
+class TestOAuth2TokenManagerConcurrency(unittest.TestCase):
+    """Tests for the single-refresh behavior under thread contention."""
+
+    def setUp(self) -> None:
+        StubAuthHandler.requests_count = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubAuthHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+        endpoint = f"http://127.0.0.1:{self.server.server_address[1]}/token"
+        config = OAuth2Config("id", "secret", "2.2", endpoint)
+        self.manager = OAuth2TokenManager(config)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def _get_tokens_concurrently(self) -> list[str]:
+        barrier = threading.Barrier(THREADS)
+        tokens: list[str] = []
+        tokens_lock = threading.Lock()
+
+        def worker() -> None:
+            barrier.wait()
+            token = self.manager.get_token()
+            with tokens_lock:
+                tokens.append(token)
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return tokens
+
+    def test_single_refresh_when_token_is_missing(self) -> None:
+        tokens = self._get_tokens_concurrently()
+
+        self.assertEqual(StubAuthHandler.requests_count, 1)
+        self.assertEqual(len(tokens), THREADS)
+        self.assertEqual(set(tokens), {"token-1"})
+
+    def test_single_refresh_per_expiry(self) -> None:
+        for cycle in range(1, EXPIRY_CYCLES + 1):
+            tokens = self._get_tokens_concurrently()
+
+            self.assertEqual(StubAuthHandler.requests_count, cycle)
+            self.assertEqual(set(tokens), {f"token-{cycle}"})
+
+            # Simulate the cached token reaching its expiration time
+            self.manager.expires_at = time.time() - 1
+
+    def test_valid_token_does_not_refresh(self) -> None:
+        self.manager.access_token = "cached"
+        self.manager.expires_at = time.time() + 100
+
+        tokens = self._get_tokens_concurrently()
+
+        self.assertEqual(StubAuthHandler.requests_count, 0)
+        self.assertEqual(set(tokens), {"cached"})
+
+    def test_concurrent_clear_does_not_return_none(self) -> None:
+        self.manager.access_token = "cached"
+        self.manager.expires_at = time.time() + 100
+        now = time.time
+
+        def clear_and_get_time() -> float:
+            # Another thread clears the token right after it has been checked
+            self.manager.clear_token()
+            return now()
+
+        with patch(
+            "creatorsapi_python_sdk.auth.oauth2_token_manager.time.time",
+            side_effect=clear_and_get_time,
+        ):
+            token = self.manager.get_token()
+
+        self.assertEqual(token, "cached")
+        self.assertEqual(StubAuthHandler.requests_count, 0)
+
+
+class TestOAuth2TokenManagerTimeout(unittest.TestCase):
+    """Tests for the timeout of the token requests."""
+
+    @patch("creatorsapi_python_sdk.auth.oauth2_token_manager.requests.post")
+    def test_timeout_is_passed_to_token_request(self, mock_post: MagicMock) -> None:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"access_token": "token"}
+        config = OAuth2Config("id", "secret", "2.2", "http://localhost/token")
+
+        token = OAuth2TokenManager(config).get_token(timeout=2.5)
+
+        self.assertEqual(token, "token")
+        self.assertEqual(mock_post.call_args.kwargs["timeout"], 2.5)
+
+
+class TestOAuth2TokenManagerPoolManager(unittest.TestCase):
+    """Tests for token requests sent with a pool manager."""
+
+    def test_token_request_uses_pool_manager(self) -> None:
+        pool_manager = MagicMock()
+        pool_manager.request.return_value.status = 200
+        pool_manager.request.return_value.data = b'{"access_token": "token"}'
+        config = OAuth2Config("id", "secret", "2.2", "http://localhost/token")
+
+        token = OAuth2TokenManager(config, pool_manager=pool_manager).get_token(
+            timeout=(1, 2)
+        )
+
+        self.assertEqual(token, "token")
+        args, kwargs = pool_manager.request.call_args
+        self.assertEqual(args, ("POST", "http://localhost/token"))
+        self.assertIn("client_secret=secret", kwargs["body"])
+        self.assertEqual(kwargs["timeout"].connect_timeout, 1)
+
+    def test_failed_token_request(self) -> None:
+        pool_manager = MagicMock()
+        pool_manager.request.return_value.status = 401
+        pool_manager.request.return_value.data = b"Unauthorized"
+        config = OAuth2Config("id", "secret", "3.1", "http://localhost/token")
+        manager = OAuth2TokenManager(config, pool_manager=pool_manager)
+
+        with self.assertRaisesRegex(Exception, "status 401: Unauthorized"):
+            manager.get_token()
+
+        self.assertEqual(
+            json.loads(pool_manager.request.call_args.kwargs["body"])["client_id"],
+            "id",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ import unittest
 from amazon_paapi.errors import AsinNotFound, InvalidArgument
 from amazon_paapi.helpers.arguments import (
     check_browse_nodes_args,
+    check_prefetch_args,
     check_search_mandatory_args,
     check_search_pagination_args,
     check_variations_args,
@@ -86,9 +87,23 @@ class TestHelpersArguments(unittest.TestCase):
         with self.assertRaises(InvalidArgument):
             check_variations_args(variation_count=0, variation_page=11)
 
+    def test_check_check_variations_args_pages_over_10(self):
+        check_variations_args(variation_count=10, variation_page=20)
+        with self.assertRaises(InvalidArgument):
+            check_variations_args(variation_count=11)
+        with self.assertRaises(InvalidArgument):
+            check_variations_args(variation_page=0)
+
     def test_check_browse_nodes_args_correct(self):
         check_browse_nodes_args(browse_node_ids=["1"])
 
     def test_check_browse_nodes_args_if_not_list(self):
         with self.assertRaises(InvalidArgument):
             check_browse_nodes_args(browse_node_ids=1)
+
+    def test_check_prefetch_args(self):
+        check_prefetch_args(prefetch=1)
+        with self.assertRaises(InvalidArgument):
+            check_prefetch_args(prefetch=0)
+        with self.assertRaises(InvalidArgument):
+            check_prefetch_args(prefetch="2")
@@ -0,0 +1,59 @@
+"""Tests for connections helper functions."""
+
+import socket
+import unittest
+
+import urllib3
+
+from amazon_creatorsapi.core.deadline import Deadline
+from amazon_paapi.helpers import connections
+
+
+class TestConnections(unittest.TestCase):
+    def test_create_pool_manager_defaults(self):
+        pool_manager = connections.create_pool_manager()
+
+        self.assertIsInstance(pool_manager, urllib3.PoolManager)
+        self.assertEqual(
+            pool_manager.connection_pool_kw["maxsize"],
+            connections.DEFAULT_POOL_MAXSIZE,
+        )
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            pool_manager.connection_pool_kw["socket_options"],
+        )
+
+    def test_create_pool_manager_custom_sizes(self):
+        pool_manager = connections.create_pool_manager(
+            pool_connections=8, pool_maxsize=32
+        )
+
+        self.assertEqual(pool_manager.pools._maxsize, 8)
+        self.assertEqual(pool_manager.connection_pool_kw["maxsize"], 32)
+
+    def test_create_pool_manager_without_keep_alive(self):
+        pool_manager = connections.create_pool_manager(keep_alive=False)
+
+        self.assertNotIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            pool_manager.connection_pool_kw["socket_options"],
+        )
+
+    def test_get_request_timeout_none(self):
+        self.assertIsNone(connections.get_request_timeout(None, None))
+
+    def test_get_request_timeout(self):
+        self.assertEqual(connections.get_request_timeout(1.5, None), (1.5, None))
+        self.assertEqual(connections.get_request_timeout(1, 10), (1, 10))
+
+    def test_limit_request_timeout_without_deadline(self):
+        self.assertEqual(connections.limit_request_timeout((1, 10), None), (1, 10))
+        self.assertIsNone(connections.limit_request_timeout(None, None))
+
+    def test_limit_request_timeout(self):
+        connect_timeout, read_timeout = connections.limit_request_timeout(
+            (1, None), Deadline(5)
+        )
+        self.assertEqual(connect_timeout, 1)
+        self.assertLessEqual(read_timeout, 5)
+        self.assertGreater(read_timeout, 4)
@@ -81,6 +81,15 @@ class TestRequests(unittest.TestCase):
 
         self.assertEqual("foo", response)
 
+    def test_get_items_response_uses_request_timeout(self):
+        amazon_api = Mock(request_timeout=(1, 5))
+        request = Mock()
+        requests.get_items_response(amazon_api, request)
+
+        amazon_api.api.get_items.assert_called_once_with(
+            request, _request_timeout=(1, 5)
+        )
+
     def test_get_items_response_api_exception(self):
         amazon_api = Mock()
         amazon_api.api.get_items.side_effect = ApiException()
@@ -0,0 +1,76 @@
+"""Tests for the lazy imports of the packages and the SDK models."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+import unittest
+
+LAZY_MODULES = (
+    "amazon_creatorsapi",
+    "amazon_creatorsapi.models",
+    "creatorsapi_python_sdk",
+    "creatorsapi_python_sdk.models",
+    "amazon_paapi.sdk",
+    "amazon_paapi.sdk.models",
+)
+
+
+def _get_imported_modules(statement: str) -> set[str]:
+    """Run an import statement in a new interpreter and return the modules loaded."""
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_import_does_not_import_the_sdk(self) -> None:
+        modules = _get_imported_modules("import amazon_creatorsapi")
+
+        self.assertFalse(
+            [name for name in modules if name.startswith("creatorsapi_python_sdk")]
+        )
+
+    def test_model_import_does_not_import_every_model(self) -> None:
+        for statement, unused_model in (
+            (
+                "from amazon_creatorsapi.models import Condition",
+                "creatorsapi_python_sdk.models.item",
+            ),
+            (
+                "from creatorsapi_python_sdk.models.condition import Condition",
+                "creatorsapi_python_sdk.models.item",
+            ),
+        ):
+            with self.subTest(statement=statement):
+                self.assertNotIn(unused_model, _get_imported_modules(statement))
+
+    def test_every_lazy_name_is_importable(self) -> None:
+        for module_name in LAZY_MODULES:
+            module = importlib.import_module(module_name)
+            for name in module.__all__:
+                with self.subTest(module=module_name, name=name):
+                    self.assertIsNotNone(getattr(module, name))
+                    self.assertIn(name, dir(module))
+
+    def test_public_import_paths(self) -> None:
+        from amazon_creatorsapi import AmazonCreatorsApi, Country, models  # noqa: PLC0415
+        from amazon_creatorsapi.api import AmazonCreatorsApi as Api  # noqa: PLC0415
+        from creatorsapi_python_sdk import ApiClient  # noqa: PLC0415
+        from creatorsapi_python_sdk.models.item import Item  # noqa: PLC0415
+
+        self.assertIs(AmazonCreatorsApi, Api)
+        self.assertEqual(Country.ES, "ES")
+        self.assertIs(models.Item, Item)
+        self.assertEqual(ApiClient.__name__, "ApiClient")
+
+    def test_unknown_name(self) -> None:
+        for module_name in LAZY_MODULES:
+            with self.subTest(module=module_name), self.assertRaises(AttributeError):
+                getattr(importlib.import_module(module_name), "Unknown")  # noqa: B009
@@ -0,0 +1,104 @@
+"""Tests for the MultiMarketplaceApi class."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from amazon_creatorsapi.testing import StubServer
+from amazon_paapi import MultiMarketplaceApi
+from amazon_paapi.errors.exceptions import InvalidArgument, ItemsNotFound
+
+CREDENTIALS = {"key": "secret"}
+
+
+class TestMultiMarketplaceApi(unittest.TestCase):
+    def setUp(self) -> None:
+        self.amazon = MultiMarketplaceApi(
+            "key",
+            "secret",
+            {"ES": "tag-21", "DE": "tag-21", "US": "tag-20"},
+            ["ES", "DE", "US"],
+            throttling={"ES": 0, "DE": 0, "US": 0.5},
+            transport=StubServer(credentials=CREDENTIALS),
+        )
+        self.addCleanup(self.amazon.close)
+
+    def test_clients(self) -> None:
+        self.assertEqual(list(self.amazon.clients), ["ES", "DE", "US"])
+        self.assertEqual(self.amazon.clients["US"].tag, "tag-20")
+        self.assertEqual(self.amazon.clients["US"].throttling, 0.5)
+        self.assertEqual(self.amazon.clients["DE"].marketplace, "www.amazon.de")
+        self.assertEqual(
+            self.amazon.regions,
+            {"ES": "eu-west-1", "DE": "eu-west-1", "US": "us-east-1"},
+        )
+
+    def test_get_items(self) -> None:
+        items = self.amazon.get_items(["B000000001", "B000000002"])
+
+        self.assertEqual(list(items), ["ES", "DE", "US"])
+        self.assertEqual(
+            [item.asin for item in items["DE"]], ["B000000001", "B000000002"]
+        )
+        self.assertEqual(items.errors, {})
+
+    def test_errors_by_marketplace(self) -> None:
+        error = ItemsNotFound("No items have been found")
+        with mock.patch.object(
+            self.amazon.clients["US"], "get_items", side_effect=error
+        ):
+            items = self.amazon.get_items("B000000001")
+
+        self.assertEqual(list(items), ["ES", "DE"])
+        self.assertEqual(items.errors, {"US": error})
+
+    def test_threads_share_one_executor(self) -> None:
+        barrier = threading.Barrier(4)
+
+        def get_items() -> None:
+            barrier.wait()
+            self.amazon.get_items("B000000001")
+
+        def create_executor(max_workers: int) -> ThreadPoolExecutor:
+            time.sleep(0.05)  # Let the other threads check for the executor
+            return ThreadPoolExecutor(max_workers)
+
+        with mock.patch(
+            "amazon_paapi.marketplaces.ThreadPoolExecutor", side_effect=create_executor
+        ) as executor_class:
+            threads = [threading.Thread(target=get_items) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        executor_class.assert_called_once()
+
+    def test_search_items(self) -> None:
+        results = self.amazon.search_items(keywords="camera")
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results["ES"].items)
+
+    def test_shared_pool_manager(self) -> None:
+        with MultiMarketplaceApi("key", "secret", "tag", ["ES", "FR"]) as amazon:
+            pool_managers = {
+                id(client.api.api_client.rest_client.pool_manager)
+                for client in amazon.clients.values()
+            }
+
+        self.assertEqual(len(pool_managers), 1)
+
+    def test_invalid_countries(self) -> None:
+        with self.assertRaises(InvalidArgument):
+            MultiMarketplaceApi("key", "secret", "tag", [])
+        with self.assertRaises(InvalidArgument):
+            MultiMarketplaceApi("key", "secret", "tag", ["ES", "XX"])  # type: ignore[list-item]
+
+    def test_missing_tag_or_throttling(self) -> None:
+        with self.assertRaisesRegex(InvalidArgument, "tag for the countries: DE"):
+            MultiMarketplaceApi("key", "secret", {"ES": "tag"}, ["ES", "DE"])
+        with self.assertRaisesRegex(InvalidArgument, "throttling for .*: ES, DE"):
+            MultiMarketplaceApi("key", "secret", "tag", ["ES", "DE"], {"FR": 1})
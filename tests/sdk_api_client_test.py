@@ -0,0 +1,58 @@
+"""Tests for the PA-API SDK ApiClient."""
+
+import threading
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from amazon_paapi.sdk.api_client import ApiClient
+
+
+class TestApiClientPool(unittest.TestCase):
+    def setUp(self):
+        self.api_client = ApiClient(
+            "key", "secret", "webservices.amazon.es", "eu-west-1"
+        )
+
+    def tearDown(self):
+        self.api_client.__del__()
+
+    def test_init_does_not_create_thread_pool(self):
+        threads_before = threading.active_count()
+        api_client = ApiClient("key", "secret", "webservices.amazon.es", "eu-west-1")
+
+        self.assertIsNone(api_client._pool)
+        self.assertEqual(threading.active_count(), threads_before)
+
+    def test_pool_is_created_once_on_first_access(self):
+        pool = self.api_client.pool
+
+        self.assertIsNotNone(pool)
+        self.assertIs(self.api_client.pool, pool)
+
+    @mock.patch.object(ApiClient, "_ApiClient__call_api")
+    def test_sync_call_does_not_create_thread_pool(self, mocked_call_api: MagicMock):
+        mocked_call_api.return_value = "response"
+
+        response = self.api_client.call_api("/paapi5/getitems", "POST", "GetItems")
+
+        self.assertEqual(response, "response")
+        self.assertIsNone(self.api_client._pool)
+
+    @mock.patch.object(ApiClient, "_ApiClient__call_api")
+    def test_async_call_creates_thread_pool(self, mocked_call_api: MagicMock):
+        mocked_call_api.return_value = "response"
+
+        thread = self.api_client.call_api(
+            "/paapi5/getitems", "POST", "GetItems", async_req=True
+        )
+
+        self.assertEqual(thread.get(timeout=5), "response")
+        self.assertIsNotNone(self.api_client._pool)
+
+    def test_del_closes_created_pool(self):
+        self.api_client.pool  # noqa: B018
+
+        self.api_client.__del__()
+
+        self.assertIsNone(self.api_client._pool)